@@ -23,3 +23,5 @@ GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
 GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI", "http://localhost:8000/auth/callback")
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
+# Session store: "json" (single process) or "sqlite" (shared by all workers)
+AUTH_STORE = os.getenv("AUTH_STORE", "json")
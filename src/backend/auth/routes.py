@@ -6,13 +6,13 @@ import secrets
 import config
 import logging
 from .providers import get_auth_provider
-from .session_manager import AuthManager
+from .session_manager import create_auth_manager
 
 logger = logging.getLogger("AuthRoutes")
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 # Initialize Managers
-auth_manager = AuthManager()
+auth_manager = create_auth_manager(config.AUTH_STORE)
 signer = URLSafeTimedSerializer(config.SECRET_KEY, salt="logenesis-session")
 
 COOKIE_NAME = "logenesis_session"
@@ -3,6 +3,8 @@ import os
 import time
 import logging
 from typing import Optional, Dict
+from pydantic import ValidationError
+from src.backend.storage import AUTH_TABLE, DEFAULT_IDLE_TTL, DEFAULT_MAX_RESIDENT, SessionCache, SqliteDocumentStore
 from .schemas import UserSession, TokenSet, IdentityProfile
 
 logger = logging.getLogger("AuthManager")
@@ -12,20 +14,32 @@ class AuthManager:
 
     This class handles the lifecycle of user sessions, including loading from disk,
     caching in memory, updating session details, and saving back to disk.
+
+    Sessions are kept as JSON and decoded when first requested; at most
+    `max_resident` decoded sessions stay in memory, and those unused for
+    `idle_ttl` seconds are dropped (see SessionCache). cache_stats() reports hit
+    rate, evictions and resident sessions. The JSON of every stored session is
+    kept in memory regardless (save() rewrites the whole file from it), so memory
+    grows with the number of users; SqliteAuthManager keeps none.
     """
 
-    def __init__(self, filepath: str = "auth_sessions.json"):
+    def __init__(self, filepath: str = "auth_sessions.json", max_resident: Optional[int] = DEFAULT_MAX_RESIDENT,
+                 idle_ttl: Optional[float] = DEFAULT_IDLE_TTL):
         """Initializes the AuthManager.
 
         Args:
             filepath: The path to the JSON file used for session persistence.
+            max_resident: Most sessions kept decoded in memory (None: unbounded).
+            idle_ttl: Seconds before an unused session is dropped from memory (None: never).
         """
         self.filepath = filepath
-        self._cache: Dict[str, UserSession] = {}
+        self._cache: SessionCache = SessionCache(max_resident, idle_ttl)
+        # User -> JSON of the stored session
+        self._encoded: Dict[str, str] = {}
         self._load()
 
     def _load(self):
-        """Loads user sessions from the JSON store into the memory cache.
+        """Loads user sessions from the JSON store; they are decoded when first requested.
 
         Handles missing files gracefully and logs any errors during loading.
         """
@@ -35,23 +49,36 @@ class AuthManager:
             with open(self.filepath, 'r') as f:
                 data = json.load(f)
                 for uid, user_data in data.items():
-                    self._cache[uid] = UserSession(**user_data)
-            logger.info(f"Loaded {len(self._cache)} identities from store.")
+                    self._encoded[uid] = json.dumps(user_data)
+            logger.info(f"Loaded {len(self._encoded)} identities from store.")
         except Exception as e:
             logger.error(f"Failed to load auth store: {e}")
 
     def save(self):
-        """Persists the current memory cache of user sessions to the JSON file.
+        """Persists all user sessions to the JSON file.
 
         Logs an error if the file operation fails.
         """
         try:
-            data = {uid: session.model_dump(mode='json') for uid, session in self._cache.items()}
+            body = ",".join(f"{json.dumps(uid)}:{encoded}" for uid, encoded in self._encoded.items())
             with open(self.filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write("{" + body + "}")
         except Exception as e:
             logger.error(f"Failed to save auth store: {e}")
 
+    def cache_stats(self) -> Dict:
+        """Hit rate, evictions and resident sessions of the in-memory cache."""
+        return self._cache.stats()
+
+    def _decode(self, user_id: str, doc: Optional[str]) -> Optional[UserSession]:
+        if doc is None:
+            return None
+        try:
+            return UserSession.model_validate_json(doc)
+        except ValidationError as e:
+            logger.error(f"Ignoring invalid session for {user_id}: {e}")
+            return None
+
     def get_user(self, user_id: str) -> Optional[UserSession]:
         """Retrieves a user session by ID.
 
@@ -61,7 +88,12 @@ class AuthManager:
         Returns:
             The UserSession object if found, otherwise None.
         """
-        return self._cache.get(user_id)
+        session = self._cache.lookup(user_id)
+        if session is None:
+            session = self._decode(user_id, self._encoded.get(user_id))
+            if session is not None:
+                self._cache[user_id] = session
+        return session
 
     def upsert_user(self, user_id: str, identity: IdentityProfile, tokens: TokenSet) -> UserSession:
         """Updates or inserts a user session.
@@ -78,11 +110,20 @@ class AuthManager:
         Returns:
             The updated or newly created UserSession.
         """
+        session = self._merge(self.get_user(user_id), user_id, identity, tokens)
+        self._cache[user_id] = session
+        self._encoded[user_id] = session.model_dump_json()
+        self.save()
+        return session
+
+    @staticmethod
+    def _merge(session: Optional[UserSession], user_id: str, identity: IdentityProfile,
+               tokens: TokenSet) -> UserSession:
+        """Applies a login to the stored session (None if the user is new)."""
         now = time.time()
 
-        if user_id in self._cache:
+        if session is not None:
             # Update existing
-            session = self._cache[user_id]
             session.identity = identity # Update profile if changed
             session.tokens = tokens     # Rotate tokens
             session.last_accessed = now
@@ -95,7 +136,68 @@ class AuthManager:
                 created_at=now,
                 last_accessed=now
             )
-            self._cache[user_id] = session
+        return session
 
-        self.save()
+
+class SqliteAuthManager(AuthManager):
+    """AuthManager backed by SQLite, so all worker processes share one set of sessions.
+
+    Sessions are read from the database on every lookup rather than cached, and
+    upsert_user does its read-modify-write inside one write transaction, so
+    concurrent logins from different workers cannot overwrite each other.
+    """
+
+    def __init__(self, filepath: str = "auth_sessions.db"):
+        """Initializes the SqliteAuthManager.
+
+        Args:
+            filepath: The path to the SQLite database shared by all workers.
+        """
+        self.documents = SqliteDocumentStore(filepath, AUTH_TABLE)
+        super().__init__(filepath, max_resident=None, idle_ttl=None) # Nothing is cached
+
+    def _load(self):
+        """Sessions are read on demand."""
+
+    def save(self):
+        """Every change is committed as it is made."""
+
+    def get_user(self, user_id: str) -> Optional[UserSession]:
+        """Retrieves a user session by ID.
+
+        Args:
+            user_id: The unique identifier of the user.
+
+        Returns:
+            The UserSession object if found, otherwise None.
+        """
+        return self._decode(user_id, self.documents.get(user_id))
+
+    def upsert_user(self, user_id: str, identity: IdentityProfile, tokens: TokenSet) -> UserSession:
+        """Updates or inserts a user session in one transaction.
+
+        Args:
+            user_id: The unique identifier of the user.
+            identity: The user's profile information.
+            tokens: The current set of authentication tokens.
+
+        Returns:
+            The updated or newly created UserSession.
+        """
+        with self.documents.transaction() as conn:
+            session = self._merge(self._decode(user_id, self.documents.get(user_id, conn)), user_id, identity, tokens)
+            self.documents.put(user_id, session.model_dump_json(), conn)
         return session
+
+
+def create_auth_manager(store: str = "json") -> AuthManager:
+    """AuthManager for a storage backend name: "json" (single process) or "sqlite".
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if store == "json":
+        return AuthManager()
+    if store == "sqlite":
+        return SqliteAuthManager()
+    raise ValueError(f"Unknown auth store: {store!r}")
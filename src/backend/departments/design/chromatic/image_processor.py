@@ -23,6 +23,34 @@ class ImageProcessor:
         Returns:
             A list of (x, y, color_hex) tuples, where x and y are normalized [0, 1].
         """
+        xs, ys, width, height, rgba = ImageProcessor._extract_pixels(image, max_particles)
+        return [
+            (x, y, "#{:02x}{:02x}{:02x}".format(r, g, b))
+            for x, y, (r, g, b, _) in zip((xs / width).tolist(), (ys / height).tolist(), rgba.tolist())
+        ]
+
+    @staticmethod
+    def process_image_to_arrays(image: Image.Image, max_particles: int = 300) -> Tuple[np.ndarray, np.ndarray]:
+        """Array form of `process_image_to_particles` for direct LCL ingestion.
+
+        Same points in the same order, without building tuples or hex strings.
+
+        Args:
+            image: A PIL Image object.
+            max_particles: Maximum number of points to extract.
+
+        Returns:
+            An (N, 2) float32 array of normalized coordinates and an (N, 4) uint8
+            RGBA color array (opaque), as accepted by LightControlLogic.manifest.
+        """
+        xs, ys, width, height, rgba = ImageProcessor._extract_pixels(image, max_particles)
+        coords = np.empty((len(xs), 2), dtype=np.float32)
+        coords[:, 0] = xs / width
+        coords[:, 1] = ys / height
+        return coords, rgba
+
+    @staticmethod
+    def _extract_pixels(image: Image.Image, max_particles: int):
         # Resize to a grid that roughly approximates the particle count
         # Square root of max_particles to get grid side
         side = int(np.sqrt(max_particles))
@@ -33,26 +61,16 @@ class ImageProcessor:
             img_small = img_small.convert('RGBA')
 
         width, height = img_small.size
-        pixels = list(img_small.getdata())
-
-        targets = []
-
-        for i, pixel in enumerate(pixels):
-            r, g, b, a = pixel
-
-            # Skip transparent or very dark pixels
-            if a < 50 or (r < 30 and g < 30 and b < 30):
-                continue
-
-            x = (i % width) / width
-            y = (i // width) / height
-
-            # Convert RGB to Hex
-            color_hex = "#{:02x}{:02x}{:02x}".format(r, g, b)
+        pixels = np.asarray(img_small, dtype=np.uint8)
+        r, g, b, a = pixels[..., 0], pixels[..., 1], pixels[..., 2], pixels[..., 3]
 
-            targets.append((x, y, color_hex))
+        # Skip transparent or very dark pixels
+        keep = (a >= 50) & ~((r < 30) & (g < 30) & (b < 30))
+        ys, xs = np.nonzero(keep) # Row-major, same order as the pixel data
 
-        return targets
+        rgba = pixels[keep]
+        rgba[:, 3] = 255
+        return xs, ys, width, height, rgba
 
     @staticmethod
     def create_text_image(text: str) -> Image.Image:
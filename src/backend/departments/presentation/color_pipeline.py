@@ -0,0 +1,185 @@
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Colors are stored packed as one little-endian uint32 per entity whose bytes are
+# R, G, B, A, so `packed.view(np.uint8).reshape(-1, 4)` is an RGBA array (the layout
+# of the binary frame format, see lcl_codec). Alpha 0 means "no color".
+PACKED_DTYPE = np.dtype("<u4")
+NO_COLOR = 0
+
+# Named color profiles (matching the light testbed renderer)
+PALETTES: Dict[str, str] = {
+    "default": "#ffffff",
+    "natural_green": "#00ff88",
+    "bright": "#ffff00",
+    "emphasis": "#ffcc00",
+    "calm": "#4488ff",
+    "warning": "#ff4400",
+}
+
+# Critically damped easing rate (1/s) of displayed colors towards their targets;
+# ~99% of the way after 0.8 s.
+COLOR_EASE_RATE = 8.0
+# Colors within this distance (0..255 scale) and slower than this per second are snapped
+COLOR_SETTLE_EPS = 0.25
+
+# ASCII -> hex digit value, 255 for non-hex characters
+_HEX_LUT = np.full(256, 255, dtype=np.uint8)
+for _i, _c in enumerate(b"0123456789abcdef"):
+    _HEX_LUT[_c] = _i
+    _HEX_LUT[ord(chr(_c).upper())] = _i
+
+ColorInput = Union[None, str, np.ndarray, List[Optional[str]]]
+
+
+def rgba_to_packed(r: int, g: int, b: int, a: int = 255) -> int:
+    return int(r) | (int(g) << 8) | (int(b) << 16) | (int(a) << 24)
+
+
+def packed_to_rgba(packed: np.ndarray) -> np.ndarray:
+    """(N,) packed colors -> (N, 4) uint8 RGBA view."""
+    return np.ascontiguousarray(packed, dtype=PACKED_DTYPE).view(np.uint8).reshape(-1, 4)
+
+
+def parse_hex_colors(values: List[str]) -> np.ndarray:
+    """Vectorized parse of '#RGB', '#RRGGBB' and '#RRGGBBAA' strings into packed colors.
+
+    Palette names are resolved first; anything unparseable becomes NO_COLOR.
+    """
+    n = len(values)
+    if n == 0:
+        return np.empty(0, dtype=PACKED_DTYPE)
+    values = [PALETTES.get(v, v) for v in values]
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=n)
+    # Fixed-width byte matrix: '#' + up to 8 hex digits
+    raw = "".join(v[:9].ljust(9) for v in values).encode("latin-1", "replace")
+    chars = np.frombuffer(raw, dtype=np.uint8).reshape(n, 9)
+    digits = _HEX_LUT[chars[:, 1:]]
+
+    rgba = np.zeros((n, 4), dtype=np.uint8)
+    full = (lengths == 7) | (lengths == 9)
+    short = lengths == 4
+    rgba[full, :3] = (digits[full, 0:6:2] << 4) | digits[full, 1:6:2]
+    rgba[full, 3] = np.where(lengths[full] == 9, (digits[full, 6] << 4) | digits[full, 7], 255)
+    rgba[short, :3] = digits[short, 0:3] * 17
+    rgba[short, 3] = 255
+
+    used = np.where(lengths == 9, 8, np.where(lengths == 7, 6, 3))
+    bad_digit = (digits == 255) & (np.arange(8) < used[:, None])
+    valid = (chars[:, 0] == ord("#")) & (full | short) & ~bad_digit.any(axis=1)
+    rgba[~valid] = 0
+    return rgba.view(PACKED_DTYPE).ravel()
+
+
+def parse_color(value: Optional[str]) -> int:
+    if not isinstance(value, str):
+        return NO_COLOR
+    return int(parse_hex_colors([value])[0])
+
+
+def to_packed(colors: ColorInput) -> Union[int, np.ndarray]:
+    """Normalizes any accepted color input into packed form.
+
+    Accepts None, a hex string or palette name (returned as a scalar), an (N,)
+    packed uint32 array, an (N, 4) uint8 RGBA array, or a sequence / object array
+    of strings and None. Sequences are parsed once per distinct value.
+    """
+    if colors is None:
+        return NO_COLOR
+    if isinstance(colors, str):
+        return parse_color(colors)
+    if isinstance(colors, np.ndarray):
+        if colors.dtype == np.uint8 and colors.ndim == 2 and colors.shape[1] == 4:
+            return np.ascontiguousarray(colors).view(PACKED_DTYPE).ravel()
+        if colors.dtype.kind in "ui":
+            return colors.astype(PACKED_DTYPE, copy=False)
+
+    if not isinstance(colors, (list, np.ndarray)):
+        colors = list(colors)
+    keys = list(dict.fromkeys(colors))
+    lut = {key: code for code, key in enumerate(keys)}
+    codes = np.fromiter(map(lut.__getitem__, colors), dtype=np.int64, count=len(colors))
+    table = np.zeros(len(keys), dtype=PACKED_DTYPE)
+    strings = [i for i, k in enumerate(keys) if isinstance(k, str)]
+    if strings:
+        table[strings] = parse_hex_colors([keys[i] for i in strings])
+    return table[codes]
+
+
+def to_hex(packed: np.ndarray) -> List[Optional[str]]:
+    """Packed colors -> '#rrggbb' ('#rrggbbaa' if translucent), None for NO_COLOR."""
+    packed = np.asarray(packed, dtype=PACKED_DTYPE)
+    unique, inverse = np.unique(packed, return_inverse=True)
+    names: List[Optional[str]] = []
+    for r, g, b, a in packed_to_rgba(unique).tolist():
+        if a == 0:
+            names.append(None)
+        elif a == 255:
+            names.append(f"#{r:02x}{g:02x}{b:02x}")
+        else:
+            names.append(f"#{r:02x}{g:02x}{b:02x}{a:02x}")
+    return [names[i] for i in inverse.ravel().tolist()]
+
+
+def ease_colors(color: np.ndarray, color_vel: np.ndarray, target: np.ndarray, dt: float,
+                rate: float = COLOR_EASE_RATE, counts: Optional[Sequence[int]] = None):
+    """Moves (N, 4) float RGBA colors towards packed targets, in place.
+
+    Exact step of a critically damped spring, so it is stable for any dt and
+    never overshoots from rest. Entities without a target color keep theirs.
+    Once every color of a scene is within COLOR_SETTLE_EPS it is snapped onto its target.
+
+    Args:
+        counts: Sizes of consecutive independent scenes in the arrays (see
+            SceneHost); settling is decided per scene. Defaults to one scene.
+
+    Returns:
+        Whether each scene is still easing (a single bool without `counts`), so
+        callers can skip easing until a target changes.
+    """
+    n = len(target)
+    seg_counts = np.array([n] if counts is None else counts, dtype=np.int64)
+    if n == 0:
+        moving = np.zeros(len(seg_counts), dtype=bool)
+        return bool(moving[0]) if counts is None else moving
+
+    has_target = target != NO_COLOR
+    partial = not has_target.all()
+    goal = packed_to_rgba(target).astype(np.float32)
+    x0 = color - goal
+    decay = np.float32(np.exp(-rate * dt))
+    carry = x0 * np.float32(rate)
+    carry += color_vel
+    x1 = carry * np.float32(dt)
+    x1 += x0
+    x1 *= decay
+    v1 = carry
+    v1 *= np.float32(-rate * dt)
+    v1 += color_vel
+    v1 *= decay
+    if partial:
+        x1[~has_target] = 0.0
+        v1[~has_target] = 0.0
+
+    residual = np.maximum(np.abs(x1), np.abs(v1))
+    starts = np.cumsum(seg_counts) - seg_counts
+    moving = np.maximum.reduceat(residual, starts, axis=0).max(axis=1) >= COLOR_SETTLE_EPS
+    if not moving.all():
+        settled = np.repeat(~moving, seg_counts)
+        x1[settled] = 0.0
+        v1[settled] = 0.0
+
+    x1 += goal
+    if partial:
+        color[has_target] = x1[has_target]
+        color_vel[has_target] = v1[has_target]
+    else:
+        color[...] = x1
+        color_vel[...] = v1
+    return bool(moving[0]) if counts is None else moving
+
+
+def display_rgba(color: np.ndarray) -> np.ndarray:
+    """(N, 4) float colors -> (N, 4) uint8 RGBA for rendering / streaming."""
+    return np.clip(np.rint(color), 0, 255).astype(np.uint8)
@@ -0,0 +1,51 @@
+import mmap
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+# Entities per chunk: the unit in which arena memory is released (and the scene size
+# from which LightControlLogic moves its arrays into an arena).
+ARENA_CHUNK = 65536
+# Entities of address space reserved per arena (~640 MB virtual for the LCL arrays,
+# physical pages are only committed when first written)
+ARENA_RESERVE = 1 << 22
+
+# Private anonymous mappings where available, so released pages are really dropped
+_MAP_FLAGS = {"flags": mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS} if hasattr(mmap, "MAP_ANONYMOUS") else {}
+
+
+class EntityArena:
+    """Reserved, lazily committed backing store for per-entity arrays.
+
+    Each field gets an anonymous memory mapping sized for `reserve` entities. The
+    kernel only backs pages once they are written, so growing the capacity within
+    the reservation is free: the arrays are views of the first `capacity` rows of
+    the mapping and never move, no row is copied. release() hands the pages of
+    freed rows back to the OS, in whole chunks, when the capacity shrinks.
+    """
+
+    def __init__(self, fields: Sequence[Tuple[str, type, Tuple[int, ...]]], reserve: int = ARENA_RESERVE):
+        self.reserve = reserve
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._rows: Dict[str, np.ndarray] = {}
+        for name, dtype, shape in fields:
+            row_bytes = np.dtype(dtype).itemsize * int(np.prod(shape))
+            buf = mmap.mmap(-1, reserve * row_bytes, **_MAP_FLAGS)
+            self._maps[name] = buf
+            self._rows[name] = np.frombuffer(buf, dtype=dtype).reshape((reserve,) + shape)
+
+    def view(self, name: str, capacity: int) -> np.ndarray:
+        """The first `capacity` rows of a field (a view, valid as long as the arena)."""
+        return self._rows[name][:capacity]
+
+    def release(self, start: int, stop: int):
+        """Returns the memory of rows [start, stop) to the OS; they read back as zeros."""
+        start = -(-start // ARENA_CHUNK) * ARENA_CHUNK
+        if start >= stop or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        for name, rows in self._rows.items():
+            row_bytes = rows.strides[0]
+            begin = -(-start * row_bytes // mmap.PAGESIZE) * mmap.PAGESIZE
+            end = stop * row_bytes // mmap.PAGESIZE * mmap.PAGESIZE
+            if end > begin:
+                self._maps[name].madvise(mmap.MADV_DONTNEED, begin, end - begin)
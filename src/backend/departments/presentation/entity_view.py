@@ -0,0 +1,150 @@
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .color_pipeline import to_hex
+from .light_schemas import LightEntity
+
+# Projectable fields -> LightControlLogic array attribute
+FIELDS: Dict[str, str] = {
+    "handle": "_handles",
+    "position": "_pos",
+    "velocity": "_vel",
+    "energy": "_energy_levels",
+    "decay": "_decay",
+    "history": "_history",
+    "target_position": "_target_pos",
+    "has_target": "_has_target",
+    "target_color": "_target_colors", # packed RGBA (see color_pipeline)
+    "color": "_color",
+}
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+class EntityView:
+    """Lazy, read-only selection of the entities of a LightControlLogic.
+
+    A view is either an index range (field access returns NumPy views, no copy) or
+    an index array produced by a filter (field access gathers). LightEntity models
+    are only built for the entities actually accessed, so paging through a million
+    entities never materializes more than one page.
+
+    Like frame_arrays(), a view is invalidated by the next call that adds or
+    removes entities (removal swaps entities around).
+    """
+
+    def __init__(self, lcl, start: int = 0, stop: Optional[int] = None,
+                 indices: Optional[np.ndarray] = None):
+        self._lcl = lcl
+        self._indices = indices
+        self._start = start
+        self._stop = lcl._count if stop is None else max(start, min(stop, lcl._count))
+
+    def _rows(self) -> Union[slice, np.ndarray]:
+        return slice(self._start, self._stop) if self._indices is None else self._indices
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Array indices (into the LCL arrays) of the selected entities."""
+        if self._indices is None:
+            return np.arange(self._start, self._stop)
+        return self._indices
+
+    def __len__(self) -> int:
+        return self._stop - self._start if self._indices is None else len(self._indices)
+
+    def _selected(self, idx: int) -> bool:
+        if self._indices is None:
+            return self._start <= idx < self._stop
+        return bool(np.any(self._indices == idx))
+
+    def __getitem__(self, key):
+        """view["id"] and view[i] return a LightEntity, view[a:b] returns a sub-view."""
+        if isinstance(key, str):
+            idx = self._lcl._index_of(key)
+            if idx is None or not self._selected(idx):
+                raise KeyError(key)
+            return self._lcl._entity_at(idx)
+        if isinstance(key, slice):
+            if self._indices is not None:
+                return EntityView(self._lcl, indices=self._indices[key])
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return EntityView(self._lcl, indices=np.arange(start, stop, step) + self._start)
+            return EntityView(self._lcl, self._start + start, self._start + max(start, stop))
+        if isinstance(key, (int, np.integer)):
+            n = len(self)
+            if key < 0:
+                key += n
+            if not 0 <= key < n:
+                raise IndexError("entity index out of range")
+            idx = self._start + key if self._indices is None else self._indices[key]
+            return self._lcl._entity_at(int(idx))
+        raise TypeError(f"Invalid key type: {type(key).__name__}")
+
+    def __contains__(self, eid: str) -> bool:
+        idx = self._lcl._index_of(eid)
+        return idx is not None and self._selected(idx)
+
+    def __iter__(self) -> Iterator[LightEntity]:
+        for idx in self.indices.tolist():
+            yield self._lcl._entity_at(idx)
+
+    def ids(self) -> List[str]:
+        auto = self._lcl._auto_id
+        handles = self._lcl._handles[self._rows()].tolist()
+        explicit = self._lcl._explicit_ids
+        if not explicit:
+            return [auto(handle) for handle in handles]
+        return [explicit.get(idx) or auto(handle)
+                for idx, handle in zip(self.indices.tolist(), handles)]
+
+    def field(self, name: str) -> np.ndarray:
+        """One field of the selection: a view for ranges, a copy for filtered views."""
+        attr = FIELDS.get(name)
+        if attr is None:
+            raise ValueError(f"Unknown entity field: {name}")
+        return getattr(self._lcl, attr)[self._rows()]
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self.field("position")
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self.field("velocity")
+
+    @property
+    def energy(self) -> np.ndarray:
+        return self.field("energy")
+
+    def project(self, *names: str) -> Dict[str, np.ndarray]:
+        """Field projection, e.g. view.project("position", "energy")."""
+        return {name: self.field(name) for name in names}
+
+    def in_region(self, x0: float, y0: float, x1: float, y1: float) -> "EntityView":
+        """Entities whose position lies in the normalized box [x0, x1] x [y0, y1]."""
+        pos = self.positions
+        mask = (pos[:, 0] >= x0) & (pos[:, 0] <= x1) & (pos[:, 1] >= y0) & (pos[:, 1] <= y1)
+        return EntityView(self._lcl, indices=self.indices[mask])
+
+    def page(self, number: int, size: int = DEFAULT_PAGE_SIZE) -> "EntityView":
+        """Zero-based page of `size` entities."""
+        return self[number * size:(number + 1) * size]
+
+    def to_entities(self) -> Dict[str, LightEntity]:
+        """Materializes the selection as LightEntity models (expensive for large views)."""
+        return {entity.id: entity for entity in self}
+
+    def to_records(self, fields: Sequence[str] = ("position",)) -> List[Dict]:
+        """JSON-friendly rows with the entity id and the projected fields (debug endpoints).
+        Target colors are rendered as hex strings."""
+        columns: List[Tuple[str, list]] = [
+            (name, to_hex(self.field(name)) if name == "target_color" else self.field(name).tolist())
+            for name in fields
+        ]
+        return [
+            {"id": eid, **{name: values[i] for name, values in columns}}
+            for i, eid in enumerate(self.ids())
+        ]
@@ -0,0 +1,256 @@
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Flow strength (normalized units / s^2) of a VisualParameters flow_direction at
+# energy_level 0; energy_level 1 doubles it
+FLOW_STRENGTH = 0.3
+# Curl-noise amplitude at turbulence 1.0
+TURBULENCE_STRENGTH = 0.6
+# Softening (squared distance) of point attractors, avoids infinite pull at the center
+ATTRACTOR_SOFTENING = 1e-3
+
+# Precomputed curl-noise texture: resolution, smallest feature (in cells) and seed
+NOISE_RESOLUTION = 128
+NOISE_FEATURE = 16
+NOISE_SEED = 7
+# Texture scroll speed (normalized units / s) so the flow evolves over time
+NOISE_DRIFT = (0.013, 0.007)
+
+Center = Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class Radial:
+    """Pushes away from `center` (strength > 0) or pulls towards it (< 0)."""
+    strength: float
+    center: Center = (0.5, 0.5)
+
+
+@dataclass(frozen=True)
+class Vortex:
+    """Swirls around `center`, clockwise on screen (y grows downwards) for strength > 0."""
+    strength: float
+    center: Center = (0.5, 0.5)
+
+
+@dataclass(frozen=True)
+class Attractor:
+    """Point attractor with inverse-distance falloff (repels for strength < 0)."""
+    strength: float
+    center: Center = (0.5, 0.5)
+
+
+@dataclass(frozen=True)
+class CurlNoise:
+    """Divergence-free turbulence sampled from a precomputed, tileable noise texture."""
+    amplitude: float
+    scale: float = 1.0 # Texture repeats per unit square
+
+
+Term = Union[Radial, Vortex, Attractor, CurlNoise]
+TERMS: Dict[str, type] = {"radial": Radial, "vortex": Vortex, "attractor": Attractor, "noise": CurlNoise}
+
+
+@lru_cache(maxsize=4)
+def noise_texture(resolution: int = NOISE_RESOLUTION, feature: int = NOISE_FEATURE,
+                  seed: int = NOISE_SEED) -> np.ndarray:
+    """(R, R, 2) float32 curl of a smooth periodic potential, unit RMS, tileable.
+
+    The potential is white noise low-pass filtered in Fourier space (so it wraps
+    around seamlessly); its curl (dpsi/dy, -dpsi/dx) has zero divergence, so the
+    flow stirs particles without clumping them.
+    """
+    rng = np.random.default_rng(seed)
+    freq = np.fft.fftfreq(resolution) * resolution
+    k2 = freq[:, None] ** 2 + freq[None, :] ** 2
+    spectrum = np.fft.fft2(rng.standard_normal((resolution, resolution)))
+    spectrum *= np.exp(-k2 * (feature / resolution) ** 2)
+    psi = np.real(np.fft.ifft2(spectrum))
+
+    # Central differences with wrap-around; axis 0 is y, axis 1 is x
+    dpsi_dy = (np.roll(psi, -1, axis=0) - np.roll(psi, 1, axis=0)) / 2.0
+    dpsi_dx = (np.roll(psi, -1, axis=1) - np.roll(psi, 1, axis=1)) / 2.0
+    texture = np.stack([dpsi_dy, -dpsi_dx], axis=-1)
+    texture /= np.sqrt(np.mean(np.sum(texture ** 2, axis=-1))) or 1.0
+    return texture.astype(np.float32)
+
+
+@lru_cache(maxsize=4)
+def _lookup_table(resolution: int = NOISE_RESOLUTION) -> np.ndarray:
+    """Noise texture as flat complex64 (x + iy), padded by one wrapped row and column:
+    one gather fetches both components and neighbor indices need no wrapping."""
+    padded = np.pad(noise_texture(resolution), ((0, 1), (0, 1), (0, 0)), mode="wrap")
+    return (padded[..., 0] + 1j * padded[..., 1]).astype(np.complex64).ravel()
+
+
+def _sample_noise(u: np.ndarray, v: np.ndarray, resolution: int = NOISE_RESOLUTION) -> np.ndarray:
+    """Bilinear lookup of the tileable noise texture at normalized coordinates.
+    Returns complex64 flow (x + iy). `resolution` must be a power of two."""
+    table = _lookup_table(resolution)
+    stride = resolution + 1
+    mask = resolution - 1
+    x = u * np.float32(resolution)
+    y = v * np.float32(resolution)
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = x - x0
+    fy = y - y0
+    # Wrap the cell indices with a bit mask (float modulo is several times slower)
+    i00 = y0.astype(np.intp)
+    i00 &= mask
+    i00 *= stride
+    ix = x0.astype(np.intp)
+    ix &= mask
+    i00 += ix
+
+    c00 = table.take(i00)
+    c01 = table.take(i00 + 1)
+    c10 = table.take(i00 + stride)
+    c11 = table.take(i00 + (stride + 1))
+    c01 -= c00
+    c01 *= fx
+    c00 += c01
+    c11 -= c10
+    c11 *= fx
+    c10 += c11
+    c10 -= c00
+    c10 *= fy
+    c00 += c10
+    return c00
+
+
+class ForceField:
+    """Composable external forces for LightControlLogic.tick().
+
+    A field is a list of terms, written in code (ForceField([Vortex(0.5), CurlNoise(0.2)]))
+    or as a JSON-friendly spec ([{"type": "vortex", "strength": 0.5}, ...], see from_spec)
+    so it can travel in the protocol and be stored with the LCL state.
+
+    accel() evaluates all terms in one fused pass into a single pair of accumulators:
+    radial and vortex terms sharing a center reduce to one pair of coefficients on one
+    distance computation, attractors and noise terms add in place (one bilinear
+    texture lookup per noise term).
+    """
+
+    def __init__(self, terms: Optional[List[Term]] = None):
+        self.terms: List[Term] = list(terms or [])
+
+        # Fused form: center -> [radial, tangential] coefficient
+        self._centers: Dict[Center, List[float]] = {}
+        attractors = []
+        for term in self.terms:
+            if isinstance(term, (Radial, Vortex)):
+                coeffs = self._centers.setdefault(tuple(term.center), [0.0, 0.0])
+                coeffs[0 if isinstance(term, Radial) else 1] += term.strength
+            elif isinstance(term, Attractor):
+                attractors.append((term.center[0], term.center[1], term.strength))
+        self._attractors = np.array(attractors, dtype=np.float32).reshape(-1, 3)
+        self._noise = [term for term in self.terms if isinstance(term, CurlNoise)]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __add__(self, other: "ForceField") -> "ForceField":
+        return ForceField(self.terms + other.terms)
+
+    def accel(self, pos: np.ndarray, t: float = 0.0) -> np.ndarray:
+        """(N, 2) float32 acceleration at positions `pos` and field time `t` (seconds)."""
+        n = len(pos)
+        ax = np.zeros(n, dtype=np.float32)
+        ay = np.zeros(n, dtype=np.float32)
+        px = pos[:, 0]
+        py = pos[:, 1]
+
+        for (cx, cy), (radial, tangential) in self._centers.items():
+            if radial == 0.0 and tangential == 0.0:
+                continue
+            dx = px - np.float32(cx)
+            dy = py - np.float32(cy)
+            inv_r = dx * dx
+            inv_r += dy * dy
+            np.sqrt(inv_r, out=inv_r)
+            np.maximum(inv_r, np.float32(1e-6), out=inv_r)
+            np.reciprocal(inv_r, out=inv_r)
+            dx *= inv_r
+            dy *= inv_r
+            # Unit radial (dx, dy) and clockwise tangent (-dy, dx)
+            ax += np.float32(radial) * dx - np.float32(tangential) * dy
+            ay += np.float32(radial) * dy + np.float32(tangential) * dx
+
+        for cx, cy, strength in self._attractors.tolist():
+            dx = np.float32(cx) - px
+            dy = np.float32(cy) - py
+            weight = dx * dx
+            weight += dy * dy
+            weight += np.float32(ATTRACTOR_SOFTENING)
+            np.divide(np.float32(strength), weight, out=weight)
+            dx *= weight
+            dy *= weight
+            ax += dx
+            ay += dy
+
+        for term in self._noise:
+            u = px * np.float32(term.scale)
+            u += np.float32(t * NOISE_DRIFT[0])
+            v = py * np.float32(term.scale)
+            v += np.float32(t * NOISE_DRIFT[1])
+            flow = _sample_noise(u, v)
+            flow *= np.float32(term.amplitude)
+            ax += flow.real
+            ay += flow.imag
+
+        return np.stack([ax, ay], axis=1)
+
+    def to_spec(self) -> List[Dict]:
+        names = {cls: name for name, cls in TERMS.items()}
+        return [{"type": names[type(term)], **asdict(term)} for term in self.terms]
+
+    @classmethod
+    def from_spec(cls, spec: List[Dict]) -> "ForceField":
+        """Builds a field from [{"type": "vortex", "strength": 0.5, "center": [x, y]}, ...].
+
+        Raises:
+            ValueError: On unknown term types or parameters.
+        """
+        terms = []
+        for entry in spec:
+            params = dict(entry)
+            kind = TERMS.get(params.pop("type", None))
+            if kind is None:
+                raise ValueError(f"Unknown force field term: {entry.get('type')!r}")
+            if "center" in params:
+                params["center"] = tuple(params["center"])
+            try:
+                terms.append(kind(**params))
+            except TypeError as e:
+                raise ValueError(f"Invalid {entry['type']} parameters: {e}") from e
+        return cls(terms)
+
+    @classmethod
+    def from_visual_parameters(cls, params) -> "ForceField":
+        """Maps VisualParameters (logenesis visual_schemas) onto a field.
+
+        flow_direction inward/outward becomes a radial pull/push, clockwise /
+        counterclockwise a vortex (as does a "vortex" base shape), both scaled by
+        energy_level; turbulence drives the curl noise amplitude.
+        """
+        specifics = params.visual_parameters
+        strength = FLOW_STRENGTH * (1.0 + params.energy_level)
+        flow = (specifics.flow_direction or "none").lower().replace("-", "").replace("_", "")
+        terms: List[Term] = []
+        if flow == "inward":
+            terms.append(Radial(-strength))
+        elif flow == "outward":
+            terms.append(Radial(strength))
+        elif flow == "clockwise":
+            terms.append(Vortex(strength))
+        elif flow in ("counterclockwise", "anticlockwise"):
+            terms.append(Vortex(-strength))
+        elif getattr(specifics.base_shape, "value", specifics.base_shape) == "vortex":
+            terms.append(Vortex(strength))
+        if specifics.turbulence > 0.0:
+            terms.append(CurlNoise(specifics.turbulence * TURBULENCE_STRENGTH))
+        return cls(terms)
@@ -0,0 +1,94 @@
+import logging
+import numpy as np
+
+logger = logging.getLogger("FormationAssignment")
+
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    logger.warning("SciPy not found. Exact formation assignment falls back to Hilbert matching.")
+
+# Above this size the O(N^3) Hungarian solver costs more than a frame budget
+EXACT_ASSIGNMENT_LIMIT = 256
+HILBERT_ORDER = 16
+
+ASSIGNMENT_METHODS = ("auto", "index", "hungarian", "hilbert")
+
+
+def hilbert_index(points: np.ndarray, order: int = HILBERT_ORDER) -> np.ndarray:
+    """Maps normalized (N, 2) points to their distance along a Hilbert curve.
+
+    Points that are close in space are (mostly) close along the curve, which
+    makes curve order a cheap proxy for spatial locality.
+    """
+    n = 1 << order
+    xy = np.clip(points, 0.0, 1.0) * (n - 1)
+    x = xy[:, 0].astype(np.int64)
+    y = xy[:, 1].astype(np.int64)
+    d = np.zeros(len(points), dtype=np.int64)
+
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx.astype(np.int64)) ^ ry.astype(np.int64))
+        # Rotate the quadrant so the curve stays continuous
+        flip = ~ry & rx
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        swap = ~ry
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+        s >>= 1
+    return d
+
+
+def assign_targets(current: np.ndarray, targets: np.ndarray, method: str = "auto") -> np.ndarray:
+    """Matches N current positions to N target points.
+
+    Args:
+        current: (N, 2) current particle positions.
+        targets: (N, 2) formation points.
+        method: "index" keeps point i -> particle i, "hungarian" minimizes the total
+            travel distance exactly (SciPy), "hilbert" pairs particles and points by
+            Hilbert-curve rank in O(N log N), "auto" picks hungarian up to
+            EXACT_ASSIGNMENT_LIMIT points and hilbert above.
+
+    Returns:
+        An index array `perm` such that particle i should move to targets[perm[i]].
+
+    Raises:
+        ValueError: On unknown method or mismatched lengths.
+    """
+    if method not in ASSIGNMENT_METHODS:
+        raise ValueError(f"Unknown assignment method: {method}")
+    if len(current) != len(targets):
+        raise ValueError("current and targets must have the same length")
+
+    n = len(targets)
+    if method == "auto":
+        method = "hungarian" if n <= EXACT_ASSIGNMENT_LIMIT else "hilbert"
+    if method == "hungarian" and not SCIPY_AVAILABLE:
+        method = "hilbert"
+
+    if method == "index" or n < 2:
+        return np.arange(n)
+
+    if method == "hungarian":
+        diff = current[:, None, :].astype(np.float64) - targets[None, :, :]
+        cost = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+        _, cols = linear_sum_assignment(cost)
+        return cols
+
+    # Hilbert rank matching: k-th particle along the curve takes the k-th point along the curve
+    particle_order = np.argsort(hilbert_index(current), kind="stable")
+    target_order = np.argsort(hilbert_index(targets), kind="stable")
+    perm = np.empty(n, dtype=np.intp)
+    perm[particle_order] = target_order
+    return perm
+
+
+def total_travel(current: np.ndarray, targets: np.ndarray, perm: np.ndarray) -> float:
+    """Sum of straight-line distances particle -> assigned target."""
+    return float(np.linalg.norm(targets[perm] - current, axis=1).sum())
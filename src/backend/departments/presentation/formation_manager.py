@@ -1,14 +1,84 @@
-import math
-import random
-from typing import List, Tuple, Optional
+from collections import OrderedDict
+from itertools import repeat
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from .color_pipeline import PACKED_DTYPE, parse_color
+from .shape_library import TEXT_PREFIX, Region, resolve_region, sample_region, shape_seed
+
+# Color hint of generated formations (a color_pipeline palette name)
+DEFAULT_COLOR_HINT = "default"
+
+Generator = Callable[[int, Tuple[float, float], float], np.ndarray]
+
+# Shared generator for scatter formations (creating one per call costs more than a 600-point scatter)
+_rng = np.random.default_rng()
+
+# Formation cache bounds: entries and total points held
+DEFAULT_CACHE_ENTRIES = 256
+DEFAULT_CACHE_POINTS = 2_000_000
+
+
+class FormationCache:
+    """LRU cache of read-only formation arrays, bounded by entry count and total points.
+
+    Arrays larger than the whole point budget are returned without being cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES, max_points: int = DEFAULT_CACHE_POINTS):
+        self.max_entries = max_entries
+        self.max_points = max_points
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._points = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], np.ndarray]) -> np.ndarray:
+        arr = self._entries.get(key)
+        if arr is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return arr
+
+        self.misses += 1
+        arr = build()
+        arr.flags.writeable = False
+        if len(arr) <= self.max_points:
+            self._entries[key] = arr
+            self._points += len(arr)
+            while len(self._entries) > self.max_entries or self._points > self.max_points:
+                _, evicted = self._entries.popitem(last=False)
+                self._points -= len(evicted)
+        return arr
+
+    def clear(self):
+        self._entries.clear()
+        self._points = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses,
+                "entries": len(self._entries), "points": self._points}
+
 
 class FormationManager:
     """Generates coordinate sets for particle formations.
 
     Coordinates are normalized (0.0 to 1.0) relative to the provided canvas dimensions,
     facilitating resolution-independent rendering on the frontend.
+
+    Every shape is center + scale * (unit shape), so unit shapes are cached per
+    (shape, count) and placed with an affine transform; array results are cached
+    per (shape, count, center, scale). Random scatters are only cached when seeded.
+
+    Besides the parametric outlines in SHAPES, the shape library (shape_library)
+    provides filled and line-art shapes (sphere, cube, cloud, cracks) and text
+    ("text:HELLO", rendered with a built-in bitmap font), blue-noise sampled for
+    even coverage. Their samples are seeded per shape, so they are cached too.
     """
 
+    cache = FormationCache()
+
     def calculate_formation(self, shape_type: str, particle_count: int, canvas_width: int, canvas_height: int) -> List[Tuple[float, float, str]]:
         """Calculates normalized particle coordinates for a given shape.
 
@@ -29,151 +99,182 @@ class FormationManager:
         return self.get_formation(shape_type, particle_count)
 
     @staticmethod
-    def get_formation(shape: str, count: int, center: Tuple[float, float] = (0.5, 0.5), scale: float = 0.3) -> List[Tuple[float, float, str]]:
+    def get_formation(shape: str, count: int, center: Tuple[float, float] = (0.5, 0.5), scale: float = 0.3,
+                      seed: Optional[int] = None) -> List[Tuple[float, float, str]]:
         """Generates formation coordinates based on shape name.
 
+        Compatibility adapter over get_formation_arrays() for callers (and the
+        protocol) that need a list of tuples.
+
         Args:
             shape: The name of the shape (case-insensitive).
             count: The number of particles.
             center: A tuple (x, y) for the center point. Defaults to (0.5, 0.5).
             scale: The scale of the formation relative to the canvas size. Defaults to 0.3.
+            seed: Seed for random shapes (scatter, library shapes); seeded scatters are
+                reproducible and cached. Library shapes default to a fixed per-shape seed.
 
         Returns:
             A list of (x, y, color_hint) tuples.
         """
-        shape = shape.lower().strip()
-        points = []
-
-        if shape == "circle" or shape == "ring":
-            points = FormationManager._circle(count, center, scale)
-        elif shape == "square" or shape == "box":
-            points = FormationManager._square(count, center, scale)
-        elif shape == "line" or shape == "horizontal":
-            points = FormationManager._line(count, center, scale)
-        elif shape == "vertical":
-            points = FormationManager._vertical_line(count, center, scale)
-        elif shape == "spiral" or shape == "vortex":
-            points = FormationManager._spiral(count, center, scale)
-        elif shape == "cross" or shape == "x":
-            points = FormationManager._cross(count, center, scale)
+        unit = FormationManager._unit_shape(shape, count, seed)
+        return FormationManager.to_tuples(unit * scale + center)
+
+    @staticmethod
+    def get_formation_arrays(shape: str, count: int, center: Tuple[float, float] = (0.5, 0.5),
+                             scale: float = 0.3, seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Generates a formation as arrays (see get_formation for the arguments).
+
+        Returns:
+            (count, 2) float32 coordinates and (count,) packed colors
+            (color_pipeline format), ready for LightControlLogic.manifest().
+            Both are read-only and may be shared with other callers.
+        """
+        name, generator = FormationManager._resolve(shape)
+        center = (float(center[0]), float(center[1]))
+        colors = FormationManager.cache.get(("colors", count), lambda: np.full(
+            count, parse_color(DEFAULT_COLOR_HINT), dtype=PACKED_DTYPE))
+
+        def build() -> np.ndarray:
+            unit = FormationManager._unit_shape(shape, count, seed)
+            return (unit * scale + center).astype(np.float32)
+
+        if generator is FormationManager._scatter and seed is None:
+            coords = build()
+        else:
+            coords = FormationManager.cache.get(
+                ("arrays", name, count, center, float(scale), seed), build)
+        return coords, colors
+
+    @staticmethod
+    def _unit_shape(shape: str, count: int, seed: Optional[int] = None) -> np.ndarray:
+        """(count, 2) float64 shape centered on the origin with scale 1 (cached)."""
+        name, generator = FormationManager._resolve(shape)
+        if generator is FormationManager._scatter and seed is None:
+            return generator(count, (0.0, 0.0), 1.0)
+        if seed is None or generator in SHAPES.values(): # Parametric shapes ignore the seed
+            return FormationManager.cache.get(
+                ("unit", name, count, None), lambda: generator(count, (0.0, 0.0), 1.0))
+        return FormationManager.cache.get(
+            ("unit", name, count, seed),
+            lambda: generator(count, (0.0, 0.0), 1.0, np.random.default_rng(seed)))
+
+    @staticmethod
+    def to_tuples(coords: np.ndarray, color_hint: str = DEFAULT_COLOR_HINT) -> List[Tuple[float, float, str]]:
+        """(N, 2) coordinates -> [(x, y, color_hint), ...] (LightIntent.formation_data format)."""
+        return list(zip(coords[:, 0].tolist(), coords[:, 1].tolist(), repeat(color_hint, len(coords))))
+
+    @staticmethod
+    def _resolve(shape: str) -> Tuple[str, Generator]:
+        """Canonical name (cache key) and generator of a shape."""
+        name = shape.strip()
+        if name[:len(TEXT_PREFIX)].lower() == TEXT_PREFIX:
+            name = TEXT_PREFIX + name[len(TEXT_PREFIX):].upper()
         else:
-            # Default to random scatter (Nebula)
-            points = FormationManager._scatter(count, center, scale)
+            name = name.lower()
+        generator = SHAPES.get(name)
+        if generator is not None:
+            return generator.__name__, generator
+        region = resolve_region(name)
+        if region is not None:
+            return name, FormationManager._sampler(name, region)
+        # Default to random scatter (Nebula)
+        return FormationManager._scatter.__name__, FormationManager._scatter
 
-        return points
+    @staticmethod
+    def _sampler(name: str, region: Region) -> Generator:
+        """Generator of blue-noise samples of a library region (per-shape seed by default)."""
+        def sample(count: int, center: Tuple[float, float], scale: float,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+            rng = np.random.default_rng(shape_seed(name)) if rng is None else rng
+            return sample_region(region, count, rng) * scale + center
+        return sample
 
     @staticmethod
-    def _circle(count: int, center: Tuple[float, float], scale: float) -> List[Tuple[float, float, str]]:
+    def _circle(count: int, center: Tuple[float, float], scale: float) -> np.ndarray:
         """Generates points arranged in a circle."""
-        cx, cy = center
-        points = []
-        for i in range(count):
-            angle = (i / count) * 2 * math.pi
-            x = cx + math.cos(angle) * scale
-            # Aspect ratio correction could be applied here if needed, but assuming square canvas for now
-            y = cy + math.sin(angle) * scale
-            points.append((x, y, "default"))
-        return points
+        angle = np.arange(count) * (2 * np.pi / count) if count else np.empty(0)
+        # Aspect ratio correction could be applied here if needed, but assuming square canvas for now
+        return np.stack([center[0] + np.cos(angle) * scale, center[1] + np.sin(angle) * scale], axis=1)
+
+    @staticmethod
+    def _ramp(count: int) -> np.ndarray:
+        """i / count for i in range(count)."""
+        return np.arange(count) / count if count else np.empty(0)
 
     @staticmethod
-    def _square(count: int, center: Tuple[float, float], scale: float) -> List[Tuple[float, float, str]]:
+    def _square(count: int, center: Tuple[float, float], scale: float) -> np.ndarray:
         """Generates points arranged in a square outline."""
         cx, cy = center
-        points = []
         side = scale * 2
         per_side = count // 4
-        # Top
-        for i in range(per_side):
-            x = cx - scale + (i / per_side) * side
-            y = cy - scale
-            points.append((x, y, "default"))
-        # Right
-        for i in range(per_side):
-            x = cx + scale
-            y = cy - scale + (i / per_side) * side
-            points.append((x, y, "default"))
-        # Bottom
-        for i in range(per_side):
-            x = cx + scale - (i / per_side) * side
-            y = cy + scale
-            points.append((x, y, "default"))
-        # Left
-        for i in range(count - 3 * per_side): # Remainder
-            x = cx - scale
-            y = cy + scale - (i / (count - 3 * per_side)) * side
-            points.append((x, y, "default"))
-        return points
+        t = FormationManager._ramp(per_side) * side
+        last = FormationManager._ramp(count - 3 * per_side) * side # Remainder
+        xs = np.concatenate([
+            cx - scale + t,                     # Top
+            np.full(per_side, cx + scale),      # Right
+            cx + scale - t,                     # Bottom
+            np.full(len(last), cx - scale),     # Left
+        ])
+        ys = np.concatenate([
+            np.full(per_side, cy - scale),
+            cy - scale + t,
+            np.full(per_side, cy + scale),
+            cy + scale - last,
+        ])
+        return np.stack([xs, ys], axis=1)
 
     @staticmethod
-    def _line(count: int, center: Tuple[float, float], scale: float) -> List[Tuple[float, float, str]]:
+    def _line(count: int, center: Tuple[float, float], scale: float) -> np.ndarray:
         """Generates points arranged in a horizontal line."""
-        cx, cy = center
-        points = []
-        start_x = cx - scale
-        width = scale * 2
-        for i in range(count):
-            x = start_x + (i / count) * width
-            y = cy
-            points.append((x, y, "default"))
-        return points
+        xs = center[0] - scale + FormationManager._ramp(count) * (scale * 2)
+        return np.stack([xs, np.full(count, float(center[1]))], axis=1)
 
     @staticmethod
-    def _vertical_line(count: int, center: Tuple[float, float], scale: float) -> List[Tuple[float, float, str]]:
+    def _vertical_line(count: int, center: Tuple[float, float], scale: float) -> np.ndarray:
         """Generates points arranged in a vertical line."""
-        cx, cy = center
-        points = []
-        start_y = cy - scale
-        height = scale * 2
-        for i in range(count):
-            x = cx
-            y = start_y + (i / count) * height
-            points.append((x, y, "default"))
-        return points
+        ys = center[1] - scale + FormationManager._ramp(count) * (scale * 2)
+        return np.stack([np.full(count, float(center[0])), ys], axis=1)
 
     @staticmethod
-    def _spiral(count: int, center: Tuple[float, float], scale: float) -> List[Tuple[float, float, str]]:
+    def _spiral(count: int, center: Tuple[float, float], scale: float) -> np.ndarray:
         """Generates points arranged in a spiral."""
-        cx, cy = center
-        points = []
         rotations = 3
-        for i in range(count):
-            progress = i / count
-            angle = progress * rotations * 2 * math.pi
-            radius = progress * scale
-            x = cx + math.cos(angle) * radius
-            y = cy + math.sin(angle) * radius
-            points.append((x, y, "default"))
-        return points
+        progress = FormationManager._ramp(count)
+        angle = progress * (rotations * 2 * np.pi)
+        radius = progress * scale
+        return np.stack([center[0] + np.cos(angle) * radius, center[1] + np.sin(angle) * radius], axis=1)
 
     @staticmethod
-    def _cross(count: int, center: Tuple[float, float], scale: float) -> List[Tuple[float, float, str]]:
+    def _cross(count: int, center: Tuple[float, float], scale: float) -> np.ndarray:
         """Generates points arranged in a cross (+)."""
-        cx, cy = center
-        points = []
         half = count // 2
-        # Horizontal
-        for i in range(half):
-            x = (cx - scale) + (i / half) * (scale * 2)
-            y = cy
-            points.append((x, y, "default"))
-        # Vertical
-        remainder = count - half
-        for i in range(remainder):
-            x = cx
-            y = (cy - scale) + (i / remainder) * (scale * 2)
-            points.append((x, y, "default"))
-        return points
+        horizontal = FormationManager._line(half, center, scale)
+        vertical = FormationManager._vertical_line(count - half, center, scale)
+        return np.concatenate([horizontal, vertical])
 
     @staticmethod
-    def _scatter(count: int, center: Tuple[float, float], scale: float) -> List[Tuple[float, float, str]]:
+    def _scatter(count: int, center: Tuple[float, float], scale: float,
+                 rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """Generates points scattered randomly within a circle."""
-        cx, cy = center
-        points = []
-        for _ in range(count):
-            # Random inside circle
-            angle = random.random() * 2 * math.pi
-            radius = math.sqrt(random.random()) * scale
-            x = cx + math.cos(angle) * radius
-            y = cy + math.sin(angle) * radius
-            points.append((x, y, "default"))
-        return points
+        rng = _rng if rng is None else rng
+        # Random inside circle (sqrt keeps the density uniform)
+        angle = rng.random(count) * (2 * np.pi)
+        radius = np.sqrt(rng.random(count)) * scale
+        return np.stack([center[0] + np.cos(angle) * radius, center[1] + np.sin(angle) * radius], axis=1)
+
+
+# Shape names (and aliases) -> generator
+SHAPES: Dict[str, Generator] = {
+    "circle": FormationManager._circle,
+    "ring": FormationManager._circle,
+    "square": FormationManager._square,
+    "box": FormationManager._square,
+    "line": FormationManager._line,
+    "horizontal": FormationManager._line,
+    "vertical": FormationManager._vertical_line,
+    "spiral": FormationManager._spiral,
+    "vortex": FormationManager._spiral,
+    "cross": FormationManager._cross,
+    "x": FormationManager._cross,
+}
@@ -1,12 +1,153 @@
+import hashlib
+import json
+import struct
 import time
-import uuid
+import zlib
 import numpy as np
-from typing import Dict, List, Deque, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from collections import deque
+from operator import itemgetter
 from .light_schemas import (
     LightIntent, LightInstruction, LightAction, LightEntity, LightState, PriorityLevel
 )
 from .formation_manager import FormationManager
+from .formation_assignment import assign_targets
+from .particle_interactions import interaction_forces
+from .force_fields import ForceField
+from .morph_tracks import MorphSettings, MorphTrack
+from .rate_limiter import TokenBucketLimiter
+from .entity_view import EntityView
+from .entity_arena import ARENA_CHUNK, ARENA_RESERVE, EntityArena
+from .color_pipeline import (
+    NO_COLOR, PACKED_DTYPE, ColorInput, display_rgba, ease_colors, packed_to_rgba, to_hex, to_packed
+)
+
+# Metabolic cost per action (deducted from system_energy)
+ENERGY_COSTS: Dict[LightAction, float] = {
+    LightAction.MOVE: 0.5,
+    LightAction.SPAWN: 2.0,
+    LightAction.ERASE: 0.2,
+    LightAction.EMPHASIZE: 0.1,
+    LightAction.MANIFEST: 5.0,
+    LightAction.ANSWER: 0.5,
+}
+
+MOVE_IMPULSE_SCALE = 0.05
+# Entities spawned by LCL itself have no stored string id; it is derived from the handle on demand
+AUTO_ID_PREFIX = "lc-"
+DEFAULT_SPAWN_REGION = (0.4, 0.4, 0.6, 0.6)
+DEFAULT_SPAWN_PROFILE = "natural_green"
+DEFAULT_CAPACITY = 10000
+
+# Capacity shrinks back (to twice the entity count, never below the initial capacity)
+# once occupancy has stayed under SHRINK_OCCUPANCY for SHRINK_AFTER_TICKS ticks.
+SHRINK_OCCUPANCY = 0.25
+SHRINK_AFTER_TICKS = 600
+
+
+# to_bytes() layout (zlib-compressed): uint32 meta length, JSON meta, then the
+# active rows of each array below in order.
+STATE_HEADER = struct.Struct("<I")
+STATE_ARRAYS: Tuple[Tuple[str, type, Tuple[int, ...]], ...] = (
+    ("_handles", np.uint32, ()),
+    ("_pos", np.float32, (2,)),
+    ("_vel", np.float32, (2,)),
+    ("_target_pos", np.float32, (2,)),
+    ("_has_target", np.bool_, ()),
+    ("_target_colors", PACKED_DTYPE, ()),
+    ("_color", np.float32, (4,)),
+    ("_color_vel", np.float32, (4,)),
+    ("_energy_levels", np.float32, ()),
+    ("_decay", np.float32, ()),
+    ("_history", np.float32, (10, 2)),
+)
+STATE_COMPRESSION_LEVEL = 1
+# Per-entity arrays, indexed by slot (see _resize and _remove_indices)
+ENTITY_ARRAYS = tuple(name for name, _, _ in STATE_ARRAYS)
+
+def formation_to_arrays(formation_data) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts [(x, y, color), ...] into an (N, 2) float32 array and packed colors (see color_pipeline)."""
+    n = len(formation_data)
+    coords = np.empty((n, 2), dtype=np.float32)
+    coords[:, 0] = np.fromiter(map(itemgetter(0), formation_data), dtype=np.float32, count=n)
+    coords[:, 1] = np.fromiter(map(itemgetter(1), formation_data), dtype=np.float32, count=n)
+    colors = to_packed(list(map(itemgetter(2), formation_data)))
+    return coords, colors
+
+def integrate(pos: np.ndarray, vel: np.ndarray, target_pos: np.ndarray, has_target: np.ndarray,
+              history: Optional[np.ndarray], dt: float, accel: Optional[np.ndarray] = None):
+    """
+    Advances particle arrays by dt seconds, in place.
+    Every step is per-particle, so arrays of several scenes can be concatenated
+    and integrated in one pass (see scene_host.SceneHost.tick).
+    `accel` is an optional (N, 2) extra acceleration (e.g. particle interactions).
+    `history` may be None if the caller records positions itself (see shift_history).
+    """
+    # 1. Formation Physics (Target Seeking) where has_target is True
+    # Vectorized conditional logic
+    if np.any(has_target):
+        # Proportional Control (Spring force)
+        k_p = 5.0
+        k_d = 0.5
+
+        tx = target_pos[has_target, 0]
+        ty = target_pos[has_target, 1]
+        x = pos[has_target, 0]
+        y = pos[has_target, 1]
+        vx = vel[has_target, 0]
+        vy = vel[has_target, 1]
+
+        dx = tx - x
+        dy = ty - y
+
+        fx = k_p * dx - k_d * vx
+        fy = k_p * dy - k_d * vy
+
+        vel[has_target, 0] += fx * dt
+        vel[has_target, 1] += fy * dt
+
+    # 1b. External acceleration
+    if accel is not None:
+        vel += accel * dt
+
+    # 2. Regular drift/friction where NO target
+    no_target = ~has_target
+    if np.any(no_target):
+        vel[no_target] *= 0.95
+
+    # 3. Integration
+    pos += vel * dt
+
+    # 4. Bounce/Clamp
+    # x < 0
+    mask_l = pos[:, 0] < 0
+    pos[mask_l, 0] = 0
+    vel[mask_l, 0] *= -0.8
+
+    # x > 1
+    mask_r = pos[:, 0] > 1
+    pos[mask_r, 0] = 1
+    vel[mask_r, 0] *= -0.8
+
+    # y < 0
+    mask_t = pos[:, 1] < 0
+    pos[mask_t, 1] = 0
+    vel[mask_t, 1] *= -0.8
+
+    # y > 1
+    mask_b = pos[:, 1] > 1
+    pos[mask_b, 1] = 1
+    vel[mask_b, 1] *= -0.8
+
+    # 5. History Update
+    if history is not None:
+        shift_history(history, pos)
+
+def shift_history(history: np.ndarray, pos: np.ndarray):
+    # Shift history: (N, 10, 2)
+    # old: [0, 1, 2, 3] -> new: [1, 2, 3, new]
+    history[:, :-1, :] = history[:, 1:, :]
+    history[:, -1, :] = pos
 
 class LightControlLogic:
     """
@@ -15,26 +156,47 @@ class LightControlLogic:
     Must be deterministic.
     """
 
-    def __init__(self):
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
         # Gatekeeper State
-        self.last_intent_time: Dict[str, float] = {}
-        self.intent_timestamps: Dict[str, Deque[float]] = {} # Sliding window for rate limit
-        self.RATE_LIMIT = 5.0 # intents per second per source
-        self.WINDOW_SIZE = 1.0 # seconds
+        # Token bucket per source: RATE_LIMIT intents per WINDOW_SIZE seconds, burst RATE_LIMIT.
+        # Per-priority overrides go in self.rate_limiter.priority_limits.
+        self.rate_limiter = TokenBucketLimiter(rate=5.0, burst=5.0)
+        self.last_activity: float = 0.0 # Time of the last admitted intent (energy regeneration)
+        # Source of "now" for gatekeeping and regeneration; replaced by lcl_replay for determinism
+        self.clock: Callable[[], float] = time.time
 
         # Physics State (NumPy)
-        # Initial capacity
-        self._capacity = 10000
+        # Initial capacity (grows geometrically, see _ensure_capacity)
+        self._capacity = capacity
+        self._min_capacity = capacity # Floor for shrinking (see _maybe_shrink)
+        self._low_occupancy_ticks = 0
         self._count = 0
 
         # Arrays
-        self._ids = np.empty(self._capacity, dtype=object)
+        self._arena: Optional[EntityArena] = None # Backing store once capacity exceeds ARENA_CHUNK
+        # Stable numeric handle per entity (survives swap-removal; used by the binary codec)
+        self._handles = np.zeros(self._capacity, dtype=np.uint32)
+        self._next_handle = 1
+        # Reverse index: slot of handle h is _slots[h - _slot_base] (-1 once removed), so
+        # auto ids resolve in O(1); the window is rebased past dead handles as it grows
+        self._slot_base = 1
+        self._slots = np.full(self._capacity, -1, dtype=np.int32)
         self._pos = np.zeros((self._capacity, 2), dtype=np.float32)
         self._vel = np.zeros((self._capacity, 2), dtype=np.float32)
         self._target_pos = np.zeros((self._capacity, 2), dtype=np.float32)
         self._has_target = np.zeros(self._capacity, dtype=bool)
-        self._target_colors = np.empty(self._capacity, dtype=object) # Can be None
+        # Colors (see color_pipeline): packed RGBA target (NO_COLOR = none) and the displayed
+        # float RGBA color easing towards it with its own velocity
+        self._target_colors = np.zeros(self._capacity, dtype=PACKED_DTYPE)
+        self._color = np.zeros((self._capacity, 4), dtype=np.float32)
+        self._color_vel = np.zeros((self._capacity, 4), dtype=np.float32)
+        self._colors_moving = False # Any color still easing (skip ease_colors when settled)
         self._energy_levels = np.ones(self._capacity, dtype=np.float32)
+        # Energy lost per second; entities whose energy runs out are removed in tick()
+        self._decay = np.zeros(self._capacity, dtype=np.float32)
+        self._mortal = False # Any entity with a non-zero decay (skip decay when none)
+        # Decay of spawned entities when the SPAWN intent has none (e.g. PhysicsParams.decay_rate)
+        self.default_decay = 0.0
 
         # History: Circular buffer? Or just list of tuples for compatibility?
         # Implementing efficient history in numpy is tricky if it needs to match List[Tuple].
@@ -46,11 +208,31 @@ class LightControlLogic:
         self._history_idx = 0 # Ring buffer index for all? No, they shift.
         # Shift approach: array[:, :-1] = array[:, 1:]; array[:, -1] = new_pos
 
+        # Explicit ids only (see _index_of): id -> slot and slot -> id
         self._id_map: Dict[str, int] = {}
+        self._explicit_ids: Dict[int, str] = {}
 
         self.system_energy: float = 100.0
         self.MAX_ENERGY = 100.0
 
+        # Formation target matching (see formation_assignment.assign_targets)
+        self.assignment_method = "auto"
+
+        # Particle-particle separation/cohesion (cell list, see particle_interactions)
+        self.interactions_enabled = False
+        self.interaction_radius = 0.02
+        self.separation_strength = 1.0
+        self.cohesion_strength = 0.0
+
+        # External forces (vortex, attractors, noise flow...), see force_fields.ForceField
+        self.force_field: Optional[ForceField] = None
+        self._field_time = 0.0 # Seconds the field has been applied (animates the noise)
+
+        # Formation changes: with morph settings, manifest() plans a MorphTrack that moves
+        # entities 0..N-1 to their targets instead of releasing them onto the springs
+        self.morph: Optional[MorphSettings] = None
+        self._track: Optional[MorphTrack] = None
+
         # Metrics
         self.metrics = {
             "latency": deque(maxlen=100),
@@ -61,40 +243,29 @@ class LightControlLogic:
     def entities(self) -> Dict[str, LightEntity]:
         """
         Reconstructs dictionary view of entities from NumPy state.
-        This is expensive and should only be used for snapshots/serialization.
+        This is expensive and should only be used for snapshots/serialization;
+        use view() to page, filter or project without building every model.
         """
-        result = {}
-        active_ids = self._ids[:self._count]
-        active_pos = self._pos[:self._count]
-        active_vel = self._vel[:self._count]
-        active_energy = self._energy_levels[:self._count]
-        active_history = self._history[:self._count]
-        active_target_pos = self._target_pos[:self._count]
-        active_has_target = self._has_target[:self._count]
-        active_target_colors = self._target_colors[:self._count]
-
-        for i, eid in enumerate(active_ids):
-            # Convert history numpy array to list of tuples
-            hist = [tuple(h) for h in active_history[i] if not (h[0] == 0 and h[1] == 0)]
-            # Note: 0,0 check is naive, but history is init with 0s.
-            # Ideally we'd track length. For now, just dumping the whole buffer or non-zero.
-            # Actually, let's just return the last 10 points.
-            hist = [tuple(p) for p in active_history[i]]
-
-            entity = LightEntity(
-                id=str(eid),
-                position=tuple(active_pos[i]),
-                velocity=tuple(active_vel[i]),
-                energy=float(active_energy[i]),
-                history=hist
-            )
-            if active_has_target[i]:
-                entity.target_position = tuple(active_target_pos[i])
-            if active_target_colors[i] is not None:
-                entity.target_color = active_target_colors[i]
-
-            result[str(eid)] = entity
-        return result
+        return self.view().to_entities()
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> EntityView:
+        """Lazy view over entities [start:stop] (see entity_view.EntityView)."""
+        return EntityView(self, start, stop)
+
+    def _entity_at(self, idx: int) -> LightEntity:
+        entity = LightEntity(
+            id=self._entity_id(idx),
+            position=tuple(self._pos[idx].tolist()),
+            velocity=tuple(self._vel[idx].tolist()),
+            energy=float(self._energy_levels[idx]),
+            # Last 10 positions (buffer starts zero-filled)
+            history=[tuple(p) for p in self._history[idx].tolist()]
+        )
+        if self._has_target[idx]:
+            entity.target_position = tuple(self._target_pos[idx].tolist())
+        if self._target_colors[idx] != NO_COLOR:
+            entity.target_color = to_hex(self._target_colors[idx:idx + 1])[0]
+        return entity
 
     @entities.setter
     def entities(self, value: Dict[str, LightEntity]):
@@ -105,23 +276,163 @@ class LightControlLogic:
         for eid, ent in value.items():
             self._add_entity(eid, ent.position, ent.velocity, ent.energy, ent.target_position, ent.target_color)
 
+    @property
+    def morphing(self) -> int:
+        """Number of entities (slots 0..n-1) currently following a morph track."""
+        return 0 if self._track is None else len(self._track)
+
+    def frame_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the active (handles, positions, velocities, colors) arrays, colors being the
+        displayed (N, 4) uint8 RGBA. Cheap alternative to `entities` for streaming (see lcl_codec).
+        Callers must not keep the views across process()/tick() calls.
+        """
+        count = self._count
+        return (
+            self._handles[:count],
+            self._pos[:count],
+            self._vel[:count],
+            display_rgba(self._color[:count])
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes entities and scalar state into a compact compressed blob (see from_bytes).
+        Rate-limit buckets and latency samples are not kept: an idle limiter is equivalent
+        to a fresh one.
+        """
+        return zlib.compress(self._state_payload(), STATE_COMPRESSION_LEVEL)
+
+    def state_digest(self) -> str:
+        """SHA-256 of the serialized state; equal digests mean identical simulations."""
+        return hashlib.sha256(self._state_payload()).hexdigest()
+
+    def _state_payload(self) -> bytes:
+        count = self._count
+        meta = {
+            "count": count,
+            "next_handle": self._next_handle,
+            "ids": {str(i): self._explicit_ids[i] for i in sorted(self._explicit_ids)},
+            "system_energy": self.system_energy,
+            "max_energy": self.MAX_ENERGY,
+            "last_activity": self.last_activity,
+            "assignment_method": self.assignment_method,
+            "interactions": [self.interactions_enabled, self.interaction_radius,
+                             self.separation_strength, self.cohesion_strength],
+            "intent_count": self.metrics["intent_count"],
+            "force_field": None if self.force_field is None else [self.force_field.to_spec(), self._field_time],
+            "morph": None if self.morph is None else self.morph.to_spec(),
+            # Active track: settings, elapsed time and length; its start positions and
+            # delays follow the entity arrays (the end positions are the targets)
+            "track": None if self._track is None else [
+                self._track.settings.to_spec(), self._track.elapsed, len(self._track)],
+        }
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        parts = [STATE_HEADER.pack(len(meta_bytes)), meta_bytes]
+        parts.extend(getattr(self, name)[:count].tobytes() for name, _, _ in STATE_ARRAYS)
+        if self._track is not None:
+            parts.extend([self._track.start.tobytes(), self._track.delays.tobytes()])
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes, capacity: int = 0) -> "LightControlLogic":
+        """
+        Restores a LightControlLogic serialized with to_bytes().
+        The arrays are sized to max(entity count, capacity).
+
+        Raises:
+            ValueError: If the blob is corrupt or truncated.
+        """
+        try:
+            data = zlib.decompress(blob)
+            (meta_len,) = STATE_HEADER.unpack_from(data)
+            offset = STATE_HEADER.size
+            meta = json.loads(data[offset:offset + meta_len])
+        except (zlib.error, struct.error, ValueError) as e:
+            raise ValueError(f"Invalid LCL state blob: {e}") from e
+        offset += meta_len
+
+        count = meta["count"]
+        lcl = cls(capacity=max(count, capacity))
+        lcl._min_capacity = capacity or DEFAULT_CAPACITY
+        for name, dtype, shape in STATE_ARRAYS:
+            rows = np.frombuffer(data, dtype=dtype, count=count * int(np.prod(shape)), offset=offset)
+            getattr(lcl, name)[:count] = rows.reshape((count,) + shape)
+            offset += rows.nbytes
+        if meta["track"] is not None:
+            spec, elapsed, n = meta["track"]
+            start = np.frombuffer(data, dtype=np.float32, count=2 * n, offset=offset).reshape(n, 2)
+            offset += start.nbytes
+            delays = np.frombuffer(data, dtype=np.float32, count=n, offset=offset)
+            offset += delays.nbytes
+            lcl._track = MorphTrack(start, lcl._target_pos[:n], delays, MorphSettings.from_spec(spec), elapsed)
+        if offset != len(data):
+            raise ValueError("Invalid LCL state blob: size mismatch")
+
+        for i, eid in meta["ids"].items():
+            lcl._explicit_ids[int(i)] = eid
+            lcl._id_map[eid] = int(i)
+        lcl._count = count
+        lcl._next_handle = meta["next_handle"]
+        lcl._rebuild_slots()
+        lcl.system_energy = meta["system_energy"]
+        lcl.MAX_ENERGY = meta["max_energy"]
+        lcl.last_activity = meta["last_activity"]
+        lcl.assignment_method = meta["assignment_method"]
+        (lcl.interactions_enabled, lcl.interaction_radius,
+         lcl.separation_strength, lcl.cohesion_strength) = meta["interactions"]
+        lcl.metrics["intent_count"] = meta["intent_count"]
+        if meta["force_field"] is not None:
+            spec, lcl._field_time = meta["force_field"]
+            lcl.force_field = ForceField.from_spec(spec)
+        if meta["morph"] is not None:
+            lcl.morph = MorphSettings.from_spec(meta["morph"])
+        lcl._mortal = bool(np.any(lcl._decay[:count]))
+        lcl._colors_moving = bool(np.any(lcl._color_vel[:count]) or np.any(
+            packed_to_rgba(lcl._target_colors[:count]) != lcl._color[:count]))
+        return lcl
+
     def _ensure_capacity(self, needed: int):
         if self._count + needed > self._capacity:
             new_cap = max(self._capacity * 2, self._count + needed)
             self._resize(new_cap)
 
     def _resize(self, new_cap: int):
-        # Resize all arrays
-        self._ids = np.resize(self._ids, new_cap)
-        self._pos = np.resize(self._pos, (new_cap, 2))
-        self._vel = np.resize(self._vel, (new_cap, 2))
-        self._target_pos = np.resize(self._target_pos, (new_cap, 2))
-        self._has_target = np.resize(self._has_target, new_cap)
-        self._target_colors = np.resize(self._target_colors, new_cap)
-        self._energy_levels = np.resize(self._energy_levels, new_cap)
-        self._history = np.resize(self._history, (new_cap, 10, 2))
+        """
+        Grows or truncates all arrays; rows past _count are free slots.
+        Small scenes reallocate. Past ARENA_CHUNK entities the arrays live in an
+        EntityArena, where growing is free (no row is copied, so there is no frame
+        spike at large N) and shrinking returns whole chunks to the OS.
+        """
+        arena = self._arena
+        if new_cap > ARENA_CHUNK:
+            if arena is None or new_cap > arena.reserve:
+                arena = EntityArena(STATE_ARRAYS, max(ARENA_RESERVE, 2 * new_cap))
+                count = self._count
+                for name in ENTITY_ARRAYS:
+                    arena.view(name, count)[...] = getattr(self, name)[:count]
+                self._arena = arena
+            elif new_cap < self._capacity:
+                arena.release(new_cap, self._capacity)
+            for name in ENTITY_ARRAYS:
+                setattr(self, name, arena.view(name, new_cap))
+        else:
+            for name in ENTITY_ARRAYS:
+                arr = getattr(self, name)
+                setattr(self, name, np.resize(arr, (new_cap,) + arr.shape[1:]))
+            self._arena = None
         self._capacity = new_cap
 
+    def _maybe_shrink(self):
+        """Releases memory after a spawn burst once occupancy has stayed low for a while."""
+        if self._capacity > self._min_capacity and self._count < self._capacity * SHRINK_OCCUPANCY:
+            self._low_occupancy_ticks += 1
+            if self._low_occupancy_ticks >= SHRINK_AFTER_TICKS:
+                self._resize(max(self._min_capacity, 2 * self._count))
+                self._low_occupancy_ticks = 0
+        else:
+            self._low_occupancy_ticks = 0
+
     def _add_entity(self, eid: str, pos, vel, energy, target_pos=None, target_color=None):
         if eid in self._id_map:
             return # Already exists
@@ -129,10 +440,12 @@ class LightControlLogic:
         self._ensure_capacity(1)
         idx = self._count
 
-        self._ids[idx] = eid
+        self._explicit_ids[idx] = eid
+        self._assign_handles(idx, 1)
         self._pos[idx] = pos
         self._vel[idx] = vel
         self._energy_levels[idx] = energy
+        self._decay[idx] = 0.0
 
         if target_pos:
             self._target_pos[idx] = target_pos
@@ -140,7 +453,7 @@ class LightControlLogic:
         else:
             self._has_target[idx] = False
 
-        self._target_colors[idx] = target_color
+        self._set_colors(idx, idx + 1, target_color)
         # Init history with current pos
         self._history[idx] = np.zeros((10, 2)) # Clear
         self._history[idx, -1] = pos # Set last to current
@@ -148,52 +461,206 @@ class LightControlLogic:
         self._id_map[eid] = idx
         self._count += 1
 
+    def spawn_many(self, count: int, positions, velocities=None, energy: float = 1.0,
+                   target_positions=None, target_colors=None, decay=0.0) -> np.ndarray:
+        """
+        Bulk spawn: fills `count` array slots with slice writes.
+        `positions`/`velocities`/`target_positions` are (count, 2) arrays or a single (x, y)
+        broadcast to all; `target_colors` is anything color_pipeline.to_packed accepts
+        (hex string, palette name, packed or RGBA array, sequence of strings).
+        `decay` (scalar or (count,) array) is the energy lost per second; 0 lives forever.
+        Slots freed by removals are reused, so steady spawning does not reallocate.
+        Entities get auto ids (see _entity_id), nothing is inserted into _id_map.
+        Returns the handles of the new entities.
+        """
+        if count <= 0:
+            return np.empty(0, dtype=np.uint32)
+        self._ensure_capacity(count)
+        start = self._count
+        end = start + count
+
+        handles = self._assign_handles(start, count)
+        self._pos[start:end] = positions
+        self._vel[start:end] = 0.0 if velocities is None else velocities
+        self._energy_levels[start:end] = energy
+        self._decay[start:end] = decay
+        if not self._mortal:
+            self._mortal = bool(np.any(self._decay[start:end]))
+        if target_positions is None:
+            self._has_target[start:end] = False
+        else:
+            self._target_pos[start:end] = target_positions
+            self._has_target[start:end] = True
+        self._set_colors(start, end, target_colors)
+        self._history[start:end] = 0.0
+        self._history[start:end, -1] = self._pos[start:end]
+
+        self._count = end
+        return handles
+
+    def _assign_handles(self, start: int, count: int) -> np.ndarray:
+        """Gives slots start..start+count-1 the next `count` handles and indexes them."""
+        if self._next_handle + count - self._slot_base > len(self._slots):
+            self._rebuild_slots(count)
+        offset = self._next_handle - self._slot_base
+        handles = np.arange(self._next_handle, self._next_handle + count, dtype=np.uint32)
+        self._next_handle += count
+        self._handles[start:start + count] = handles
+        self._slots[offset:offset + count] = np.arange(start, start + count, dtype=np.int32)
+        return handles
+
+    def _rebuild_slots(self, reserve: int = 0):
+        """
+        Rebuilds the handle -> slot index from _handles, based at the oldest live handle
+        and with room for twice the live handle range plus `reserve` new handles.
+        """
+        live = self._handles[:self._count].astype(np.int64)
+        self._slot_base = int(live.min()) if len(live) else self._next_handle
+        size = max(self._capacity, 2 * (self._next_handle + reserve - self._slot_base))
+        self._slots = np.full(size, -1, dtype=np.int32)
+        self._slots[live - self._slot_base] = np.arange(len(live))
+
+    def _set_colors(self, start: int, end: int, target_colors: ColorInput):
+        # New entities appear directly in their target color
+        packed = to_packed(target_colors)
+        self._target_colors[start:end] = packed
+        self._color[start:end] = packed_to_rgba(self._target_colors[start:end])
+        self._color_vel[start:end] = 0.0
+
+    @staticmethod
+    def _auto_id(handle) -> str:
+        return f"{AUTO_ID_PREFIX}{int(handle)}"
+
+    def _entity_id(self, idx: int) -> str:
+        eid = self._explicit_ids.get(idx)
+        return eid if eid is not None else self._auto_id(self._handles[idx])
+
+    def _index_of(self, eid: Optional[str]) -> Optional[int]:
+        """Resolves an entity id (explicit or auto) to its current array index."""
+        if not eid:
+            return None
+        idx = self._id_map.get(eid)
+        if idx is not None:
+            return idx
+        if eid.startswith(AUTO_ID_PREFIX):
+            try:
+                handle = int(eid[len(AUTO_ID_PREFIX):])
+            except ValueError:
+                return None
+            offset = handle - self._slot_base
+            if 0 <= offset < len(self._slots):
+                idx = int(self._slots[offset])
+                if idx >= 0 and idx not in self._explicit_ids:
+                    return idx
+        return None
+
     def _remove_entity_by_index(self, idx: int):
+        if self._track is not None and idx < len(self._track):
+            self._track = None
         last_idx = self._count - 1
-        eid_to_remove = self._ids[idx]
+        eid_to_remove = self._explicit_ids.pop(idx, None)
+        self._slots[int(self._handles[idx]) - self._slot_base] = -1
 
         if idx != last_idx:
             # Swap with last
-            last_eid = self._ids[last_idx]
-
-            self._ids[idx] = self._ids[last_idx]
-            self._pos[idx] = self._pos[last_idx]
-            self._vel[idx] = self._vel[last_idx]
-            self._target_pos[idx] = self._target_pos[last_idx]
-            self._has_target[idx] = self._has_target[last_idx]
-            self._target_colors[idx] = self._target_colors[last_idx]
-            self._energy_levels[idx] = self._energy_levels[last_idx]
-            self._history[idx] = self._history[last_idx]
+            last_eid = self._explicit_ids.pop(last_idx, None)
 
-            self._id_map[last_eid] = idx
+            for name in ENTITY_ARRAYS:
+                arr = getattr(self, name)
+                arr[idx] = arr[last_idx]
+            self._slots[int(self._handles[idx]) - self._slot_base] = idx
 
-        # Clear last (optional, helps GC)
-        self._ids[last_idx] = None
-        self._target_colors[last_idx] = None
+            if last_eid is not None:
+                self._explicit_ids[idx] = last_eid
+                self._id_map[last_eid] = idx
 
-        del self._id_map[eid_to_remove]
+        if eid_to_remove is not None:
+            del self._id_map[eid_to_remove]
         self._count -= 1
 
+    def _remove_indices(self, indices: np.ndarray):
+        """
+        Bulk swap-removal: surviving entities from the tail fill the holes, so the cost
+        is proportional to the number removed and the other entities keep their slots.
+        The vacated tail rows become free slots reused by the next spawns.
+        """
+        count = self._count
+        if len(indices) == 0:
+            return
+        dead = np.zeros(count, dtype=bool)
+        dead[indices] = True
+        new_count = count - int(np.count_nonzero(dead))
+        if self._track is not None and dead[:len(self._track)].any():
+            # Holes in the tracked slots get refilled by other entities; the rest
+            # finish the transition on their springs
+            self._track = None
+
+        holes = np.flatnonzero(dead[:new_count])
+        movers = new_count + np.flatnonzero(~dead[new_count:])
+        self._slots[self._handles[:count][dead].astype(np.int64) - self._slot_base] = -1
+        for name in ENTITY_ARRAYS:
+            arr = getattr(self, name)
+            arr[holes] = arr[movers]
+        self._slots[self._handles[holes].astype(np.int64) - self._slot_base] = holes
+
+        if self._explicit_ids:
+            for idx in [i for i in self._explicit_ids if dead[i]]:
+                del self._id_map[self._explicit_ids.pop(idx)]
+            moved = [i for i in self._explicit_ids if i >= new_count]
+            targets = holes[np.searchsorted(movers, moved)].tolist() if moved else []
+            for old, new in zip(moved, targets):
+                eid = self._explicit_ids.pop(old)
+                self._explicit_ids[new] = eid
+                self._id_map[eid] = new
+
+        self._count = new_count
+
+    def _expire(self, dt: float):
+        """Applies energy decay, removes entities whose energy ran out, then maybe shrinks."""
+        if self._mortal:
+            count = self._count
+            energy = self._energy_levels[:count]
+            decay = self._decay[:count]
+            energy -= decay * np.float32(dt)
+            dead = np.flatnonzero((energy <= 0.0) & (decay > 0.0))
+            if len(dead):
+                self._remove_indices(dead)
+                self._mortal = bool(np.any(self._decay[:self._count]))
+        self._maybe_shrink()
+
     def _clear_entities(self):
+        self._slots[self._handles[:self._count].astype(np.int64) - self._slot_base] = -1
         self._count = 0
+        self._track = None
         self._id_map.clear()
-        # Arrays remain allocated but logically empty
+        self._explicit_ids.clear()
+        self._mortal = False
+        # Arrays remain allocated but logically empty (see _maybe_shrink)
 
-    def _check_rate_limit(self, source: str) -> bool:
-        if source not in self.intent_timestamps:
-            self.intent_timestamps[source] = deque()
+    @property
+    def RATE_LIMIT(self) -> float:
+        """Default intents allowed per WINDOW_SIZE seconds per source."""
+        return self.rate_limiter.default_limit[1]
 
-        now = time.time()
-        timestamps = self.intent_timestamps[source]
+    @RATE_LIMIT.setter
+    def RATE_LIMIT(self, value: float):
+        self.rate_limiter.default_limit = (value / self.WINDOW_SIZE, value)
 
-        while timestamps and timestamps[0] < now - self.WINDOW_SIZE:
-            timestamps.popleft()
+    @property
+    def WINDOW_SIZE(self) -> float:
+        rate, burst = self.rate_limiter.default_limit
+        return burst / rate
 
-        if len(timestamps) >= self.RATE_LIMIT:
-            return False
+    @WINDOW_SIZE.setter
+    def WINDOW_SIZE(self, value: float):
+        burst = self.RATE_LIMIT
+        self.rate_limiter.default_limit = (burst / value, burst)
 
-        timestamps.append(now)
-        return True
+    def _check_rate_limit(self, source: str, now: Optional[float] = None,
+                          priority: int = PriorityLevel.USER) -> bool:
+        if now is None:
+            now = self.clock()
+        return self.rate_limiter.allow(source, now, priority)
 
     def _check_priority(self, intent: LightIntent) -> bool:
         if intent.priority < PriorityLevel.AMBIENT:
@@ -215,14 +682,7 @@ class LightControlLogic:
         return intent
 
     def _deduct_energy(self, action: LightAction) -> bool:
-        cost = 0.0
-        if action == LightAction.MOVE: cost = 0.5
-        elif action == LightAction.SPAWN: cost = 2.0
-        elif action == LightAction.ERASE: cost = 0.2
-        elif action == LightAction.EMPHASIZE: cost = 0.1
-        elif action == LightAction.MANIFEST: cost = 5.0
-        elif action == LightAction.ANSWER: cost = 0.5
-
+        cost = ENERGY_COSTS.get(action, 0.0)
         if self.system_energy >= cost:
             self.system_energy -= cost
             return True
@@ -238,42 +698,168 @@ class LightControlLogic:
 
         return instruction
 
-    def _process_internal(self, intent: LightIntent) -> Optional[LightInstruction]:
-        if not self._check_rate_limit(intent.source):
-            return None
+    def process_batch(self, intents: List[LightIntent]) -> List[Optional[LightInstruction]]:
+        """
+        Processes a burst of intents with the same outcome as calling process() on each
+        in order, but with the per-intent overhead amortized:
+        one clock read per batch, gatekeeping in a single pass, consecutive SPAWNs
+        appended with one array write and consecutive MOVE impulses summed per target.
+        ERASE/MANIFEST rewrite entity state, so they act as barriers and run through the
+        scalar path; EMPHASIZE/ANSWER do not touch entities and are executed in place.
+
+        Returns one entry per intent (None where rejected), in input order.
+        """
+        start_time = time.time()
+        now = self.clock()
+        results: List[Optional[LightInstruction]] = [None] * len(intents)
+        spawns = []  # (result_index, intent)
+        moves = []   # (result_index, intent, spawns queued before it, target index)
+
+        for i, intent in enumerate(intents):
+            if not self._admit(intent, now):
+                continue
+            if intent.action == LightAction.SPAWN:
+                spawns.append((i, intent))
+            elif intent.action == LightAction.MOVE:
+                # Resolved now, so an entity spawned later in the batch is not a target yet
+                moves.append((i, intent, len(spawns), self._queued_index_of(intent.target, len(spawns))))
+            elif intent.action in (LightAction.EMPHASIZE, LightAction.ANSWER):
+                results[i] = self._execute(intent)
+            else:
+                self._flush_spawns_and_moves(spawns, moves, results)
+                spawns, moves = [], []
+                results[i] = self._execute(intent)
+        self._flush_spawns_and_moves(spawns, moves, results)
+
+        if intents:
+            latency = (time.time() - start_time) * 1000 / len(intents)
+            self.metrics["latency"].append(latency)
+            self.metrics["intent_count"] += len(intents)
+
+        return results
+
+    def _flush_spawns_and_moves(self, spawns, moves, results: List[Optional[LightInstruction]]):
+        base = self._count
+
+        if spawns:
+            regions = np.array([it.region or DEFAULT_SPAWN_REGION for _, it in spawns], dtype=np.float32)
+            pos = np.empty((len(spawns), 2), dtype=np.float32)
+            pos[:, 0] = (regions[:, 0] + regions[:, 2]) / 2
+            pos[:, 1] = (regions[:, 1] + regions[:, 3]) / 2
+            colors = to_packed([it.color_hint or DEFAULT_SPAWN_PROFILE for _, it in spawns])
+            decay = np.array([self._spawn_decay(it) for _, it in spawns], dtype=np.float32)
+            handles = self.spawn_many(len(spawns), pos, target_colors=colors, decay=decay)
+
+            for (i, it), handle in zip(spawns, handles):
+                results[i] = LightInstruction(
+                    intent=LightAction.SPAWN,
+                    target=self._auto_id(handle),
+                    region=it.region,
+                    color_profile=it.color_hint or DEFAULT_SPAWN_PROFILE,
+                    decay=it.decay,
+                    shape="organic"
+                )
+
+        if moves:
+            global_limits, global_impulses = [], []
+            target_indices, target_impulses = [], []
+            for i, it, spawned_before, idx in moves:
+                vec = it.vector or (0.0, 0.0)
+                strength = it.intensity if it.intensity is not None else 1.0
+                impulse = (vec[0] * strength * MOVE_IMPULSE_SCALE, vec[1] * strength * MOVE_IMPULSE_SCALE)
+
+                if idx is not None:
+                    target_indices.append(idx)
+                    target_impulses.append(impulse)
+                elif not it.target or it.target == "GLOBAL":
+                    # A global MOVE only reaches entities that existed when it was issued
+                    global_limits.append(base + spawned_before)
+                    global_impulses.append(impulse)
+
+                results[i] = LightInstruction(
+                    intent=LightAction.MOVE,
+                    target=it.target,
+                    vector=vec,
+                    strength=strength
+                )
+
+            if target_indices or global_limits:
+                self._track = None # See _execute (MOVE)
+            if target_indices:
+                idx = np.array(target_indices)
+                self._has_target[idx] = False
+                np.add.at(self._vel, idx, np.array(target_impulses, dtype=np.float32))
+
+            if global_limits:
+                limits = np.array(global_limits)
+                top = int(limits.max())
+                acc = np.zeros((top + 1, 2), dtype=np.float64)
+                np.add.at(acc, limits, np.array(global_impulses))
+                # Entity i receives every impulse whose limit is > i (reverse cumulative sum)
+                per_entity = np.cumsum(acc[::-1], axis=0)[::-1][1:]
+                self._has_target[:top] = False
+                self._vel[:top] += per_entity.astype(np.float32)
+
+    def _queued_index_of(self, eid: Optional[str], pending: int) -> Optional[int]:
+        """
+        Like _index_of, with the `pending` spawns queued by process_batch counted as present:
+        they will take the next handles and the slots after the current entities.
+        """
+        idx = self._index_of(eid)
+        if idx is None and pending and eid and eid.startswith(AUTO_ID_PREFIX):
+            try:
+                offset = int(eid[len(AUTO_ID_PREFIX):]) - self._next_handle
+            except ValueError:
+                return None
+            if 0 <= offset < pending:
+                return self._count + offset
+        return idx
+
+    def _spawn_decay(self, intent: LightIntent) -> float:
+        return intent.decay if intent.decay is not None else self.default_decay
+
+    def _admit(self, intent: LightIntent, now: Optional[float] = None) -> bool:
+        """Gatekeeper: rate limit, priority, harmony clamp and energy deduction."""
+        if now is None:
+            now = self.clock()
+
+        if not self._check_rate_limit(intent.source, now, intent.priority):
+            return False
 
         if not self._check_priority(intent):
-            return None
+            return False
 
-        intent = self._check_harmony(intent)
+        self._check_harmony(intent)
 
         if not self._deduct_energy(intent.action):
-            if intent.action == LightAction.SPAWN:
-                return None
-            return None
+            return False
+
+        self.last_activity = now
+        return True
 
-        self.last_intent_time[intent.source] = time.time()
+    def _process_internal(self, intent: LightIntent) -> Optional[LightInstruction]:
+        if not self._admit(intent):
+            return None
+        return self._execute(intent)
 
+    def _execute(self, intent: LightIntent) -> Optional[LightInstruction]:
         instruction = None
 
         if intent.action == LightAction.SPAWN:
-            entity_id = str(uuid.uuid4())
-            region = intent.region or (0.4, 0.4, 0.6, 0.6)
+            region = intent.region or DEFAULT_SPAWN_REGION
             x = (region[0] + region[2]) / 2
             y = (region[1] + region[3]) / 2
 
-            self._add_entity(
-                eid=entity_id,
-                pos=(x, y),
-                vel=(0.0, 0.0),
-                energy=1.0
-            )
+            handles = self.spawn_many(1, (x, y), target_colors=intent.color_hint or DEFAULT_SPAWN_PROFILE,
+                                      decay=self._spawn_decay(intent))
+            entity_id = self._auto_id(handles[0])
 
             instruction = LightInstruction(
                 intent=LightAction.SPAWN,
                 target=entity_id,
                 region=intent.region,
-                color_profile=intent.color_hint or "natural_green",
+                color_profile=intent.color_hint or DEFAULT_SPAWN_PROFILE,
+                decay=intent.decay,
                 shape="organic"
             )
 
@@ -282,13 +868,16 @@ class LightControlLogic:
             strength = intent.intensity if intent.intensity is not None else 1.0
 
             indices = []
-            if intent.target and intent.target in self._id_map:
-                indices = [self._id_map[intent.target]]
+            target_idx = self._index_of(intent.target)
+            if target_idx is not None:
+                indices = [target_idx]
             elif not intent.target or intent.target == "GLOBAL":
                 indices = range(self._count) # All
 
             if indices:
                 # Use slicing if indices is range
+                # A pushed entity leaves its morph track (the others fall back to springs)
+                self._track = None
                 if isinstance(indices, range):
                     count = indices.stop
                     # Break locks
@@ -297,18 +886,16 @@ class LightControlLogic:
                     vx = self._vel[:count, 0]
                     vy = self._vel[:count, 1]
 
-                    impulse_scale = 0.05
-                    self._vel[:count, 0] = vx + vec[0] * strength * impulse_scale
-                    self._vel[:count, 1] = vy + vec[1] * strength * impulse_scale
+                    self._vel[:count, 0] = vx + vec[0] * strength * MOVE_IMPULSE_SCALE
+                    self._vel[:count, 1] = vy + vec[1] * strength * MOVE_IMPULSE_SCALE
                 else:
                     # Specific list
                     for idx in indices:
                         self._has_target[idx] = False
                         vx, vy = self._vel[idx]
-                        impulse_scale = 0.05
                         self._vel[idx] = (
-                            vx + vec[0] * strength * impulse_scale,
-                            vy + vec[1] * strength * impulse_scale
+                            vx + vec[0] * strength * MOVE_IMPULSE_SCALE,
+                            vy + vec[1] * strength * MOVE_IMPULSE_SCALE
                         )
 
             instruction = LightInstruction(
@@ -326,29 +913,7 @@ class LightControlLogic:
                 py = self._pos[:self._count, 1]
 
                 mask = (px >= r[0]) & (px <= r[2]) & (py >= r[1]) & (py <= r[3])
-
-                # Deletion while iterating is tricky.
-                # It's better to gather IDs to remove, or sort indices descending and remove.
-                # Vectorized removal:
-                # Actually, filtering might be easier: create new arrays?
-                # But swapping is O(1) per remove.
-                # If removing many, rebuilding might be faster.
-                # Let's iterate backwards.
-                indices_to_remove = np.where(mask)[0]
-                # Sort descending to remove without affecting other indices (except via swap)
-                # Swap removal changes indices, so simple iteration doesn't work if indices change.
-                # Wait, if we swap with last, the last one moves.
-                # We should use ids to be safe or be very careful.
-                # Simplest for now: loop and use _remove_entity_by_index carefully?
-                # No, standard swap-remove loop is:
-                i = 0
-                while i < self._count:
-                    px, py = self._pos[i]
-                    if r[0] <= px <= r[2] and r[1] <= py <= r[3]:
-                        self._remove_entity_by_index(i)
-                        # Don't increment i, as new element is at i
-                    else:
-                        i += 1
+                self._remove_indices(np.flatnonzero(mask))
             else:
                 self._clear_entities()
 
@@ -373,132 +938,94 @@ class LightControlLogic:
             if not intent.formation_data and intent.shape_name:
                 count = self._count if self._count > 0 else 50
                 count = max(count, 30)
-                intent.formation_data = FormationManager.get_formation(intent.shape_name, count)
-
-            if intent.formation_data:
-                target_count = len(intent.formation_data)
-
-                # Spawn if needed
-                if self._count < target_count:
-                    needed = target_count - self._count
-                    self._ensure_capacity(needed)
-                    # Bulk spawn?
-                    # For now, loop spawn is fine
-                    for _ in range(needed):
-                        eid = str(uuid.uuid4())
-                        self._add_entity(eid, (0.5, 0.5), (0.0, 0.0), 1.0)
-
-                # Assign targets
-                # Vectorized assignment?
-                # We iterate through formation data and assign to existing indices 0..N
-
-                # Prepare arrays for bulk update
-                # Only update up to min(count, target_count)
-                limit = min(self._count, target_count)
-
-                # Extract formation data
-                formation_arr = np.array(intent.formation_data, dtype=object) # (N, 3)
-                # Separate coords and colors
-                # formation_data is [(x, y, color), ...]
-
-                # This unpacking might be slow if list is huge, but usually < 10k
-                coords = np.array([f[:2] for f in intent.formation_data[:limit]])
-                colors = [f[2] for f in intent.formation_data[:limit]]
-
-                self._target_pos[:limit] = coords
-                self._has_target[:limit] = True
-                self._target_colors[:limit] = colors
+                coords, colors = FormationManager.get_formation_arrays(intent.shape_name, count)
+                # The instruction still carries the points for the client
+                intent.formation_data = FormationManager.to_tuples(coords)
+                track = self.manifest(coords, colors)
+            elif intent.formation_data:
+                coords, colors = formation_to_arrays(intent.formation_data)
+                track = self.manifest(coords, colors)
+            else:
+                track = None
 
-            instruction = LightInstruction(
+            # formation_data was already validated on the intent; skip re-validating every point
+            instruction = LightInstruction.model_construct(
                 intent=LightAction.MANIFEST,
                 text_content=intent.text_content,
-                formation_data=intent.formation_data
+                formation_data=intent.formation_data,
+                morph=None if track is None else track.params(self._handles[:len(track)])
             )
 
         return instruction
 
-    def tick(self, dt: float) -> LightState:
+    def manifest(self, coords: np.ndarray, colors: ColorInput = None,
+                 morph: Optional[MorphSettings] = None) -> Optional[MorphTrack]:
+        """
+        Locks entities onto a formation given as an (N, 2) float array of targets.
+        `colors` is a single color or N colors in any form color_pipeline.to_packed
+        accepts, e.g. the RGBA array of ImageProcessor.process_image_to_arrays.
+        Displayed colors ease towards the new targets during tick().
+        Missing entities are bulk-spawned at the center. Entities 0..N-1 take the formation;
+        which point each one gets is decided by `assignment_method` so particles travel
+        as little as possible instead of crossing the screen.
+        With morph settings (`morph`, else self.morph) the entities follow a precomputed
+        MorphTrack to their targets, which is returned; otherwise the springs pull them.
+        """
+        target_count = len(coords)
+        if self._count < target_count:
+            self.spawn_many(target_count - self._count, (0.5, 0.5))
+
+        perm = assign_targets(self._pos[:target_count], coords, self.assignment_method)
+        colors = to_packed(colors)
+        if isinstance(colors, np.ndarray) and colors.shape == (target_count,):
+            colors = colors[perm]
+
+        self._target_pos[:target_count] = coords[perm]
+        self._has_target[:target_count] = True
+        self._target_colors[:target_count] = colors
+        self._colors_moving = True
+
+        morph = morph or self.morph
+        self._track = None if morph is None else MorphTrack.plan(
+            self._pos[:target_count], np.asarray(coords, dtype=np.float32), perm, morph)
+        return self._track
+
+    def tick(self, dt: float, interactions: Optional[bool] = None) -> LightState:
+        """
+        Advances physics by dt seconds.
+        `interactions` overrides `interactions_enabled` for this tick.
+        """
         count = self._count
         if count == 0:
+            self._maybe_shrink()
             return LightState(entities={}, system_energy=self.system_energy)
 
-        # Slice active arrays
-        pos = self._pos[:count]
-        vel = self._vel[:count]
-        has_target = self._has_target[:count]
-        target_pos = self._target_pos[:count]
-
-        # 1. Formation Physics (Target Seeking) where has_target is True
-        # Vectorized conditional logic
-
-        # Calculate forces for all, mask later? Or calculate only for masked?
-        # Calculating for all is often faster due to contiguous memory, if mask is dense.
-        # But if sparse, indexing is better. Let's assume mixed.
-
-        # Indices with targets
-        target_indices = has_target
-
-        if np.any(target_indices):
-            # Proportional Control (Spring force)
-            k_p = 5.0
-            k_d = 0.5
-
-            tx = target_pos[target_indices, 0]
-            ty = target_pos[target_indices, 1]
-            x = pos[target_indices, 0]
-            y = pos[target_indices, 1]
-            vx = vel[target_indices, 0]
-            vy = vel[target_indices, 1]
-
-            dx = tx - x
-            dy = ty - y
-
-            fx = k_p * dx - k_d * vx
-            fy = k_p * dy - k_d * vy
-
-            vel[target_indices, 0] += fx * dt
-            vel[target_indices, 1] += fy * dt
-
-        # 2. Regular drift/friction where NO target
-        no_target_indices = ~target_indices
-        if np.any(no_target_indices):
-            vel[no_target_indices] *= 0.95
-
-        # 3. Integration
-        pos += vel * dt
-
-        # 4. Bounce/Clamp
-        # x < 0
-        mask_l = pos[:, 0] < 0
-        pos[mask_l, 0] = 0
-        vel[mask_l, 0] *= -0.8
-
-        # x > 1
-        mask_r = pos[:, 0] > 1
-        pos[mask_r, 0] = 1
-        vel[mask_r, 0] *= -0.8
-
-        # y < 0
-        mask_t = pos[:, 1] < 0
-        pos[mask_t, 1] = 0
-        vel[mask_t, 1] *= -0.8
-
-        # y > 1
-        mask_b = pos[:, 1] > 1
-        pos[mask_b, 1] = 1
-        vel[mask_b, 1] *= -0.8
-
-        # 5. History Update
-        # Shift history: (N, 10, 2)
-        # old: [0, 1, 2, 3] -> new: [1, 2, 3, new]
-        hist = self._history[:count]
-        hist[:, :-1, :] = hist[:, 1:, :]
-        hist[:, -1, :] = pos
+        # Entities 0..tracked-1 follow the morph track, the rest are integrated
+        tracked = self._advance_track(dt)
+        pos = self._pos[tracked:count]
+        accel = None
+        # Particle-particle separation/cohesion (keeps formations from collapsing into points)
+        if interactions is None:
+            interactions = self.interactions_enabled
+        if interactions and len(pos):
+            accel = interaction_forces(
+                self._pos[:count], self.interaction_radius, self.separation_strength, self.cohesion_strength
+            )[tracked:]
+        if self.force_field:
+            if len(pos):
+                field_accel = self.force_field.accel(pos, self._field_time)
+                accel = field_accel if accel is None else accel + field_accel
+            self._field_time += dt
+
+        integrate(pos, self._vel[tracked:count], self._target_pos[tracked:count], self._has_target[tracked:count],
+                  self._history[tracked:count], dt, accel)
+        if self._colors_moving:
+            self._colors_moving = ease_colors(
+                self._color[:count], self._color_vel[:count], self._target_colors[:count], dt
+            )
+        self._expire(dt)
 
-        # Energy Regeneration
-        last_activity = max(self.last_intent_time.values()) if self.last_intent_time else 0
-        if time.time() - last_activity > 1.0:
-            self.system_energy = min(self.MAX_ENERGY, self.system_energy + 5.0 * dt)
+        self._regenerate(dt, self.clock())
 
         # Return State
         # Performance Note: We return an empty entities dict to avoid
@@ -509,6 +1036,36 @@ class LightControlLogic:
             system_energy=self.system_energy
         )
 
+    def _advance_track(self, dt: float) -> int:
+        """Moves the tracked entities along the morph track; returns how many there are."""
+        track = self._track
+        if track is None:
+            return 0
+        n = len(track)
+        track.elapsed += dt
+        if track.done:
+            # Land exactly on the targets and hand over to the (now idle) springs
+            self._pos[:n] = self._target_pos[:n]
+            self._vel[:n] = 0.0
+            self._track = None
+        else:
+            pos = track.sample(track.elapsed)
+            if dt > 0:
+                np.subtract(pos, self._pos[:n], out=self._vel[:n])
+                self._vel[:n] /= np.float32(dt)
+            self._pos[:n] = pos
+        shift_history(self._history[:n], self._pos[:n])
+        return n
+
+    def apply_visual_parameters(self, params):
+        """Drives the force field from logenesis VisualParameters (flow_direction, turbulence)."""
+        self.force_field = ForceField.from_visual_parameters(params)
+
+    def _regenerate(self, dt: float, now: float):
+        # Energy Regeneration
+        if now - self.last_activity > 1.0:
+            self.system_energy = min(self.MAX_ENERGY, self.system_energy + 5.0 * dt)
+
     def get_metrics(self) -> Dict:
         avg_latency = sum(self.metrics["latency"]) / len(self.metrics["latency"]) if self.metrics["latency"] else 0.0
         return {
@@ -0,0 +1,378 @@
+import argparse
+import json
+import struct
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from .lcl import LightControlLogic
+from .light_schemas import LightAction, LightIntent, LightInstruction
+
+# Session File Format:
+#
+# File header (uncompressed, 8 bytes):
+#   magic    4s  b"LCLR"
+#   version  B
+#   reserved 3x
+#
+# Followed by one zlib stream of records, each starting with a kind byte:
+#   REC_STATE       I len, LightControlLogic.to_bytes() blob, I len, limiter state JSON
+#   REC_INTENT      d t, I len, LightIntent JSON (as received, plus the formation_data a
+#                   shape_name MANIFEST resolved to: random shapes are not reproducible)
+#   REC_BATCH       d t, I len, JSON array of LightIntent
+#   REC_TICK        d t, d dt, b interactions (-1 = default, 0 = off, 1 = on)
+#   REC_CHECKPOINT  32s SHA-256 state digest after the preceding tick
+#   REC_END         32s SHA-256 final state digest
+#
+# `t` is the clock value the LCL saw during the call (see LightControlLogic.clock), which
+# is all it takes for the replay to reproduce rate limiting and energy regeneration.
+FILE_HEADER = struct.Struct("<4sB3x")
+MAGIC = b"LCLR"
+VERSION = 3 # 2: per-entity decay in the state blob, 3: morph tracks
+
+REC_STATE = 0
+REC_INTENT = 1
+REC_BATCH = 2
+REC_TICK = 3
+REC_CHECKPOINT = 4
+REC_END = 5
+
+_KIND = struct.Struct("<B")
+_LEN = struct.Struct("<I")
+_TIMED = struct.Struct("<dI")
+_TICK = struct.Struct("<ddb")
+_DIGEST = struct.Struct("<32s")
+
+DEFAULT_CHECKPOINT_EVERY = 600 # ticks (10 s at 60 fps)
+SESSION_COMPRESSION_LEVEL = 1
+
+_INTENT_LIST = TypeAdapter(List[LightIntent])
+
+
+def _intent_json(intent: LightIntent) -> bytes:
+    return intent.model_dump_json(exclude_defaults=True).encode("utf-8")
+
+
+def _resolves_shape(intent: LightIntent) -> bool:
+    """Whether the LCL will generate this intent's formation from its shape_name."""
+    return intent.action == LightAction.MANIFEST and bool(intent.shape_name) and not intent.formation_data
+
+
+def _recorded_json(payload: bytes, resolved: LightIntent) -> bytes:
+    """The intent as received (`payload`) with the formation the LCL resolved its shape_name to."""
+    if not resolved.formation_data:
+        return payload # Rejected by the gatekeeper
+    recorded = LightIntent.model_validate_json(payload)
+    recorded.formation_data = resolved.formation_data
+    return _intent_json(recorded)
+
+
+class SessionRecorder:
+    """Records the intents and ticks applied to a LightControlLogic into a session file.
+
+    All calls must go through the recorder (process / process_batch / tick) for the
+    session to replay deterministically:
+
+        with SessionRecorder(lcl, "session.lclr") as rec:
+            rec.process(intent)
+            rec.tick(0.016)
+    """
+
+    def __init__(self, lcl: LightControlLogic, target: Union[str, BinaryIO],
+                 checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY):
+        """Starts recording from the current state of `lcl`.
+
+        Args:
+            lcl: The scene to record.
+            target: File path or binary stream to write to.
+            checkpoint_every: Store a state digest every this many ticks (0 disables).
+        """
+        self.lcl = lcl
+        self.checkpoint_every = checkpoint_every
+        self._owns_stream = isinstance(target, str)
+        self._stream: BinaryIO = open(target, "wb") if self._owns_stream else target
+        self._zip = zlib.compressobj(SESSION_COMPRESSION_LEVEL)
+        self._ticks = 0
+        self.closed = False
+
+        # The LCL reads the recorded timestamp while inside a recorded call
+        self._real_clock: Callable[[], float] = lcl.clock
+        self._now: Optional[float] = None
+        lcl.clock = self._clock
+
+        self._stream.write(FILE_HEADER.pack(MAGIC, VERSION))
+        state = lcl.to_bytes()
+        limiter = json.dumps(lcl.rate_limiter.get_state(), separators=(",", ":")).encode("utf-8")
+        self._write(_KIND.pack(REC_STATE), _LEN.pack(len(state)), state, _LEN.pack(len(limiter)), limiter)
+
+    def _clock(self) -> float:
+        return self._now if self._now is not None else self._real_clock()
+
+    def _write(self, *parts: bytes):
+        for part in parts:
+            self._stream.write(self._zip.compress(part))
+
+    def process(self, intent: LightIntent) -> Optional[LightInstruction]:
+        self._now = self._real_clock()
+        payload = _intent_json(intent) # Before processing: the gatekeeper may clamp the intent
+        resolves = _resolves_shape(intent)
+        try:
+            return self.lcl.process(intent)
+        finally:
+            if resolves:
+                payload = _recorded_json(payload, intent)
+            self._write(_KIND.pack(REC_INTENT), _TIMED.pack(self._now, len(payload)), payload)
+            self._now = None
+
+    def process_batch(self, intents: List[LightIntent]) -> List[Optional[LightInstruction]]:
+        self._now = self._real_clock()
+        payloads = [_intent_json(intent) for intent in intents]
+        resolves = [i for i, intent in enumerate(intents) if _resolves_shape(intent)]
+        try:
+            return self.lcl.process_batch(intents)
+        finally:
+            for i in resolves:
+                payloads[i] = _recorded_json(payloads[i], intents[i])
+            payload = b"[" + b",".join(payloads) + b"]"
+            self._write(_KIND.pack(REC_BATCH), _TIMED.pack(self._now, len(payload)), payload)
+            self._now = None
+
+    def tick(self, dt: float, interactions: Optional[bool] = None):
+        self._now = self._real_clock()
+        flag = -1 if interactions is None else int(interactions)
+        self._write(_KIND.pack(REC_TICK), _TICK.pack(self._now, dt, flag))
+        try:
+            state = self.lcl.tick(dt, interactions)
+        finally:
+            self._now = None
+        self._ticks += 1
+        if self.checkpoint_every and self._ticks % self.checkpoint_every == 0:
+            self._write(_KIND.pack(REC_CHECKPOINT), _DIGEST.pack(bytes.fromhex(self.lcl.state_digest())))
+        return state
+
+    def close(self) -> str:
+        """Writes the final state digest, restores the LCL clock and returns the digest."""
+        if self.closed:
+            return ""
+        digest = self.lcl.state_digest()
+        self._write(_KIND.pack(REC_END), _DIGEST.pack(bytes.fromhex(digest)))
+        self._stream.write(self._zip.flush())
+        if self._owns_stream:
+            self._stream.close()
+        self.lcl.clock = self._real_clock
+        self.closed = True
+        return digest
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass
+class RecordedSession:
+    state: bytes
+    limiter_state: Dict
+    # (kind, t, payload): payload is a LightIntent, a list of them, (dt, interactions) or a digest
+    records: List[Tuple[int, float, object]]
+    final_digest: Optional[str] = None
+
+    @property
+    def intent_count(self) -> int:
+        return sum(1 if kind == REC_INTENT else len(payload)
+                   for kind, _, payload in self.records if kind in (REC_INTENT, REC_BATCH))
+
+    @property
+    def tick_count(self) -> int:
+        return sum(1 for kind, _, _ in self.records if kind == REC_TICK)
+
+
+def load_session(source: Union[str, bytes]) -> RecordedSession:
+    """Parses a session file (path or raw bytes) fully into memory.
+
+    Raises:
+        ValueError: If the data is not a valid session.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            source = f.read()
+    if len(source) < FILE_HEADER.size:
+        raise ValueError("Session too short")
+    magic, version = FILE_HEADER.unpack_from(source)
+    if magic != MAGIC:
+        raise ValueError(f"Bad magic: {magic!r}")
+    if version != VERSION:
+        raise ValueError(f"Unsupported session version: {version}")
+    try:
+        data = zlib.decompress(source[FILE_HEADER.size:])
+    except zlib.error as e:
+        raise ValueError(f"Corrupt session: {e}") from e
+
+    session = None
+    records: List[Tuple[int, float, object]] = []
+    offset = 0
+    try:
+        while offset < len(data):
+            (kind,) = _KIND.unpack_from(data, offset)
+            offset += _KIND.size
+            if kind in (REC_INTENT, REC_BATCH):
+                t, length = _TIMED.unpack_from(data, offset)
+                offset += _TIMED.size
+                payload = data[offset:offset + length]
+                offset += length
+                if kind == REC_INTENT:
+                    records.append((kind, t, LightIntent.model_validate_json(payload)))
+                else:
+                    records.append((kind, t, _INTENT_LIST.validate_json(payload)))
+            elif kind == REC_TICK:
+                t, dt, flag = _TICK.unpack_from(data, offset)
+                offset += _TICK.size
+                records.append((kind, t, (dt, None if flag < 0 else bool(flag))))
+            elif kind in (REC_CHECKPOINT, REC_END):
+                (digest,) = _DIGEST.unpack_from(data, offset)
+                offset += _DIGEST.size
+                if kind == REC_END:
+                    session.final_digest = digest.hex()
+                else:
+                    records.append((kind, 0.0, digest.hex()))
+            elif kind == REC_STATE:
+                (length,) = _LEN.unpack_from(data, offset)
+                offset += _LEN.size
+                state = data[offset:offset + length]
+                offset += length
+                (length,) = _LEN.unpack_from(data, offset)
+                offset += _LEN.size
+                limiter = json.loads(data[offset:offset + length])
+                offset += length
+                session = RecordedSession(state, limiter, records)
+            else:
+                raise ValueError(f"Unknown record kind {kind} at offset {offset - 1}")
+    except (struct.error, AttributeError) as e:
+        raise ValueError(f"Corrupt session at offset {offset}: {e}") from e
+
+    if session is None:
+        raise ValueError("Session has no initial state")
+    return session
+
+
+@dataclass
+class PhaseTiming:
+    calls: int
+    total_ms: float
+    mean_us: float
+    p99_us: float
+    max_us: float
+
+    @classmethod
+    def from_samples(cls, samples: List[float]) -> "PhaseTiming":
+        if not samples:
+            return cls(0, 0.0, 0.0, 0.0, 0.0)
+        arr = np.array(samples) * 1e6
+        return cls(len(samples), float(arr.sum()) / 1000.0, float(arr.mean()),
+                   float(np.percentile(arr, 99)), float(arr.max()))
+
+
+@dataclass
+class ReplayReport:
+    intents: int
+    ticks: int
+    wall_ms: float
+    phases: Dict[str, PhaseTiming]
+    final_digest: str
+    expected_digest: Optional[str]
+    checkpoints_checked: int = 0
+    # Tick number after which the first checkpoint mismatched (None if all matched)
+    first_divergence: Optional[int] = None
+    lcl: Optional[LightControlLogic] = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.first_divergence is None and self.final_digest == self.expected_digest
+
+
+def replay(source: Union[str, bytes, RecordedSession], check: bool = True) -> ReplayReport:
+    """Re-executes a recorded session headlessly, as fast as possible.
+
+    Per-phase timing covers only the LCL calls; checkpoint hashing is excluded.
+    With `check=False` checkpoints are skipped entirely (pure timing run).
+    """
+    session = source if isinstance(source, RecordedSession) else load_session(source)
+    lcl = LightControlLogic.from_bytes(session.state)
+    lcl.rate_limiter.set_state(session.limiter_state)
+    now = [0.0]
+    lcl.clock = lambda: now[0]
+
+    samples: Dict[str, List[float]] = {"process": [], "process_batch": [], "tick": []}
+    perf = time.perf_counter
+    ticks = 0
+    checked = 0
+    divergence = None
+
+    wall_start = perf()
+    for kind, t, payload in session.records:
+        if kind == REC_TICK:
+            now[0] = t
+            dt, interactions = payload
+            t0 = perf()
+            lcl.tick(dt, interactions)
+            samples["tick"].append(perf() - t0)
+            ticks += 1
+        elif kind == REC_INTENT:
+            now[0] = t
+            intent = payload.model_copy() # The gatekeeper clamps intents in place
+            t0 = perf()
+            lcl.process(intent)
+            samples["process"].append(perf() - t0)
+        elif kind == REC_BATCH:
+            now[0] = t
+            intents = [intent.model_copy() for intent in payload]
+            t0 = perf()
+            lcl.process_batch(intents)
+            samples["process_batch"].append(perf() - t0)
+        elif kind == REC_CHECKPOINT and check:
+            checked += 1
+            if divergence is None and lcl.state_digest() != payload:
+                divergence = ticks
+    wall_ms = (perf() - wall_start) * 1000.0
+
+    return ReplayReport(
+        intents=session.intent_count,
+        ticks=ticks,
+        wall_ms=wall_ms,
+        phases={name: PhaseTiming.from_samples(s) for name, s in samples.items()},
+        final_digest=lcl.state_digest(),
+        expected_digest=session.final_digest,
+        checkpoints_checked=checked,
+        first_divergence=divergence,
+        lcl=lcl,
+    )
+
+
+def format_report(report: ReplayReport) -> str:
+    lines = [f"Replayed {report.intents} intents and {report.ticks} ticks in {report.wall_ms:.1f} ms"]
+    for name, phase in report.phases.items():
+        if phase.calls:
+            lines.append(f"  {name:<14} calls {phase.calls:>7} | total {phase.total_ms:9.2f} ms | "
+                         f"mean {phase.mean_us:8.1f} us | p99 {phase.p99_us:8.1f} us | max {phase.max_us:8.1f} us")
+    if report.first_divergence is not None:
+        lines.append(f"  DIVERGED: first checkpoint mismatch after tick {report.first_divergence}")
+    status = "OK" if report.ok else "MISMATCH"
+    lines.append(f"  Final state {status} ({report.checkpoints_checked} checkpoints checked)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded LCL session and verify determinism")
+    parser.add_argument("session", help="Path to a .lclr session file")
+    parser.add_argument("--no-check", action="store_true", help="Skip checkpoint digests (timing only)")
+    args = parser.parse_args()
+
+    result = replay(args.session, check=not args.no_check)
+    print(format_report(result))
+    sys.exit(0 if result.ok or args.no_check else 1)
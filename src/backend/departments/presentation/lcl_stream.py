@@ -0,0 +1,119 @@
+import asyncio
+import json
+import logging
+from typing import Any, Optional
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from .lcl import LightControlLogic
+from .lcl_codec import DeltaEncoder, FRAME_DELTA, HEADER_SIZE
+from .light_schemas import LightIntent
+
+logger = logging.getLogger("LightStream")
+
+# LCL State Stream Protocol (one WebSocket per client, see gunui/light_testbed.html):
+#
+# Server -> client:
+#   binary   an lcl_codec frame every FRAME_INTERVAL: a keyframe until the client has
+#            acknowledged one, then deltas against the newest acknowledged frame
+#            (deltas that would carry nothing are not sent)
+#   text     the LightInstruction JSON of each processed intent, or
+#            {"type": "INTENT_REJECTED", "action": ...} when the gatekeeper refused it
+#
+# Client -> server (JSON text):
+#   {"type": "ACK_FRAME", "frame_id": n}       frame n was applied (DeltaEncoder.ack)
+#   {"type": "LIGHT_INTENT", "intent": {...}}   a LightIntent for the scene
+#   {"type": "RESYNC"}                          the client lost its state: send a keyframe
+FRAME_INTERVAL = 1 / 30
+
+
+class LightStream:
+    """One client's binary view of a LightControlLogic scene."""
+
+    def __init__(self, lcl: Optional[LightControlLogic] = None, encoder: Optional[DeltaEncoder] = None):
+        self.lcl = lcl if lcl is not None else LightControlLogic()
+        self.encoder = encoder if encoder is not None else DeltaEncoder()
+
+    def frame(self, dt: float) -> Optional[bytes]:
+        """Advances the scene by dt seconds and encodes it.
+
+        Returns:
+            The frame, or None for a delta with nothing in it.
+        """
+        if dt > 0:
+            self.lcl.tick(dt)
+        data = self.encoder.encode(self.lcl)
+        if len(data) == HEADER_SIZE and data[5] == FRAME_DELTA:
+            return None
+        return data
+
+    def handle(self, msg: Any) -> Optional[str]:
+        """Applies a client message (see the protocol above).
+
+        Returns:
+            The JSON text to send back, if any.
+
+        Raises:
+            ValueError: If the message is malformed (e.g. not a JSON object) or of an unknown type.
+        """
+        if not isinstance(msg, dict):
+            raise ValueError(f"Expected a JSON object, got {type(msg).__name__}")
+        kind = msg.get("type")
+        if kind == "ACK_FRAME":
+            try:
+                frame_id = int(msg["frame_id"])
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Bad ACK_FRAME: {e}") from e
+            self.encoder.ack(frame_id)
+            return None
+        if kind == "RESYNC":
+            self.encoder.reset()
+            return None
+        if kind == "LIGHT_INTENT":
+            intent = LightIntent.model_validate(msg.get("intent")) # ValidationError is a ValueError
+            instruction = self.lcl.process(intent)
+            if instruction is None:
+                return json.dumps({"type": "INTENT_REJECTED", "action": intent.action.value})
+            return instruction.model_dump_json(exclude_none=True)
+        raise ValueError(f"Unknown message type: {kind!r}")
+
+
+async def serve_light_stream(websocket: WebSocket, stream: Optional[LightStream] = None,
+                             frame_interval: float = FRAME_INTERVAL):
+    """Streams a scene to one WebSocket client until it disconnects.
+
+    Frames are sent from a background task every `frame_interval` seconds while
+    this coroutine handles the client's messages.
+    """
+    await websocket.accept()
+    stream = stream if stream is not None else LightStream()
+    loop = asyncio.get_running_loop()
+    sending = asyncio.Lock()
+
+    async def pump():
+        last = loop.time()
+        while True:
+            now = loop.time()
+            data = stream.frame(now - last)
+            last = now
+            if data is not None:
+                async with sending:
+                    await websocket.send_bytes(data)
+            await asyncio.sleep(frame_interval)
+
+    sender = asyncio.ensure_future(pump())
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                reply = stream.handle(json.loads(raw))
+            except ValueError as e:
+                logger.warning(f"Ignoring LCL stream message: {e}")
+                continue
+            if reply is not None:
+                async with sending:
+                    await websocket.send_text(reply)
+    except WebSocketDisconnect:
+        logger.info("LCL stream client disconnected")
+    finally:
+        sender.cancel()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Tuple, List, Dict
+from typing import Any, Optional, Tuple, List, Dict
 from enum import Enum, IntEnum
 
 class LightAction(str, Enum):
@@ -58,6 +58,9 @@ class LightInstruction(BaseModel):
     text_content: Optional[str] = None
     # Added to carry calculated points to the client
     formation_data: Optional[List[Tuple[float, float, str]]] = None
+    # Morph track parameters for MANIFEST, so the client can animate the transition
+    # itself: MorphSettings fields plus "handles" (entity per formation point)
+    morph: Optional[Dict[str, Any]] = None
 
 class LightEntity(BaseModel):
     id: str
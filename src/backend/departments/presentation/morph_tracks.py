@@ -0,0 +1,139 @@
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+# Resolution of the precomputed easing curves (samples over 0..1)
+EASING_SAMPLES = 1024
+_BACK = 1.70158 # Overshoot of "back_out" (~10%)
+
+EASINGS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "linear": lambda u: u,
+    "ease_in": lambda u: u ** 3,
+    "ease_out": lambda u: 1 - (1 - u) ** 3,
+    "ease_in_out": lambda u: np.where(u < 0.5, 4 * u ** 3, 1 - (2 - 2 * u) ** 3 / 2),
+    "back_out": lambda u: 1 + (_BACK + 1) * (u - 1) ** 3 + _BACK * (u - 1) ** 2,
+}
+
+# How the stagger delay is spread over the points of the target formation:
+# none (all together), sequential (formation order), radial (from the formation
+# centroid outwards) and random (seeded)
+STAGGER_ORDERS = ("none", "sequential", "radial", "random")
+
+
+@lru_cache(maxsize=None)
+def easing_table(name: str) -> np.ndarray:
+    """(EASING_SAMPLES + 1,) float32 samples of an easing curve over 0..1."""
+    return np.asarray(EASINGS[name](np.linspace(0.0, 1.0, EASING_SAMPLES + 1)), dtype=np.float32)
+
+
+@dataclass(frozen=True)
+class MorphSettings:
+    """How LightControlLogic animates formation changes (see MorphTrack).
+
+    Each particle travels for `duration` seconds along `easing`, starting after a
+    delay of up to `stagger` seconds given by its target's place in `order`.
+    """
+    duration: float = 1.2
+    easing: str = "ease_in_out"
+    stagger: float = 0.3
+    order: str = "radial"
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.easing not in EASINGS:
+            raise ValueError(f"Unknown easing: {self.easing!r}")
+        if self.order not in STAGGER_ORDERS:
+            raise ValueError(f"Unknown stagger order: {self.order!r}")
+        if self.duration <= 0.0 or self.stagger < 0.0:
+            raise ValueError("Morph duration must be positive and stagger non-negative")
+
+    def to_spec(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_spec(cls, spec: Dict) -> "MorphSettings":
+        """Raises ValueError on unknown or invalid parameters."""
+        try:
+            return cls(**spec)
+        except TypeError as e:
+            raise ValueError(f"Invalid morph settings: {e}") from e
+
+
+def stagger_delays(targets: np.ndarray, settings: MorphSettings) -> np.ndarray:
+    """(N,) float32 start delays for the points of a formation, in formation order.
+
+    Depends only on the target formation and the settings, so clients given the
+    formation and MorphSettings.to_spec() can reproduce them.
+    """
+    n = len(targets)
+    if settings.order == "none" or settings.stagger == 0.0 or n < 2:
+        key = np.zeros(n)
+    elif settings.order == "sequential":
+        key = np.arange(n) / (n - 1)
+    elif settings.order == "radial":
+        dist = np.hypot(*(targets - targets.mean(axis=0)).T)
+        key = dist / (dist.max() or 1.0)
+    else:
+        key = np.random.default_rng(settings.seed).random(n)
+    return (key * settings.stagger).astype(np.float32)
+
+
+class MorphTrack:
+    """Precomputed per-particle interpolation from one formation to the next.
+
+    Planning stores each particle's start, displacement and start delay once;
+    sample() is then a single vectorized pass (phase, easing table lookup,
+    multiply-add) with no integration, so a tick costs the same at any point of
+    the transition and its result depends only on the elapsed time.
+    """
+
+    def __init__(self, start: np.ndarray, end: np.ndarray, delays: np.ndarray, settings: MorphSettings,
+                 elapsed: float = 0.0):
+        self.settings = settings
+        self.start = np.array(start, dtype=np.float32)
+        self.delta = np.asarray(end, dtype=np.float32) - self.start
+        self.delays = np.asarray(delays, dtype=np.float32)
+        self.elapsed = elapsed
+        # Formation point of each slot (set by plan(), used by params())
+        self.perm: Optional[np.ndarray] = None
+        self.total = settings.duration + (float(self.delays.max()) if len(self.delays) else 0.0)
+        self._table = easing_table(settings.easing)
+        # Phase in table samples: (t - delay) * rate, clipped to the table
+        self._rate = np.float32(EASING_SAMPLES / settings.duration)
+        self._offset = -self.delays * self._rate
+
+    @classmethod
+    def plan(cls, start: np.ndarray, targets: np.ndarray, perm: np.ndarray,
+             settings: MorphSettings) -> "MorphTrack":
+        """Track from `start` (slot order) to `targets[perm]` (slot i goes to formation point
+        perm[i], see formation_assignment.assign_targets)."""
+        track = cls(start, targets[perm], stagger_delays(targets, settings)[perm], settings)
+        track.perm = perm
+        return track
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def done(self) -> bool:
+        return self.elapsed >= self.total
+
+    def sample(self, t: float) -> np.ndarray:
+        """(N, 2) float32 positions at `t` seconds into the transition."""
+        phase = self._offset + np.float32(t) * self._rate
+        np.clip(phase, 0.0, EASING_SAMPLES, out=phase)
+        phase += 0.5
+        eased = self._table.take(phase.astype(np.intp))
+        out = self.delta * eased[:, None]
+        out += self.start
+        return out
+
+    def params(self, handles: np.ndarray) -> Dict:
+        """What a client needs to animate the transition itself: the settings plus the
+        entity handle travelling to each formation point, in formation order.
+        `handles` are the tracked entities' handles in slot order."""
+        by_point = np.empty_like(handles)
+        by_point[self.perm] = handles
+        return {**self.settings.to_spec(), "handles": by_point.tolist()}
@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from .light_schemas import PriorityLevel
+
+# (rate in tokens per second, burst capacity); None means unlimited
+RateLimit = Optional[Tuple[float, float]]
+
+# Idle buckets are swept once every this many calls (LRU cap is enforced on every call)
+SWEEP_INTERVAL = 64
+
+
+class TokenBucketLimiter:
+    """Per-source token bucket rate limiter with O(1) check-and-consume.
+
+    Each source owns a bucket that refills continuously at `rate` tokens per second
+    up to `burst`; an intent consumes one token. Buckets are kept in LRU order so
+    that idle sources can be dropped cheaply:
+
+    - A bucket idle long enough to have refilled completely is indistinguishable
+      from a fresh one, so it is evicted without changing behavior.
+    - If more than `max_sources` buckets are live, the least recently used is evicted.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: float = 5.0,
+                 priority_limits: Optional[Dict[int, RateLimit]] = None,
+                 max_sources: int = 10000):
+        """Initializes the limiter.
+
+        Args:
+            rate: Default refill rate (tokens per second).
+            burst: Default bucket capacity.
+            priority_limits: Optional per-PriorityLevel override of (rate, burst);
+                a value of None exempts that priority from rate limiting.
+            max_sources: Upper bound on tracked sources (LRU eviction beyond it).
+        """
+        self.default_limit: Tuple[float, float] = (rate, burst)
+        self.priority_limits: Dict[int, RateLimit] = dict(priority_limits or {})
+        self.max_sources = max_sources
+        # source -> [tokens, last_refill_time, full_refill_time]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.evictions = 0
+        self._calls = 0
+
+    def limit_for(self, priority: int) -> RateLimit:
+        return self.priority_limits.get(priority, self.default_limit)
+
+    def allow(self, source: str, now: float, priority: int = PriorityLevel.USER) -> bool:
+        """Refills the source's bucket and consumes one token if available."""
+        limit = self.limit_for(priority)
+        if limit is None:
+            return True
+        rate, burst = limit
+
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            tokens = burst
+        else:
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            self._buckets.move_to_end(source)
+
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+
+        full_at = now + (burst - tokens) / rate if rate > 0 else float("inf")
+        if bucket is None:
+            self._buckets[source] = [tokens, now, full_at]
+        else:
+            bucket[0], bucket[1], bucket[2] = tokens, now, full_at
+
+        self._calls += 1
+        if self._calls % SWEEP_INTERVAL == 0 or len(self._buckets) > self.max_sources:
+            self._evict(now)
+        return allowed
+
+    def _evict(self, now: float):
+        buckets = self._buckets
+        # Oldest-first: stop at the first bucket that has not refilled yet (amortized O(1))
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if oldest[2] > now:
+                break
+            buckets.popitem(last=False)
+        while len(buckets) > self.max_sources:
+            buckets.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def get_state(self) -> Dict:
+        """JSON-serializable snapshot of the configuration and live buckets (see set_state)."""
+        return {
+            "default_limit": list(self.default_limit),
+            "priority_limits": [[int(p), None if lim is None else list(lim)]
+                                for p, lim in self.priority_limits.items()],
+            "max_sources": self.max_sources,
+            "buckets": [[source] + bucket for source, bucket in self._buckets.items()],
+            "calls": self._calls,
+        }
+
+    def set_state(self, state: Dict):
+        self.default_limit = tuple(state["default_limit"])
+        self.priority_limits = {p: None if lim is None else tuple(lim)
+                                for p, lim in state["priority_limits"]}
+        self.max_sources = state["max_sources"]
+        self._buckets = OrderedDict((b[0], list(b[1:])) for b in state["buckets"])
+        self._calls = state["calls"]
+
+    def reset(self, source: Optional[str] = None):
+        if source is None:
+            self._buckets.clear()
+        else:
+            self._buckets.pop(source, None)
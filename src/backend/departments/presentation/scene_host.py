@@ -0,0 +1,182 @@
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .color_pipeline import ease_colors
+from .lcl import LightControlLogic, integrate, shift_history
+from .light_schemas import LightIntent, LightInstruction
+
+# A fresh LightControlLogic preallocates DEFAULT_CAPACITY (10k) rows, ~1 MB per scene;
+# hosted scenes start small and grow geometrically as they spawn.
+DEFAULT_SCENE_CAPACITY = 64
+DEFAULT_IDLE_TIMEOUT = 300.0
+# Scenes at least this large (or with interactions or a force field) tick on their own arrays;
+# smaller ones are concatenated so the per-call overhead is paid once per frame.
+BATCH_SCENE_LIMIT = 1024
+
+
+class SceneHost:
+    """Hosts many isolated LightControlLogic scenes in one process (e.g. one per session).
+
+    - Scenes are created on first access with a small initial capacity.
+    - Scenes not accessed for `idle_timeout` seconds are frozen into a compressed
+      blob (LightControlLogic.to_bytes) and transparently thawed on next access.
+    - tick() concatenates the particles of all small active scenes and integrates
+      them in a single vectorized pass instead of one tick() per scene.
+    """
+
+    def __init__(self, initial_capacity: int = DEFAULT_SCENE_CAPACITY,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 max_active: Optional[int] = None):
+        """Initializes the host.
+
+        Args:
+            initial_capacity: Entity capacity of newly created scenes.
+            idle_timeout: Seconds without access before a scene is frozen.
+            max_active: Optional cap on live scenes (least recently used are frozen).
+        """
+        self.initial_capacity = initial_capacity
+        self.idle_timeout = idle_timeout
+        self.max_active = max_active
+        # scene_id -> [scene, last_access], least recently used first
+        self._active: "OrderedDict[str, List]" = OrderedDict()
+        self._frozen: Dict[str, bytes] = {}
+        self.freezes = 0
+        self.thaws = 0
+
+    def scene(self, scene_id: str, now: Optional[float] = None) -> LightControlLogic:
+        """Returns the scene for `scene_id`, creating or thawing it as needed."""
+        now = time.time() if now is None else now
+        entry = self._active.get(scene_id)
+        if entry is not None:
+            entry[1] = now
+            self._active.move_to_end(scene_id)
+            return entry[0]
+
+        blob = self._frozen.pop(scene_id, None)
+        if blob is None:
+            lcl = LightControlLogic(capacity=self.initial_capacity)
+        else:
+            lcl = LightControlLogic.from_bytes(blob, capacity=self.initial_capacity)
+            self.thaws += 1
+        self._active[scene_id] = [lcl, now]
+        if self.max_active is not None and len(self._active) > self.max_active:
+            self.freeze(next(iter(self._active)))
+        return lcl
+
+    def process(self, scene_id: str, intent: LightIntent) -> Optional[LightInstruction]:
+        return self.scene(scene_id).process(intent)
+
+    def process_batch(self, scene_id: str, intents: List[LightIntent]) -> List[Optional[LightInstruction]]:
+        return self.scene(scene_id).process_batch(intents)
+
+    def freeze(self, scene_id: str) -> bool:
+        """Serializes an active scene and releases its arrays."""
+        entry = self._active.pop(scene_id, None)
+        if entry is None:
+            return False
+        self._frozen[scene_id] = entry[0].to_bytes()
+        self.freezes += 1
+        return True
+
+    def remove(self, scene_id: str) -> bool:
+        """Drops a scene entirely (e.g. on session disconnect)."""
+        found = self._active.pop(scene_id, None) is not None
+        return self._frozen.pop(scene_id, None) is not None or found
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Freezes every scene not accessed for `idle_timeout` seconds."""
+        now = time.time() if now is None else now
+        deadline = now - self.idle_timeout
+        evicted = 0
+        # Oldest-first: stop at the first recently used scene
+        while self._active:
+            scene_id, entry = next(iter(self._active.items()))
+            if entry[1] > deadline:
+                break
+            self.freeze(scene_id)
+            evicted += 1
+        return evicted
+
+    def tick(self, dt: float, now: Optional[float] = None) -> int:
+        """
+        Evicts idle scenes, then advances every active scene by dt seconds.
+        Equivalent to calling tick() on each scene. Returns the number of particles advanced.
+        """
+        self.evict_idle(now)
+        small, total = [], 0
+        for entry in self._active.values():
+            lcl = entry[0]
+            if lcl._count == 0:
+                lcl._maybe_shrink()
+                continue
+            if (lcl._count >= BATCH_SCENE_LIMIT or lcl.interactions_enabled or lcl.force_field
+                    or lcl._track is not None):
+                # Large scenes are already vectorized; copying them in and out costs more than it saves
+                lcl.tick(dt)
+                total += lcl._count
+            else:
+                small.append(lcl)
+        if small:
+            total += self._tick_batched(small, dt)
+        return total
+
+    @staticmethod
+    def _tick_batched(scenes: List[LightControlLogic], dt: float) -> int:
+        counts = [lcl._count for lcl in scenes]
+        pos = np.concatenate([lcl._pos[:lcl._count] for lcl in scenes])
+        vel = np.concatenate([lcl._vel[:lcl._count] for lcl in scenes])
+        target_pos = np.concatenate([lcl._target_pos[:lcl._count] for lcl in scenes])
+        has_target = np.concatenate([lcl._has_target[:lcl._count] for lcl in scenes])
+
+        integrate(pos, vel, target_pos, has_target, None, dt)
+
+        start = 0
+        for lcl, count in zip(scenes, counts):
+            end = start + count
+            lcl._pos[:count] = pos[start:end]
+            lcl._vel[:count] = vel[start:end]
+            shift_history(lcl._history[:count], pos[start:end])
+            lcl._regenerate(dt, lcl.clock())
+            start = end
+
+        SceneHost._ease_batched([lcl for lcl in scenes if lcl._colors_moving], dt)
+        for lcl in scenes:
+            lcl._expire(dt)
+        return start
+
+    @staticmethod
+    def _ease_batched(scenes: List[LightControlLogic], dt: float):
+        if not scenes:
+            return
+        color = np.concatenate([lcl._color[:lcl._count] for lcl in scenes])
+        color_vel = np.concatenate([lcl._color_vel[:lcl._count] for lcl in scenes])
+        target_colors = np.concatenate([lcl._target_colors[:lcl._count] for lcl in scenes])
+        moving = ease_colors(color, color_vel, target_colors, dt,
+                             counts=[lcl._count for lcl in scenes]).tolist()
+
+        start = 0
+        for lcl, still_moving in zip(scenes, moving):
+            end = start + lcl._count
+            lcl._color[:lcl._count] = color[start:end]
+            lcl._color_vel[:lcl._count] = color_vel[start:end]
+            lcl._colors_moving = still_moving
+            start = end
+
+    def __contains__(self, scene_id: str) -> bool:
+        return scene_id in self._active or scene_id in self._frozen
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._frozen)
+
+    def get_metrics(self) -> Dict:
+        return {
+            "active_scenes": len(self._active),
+            "frozen_scenes": len(self._frozen),
+            "frozen_bytes": sum(len(blob) for blob in self._frozen.values()),
+            "active_entities": sum(entry[0]._count for entry in self._active.values()),
+            "freezes": self.freezes,
+            "thaws": self.thaws,
+        }
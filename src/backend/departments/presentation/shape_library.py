@@ -0,0 +1,319 @@
+import zlib
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+# Shapes live in unit coordinates [-1, 1]^2 (FormationManager places them with
+# center + scale * point), y pointing down like the screen.
+InsideTest = Callable[[np.ndarray, np.ndarray], np.ndarray]
+Bounds = Tuple[float, float, float, float]
+UNIT_BOUNDS: Bounds = (-1.0, -1.0, 1.0, 1.0)
+
+# Half width of line-art shapes (cube edges, cracks) in unit coordinates
+STROKE = 0.035
+# Blue-noise tile: Poisson-disk points on a periodic grid of TILE_CELLS^2 cells
+# (a multiple of 3 for the phase groups), TILE_TRIALS dart-throwing rounds
+TILE_CELLS = 150
+TILE_TRIALS = 12
+TILE_SEED = 11
+# Tiled samples aim this much above the requested count (the surplus is dropped)
+SAMPLE_MARGIN = 1.05
+SAMPLE_RETRIES = 4
+# Probes used to estimate the area of a region
+AREA_PROBES = 1 << 14
+
+TEXT_PREFIX = "text:"
+
+# 5x7 bitmap font: one 5-bit row per line, most significant bit on the left
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+GLYPHS: Dict[str, Tuple[int, ...]] = {
+    "A": (0x0E, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11), "B": (0x1E, 0x11, 0x11, 0x1E, 0x11, 0x11, 0x1E),
+    "C": (0x0E, 0x11, 0x10, 0x10, 0x10, 0x11, 0x0E), "D": (0x1E, 0x11, 0x11, 0x11, 0x11, 0x11, 0x1E),
+    "E": (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x1F), "F": (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x10),
+    "G": (0x0E, 0x11, 0x10, 0x17, 0x11, 0x11, 0x0F), "H": (0x11, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11),
+    "I": (0x0E, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0E), "J": (0x07, 0x02, 0x02, 0x02, 0x02, 0x12, 0x0C),
+    "K": (0x11, 0x12, 0x14, 0x18, 0x14, 0x12, 0x11), "L": (0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x1F),
+    "M": (0x11, 0x1B, 0x15, 0x15, 0x11, 0x11, 0x11), "N": (0x11, 0x11, 0x19, 0x15, 0x13, 0x11, 0x11),
+    "O": (0x0E, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E), "P": (0x1E, 0x11, 0x11, 0x1E, 0x10, 0x10, 0x10),
+    "Q": (0x0E, 0x11, 0x11, 0x11, 0x15, 0x12, 0x0D), "R": (0x1E, 0x11, 0x11, 0x1E, 0x14, 0x12, 0x11),
+    "S": (0x0F, 0x10, 0x10, 0x0E, 0x01, 0x01, 0x1E), "T": (0x1F, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04),
+    "U": (0x11, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E), "V": (0x11, 0x11, 0x11, 0x11, 0x11, 0x0A, 0x04),
+    "W": (0x11, 0x11, 0x11, 0x15, 0x15, 0x15, 0x0A), "X": (0x11, 0x11, 0x0A, 0x04, 0x0A, 0x11, 0x11),
+    "Y": (0x11, 0x11, 0x0A, 0x04, 0x04, 0x04, 0x04), "Z": (0x1F, 0x01, 0x02, 0x04, 0x08, 0x10, 0x1F),
+    "0": (0x0E, 0x11, 0x13, 0x15, 0x19, 0x11, 0x0E), "1": (0x04, 0x0C, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    "2": (0x0E, 0x11, 0x01, 0x02, 0x04, 0x08, 0x1F), "3": (0x1F, 0x02, 0x04, 0x02, 0x01, 0x11, 0x0E),
+    "4": (0x02, 0x06, 0x0A, 0x12, 0x1F, 0x02, 0x02), "5": (0x1F, 0x10, 0x1E, 0x01, 0x01, 0x11, 0x0E),
+    "6": (0x06, 0x08, 0x10, 0x1E, 0x11, 0x11, 0x0E), "7": (0x1F, 0x01, 0x02, 0x04, 0x08, 0x08, 0x08),
+    "8": (0x0E, 0x11, 0x11, 0x0E, 0x11, 0x11, 0x0E), "9": (0x0E, 0x11, 0x11, 0x0F, 0x01, 0x02, 0x0C),
+    " ": (0, 0, 0, 0, 0, 0, 0), ".": (0, 0, 0, 0, 0, 0x0C, 0x0C), ",": (0, 0, 0, 0, 0x0C, 0x04, 0x08),
+    "!": (0x04, 0x04, 0x04, 0x04, 0x04, 0, 0x04), "?": (0x0E, 0x11, 0x01, 0x02, 0x04, 0, 0x04),
+    "-": (0, 0, 0, 0x1F, 0, 0, 0), ":": (0, 0x0C, 0x0C, 0, 0x0C, 0x0C, 0), "'": (0x04, 0x04, 0x08, 0, 0, 0, 0),
+}
+
+
+class Region:
+    """A samplable area: vectorized inside test over (x, y) arrays plus a bounding box.
+
+    Regions built from a signed distance function also keep it (`distance`, negative
+    inside), which lets the sampler skip whole blocks far from the shape.
+    """
+
+    def __init__(self, inside: InsideTest, bounds: Bounds = UNIT_BOUNDS, area: Optional[float] = None,
+                 distance: Optional[InsideTest] = None):
+        self.inside = inside
+        self.bounds = bounds
+        self.distance = distance
+        self._area = area
+
+    @property
+    def area(self) -> float:
+        """Exact if known, otherwise estimated with a fixed probe set."""
+        if self._area is None:
+            x0, y0, x1, y1 = self.bounds
+            probes = np.random.default_rng(0).random((AREA_PROBES, 2))
+            inside = self.inside(x0 + probes[:, 0] * (x1 - x0), y0 + probes[:, 1] * (y1 - y0))
+            self._area = float(np.mean(inside)) * (x1 - x0) * (y1 - y0)
+        return self._area
+
+
+def segment_distance(x: np.ndarray, y: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """Distance from each point to the nearest of the (M, 4) segments [x0, y0, x1, y1]."""
+    best = np.full(len(x), np.inf)
+    for x0, y0, x1, y1 in segments.tolist():
+        dx, dy = x1 - x0, y1 - y0
+        t = np.clip(((x - x0) * dx + (y - y0) * dy) / (dx * dx + dy * dy), 0.0, 1.0)
+        np.minimum(best, np.hypot(x - (x0 + t * dx), y - (y0 + t * dy)), out=best)
+    return best
+
+
+def polyline(*points: Tuple[float, float]) -> np.ndarray:
+    pts = np.array(points, dtype=np.float64)
+    return np.concatenate([pts[:-1], pts[1:]], axis=1)
+
+
+def stroke(segments: np.ndarray, width: float = STROKE) -> Region:
+    """Line art: points within `width` of any segment."""
+    ends = segments.reshape(-1, 2)
+    lo = ends.min(axis=0) - width
+    hi = ends.max(axis=0) + width
+    return Region(lambda x, y: segment_distance(x, y, segments) <= width,
+                  (lo[0], lo[1], hi[0], hi[1]),
+                  distance=lambda x, y: segment_distance(x, y, segments) - width)
+
+
+def discs(circles: np.ndarray) -> Region:
+    """Union of (K, 3) discs [cx, cy, r] (signed distance <= 0)."""
+    def distance(x, y):
+        d = np.full(len(x), np.inf)
+        for cx, cy, r in circles.tolist():
+            np.minimum(d, np.hypot(x - cx, y - cy) - r, out=d)
+        return d
+    lo = (circles[:, :2] - circles[:, 2:]).min(axis=0)
+    hi = (circles[:, :2] + circles[:, 2:]).max(axis=0)
+    return Region(lambda x, y: distance(x, y) <= 0.0, (lo[0], lo[1], hi[0], hi[1]), distance=distance)
+
+
+def _isometric_cube() -> np.ndarray:
+    # Hexagon outline plus the three edges meeting at the front corner (inset so
+    # the stroke stays inside the unit square)
+    angles = np.deg2rad(np.arange(6) * 60.0 - 90.0)
+    hexagon = [(float(np.cos(a)) * (1 - STROKE), float(np.sin(a)) * (1 - STROKE)) for a in angles]
+    inner = np.array([[0.0, 0.0, *hexagon[i]] for i in (1, 3, 5)])
+    return np.concatenate([polyline(*hexagon, hexagon[0]), inner])
+
+
+def _cracks() -> np.ndarray:
+    # Jagged fractures radiating from an off-center impact point
+    branches = [
+        ((-0.1, 0.05), (0.25, -0.2), (0.4, -0.15), (0.7, -0.55), (0.95, -0.6)),
+        ((-0.1, 0.05), (-0.35, -0.3), (-0.3, -0.55), (-0.6, -0.9)),
+        ((-0.1, 0.05), (-0.45, 0.15), (-0.65, 0.05), (-0.95, 0.3)),
+        ((-0.1, 0.05), (0.05, 0.4), (-0.05, 0.6), (0.2, 0.95)),
+        ((-0.1, 0.05), (0.35, 0.25), (0.6, 0.2), (0.85, 0.5)),
+        ((0.4, -0.15), (0.55, 0.0)),
+        ((-0.3, -0.55), (-0.05, -0.7)),
+    ]
+    return np.concatenate([polyline(*branch) for branch in branches])
+
+
+REGIONS: Dict[str, Region] = {
+    "sphere": discs(np.array([[0.0, 0.0, 1.0]])),
+    "cloud": discs(np.array([
+        [-0.55, 0.15, 0.38], [-0.15, -0.1, 0.5], [0.3, -0.05, 0.45], [0.62, 0.2, 0.33], [0.05, 0.28, 0.4],
+    ])),
+    "cube": stroke(_isometric_cube()),
+    "cracks": stroke(_cracks(), STROKE * 0.6),
+}
+
+
+def text_mask(text: str) -> np.ndarray:
+    """Rasterizes text with the built-in 5x7 font into a boolean mask (rows, cols).
+    Lines are split on newlines; unknown characters render as '?'."""
+    lines = text.upper().split("\n")
+    width = max(len(line) for line in lines) * (GLYPH_WIDTH + 1) - 1
+    height = len(lines) * (GLYPH_HEIGHT + 2) - 2
+    mask = np.zeros((max(height, 1), max(width, 1)), dtype=bool)
+    bits = 1 << np.arange(GLYPH_WIDTH - 1, -1, -1)
+    for row, line in enumerate(lines):
+        top = row * (GLYPH_HEIGHT + 2)
+        for col, char in enumerate(line):
+            glyph = np.array(GLYPHS.get(char, GLYPHS["?"]))
+            left = col * (GLYPH_WIDTH + 1)
+            mask[top:top + GLYPH_HEIGHT, left:left + GLYPH_WIDTH] = (glyph[:, None] & bits) > 0
+    return mask
+
+
+def mask_region(mask: np.ndarray) -> Region:
+    """Boolean (rows, cols) mask fitted into the unit square, aspect ratio kept."""
+    rows, cols = mask.shape
+    pixel = 2.0 / max(rows, cols)
+    half_w, half_h = cols * pixel / 2, rows * pixel / 2
+
+    def inside(x, y):
+        col = np.floor((x + half_w) / pixel).astype(np.intp)
+        row = np.floor((y + half_h) / pixel).astype(np.intp)
+        valid = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+        result = np.zeros(len(x), dtype=bool)
+        result[valid] = mask[row[valid], col[valid]]
+        return result
+
+    return Region(inside, (-half_w, -half_h, half_w, half_h), float(mask.sum()) * pixel * pixel)
+
+
+def resolve_region(name: str) -> Optional[Region]:
+    """Region for a library shape name or "text:<content>", None if unknown."""
+    if name.startswith(TEXT_PREFIX):
+        return _text_region(name[len(TEXT_PREFIX):])
+    return REGIONS.get(name)
+
+
+@lru_cache(maxsize=64)
+def _text_region(text: str) -> Region:
+    return mask_region(text_mask(text))
+
+
+@lru_cache(maxsize=2)
+def blue_noise_tile(cells: int = TILE_CELLS, trials: int = TILE_TRIALS, seed: int = TILE_SEED) -> np.ndarray:
+    """Poisson-disk (blue noise) points in the periodic unit square, (T, 2) float64.
+
+    Vectorized parallel dart throwing on a grid of cells x cells with one point per
+    cell at most, so the disk radius is the cell diagonal. Cells are split into
+    3x3 phase groups whose members are more than a radius apart: every empty cell
+    of a group throws a dart at once and only checks the points of its 5x5
+    neighborhood (wrapping around the edges). Cells whose corners and center are
+    already covered by neighbors' disks are retired, the rest retry `trials` times.
+    Points are at least sqrt(2) / cells apart, across the tile edges too.
+    """
+    rng = np.random.default_rng(seed)
+    cell = 1.0 / cells
+    r2 = 2.0 * cell * cell
+    grid_x = np.full(cells * cells, np.nan)
+    grid_y = np.full(cells * cells, np.nan)
+    offsets = np.array([(dy, dx) for dy in range(-2, 3) for dx in range(-2, 3)
+                        if (dy, dx) != (0, 0) and abs(dy) + abs(dx) < 4]) # Corner cells are >= r away
+    iy, ix = np.divmod(np.arange(cells * cells), cells)
+    phase = (iy % 3) * 3 + ix % 3
+    pending = [np.flatnonzero(phase == p) for p in range(9)]
+
+    for _ in range(trials):
+        for p, slots in enumerate(pending):
+            if len(slots) == 0:
+                continue
+            cy, cx = np.divmod(slots, cells)
+            px = (cx + rng.random(len(slots))) * cell
+            py = (cy + rng.random(len(slots))) * cell
+            near = ((cy[:, None] + offsets[:, 0]) % cells) * cells + (cx[:, None] + offsets[:, 1]) % cells
+            # Neighbor offsets relative to the cell origin, unwrapped across the tile edge
+            near_x = grid_x[near] + (np.floor_divide(cx[:, None] + offsets[:, 1], cells) - cx[:, None] // cells)
+            near_y = grid_y[near] + (np.floor_divide(cy[:, None] + offsets[:, 0], cells) - cy[:, None] // cells)
+            # NaN (empty) neighbors compare False
+            ok = ~((near_x - px[:, None]) ** 2 + (near_y - py[:, None]) ** 2 < r2).any(axis=1)
+            grid_x[slots[ok]] = px[ok]
+            grid_y[slots[ok]] = py[ok]
+
+            retry = ~ok
+            near_x, near_y = near_x[retry], near_y[retry]
+            left = cx[retry, None] * cell
+            top = cy[retry, None] * cell
+            covered = np.ones(len(near_x), dtype=bool)
+            for fx, fy in ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0), (0.5, 0.5)):
+                covered &= ((near_x - (left + fx * cell)) ** 2
+                            + (near_y - (top + fy * cell)) ** 2 < r2).any(axis=1)
+            pending[p] = slots[retry][~covered]
+
+    filled = ~np.isnan(grid_x)
+    tile = np.stack([grid_x[filled], grid_y[filled]], axis=1)
+    tile.flags.writeable = False # Shared through the lru_cache
+    return tile
+
+
+def _tiled(region: Region, side: float, angle: float, shift: np.ndarray) -> np.ndarray:
+    """The blue-noise tile repeated with period `side`, rotated by `angle` around the
+    region center, clipped to the region."""
+    tile = blue_noise_tile()
+    x0, y0, x1, y1 = region.bounds
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    reach = int(np.ceil(np.hypot(x1 - x0, y1 - y0) / 2 / side))
+    span = np.arange(-reach - 1, reach) # Shifted by up to one period
+    copies = np.stack(np.meshgrid(span, span), axis=-1).reshape(-1, 2)
+    cos, sin = np.cos(angle), np.sin(angle)
+    rotation = np.array([[cos, sin], [-sin, cos]])
+
+    # Drop copies that cannot reach the shape (distance from the copy center
+    # beyond its half diagonal), or fall outside the bounding box
+    centers = ((copies + shift + 0.5) * side) @ rotation + (cx, cy)
+    half = side * np.sqrt(0.5)
+    reachable = ((centers[:, 0] >= x0 - half) & (centers[:, 0] <= x1 + half)
+                 & (centers[:, 1] >= y0 - half) & (centers[:, 1] <= y1 + half))
+    if region.distance is not None:
+        reachable[reachable] = region.distance(centers[reachable, 0], centers[reachable, 1]) <= half
+    copies = copies[reachable]
+
+    points = (((tile[None] + (copies + shift)[:, None]) * side).reshape(-1, 2)) @ rotation + (cx, cy)
+    keep = ((points[:, 0] >= x0) & (points[:, 0] <= x1) & (points[:, 1] >= y0) & (points[:, 1] <= y1))
+    points = points[keep]
+    return points[region.inside(points[:, 0], points[:, 1])]
+
+
+def sample_region(region: Region, count: int, rng: np.random.Generator) -> np.ndarray:
+    """Exactly `count` evenly spread (blue noise) points of a region, (count, 2) float64.
+
+    The precomputed blue-noise tile is repeated over the region at a period that
+    yields slightly more points than requested given the region area (with a
+    random rotation and offset per rng, shrunk and retried if short), clipped to
+    the region, and the surplus dropped at random. Regions too small for the
+    tiling are topped up with rejection samples.
+    """
+    if count <= 0:
+        return np.empty((0, 2))
+    tile_points = len(blue_noise_tile())
+    angle = rng.random() * 2 * np.pi
+    shift = rng.random(2)
+    side = np.sqrt(tile_points * region.area / (count * SAMPLE_MARGIN))
+    points = np.empty((0, 2))
+    for _ in range(SAMPLE_RETRIES):
+        if side <= 0:
+            break
+        points = _tiled(region, side, angle, shift)
+        if len(points) >= count:
+            return points[np.sort(rng.choice(len(points), count, replace=False))]
+        side *= np.sqrt(max(len(points), 1) / (count * SAMPLE_MARGIN))
+
+    x0, y0, x1, y1 = region.bounds
+    extra = []
+    missing = count - len(points)
+    while missing > 0:
+        batch = rng.random((max(64, 4 * missing), 2)) * (x1 - x0, y1 - y0) + (x0, y0)
+        batch = batch[region.inside(batch[:, 0], batch[:, 1])][:missing]
+        if region.area <= 0 and not len(batch):
+            raise ValueError("Cannot sample an empty region")
+        extra.append(batch)
+        missing -= len(batch)
+    return np.concatenate([points] + extra)
+
+
+def shape_seed(name: str) -> int:
+    """Stable per-shape seed, so library formations are reproducible and cacheable."""
+    return zlib.crc32(name.encode("utf-8"))
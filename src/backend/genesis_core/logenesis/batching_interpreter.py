@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from .interpreter import IntentInterpreter
+from .visual_schemas import EmbodimentContract, PartialContract
+
+logger = logging.getLogger("BatchingInterpreter")
+
+# Defaults of the batching knobs (LOGENESIS_INTERPRET_BATCH / LOGENESIS_INTERPRET_WAIT_MS)
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_MAX_WAIT = 0.01
+
+_Request = Tuple[str, Optional[Dict[str, Any]], asyncio.Future]
+
+class BatchingInterpreter(IntentInterpreter):
+    """Micro-batching scheduler in front of another interpreter.
+
+    interpret() calls arriving within `max_wait` seconds of each other are
+    coalesced into one interpret_batch() call on the wrapped interpreter (one
+    prompt for an LLM, one pass for the simulation); each caller awaits its own
+    future. A batch is dispatched as soon as it holds `max_batch_size` requests,
+    or `max_wait` after its first request arrived. Batches run concurrently.
+
+    If a batched call fails, its requests are retried one by one, so a single
+    bad input only fails its own caller.
+    """
+
+    def __init__(self, interpreter: IntentInterpreter, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait: float = DEFAULT_MAX_WAIT):
+        """Wraps `interpreter`.
+
+        Raises:
+            ValueError: If max_batch_size < 1 or max_wait < 0.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative")
+        self.interpreter = interpreter
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: List[_Request] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.requests = 0
+
+    async def interpret(self, text: str, context: Optional[Dict[str, Any]] = None) -> EmbodimentContract:
+        """Queues the text for the next batch and waits for its contract.
+
+        Args:
+            text: The user input text.
+            context: Optional conversational context.
+
+        Returns:
+            The EmbodimentContract of `text`.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, context, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+        return await future
+
+    async def interpret_batch(self, texts: List[str], contexts: List[Optional[Dict[str, Any]]]) -> List[EmbodimentContract]:
+        """Already-formed batches go straight to the wrapped interpreter."""
+        return await self.interpreter.interpret_batch(texts, contexts)
+
+    async def interpret_stream(self, text: str, context: Optional[Dict[str, Any]] = None) -> AsyncIterator[PartialContract]:
+        """Streams are not batched: waiting for a batch would delay the first update."""
+        async for update in self.interpreter.interpret_stream(text, context):
+            yield update
+
+    def stats(self) -> Dict[str, float]:
+        """Batches sent, requests served and the mean batch size."""
+        return {"batches": self.batches, "requests": self.requests,
+                "mean_batch_size": self.requests / self.batches if self.batches else 0.0}
+
+    def _dispatch(self):
+        """Sends the pending requests, in batches of at most max_batch_size."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Callers that were cancelled while waiting (e.g. a closed socket) are dropped
+        pending = [request for request in self._pending if not request[2].done()]
+        self._pending = []
+        for start in range(0, len(pending), self.max_batch_size):
+            task = asyncio.ensure_future(self._run(pending[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[_Request]):
+        self.batches += 1
+        self.requests += len(batch)
+        texts = [text for text, _, _ in batch]
+        contexts = [context for _, context, _ in batch]
+        try:
+            try:
+                results = await self.interpreter.interpret_batch(texts, contexts)
+                if len(results) != len(batch):
+                    raise ValueError(f"Got {len(results)} contracts for {len(batch)} inputs")
+            except Exception as e:
+                if len(batch) == 1:
+                    results = [e]
+                else:
+                    logger.warning(f"Batch of {len(batch)} failed ({e}). Retrying one by one.")
+                    results = await asyncio.gather(*(self.interpreter.interpret(text, context)
+                                                     for text, context in zip(texts, contexts)), return_exceptions=True)
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Never leave a caller waiting (e.g. when the loop shuts down mid-batch)
+            for _, _, future in batch:
+                if not future.done():
+                    future.cancel()
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.backend.storage import SessionCache, SqliteDocumentStore
+from .interpreter import IntentInterpreter
+from .visual_schemas import EmbodimentContract, PartialContract
+
+logger = logging.getLogger("CachingInterpreter")
+
+# Defaults of the cache knobs (LOGENESIS_INTERPRET_CACHE / LOGENESIS_INTERPRET_CACHE_TTL)
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 3600.0
+
+_SPACES = re.compile(r"\s+")
+# Punctuation around an utterance does not change what it asks for ("Hello!" == "hello")
+_EDGE_PUNCTUATION = " .,!?;:'\"…"
+
+def normalize_text(text: str) -> str:
+    """Case-folded text with runs of whitespace collapsed and edge punctuation removed."""
+    return _SPACES.sub(" ", text.casefold()).strip(_EDGE_PUNCTUATION)
+
+def cache_key(text: str, context: Optional[Dict[str, Any]]) -> str:
+    """Normalized text plus a hash of the context ("" when there is none)."""
+    if not context:
+        return normalize_text(text) + "\0"
+    encoded = json.dumps(context, sort_keys=True, default=str).encode()
+    return normalize_text(text) + "\0" + hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+class CachingInterpreter(IntentInterpreter):
+    """Result cache in front of another interpreter, for repeated utterances.
+
+    Contracts are cached by normalized text plus a hash of the context, in an LRU
+    bounded to `max_entries` (storage.SessionCache); they expire `ttl` seconds
+    after they were interpreted. A hit returns the cached contract as is:
+    it was verified when first produced, so it is not verified again, and
+    callers must treat it as read-only. Concurrent misses for the same key share
+    one interpretation; if the caller running it is cancelled, a waiting caller
+    takes it over. Failures are not cached.
+
+    With `documents` (e.g. SqliteDocumentStore(path, INTERPRETATION_TABLE)),
+    contracts are also written to disk and memory misses are served from there
+    while younger than `ttl`, so the cache survives restarts and is shared by
+    worker processes. Disk reads and writes run in worker threads.
+    """
+
+    def __init__(self, interpreter: IntentInterpreter, max_entries: Optional[int] = DEFAULT_CACHE_SIZE,
+                 ttl: Optional[float] = DEFAULT_CACHE_TTL, documents: Optional[SqliteDocumentStore] = None):
+        """Wraps `interpreter`.
+
+        Raises:
+            ValueError: If max_entries < 1.
+        """
+        self.interpreter = interpreter
+        self.ttl = ttl
+        self.documents = documents
+        self._cache = SessionCache(max_entries, ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.disk_hits = 0
+
+    async def interpret(self, text: str, context: Optional[Dict[str, Any]] = None) -> EmbodimentContract:
+        """The cached contract for (text, context), interpreting it on a miss.
+
+        Args:
+            text: The user input text.
+            context: Optional conversational context.
+
+        Returns:
+            The EmbodimentContract of `text`.
+        """
+        key = cache_key(text, context)
+        while True:
+            contract = await self._lookup(key)
+            if contract is not None:
+                return contract
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            contract = await self._join(inflight)
+            if contract is not None:
+                return contract
+            # Its caller was cancelled (e.g. a closed socket): take over the interpretation
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            contract = await self.interpreter.interpret(text, context)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception() # Retrieved here, so waiting on it is optional
+            raise
+        else:
+            future.set_result(contract)
+            await self._store([(key, contract)])
+            return contract
+        finally:
+            del self._inflight[key]
+
+    async def interpret_batch(self, texts: List[str], contexts: List[Optional[Dict[str, Any]]]) -> List[EmbodimentContract]:
+        """Serves hits from the cache and interprets the misses as one batch.
+
+        Args:
+            texts: The user input texts.
+            contexts: The context of each text (or None).
+
+        Returns:
+            One EmbodimentContract per text, in order.
+        """
+        keys = [cache_key(text, context) for text, context in zip(texts, contexts)]
+        contracts = list(await asyncio.gather(*(self._lookup(key) for key in keys)))
+        misses: Dict[str, Tuple[int, ...]] = {}
+        for i, (key, contract) in enumerate(zip(keys, contracts)):
+            if contract is None:
+                misses[key] = misses.get(key, ()) + (i,)
+        if misses:
+            first = [positions[0] for positions in misses.values()]
+            results = await self.interpreter.interpret_batch([texts[i] for i in first], [contexts[i] for i in first])
+            for positions, contract in zip(misses.values(), results):
+                for i in positions:
+                    contracts[i] = contract
+            await self._store(list(zip(misses, results)))
+        return contracts
+
+    async def interpret_stream(self, text: str, context: Optional[Dict[str, Any]] = None) -> AsyncIterator[PartialContract]:
+        """Yields a cached contract at once; streams a miss from the wrapped interpreter.
+
+        The streamed contract is cached when it completes.
+
+        Args:
+            text: The user input text.
+            context: Optional conversational context.
+
+        Yields:
+            PartialContract updates, the last one with `contract` set.
+        """
+        key = cache_key(text, context)
+        contract = await self._lookup(key)
+        while contract is None and key in self._inflight:
+            contract = await self._join(self._inflight[key])
+        if contract is not None:
+            yield PartialContract.from_contract(contract)
+            return
+        async for update in self.interpreter.interpret_stream(text, context):
+            if update.contract is not None:
+                await self._store([(key, update.contract)])
+            yield update
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory tier counters (see SessionCache.stats) plus hits served from disk."""
+        stats = self._cache.stats()
+        stats["disk_hits"] = self.disk_hits
+        return stats
+
+    async def _join(self, inflight: asyncio.Future) -> Optional[EmbodimentContract]:
+        """Waits for another caller's interpretation; None if that caller was cancelled.
+
+        Unlike awaiting a shielded future, a cancelled owner does not cancel its waiters.
+        """
+        await asyncio.wait((inflight,)) # Cancelling this caller leaves the future alone
+        if inflight.cancelled():
+            return None
+        return inflight.result()
+
+    async def _lookup(self, key: str) -> Optional[EmbodimentContract]:
+        """The live cached contract of `key`; the disk tier is read in a worker thread."""
+        entry = self._cache.get(key)
+        if entry is not None and self.ttl is not None and time.time() - entry[0] > self.ttl:
+            del self._cache[key]
+            self._cache.expirations += 1
+        entry = self._cache.lookup(key)
+        if entry is not None:
+            return entry[1]
+        if self.documents is None:
+            return None
+        doc = await asyncio.to_thread(self.documents.get, key)
+        if doc is None:
+            return None
+        try:
+            record = json.loads(doc)
+            stored_at = float(record["stored_at"])
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+                return None
+            contract = EmbodimentContract.model_validate(record["contract"])
+        except (ValueError, KeyError, TypeError, ValidationError) as e:
+            logger.warning(f"Dropping unreadable cached interpretation: {e}")
+            return None
+        self.disk_hits += 1
+        self._cache[key] = (stored_at, contract)
+        return contract
+
+    async def _store(self, items: List[Tuple[str, EmbodimentContract]]):
+        """Caches (key, contract) pairs in memory, then on disk in one transaction.
+
+        The disk write (an fsync'd SQLite commit) runs in a worker thread so it
+        never stalls the event loop; a failed write only costs future disk hits.
+        """
+        stored_at = time.time()
+        for key, contract in items:
+            # Entries are (interpretation time, contract)
+            self._cache[key] = (stored_at, contract)
+        if self.documents is None:
+            return
+        docs = [(key, f'{{"stored_at": {stored_at!r}, "contract": {contract.model_dump_json()}}}')
+                for key, contract in items]
+        try:
+            await asyncio.to_thread(self.documents.put_many, docs)
+        except Exception as e:
+            logger.error(f"Error saving cached interpretations: {e}")
@@ -2,9 +2,15 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from .visual_schemas import (
     EmbodimentContract, VisualParameters, VisualSpecifics,
-    IntentCategory, BaseShape, ContractIntentCategory, TemporalPhase
+    IntentCategory, BaseShape, ContractIntentCategory, TemporalPhase,
+    PartialContract, TemporalState, CognitiveMetadata, IntentData
 )
 
+# Cognitive load assumed while a streamed contract has not stated it yet
+# (the verifier's defaults for a missing field)
+PARTIAL_EFFORT = 0.5
+PARTIAL_UNCERTAINTY = 0.1
+
 class EmbodimentAdapter:
     """The Nervous System: Translates Cognitive Contracts into Visual Parameters.
 
@@ -104,6 +110,32 @@ class EmbodimentAdapter:
             )
         )
 
+    def translate_partial(self, partial: PartialContract) -> Optional[VisualParameters]:
+        """Converts the fields of a streaming contract known so far into VisualParameters.
+
+        Lets the interface morph as soon as the intent category is known, instead of
+        after the whole response was generated. Effort and uncertainty take neutral
+        defaults until they arrive; the final update translates the verified contract.
+
+        Args:
+            partial: The latest update of IntentInterpreter.interpret_stream().
+
+        Returns:
+            A VisualParameters object, or None while the category is unknown.
+        """
+        if partial.contract is not None:
+            return self.translate(partial.contract)
+        if partial.category is None:
+            return None
+        return self.translate(EmbodimentContract(
+            temporal_state=TemporalState(phase=TemporalPhase.MANIFESTING, stability=1.0),
+            cognitive=CognitiveMetadata(
+                effort=PARTIAL_EFFORT if partial.effort is None else partial.effort,
+                uncertainty=PARTIAL_UNCERTAINTY if partial.uncertainty is None else partial.uncertainty
+            ),
+            intent=IntentData(category=partial.category, purity=1.0)
+        ))
+
     def get_temporal_visuals(self, phase: TemporalPhase) -> VisualParameters:
         """Generates immediate visual states for specific temporal phases.
 
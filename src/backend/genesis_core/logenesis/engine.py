@@ -1,12 +1,13 @@
-import json
 import os
 import math
 import re
-from typing import Dict, Any, Optional, Tuple, Union
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
-from pydantic import ValidationError
 import logging
 
+import numpy as np
+
 from .schemas import (
     LogenesisResponse, LogenesisState, IntentVector, ExpressionState,
     VisualQualia, AudioQualia, PhysicsParams, IntentPacket, StateMetrics
@@ -14,88 +15,27 @@ from .schemas import (
 from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
 from src.backend.departments.presentation.formation_manager import FormationManager
 from src.backend.genesis_core.state.aether_state import AetherOutput, AetherState
+from src.backend.storage import INTERPRETATION_TABLE, SqliteDocumentStore
 
 # New Imports
-from .visual_schemas import VisualParameters, IntentCategory, BaseShape, VisualSpecifics
+from .visual_schemas import VisualParameters, IntentCategory, BaseShape, VisualSpecifics, EmbodimentContract
 from .gemini_interpreter import GeminiIntentInterpreter
 from .simulated_interpreter import SimulatedIntentInterpreter
-from .embodiment_adapter import EmbodimentAdapter
+from .batching_interpreter import BatchingInterpreter, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT
+from .caching_interpreter import CachingInterpreter, DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL
+from .embodiment import EmbodimentAdapter
+from .state_store import StateStore
+from .log_state_store import LogStateStore
+from .sqlite_state_store import SqliteStateStore
+from . import state_physics
 
 logger = logging.getLogger("LogenesisEngine")
 
-class StateStore:
-    """Persistence layer for Logenesis expression states.
-
-    Manages the saving and loading of session-specific state data (inertia, velocity, current vector)
-    to a local JSON file.
-    """
-    def __init__(self, filepath: str = "logenesis_state.json"):
-        """Initializes the StateStore.
-
-        Args:
-            filepath: Path to the JSON file for state persistence.
-        """
-        self.filepath = filepath
-        self._cache: Dict[str, ExpressionState] = {}
-        self._load()
-
-    def _load(self):
-        """Loads states from disk into memory."""
-        if not os.path.exists(self.filepath):
-            return
-        try:
-            with open(self.filepath, 'r') as f:
-                data = json.load(f)
-                for sid, state_dict in data.items():
-                    try:
-                        self._cache[sid] = ExpressionState(**state_dict)
-                    except ValidationError:
-                        continue # Skip invalid entries
-        except Exception as e:
-            logger.error(f"Error loading state store: {e}")
-
-    def save(self):
-        """Saves current memory states to disk."""
-        try:
-            data = {sid: state.model_dump(mode='json') for sid, state in self._cache.items()}
-            with open(self.filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving state store: {e}")
-
-    def get_state(self, session_id: str) -> ExpressionState:
-        """Retrieves or initializes the state for a given session.
+# Minimum drift velocity for a state update to be persisted (Stillness Protocol)
+SIGNIFICANCE_THRESHOLD = 0.05
 
-        Args:
-            session_id: The unique session identifier.
-
-        Returns:
-            The ExpressionState object.
-        """
-        if session_id not in self._cache:
-            # Initialize with default neutral state
-            default_vector = IntentVector(
-                epistemic_need=0.1,
-                subjective_weight=0.1,
-                decision_urgency=0.1,
-                precision_required=0.1
-            )
-            self._cache[session_id] = ExpressionState(
-                current_vector=default_vector,
-                velocity=0.0,
-                inertia=0.8
-            )
-        return self._cache[session_id]
-
-    def update_state(self, session_id: str, state: ExpressionState):
-        """Updates and persists the state for a session.
-
-        Args:
-            session_id: The unique session identifier.
-            state: The new ExpressionState.
-        """
-        self._cache[session_id] = state
-        self.save() # Naive save on every update for now
+# Smaller batches are cheaper through process() than through array expressions
+MIN_VECTOR_BATCH = 8
 
 class LogenesisEngine:
     """The Cognitive Fabric Implementation.
@@ -107,7 +47,14 @@ class LogenesisEngine:
     def __init__(self):
         """Initializes the engine, managers, adapters, and interpreters."""
         self.state = LogenesisState.VOID
-        self.state_store = StateStore()
+        # LOGENESIS_STATE_STORE selects the backend: json (default), log or sqlite
+        backend = os.environ.get("LOGENESIS_STATE_STORE", "json")
+        if backend == "log":
+            self.state_store = LogStateStore()
+        elif backend == "sqlite":
+            self.state_store = SqliteStateStore()
+        else:
+            self.state_store = StateStore()
         self.formation_manager = FormationManager()
         self.adapter = EmbodimentAdapter()
 
@@ -120,7 +67,24 @@ class LogenesisEngine:
             logger.warning("GOOGLE_API_KEY missing. Using Simulated Interpreter.")
             self.interpreter = SimulatedIntentInterpreter()
 
-    async def process(self, packet: Union[IntentPacket, str], session_id: str = "global", memory_index: Optional[list] = None, recalled_context: Optional[str] = None) -> LogenesisResponse:
+        # Coalesce concurrent interpretations into batched calls. On by default for the
+        # LLM, whose call latency dwarfs the wait; LOGENESIS_INTERPRET_BATCH=1 disables it.
+        max_batch_size = int(os.environ.get("LOGENESIS_INTERPRET_BATCH", DEFAULT_MAX_BATCH_SIZE if api_key else 1))
+        if max_batch_size > 1:
+            max_wait = float(os.environ.get("LOGENESIS_INTERPRET_WAIT_MS", DEFAULT_MAX_WAIT * 1000)) / 1000
+            self.interpreter = BatchingInterpreter(self.interpreter, max_batch_size, max_wait)
+
+        # Reuse the contracts of repeated utterances (LOGENESIS_INTERPRET_CACHE=0 disables it).
+        # LOGENESIS_INTERPRET_CACHE_DB adds an on-disk tier shared by workers.
+        cache_size = int(os.environ.get("LOGENESIS_INTERPRET_CACHE", DEFAULT_CACHE_SIZE))
+        if cache_size > 0:
+            cache_ttl = float(os.environ.get("LOGENESIS_INTERPRET_CACHE_TTL", DEFAULT_CACHE_TTL))
+            cache_db = os.environ.get("LOGENESIS_INTERPRET_CACHE_DB")
+            documents = SqliteDocumentStore(cache_db, INTERPRETATION_TABLE) if cache_db else None
+            self.interpreter = CachingInterpreter(self.interpreter, cache_size, cache_ttl, documents)
+
+    async def process(self, packet: Union[IntentPacket, str], session_id: str = "global", memory_index: Optional[list] = None, recalled_context: Optional[str] = None,
+                      contract: Optional[EmbodimentContract] = None) -> LogenesisResponse:
         """Processes an incoming intent packet and generates a cognitive response.
 
         This method orchestrates the full cognitive cycle:
@@ -136,11 +100,231 @@ class LogenesisEngine:
             session_id: The session identifier for state persistence.
             memory_index: Optional list of memory items for recall checks.
             recalled_context: Optional string of previously recalled context.
+            contract: The packet's contract if it was already interpreted (see process_stream).
 
         Returns:
             A LogenesisResponse containing text, visual params, and system state.
         """
         # 0. Packet Normalization
+        packet = self._normalize_packet(packet)
+        if self._is_nirodha_trigger(packet):
+            return self.enter_nirodha()
+
+        # If currently in VOID or NIRODHA, wake up
+        if self.state != LogenesisState.AWAKENED:
+            self.state = LogenesisState.AWAKENED
+
+        # 1. Intent Interpretation and Embodiment Adaptation
+        contract, visual_params, input_intent = await self._perceive(packet, recalled_context, contract)
+
+        # 2. Physics of Thought (Entropy & Coherence)
+        current_state = self.state_store.get_state(session_id)
+
+        # 2a. Calculate Entropy & Apply Homeostasis (Level 1 Correction)
+        raw_entropy = self._calculate_entropy(input_intent)
+        structural_stability = 1.0 - raw_entropy
+
+        # Apply Homeostasis if entropy is high (Correction)
+        if raw_entropy > 0.6:
+            logger.info(f"Entropy High ({raw_entropy:.2f}). Applying Homeostasis.")
+            input_intent = self._apply_homeostasis(input_intent, raw_entropy)
+            # Re-calculate stability after correction (simulated improvement)
+            structural_stability = min(1.0, structural_stability + 0.2)
+
+        # 2b. Calculate Temporal Coherence
+        coherence = self._calculate_coherence(current_state, input_intent)
+
+        # 2c. Level 3 Check: Rejection (Collapse)
+        if raw_entropy > 0.9 or coherence < 0.2:
+            logger.warning(f"State Collapse: Entropy={raw_entropy:.2f}, Coherence={coherence:.2f}")
+            return self._collapse_response(raw_entropy, coherence)
+
+        # 2d. State Drift Calculation
+        proposed_state = self._drift_state(current_state, input_intent)
+
+        # Update previous vector for next cycle
+        proposed_state.previous_vector = current_state.current_vector
+
+        # Noise Filtering / Stillness Protocol
+        if proposed_state.velocity > SIGNIFICANCE_THRESHOLD:
+            self.state_store.update_state(session_id, proposed_state)
+            active_state = proposed_state
+        else:
+            active_state = current_state
+
+        # 3. Resonance Calculation (Determine the "Qualia") based on ACTIVE state
+        drifted_vector = active_state.current_vector
+        qualia = self._calculate_qualia(drifted_vector)
+        audio = self._calculate_audio(drifted_vector)
+        physics = self._calculate_physics(drifted_vector)
+
+        return self._synthesize_response(
+            packet, contract, visual_params, input_intent, drifted_vector, qualia, audio, physics,
+            StateMetrics(intent_entropy=raw_entropy, temporal_coherence=coherence, structural_stability=structural_stability),
+            memory_index, recalled_context
+        )
+
+    async def process_stream(self, packet: Union[IntentPacket, str], session_id: str = "global", memory_index: Optional[list] = None,
+                             recalled_context: Optional[str] = None) -> AsyncIterator[Union[VisualParameters, LogenesisResponse]]:
+        """Processes a packet like process(), morphing the visuals while the interpretation streams in.
+
+        For text, the contract is streamed (IntentInterpreter.interpret_stream) and
+        translated incrementally (EmbodimentAdapter.translate_partial), so the first
+        VisualParameters are yielded as soon as the intent category is known. Early
+        visuals are yielded when they change and pass the Manifestation Gate. The
+        LogenesisResponse of the completed contract comes last; other packets only
+        yield that response.
+
+        Args:
+            packet: The input data, either a raw string or an IntentPacket.
+            session_id: The session identifier for state persistence.
+            memory_index: Optional list of memory items for recall checks.
+            recalled_context: Optional string of previously recalled context.
+
+        Yields:
+            Early VisualParameters, then the LogenesisResponse.
+        """
+        packet = self._normalize_packet(packet)
+        contract = None
+        if packet.modality == "text" and not self._is_nirodha_trigger(packet):
+            early = None
+            async for partial in self.interpreter.interpret_stream(packet.raw_payload, context={"recalled": recalled_context}):
+                if partial.contract is not None:
+                    # The final visuals come with the response
+                    contract = partial.contract
+                    continue
+                visual_params = self.adapter.translate_partial(partial)
+                if visual_params is not None and visual_params != early and self._check_manifestation_gate(visual_params):
+                    early = visual_params
+                    yield visual_params
+        yield await self.process(packet, session_id, memory_index, recalled_context, contract=contract)
+
+    async def process_batch(self, packets: Sequence[Union[IntentPacket, str]], session_ids: Sequence[str], memory_index: Optional[list] = None, recalled_context: Optional[str] = None) -> List[LogenesisResponse]:
+        """Processes a micro-batch of requests, with the same responses and state
+        updates as awaiting process() on each of them in order.
+
+        Interpretations run concurrently. The physics then runs as array
+        expressions over the whole batch (see state_physics): entropy and
+        homeostasis in one pass, and drift and coherence over the sessions'
+        vectors gathered into an (S, 4) array. A session that appears several
+        times in the batch is advanced once per pass, in request order, so each
+        request sees the state left by the previous one. Responses that manifest
+        the same (non-random) shape share its formation data. Batches smaller
+        than MIN_VECTOR_BATCH simply go through process().
+
+        Args:
+            packets: The inputs, raw strings or IntentPackets.
+            session_ids: The session of each packet.
+            memory_index: Optional list of memory items for recall checks (shared by the batch).
+            recalled_context: Optional previously recalled context (shared by the batch).
+
+        Returns:
+            One LogenesisResponse per packet, in order.
+
+        Raises:
+            ValueError: If packets and session_ids differ in length.
+        """
+        if len(packets) != len(session_ids):
+            raise ValueError(f"Got {len(packets)} packets for {len(session_ids)} session ids")
+        if len(packets) < MIN_VECTOR_BATCH:
+            return [await self.process(packet, session_id, memory_index, recalled_context)
+                    for packet, session_id in zip(packets, session_ids)]
+        packets = [self._normalize_packet(packet) for packet in packets]
+        silenced = [self._is_nirodha_trigger(packet) for packet in packets]
+        active = [i for i, stop in enumerate(silenced) if not stop]
+        if not active:
+            return [self.enter_nirodha() for _ in packets]
+
+        # 1. Intent Interpretation and Embodiment Adaptation
+        perceived = await asyncio.gather(*(self._perceive(packets[i], recalled_context) for i in active))
+        intents = [input_intent for _, _, input_intent in perceived]
+
+        # 2a. Entropy & Homeostasis do not depend on session state
+        targets = state_physics.to_array(intents)
+        raw_entropy = state_physics.entropy(targets)
+        stability = 1.0 - raw_entropy
+        high = raw_entropy > 0.6
+        if high.any():
+            targets = np.where(high[:, None], state_physics.homeostasis(targets, raw_entropy), targets)
+            stability = np.where(high, np.minimum(1.0, stability + 0.2), stability)
+            for k in np.flatnonzero(high).tolist():
+                logger.info(f"Entropy High ({raw_entropy[k]:.2f}). Applying Homeostasis.")
+                intents[k] = intents[k].model_copy(update=dict(zip(state_physics.VECTOR_FIELDS, targets[k].tolist())))
+
+        # 2b-2d. Coherence, collapse and drift, one pass per repeat of a session
+        rows: Dict[str, int] = {}
+        session_rows = np.array([rows.setdefault(session_ids[i], len(rows)) for i in active])
+        states = [self.state_store.get_state(session_id) for session_id in rows]
+        vectors = state_physics.to_array(state.current_vector for state in states)
+        inertia = np.array([state.inertia for state in states])
+        passes = np.zeros(len(active), dtype=np.int64)
+        seen: Dict[int, int] = {}
+        for k, row in enumerate(session_rows.tolist()):
+            passes[k] = seen[row] = seen.get(row, -1) + 1
+
+        coherence = np.empty(len(active))
+        collapsed = np.empty(len(active), dtype=bool)
+        drifted = np.empty((len(active), 4))
+        active_states: List[ExpressionState] = [None] * len(active)
+        for step in range(int(passes.max()) + 1):
+            batch = np.flatnonzero(passes == step)
+            sessions = session_rows[batch]
+            coherence[batch] = state_physics.coherence(vectors[sessions], inertia[sessions], targets[batch])
+            collapsed[batch] = (raw_entropy[batch] > 0.9) | (coherence[batch] < 0.2)
+            proposed, velocity, effective_inertia = state_physics.drift(vectors[sessions], targets[batch])
+            moved = ~collapsed[batch] & (velocity > SIGNIFICANCE_THRESHOLD)
+            for j in np.flatnonzero(moved).tolist():
+                row = int(sessions[j])
+                state = ExpressionState(
+                    current_vector=state_physics.to_vector(proposed[j].tolist()),
+                    previous_vector=states[row].current_vector,
+                    velocity=float(velocity[j]),
+                    inertia=float(effective_inertia[j]),
+                    last_updated=datetime.now()
+                )
+                self.state_store.update_state(session_ids[active[batch[j]]], state)
+                states[row] = state
+            vectors[sessions[moved]] = proposed[moved]
+            inertia[sessions[moved]] = effective_inertia[moved]
+            drifted[batch] = vectors[sessions]
+            for k, row in zip(batch.tolist(), sessions.tolist()):
+                active_states[k] = states[row]
+
+        # 3. Resonance Calculation over every request's active state
+        colors, shapes, intensity, turbulence = state_physics.qualia(drifted)
+        rhythm, textures, amplitude = state_physics.audio(drifted)
+        spawn_rate, decay = state_physics.physics(drifted)
+        intensity, turbulence, rhythm, amplitude = intensity.tolist(), turbulence.tolist(), rhythm.tolist(), amplitude.tolist()
+        spawn_rate, decay = spawn_rate.tolist(), decay.tolist()
+        raw_entropy, stability, coherence = raw_entropy.tolist(), stability.tolist(), coherence.tolist()
+
+        # 4-6. Responses, in order (the engine state follows the same sequence as process())
+        responses = []
+        formations: Dict[BaseShape, LightIntent] = {}
+        k = 0
+        for i, stop in enumerate(silenced):
+            if stop:
+                responses.append(self.enter_nirodha())
+                continue
+            self.state = LogenesisState.AWAKENED
+            if collapsed[k]:
+                logger.warning(f"State Collapse: Entropy={raw_entropy[k]:.2f}, Coherence={coherence[k]:.2f}")
+                responses.append(self._collapse_response(raw_entropy[k], coherence[k]))
+            else:
+                contract, visual_params, _ = perceived[k]
+                responses.append(self._synthesize_response(
+                    packets[i], contract, visual_params, intents[k], active_states[k].current_vector,
+                    VisualQualia(color=colors[k], intensity=intensity[k], turbulence=turbulence[k], shape=shapes[k]),
+                    AudioQualia(rhythm_density=rhythm[k], tone_texture=textures[k], amplitude_bias=amplitude[k]),
+                    PhysicsParams(spawn_rate=spawn_rate[k], decay_rate=decay[k]),
+                    StateMetrics(intent_entropy=raw_entropy[k], temporal_coherence=coherence[k], structural_stability=stability[k]),
+                    memory_index, recalled_context, formations
+                ))
+            k += 1
+        return responses
+
+    def _normalize_packet(self, packet: Union[IntentPacket, str]) -> IntentPacket:
+        """Wraps raw text into a text IntentPacket."""
         if isinstance(packet, str):
             packet = IntentPacket(
                 modality="text",
@@ -149,26 +333,34 @@ class LogenesisEngine:
                 confidence=1.0,
                 raw_payload=packet
             )
+        return packet
 
-        text = ""
-        if packet.modality == "text":
-            text = packet.raw_payload
-            # Check for Nirodha Triggers (The "Silence Protocol")
-            if any(w in text.lower() for w in ["sleep", "stop", "rest", "retreat", "bye", "enough", "พอ", "พัก"]):
-                return self.enter_nirodha()
+    def _is_nirodha_trigger(self, packet: IntentPacket) -> bool:
+        """Checks a text packet for Nirodha Triggers (The "Silence Protocol")."""
+        if packet.modality != "text":
+            return False
+        text = packet.raw_payload.lower()
+        return any(w in text for w in ["sleep", "stop", "rest", "retreat", "bye", "enough", "พอ", "พัก"])
 
-        # If currently in VOID or NIRODHA, wake up
-        if self.state != LogenesisState.AWAKENED:
-            self.state = LogenesisState.AWAKENED
+    async def _perceive(self, packet: IntentPacket, recalled_context: Optional[str], contract: Optional[EmbodimentContract] = None) -> Tuple[Optional[EmbodimentContract], Optional[VisualParameters], Optional[IntentVector]]:
+        """Interprets a packet into its contract, visual parameters and intent vector.
 
-        contract = None
+        Args:
+            packet: The normalized input packet.
+            recalled_context: Optional string of previously recalled context.
+            contract: The contract of a text packet, if it was already interpreted.
+
+        Returns:
+            The EmbodimentContract (text input only), the VisualParameters and the IntentVector.
+        """
         visual_params = None
         input_intent = None
 
         if packet.modality == "text":
             # 1. Intent Interpretation (The "Cognitive Cycle")
             # Returns EmbodimentContract (High Level)
-            contract = await self.interpreter.interpret(text, context={"recalled": recalled_context})
+            if contract is None:
+                contract = await self.interpreter.interpret(packet.raw_payload, context={"recalled": recalled_context})
 
             # 1.5 Adaptation (The "Nervous System")
             # Translates Contract -> VisualParameters (Low Level)
@@ -193,59 +385,48 @@ class LogenesisEngine:
                          base_shape=BaseShape.CLOUD, turbulence=packet.energy_level, particle_density=packet.confidence, color_palette="#FFFFFF"
                      )
                  )
+        return contract, visual_params, input_intent
 
-        # 2. Physics of Thought (Entropy & Coherence)
-        current_state = self.state_store.get_state(session_id)
-
-        # 2a. Calculate Entropy & Apply Homeostasis (Level 1 Correction)
-        raw_entropy = self._calculate_entropy(input_intent)
-        structural_stability = 1.0 - raw_entropy
-
-        # Apply Homeostasis if entropy is high (Correction)
-        if raw_entropy > 0.6:
-            logger.info(f"Entropy High ({raw_entropy:.2f}). Applying Homeostasis.")
-            input_intent = self._apply_homeostasis(input_intent, raw_entropy)
-            # Re-calculate stability after correction (simulated improvement)
-            structural_stability = min(1.0, structural_stability + 0.2)
-
-        # 2b. Calculate Temporal Coherence
-        coherence = self._calculate_coherence(current_state, input_intent)
-
-        # 2c. Level 3 Check: Rejection (Collapse)
-        if raw_entropy > 0.9 or coherence < 0.2:
-            logger.warning(f"State Collapse: Entropy={raw_entropy:.2f}, Coherence={coherence:.2f}")
-            return LogenesisResponse(
-                state=LogenesisState.COLLAPSED,
-                text_content="I cannot form a stable internal structure for this request.",
-                visual_qualia=VisualQualia(color="#000000", intensity=0.0, turbulence=0.0, shape="void"),
-                audio_qualia=AudioQualia(rhythm_density=0.0, tone_texture="static", amplitude_bias=0.0),
-                state_metrics=StateMetrics(
-                    intent_entropy=raw_entropy,
-                    temporal_coherence=coherence,
-                    structural_stability=0.0
-                ),
-                manifestation_granted=False
-            )
-
-        # 2d. State Drift Calculation
-        proposed_state = self._drift_state(current_state, input_intent)
+    def _collapse_response(self, raw_entropy: float, coherence: float) -> LogenesisResponse:
+        """Builds the Level 3 rejection response for a collapsed state."""
+        return LogenesisResponse(
+            state=LogenesisState.COLLAPSED,
+            text_content="I cannot form a stable internal structure for this request.",
+            visual_qualia=VisualQualia(color="#000000", intensity=0.0, turbulence=0.0, shape="void"),
+            audio_qualia=AudioQualia(rhythm_density=0.0, tone_texture="static", amplitude_bias=0.0),
+            state_metrics=StateMetrics(
+                intent_entropy=raw_entropy,
+                temporal_coherence=coherence,
+                structural_stability=0.0
+            ),
+            manifestation_granted=False
+        )
 
-        # Update previous vector for next cycle
-        proposed_state.previous_vector = current_state.current_vector
+    def _synthesize_response(self, packet: IntentPacket, contract: Optional[EmbodimentContract], visual_params: VisualParameters,
+                             input_intent: IntentVector, drifted_vector: IntentVector, qualia: VisualQualia, audio: AudioQualia,
+                             physics: PhysicsParams, metrics: StateMetrics, memory_index: Optional[list],
+                             recalled_context: Optional[str], formations: Optional[Dict[BaseShape, LightIntent]] = None) -> LogenesisResponse:
+        """Completes a response from the resolved physics (recall, manifestation and text).
 
-        # Noise Filtering / Stillness Protocol
-        significance_threshold = 0.05
-        if proposed_state.velocity > significance_threshold:
-            self.state_store.update_state(session_id, proposed_state)
-            active_state = proposed_state
-        else:
-            active_state = current_state
+        Args:
+            packet: The normalized input packet.
+            contract: The interpreter's contract, if any.
+            visual_params: The visual parameters of the input.
+            input_intent: The (corrected) input intent vector.
+            drifted_vector: The active state's vector.
+            qualia: Visual qualia derived from the active vector.
+            audio: Audio qualia derived from the active vector.
+            physics: Physics parameters derived from the active vector.
+            metrics: Entropy, coherence and stability of the transition.
+            memory_index: Optional list of memory items for recall checks.
+            recalled_context: Optional string of previously recalled context.
+            formations: Optional LightIntents by shape, shared by the responses of a batch.
 
-        # 3. Resonance Calculation (Determine the "Qualia") based on ACTIVE state
-        drifted_vector = active_state.current_vector
-        qualia = self._calculate_qualia(drifted_vector)
-        audio = self._calculate_audio(drifted_vector)
-        physics = self._calculate_physics(drifted_vector)
+        Returns:
+            The LogenesisResponse.
+        """
+        text = packet.raw_payload if packet.modality == "text" else ""
+        coherence = metrics.temporal_coherence
 
         # 4. Recall Logic
         recall_proposal = None
@@ -260,7 +441,13 @@ class LogenesisEngine:
         if is_manifestation_granted:
             # We now trust the LLM's visual parameters more than the old gate logic,
             # but we can fallback to formation logic if shape is explicit.
-            light_intent = self._create_intent_from_params(visual_params)
+            shape = visual_params.visual_parameters.base_shape
+            if formations is None or shape == BaseShape.SCATTER: # Scatters are random per request
+                light_intent = self._create_intent_from_params(visual_params)
+            else:
+                if shape not in formations:
+                    formations[shape] = self._create_intent_from_params(visual_params)
+                light_intent = formations[shape].model_copy()
 
         # 6. Synthesize Text Response
         # Prefer the text generated by the Embodiment Contract (LLM) if available
@@ -288,11 +475,7 @@ class LogenesisEngine:
             audio_qualia=audio,
             physics_params=physics,
             intent_debug=drifted_vector,
-            state_metrics=StateMetrics(
-                intent_entropy=raw_entropy,
-                temporal_coherence=coherence,
-                structural_stability=structural_stability
-            ),
+            state_metrics=metrics,
             recall_proposal=recall_proposal,
             light_intent=light_intent,
             visual_analysis=visual_params, # The new payload
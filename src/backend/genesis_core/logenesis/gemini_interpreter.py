@@ -2,15 +2,19 @@ import os
 import json
 import logging
 import asyncio
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, AsyncIterator, List, Optional
 import google.generativeai as genai
 
 from .interpreter import IntentInterpreter
-from .visual_schemas import EmbodimentContract
+from .partial_json import PartialJSONParser
+from .visual_schemas import ContractIntentCategory, EmbodimentContract, PartialContract
 from .verifier import VisualVerifier
 
 logger = logging.getLogger("GeminiInterpreter")
 
+_CATEGORIES = {category.value for category in ContractIntentCategory}
+
 class GeminiIntentInterpreter(IntentInterpreter):
     """Implementation of IntentInterpreter using Google's Gemini Pro.
 
@@ -57,22 +61,24 @@ class GeminiIntentInterpreter(IntentInterpreter):
         OUTPUT JSON SCHEMA (EmbodimentContract):
         Return ONLY valid JSON matching this structure:
         {
-          "temporal_state": {
-            "phase": "MANIFESTING",  // Always 'MANIFESTING' for the final response.
-            "stability": 0.8,        // 0.0 (Volatile/Changing) -> 1.0 (Stable/Locked)
-            "duration_ms": 0
+          "intent": {
+            "category": "CHIT_CHAT", // Options: CHIT_CHAT, ANALYTIC, CREATIVE, SYSTEM_OPS
+            "purity": 1.0            // 0.0 (Mixed) -> 1.0 (Pure Intent)
           },
           "cognitive": {
             "effort": 0.5,           // 0.0 (Reflex/Easy) -> 1.0 (Deep Reasoning/Hard)
             "uncertainty": 0.1,      // 0.0 (Confident) -> 1.0 (Confused/Guessing)
             "latency_factor": 0.0
           },
-          "intent": {
-            "category": "CHIT_CHAT", // Options: CHIT_CHAT, ANALYTIC, CREATIVE, SYSTEM_OPS
-            "purity": 1.0            // 0.0 (Mixed) -> 1.0 (Pure Intent)
+          "temporal_state": {
+            "phase": "MANIFESTING",  // Always 'MANIFESTING' for the final response.
+            "stability": 0.8,        // 0.0 (Volatile/Changing) -> 1.0 (Stable/Locked)
+            "duration_ms": 0
           },
           "text_content": "Write your verbal response to the user here."
         }
+        Emit the keys in exactly this order: the interface starts morphing as soon as
+        "intent" and "cognitive" arrive, while "text_content" is still being written.
 
         INTENT CATEGORIES:
         - ANALYTIC: For logic, math, code, definitions, specific questions. (Maps to Cubic forms)
@@ -102,28 +108,7 @@ class GeminiIntentInterpreter(IntentInterpreter):
             raise RuntimeError("Gemini model not initialized")
 
         try:
-            # Construct the prompt with context
-            prompt = f"User Input: {text}\n"
-            if context:
-                prompt += f"Context: {json.dumps(context)}\n"
-
-            # Call Gemini (async wrapper)
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt,
-                generation_config={"response_mime_type": "application/json"}
-            )
-
-            raw_json = response.text
-            try:
-                data = json.loads(raw_json)
-            except json.JSONDecodeError:
-                # Sometimes models wrap in markdown ```json ... ``` despite mime_type
-                if "```json" in raw_json:
-                    raw_json = raw_json.split("```json")[1].split("```")[0].strip()
-                    data = json.loads(raw_json)
-                else:
-                    raise
+            data = await self._generate(self._prompt(text, context))
 
             # Verify and Repair
             return VisualVerifier.verify_contract(data)
@@ -131,3 +116,173 @@ class GeminiIntentInterpreter(IntentInterpreter):
         except Exception as e:
             logger.error(f"Gemini Interpretation failed: {e}")
             raise e
+
+    async def interpret_stream(self, text: str, context: Optional[Dict[str, Any]] = None) -> AsyncIterator[PartialContract]:
+        """Streams the EmbodimentContract of the user text from Gemini.
+
+        The answer is parsed as it arrives (PartialJSONParser), so the intent
+        category and cognitive load are yielded as soon as the model has written
+        them, followed by the response text token by token. The last update
+        carries the verified contract.
+
+        Args:
+            text: The user input text.
+            context: Optional conversational context.
+
+        Yields:
+            PartialContract updates, the last one with `contract` set.
+
+        Raises:
+            RuntimeError: If the model is not initialized.
+            Exception: If generation or parsing fails.
+        """
+        if not self.model:
+            raise RuntimeError("Gemini model not initialized")
+
+        try:
+            parser = PartialJSONParser()
+            update = PartialContract()
+            async for chunk in self._generate_stream(self._prompt(text, context)):
+                partial = self._partial_contract(parser.feed(chunk), update)
+                if partial is not update:
+                    update = partial
+                    yield update
+
+            data = parser.value() if parser.done else json.loads(parser.text)
+            yield PartialContract.from_contract(VisualVerifier.verify_contract(data), update.text_content)
+
+        except Exception as e:
+            logger.error(f"Gemini streaming interpretation failed: {e}")
+            raise e
+
+    async def interpret_batch(self, texts: List[str], contexts: List[Optional[Dict[str, Any]]]) -> List[EmbodimentContract]:
+        """Generates the contracts of several independent inputs with one Gemini call.
+
+        The inputs are numbered in a single prompt and the model is asked for a JSON
+        array of contracts in the same order.
+
+        Args:
+            texts: The user input texts.
+            contexts: The conversational context of each text (or None).
+
+        Returns:
+            One verified EmbodimentContract per text, in order.
+
+        Raises:
+            RuntimeError: If the model is not initialized.
+            ValueError: If the model does not return one contract per input.
+            Exception: If generation or parsing fails.
+        """
+        if len(texts) == 1:
+            return [await self.interpret(texts[0], contexts[0])]
+        if not self.model:
+            raise RuntimeError("Gemini model not initialized")
+
+        try:
+            prompt = (f"Interpret each of the following {len(texts)} inputs independently. "
+                      f"Return ONLY a JSON array of {len(texts)} Embodiment Contracts, one per input, in the same order.\n")
+            for i, (text, context) in enumerate(zip(texts, contexts), 1):
+                prompt += f"\n[{i}] User Input: {text}\n"
+                if context:
+                    prompt += f"[{i}] Context: {json.dumps(context)}\n"
+
+            data = await self._generate(prompt)
+            if not isinstance(data, list) or len(data) != len(texts):
+                raise ValueError(f"Expected a JSON array of {len(texts)} contracts")
+            return [VisualVerifier.verify_contract(item) for item in data]
+
+        except Exception as e:
+            logger.error(f"Gemini batch interpretation failed: {e}")
+            raise e
+
+    def _prompt(self, text: str, context: Optional[Dict[str, Any]]) -> str:
+        """The prompt of one input, with its context."""
+        prompt = f"User Input: {text}\n"
+        if context:
+            prompt += f"Context: {json.dumps(context)}\n"
+        return prompt
+
+    @staticmethod
+    def _partial_contract(data: Any, previous: PartialContract) -> PartialContract:
+        """The update for a partially parsed contract (`previous` itself if nothing new is known)."""
+        if not isinstance(data, dict):
+            return previous
+        intent = data.get("intent") if isinstance(data.get("intent"), dict) else {}
+        cognitive = data.get("cognitive") if isinstance(data.get("cognitive"), dict) else {}
+
+        fields = {}
+        category = intent.get("category")
+        # An unfinished category string is not a valid category yet
+        if isinstance(category, str) and category.upper() in _CATEGORIES:
+            fields["category"] = ContractIntentCategory(category.upper())
+        for name in ("effort", "uncertainty"):
+            value = cognitive.get(name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                fields[name] = max(0.0, min(float(value), 1.0))
+        text = data.get("text_content")
+        if isinstance(text, str):
+            fields["text_content"] = text
+
+        if all(getattr(previous, name) == value for name, value in fields.items()):
+            return previous
+        text = fields.get("text_content", previous.text_content)
+        fields["text_delta"] = text[len(previous.text_content):] if text.startswith(previous.text_content) else text
+        return previous.model_copy(update=fields)
+
+    async def _generate(self, prompt: str) -> Any:
+        """Calls Gemini (in a worker thread) and parses its JSON answer."""
+        response = await asyncio.to_thread(
+            self.model.generate_content,
+            prompt,
+            generation_config={"response_mime_type": "application/json"}
+        )
+
+        raw_json = response.text
+        try:
+            return json.loads(raw_json)
+        except json.JSONDecodeError:
+            # Sometimes models wrap in markdown ```json ... ``` despite mime_type
+            if "```json" in raw_json:
+                raw_json = raw_json.split("```json")[1].split("```")[0].strip()
+                return json.loads(raw_json)
+            raise
+
+    async def _generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Calls Gemini with streaming (in a worker thread) and yields its text chunks as they arrive."""
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        end = object()
+        abandoned = threading.Event()
+
+        def produce():
+            try:
+                response = self.model.generate_content(
+                    prompt,
+                    generation_config={"response_mime_type": "application/json"},
+                    stream=True
+                )
+                for chunk in response:
+                    if abandoned.is_set():
+                        break
+                    loop.call_soon_threadsafe(chunks.put_nowait, chunk.text)
+                item = end
+            except Exception as e:
+                item = e
+            try:
+                loop.call_soon_threadsafe(chunks.put_nowait, item)
+            except RuntimeError:
+                pass # The loop closed while the model was still answering
+
+        worker = asyncio.ensure_future(asyncio.to_thread(produce))
+        try:
+            while True:
+                item = await chunks.get()
+                if item is end:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+            await worker
+        finally:
+            # Stops reading the model's answer when the caller stops early
+            abandoned.set()
@@ -1,6 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from .visual_schemas import EmbodimentContract
+from typing import Dict, Any, AsyncIterator, List, Optional
+from .visual_schemas import EmbodimentContract, PartialContract
 
 class IntentInterpreter(ABC):
     """Abstract Base Class for interpreting natural language into EmbodimentContract.
@@ -21,3 +22,35 @@ class IntentInterpreter(ABC):
             An EmbodimentContract describing the system's intent, cognitive state, and response.
         """
         pass
+
+    async def interpret_batch(self, texts: List[str], contexts: List[Optional[Dict[str, Any]]]) -> List[EmbodimentContract]:
+        """Translates several independent inputs at once (used by BatchingInterpreter).
+
+        The default runs interpret() concurrently; interpreters that can do better
+        (one LLM call, one pass over the inputs) override it.
+
+        Args:
+            texts: The raw input texts.
+            contexts: The context of each text (or None).
+
+        Returns:
+            One EmbodimentContract per text, in order.
+        """
+        return list(await asyncio.gather(*(self.interpret(text, context) for text, context in zip(texts, contexts))))
+
+    async def interpret_stream(self, text: str, context: Optional[Dict[str, Any]] = None) -> AsyncIterator[PartialContract]:
+        """Translates the user's text, yielding the contract's fields as they become known.
+
+        Updates carry the intent category and cognitive load as soon as they are
+        known, then the response text token by token; the last update carries the
+        verified contract. The default yields that single last update; interpreters
+        backed by a streaming model override it.
+
+        Args:
+            text: The raw input text from the user.
+            context: Optional dictionary containing conversational or system context.
+
+        Yields:
+            PartialContract updates, the last one with `contract` set.
+        """
+        yield PartialContract.from_contract(await self.interpret(text, context))
@@ -0,0 +1,310 @@
+import json
+import logging
+import os
+import struct
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .schemas import ExpressionState, IntentVector
+from src.backend.storage import DEFAULT_IDLE_TTL, DEFAULT_MAX_RESIDENT
+from .state_store import DEFAULT_FLUSH_INTERVAL, StateStore
+
+logger = logging.getLogger("LogStateStore")
+
+VECTOR_FIELDS = ("epistemic_need", "subjective_weight", "decision_urgency", "precision_required")
+
+# Fixed binary layout of one session state (89 bytes, little-endian, packed);
+# `updated` is last_updated as a POSIX timestamp
+RECORD_DTYPE = np.dtype([
+    ("current", "<f8", (4,)),
+    ("previous", "<f8", (4,)),
+    ("velocity", "<f8"),
+    ("inertia", "<f8"),
+    ("updated", "<f8"),
+    ("flags", "u1"),
+])
+FLAG_PREVIOUS = 1 # previous_vector is set
+FLAG_EXTRA = 2    # A JSON [current, previous] raw_embedding pair follows the record
+
+# Log entry: key length, UTF-8 key, record[, extra length, extra JSON]
+_KEY = struct.Struct("<H")
+_EXTRA = struct.Struct("<I")
+# Snapshot: magic, version, session count, key blob length, extras blob length,
+# then the records, the NUL-separated keys and the extras JSON ({key: [current, previous]})
+_SNAPSHOT = struct.Struct("<4sIQQQ")
+SNAPSHOT_MAGIC = b"LGSS"
+SNAPSHOT_VERSION = 1
+
+# Compact once the log outgrows both this size and `compact_ratio` x the snapshot
+DEFAULT_COMPACT_MIN_BYTES = 4 << 20
+
+
+class LogStateStore(StateStore):
+    """Append-only, log-structured backend for Logenesis expression states.
+
+    Flushes append one fixed-layout record per dirty session to `filepath`
+    instead of rewriting every session; once the log grows past the compaction
+    threshold it is folded into a snapshot (written atomically) and truncated.
+    All session records live in one structured numpy table indexed by session id,
+    so startup is one read of the snapshot plus a replay of the log tail, and
+    ExpressionState objects are only built, without validation, for sessions
+    that are actually requested (and again after being dropped from the cache). Write-behind batching, start() and aclose() work
+    as in StateStore.
+
+    Session ids must not contain NUL characters (or exceed 64 KiB). last_updated is stored as a
+    timestamp and comes back as a naive local datetime.
+    """
+    def __init__(self, filepath: str = "logenesis_state.log", flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 compact_ratio: float = 1.0, compact_min_bytes: int = DEFAULT_COMPACT_MIN_BYTES,
+                 max_resident: Optional[int] = DEFAULT_MAX_RESIDENT, idle_ttl: Optional[float] = DEFAULT_IDLE_TTL):
+        """Initializes the LogStateStore.
+
+        Args:
+            filepath: Path of the append-only log; the snapshot sits next to it (.snapshot).
+            flush_interval: Seconds between batched flushes; 0 saves on every update.
+            compact_ratio: Compact when the log is this many times larger than the snapshot...
+            compact_min_bytes: ...and larger than this.
+            max_resident: Most sessions kept decoded in memory (None: unbounded).
+            idle_ttl: Seconds before an unused session is dropped from memory (None: never).
+        """
+        self.snapshot_path = os.path.splitext(filepath)[0] + ".snapshot"
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self._records = np.zeros(16, dtype=RECORD_DTYPE)
+        self._keys: List[str] = []
+        self._index: Dict[str, int] = {}
+        # Session -> JSON [current, previous] raw_embedding pair, for the few states that have one
+        self._extras: Dict[str, str] = {}
+        self._log_size = 0
+        self._snapshot_size = 0
+        self.compactions = 0
+        super().__init__(filepath, flush_interval, max_resident, idle_ttl)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _load(self):
+        """Loads the snapshot, then replays the log written since."""
+        try:
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, 'rb') as f:
+                    self._load_snapshot(f.read())
+            if os.path.exists(self.filepath):
+                with open(self.filepath, 'rb') as f:
+                    data = f.read()
+                end = self._replay(data)
+                if end < len(data):
+                    logger.warning(f"Dropping {len(data) - end} bytes of incomplete log tail")
+                    with open(self.filepath, 'r+b') as f:
+                        f.truncate(end)
+                self._log_size = end
+        except Exception as e:
+            logger.error(f"Error loading state store: {e}")
+
+    def _load_snapshot(self, data: bytes):
+        magic, version, count, keys_len, extras_len = _SNAPSHOT.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported state snapshot: {magic!r} v{version}")
+        offset = _SNAPSHOT.size
+        records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count, offset=offset)
+        offset += records.nbytes
+        self._records = np.zeros(max(16, count), dtype=RECORD_DTYPE)
+        self._records[:count] = records
+        self._keys = data[offset:offset + keys_len].decode().split("\x00") if count else []
+        self._index = dict(zip(self._keys, range(count)))
+        offset += keys_len
+        self._extras = {key: json.dumps(pair) for key, pair in json.loads(data[offset:offset + extras_len]).items()} \
+            if extras_len else {}
+        self._snapshot_size = len(data)
+
+    def _replay(self, data: bytes) -> int:
+        """Applies the complete log entries in `data`; returns where they end."""
+        size = RECORD_DTYPE.itemsize
+        latest: Dict[str, Tuple[bytes, Optional[str]]] = {}
+        pos, n = 0, len(data)
+        while pos + _KEY.size <= n:
+            (key_len,) = _KEY.unpack_from(data, pos)
+            start = pos + _KEY.size + key_len
+            end = start + size
+            if end > n:
+                break
+            extra = None
+            if data[end - 1] & FLAG_EXTRA:
+                if end + _EXTRA.size > n:
+                    break
+                (extra_len,) = _EXTRA.unpack_from(data, end)
+                if end + _EXTRA.size + extra_len > n:
+                    break
+                extra = data[end + _EXTRA.size:end + _EXTRA.size + extra_len].decode()
+                end += _EXTRA.size + extra_len
+            latest[data[pos + _KEY.size:start].decode()] = (data[start:start + size], extra)
+            pos = end
+        if latest:
+            rows = np.fromiter((self._row(key) for key in latest), dtype=np.intp, count=len(latest))
+            self._records[rows] = np.frombuffer(b"".join(record for record, _ in latest.values()), dtype=RECORD_DTYPE)
+            for key, (_, extra) in latest.items():
+                self._set_extra(key, extra)
+        return pos
+
+    def _row(self, session_id: str) -> int:
+        """Table row of a session, appending one if it is new."""
+        row = self._index.get(session_id)
+        if row is None:
+            row = self._index[session_id] = len(self._keys)
+            self._keys.append(session_id)
+            if row == len(self._records):
+                grown = np.zeros(2 * row, dtype=RECORD_DTYPE)
+                grown[:row] = self._records
+                self._records = grown
+        return row
+
+    def _set_extra(self, session_id: str, extra: Optional[str]):
+        if extra is None:
+            self._extras.pop(session_id, None)
+        else:
+            self._extras[session_id] = extra
+
+    @staticmethod
+    def _encode(state: ExpressionState) -> Tuple[tuple, Optional[str]]:
+        """Record values (the float fields in layout order, then flags) and raw_embedding JSON
+        (None if neither vector has one) of a state."""
+        current, previous = state.current_vector, state.previous_vector
+        flags = 0 if previous is None else FLAG_PREVIOUS
+        extra = None
+        if current.raw_embedding is not None or (previous is not None and previous.raw_embedding is not None):
+            flags |= FLAG_EXTRA
+            extra = json.dumps([current.raw_embedding, None if previous is None else previous.raw_embedding])
+        if previous is None:
+            previous_values = (0.0, 0.0, 0.0, 0.0)
+        else:
+            previous_values = (previous.epistemic_need, previous.subjective_weight, previous.decision_urgency,
+                               previous.precision_required)
+        return (current.epistemic_need, current.subjective_weight, current.decision_urgency,
+                current.precision_required, *previous_values, state.velocity, state.inertia,
+                state.last_updated.timestamp(), flags), extra
+
+    @staticmethod
+    def _pack(values: List[tuple]) -> np.ndarray:
+        """Record array from _encode() values."""
+        flat = np.array(values, dtype=np.float64).reshape(len(values), 12)
+        batch = np.empty(len(values), dtype=RECORD_DTYPE)
+        batch["current"] = flat[:, 0:4]
+        batch["previous"] = flat[:, 4:8]
+        batch["velocity"] = flat[:, 8]
+        batch["inertia"] = flat[:, 9]
+        batch["updated"] = flat[:, 10]
+        batch["flags"] = flat[:, 11]
+        return batch
+
+    def _decode(self, session_id: str) -> Optional[ExpressionState]:
+        """Builds a session's state from its table row, or None if it has none (no
+        validation: it was validated when written)."""
+        row = self._index.get(session_id)
+        if row is None:
+            return None
+        record = self._records[row]
+        extra = self._extras.get(session_id)
+        embeddings = json.loads(extra) if extra is not None else [None, None]
+        previous = None
+        if record["flags"] & FLAG_PREVIOUS:
+            previous = IntentVector.model_construct(**dict(zip(VECTOR_FIELDS, record["previous"].tolist())),
+                                                    raw_embedding=embeddings[1])
+        return ExpressionState.model_construct(
+            current_vector=IntentVector.model_construct(**dict(zip(VECTOR_FIELDS, record["current"].tolist())),
+                                                        raw_embedding=embeddings[0]),
+            previous_vector=previous,
+            velocity=float(record["velocity"]),
+            inertia=float(record["inertia"]),
+            last_updated=datetime.fromtimestamp(float(record["updated"])),
+        )
+
+    def _snapshot(self):
+        """Encodes the dirty sessions into the table and a log chunk; adds a copy of the
+        whole table when the log is due for compaction."""
+        if not self._dirty:
+            return None, []
+        flushed = list(self._dirty)
+        self._dirty.clear()
+        encoded = [self._encode(self._cache[sid]) for sid in flushed]
+        batch = self._pack([values for values, _ in encoded])
+        rows = np.fromiter(map(self._row, flushed), dtype=np.intp, count=len(flushed)) # May grow the table
+        self._records[rows] = batch
+        records = batch.tobytes()
+        size = RECORD_DTYPE.itemsize
+        parts = []
+        for i, (sid, (_, extra)) in enumerate(zip(flushed, encoded)):
+            self._set_extra(sid, extra)
+            key = sid.encode()
+            parts += (_KEY.pack(len(key)), key, records[i * size:(i + 1) * size])
+            if extra is not None:
+                extra = extra.encode()
+                parts += (_EXTRA.pack(len(extra)), extra)
+        chunk = b"".join(parts)
+        self.flushes += 1
+        log_size = self._log_size + len(chunk)
+        compaction = None
+        if log_size > self.compact_min_bytes and log_size > self.compact_ratio * self._snapshot_size:
+            compaction = self._table()
+        return (chunk, compaction), flushed
+
+    def _table(self) -> Tuple[np.ndarray, List[str], Dict[str, str]]:
+        count = len(self._keys)
+        return self._records[:count].copy(), list(self._keys), dict(self._extras)
+
+    def _write(self, payload):
+        chunk, compaction = payload
+        # Written at the end of the last complete entry rather than appended, so the torn
+        # tail of a failed write (e.g. ENOSPC mid-chunk) is overwritten by the retry
+        with os.fdopen(os.open(self.filepath, os.O_RDWR | os.O_CREAT, 0o666), 'r+b') as f:
+            f.seek(self._log_size)
+            f.write(chunk)
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_size += len(chunk)
+        if compaction is not None:
+            self._compact(*compaction)
+
+    def _compact(self, records: np.ndarray, keys: List[str], extras: Dict[str, str]):
+        """Writes `records` (the table as of the last log entry) as the new snapshot, then
+        empties the log. A crash in between only leaves log entries the snapshot already holds."""
+        keys_blob = "\x00".join(keys).encode()
+        extras_blob = ("{" + ",".join(f"{json.dumps(k)}:{v}" for k, v in extras.items()) + "}").encode() \
+            if extras else b""
+        header = _SNAPSHOT.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(keys), len(keys_blob), len(extras_blob))
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".state-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for part in (header, records.tobytes(), keys_blob, extras_blob):
+                    f.write(part)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        with open(self.filepath, 'wb') as f:
+            os.fsync(f.fileno())
+        self._snapshot_size = len(header) + records.nbytes + len(keys_blob) + len(extras_blob)
+        self._log_size = 0
+        self.compactions += 1
+
+    def compact(self):
+        """Flushes pending changes and folds the log into the snapshot now."""
+        self.flush()
+        self._compact(*self._table())
+
+    def update_state(self, session_id: str, state: ExpressionState):
+        """Updates the state for a session; it is appended to the log by the next flush.
+
+        Raises:
+            ValueError: If the session id contains a NUL character or exceeds 65535 bytes.
+        """
+        if "\x00" in session_id or len(session_id.encode()) > 0xFFFF:
+            raise ValueError("Session ids must be under 64 KiB and contain no NUL characters")
+        super().update_state(session_id, state)
@@ -0,0 +1,129 @@
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+_WHITESPACE = " \t\r\n"
+# A string cut inside a unicode escape ("\u00"), or between the two halves of a
+# surrogate pair, is cut back to before the escape
+_OPEN_UNICODE = re.compile(r"(\\+)u([0-9a-fA-F]{0,3}|[dD][89abAB][0-9a-fA-F]{2})$")
+
+class PartialJSONParser:
+    """Incremental parser for a JSON document that arrives in chunks (a streamed LLM answer).
+
+    feed() appends a chunk and returns the best-effort value of everything
+    received so far: the longest prefix that ends on a complete value, with its
+    open objects and arrays closed. Numbers and literals only appear once they
+    are complete, object keys once their value has started, and an open string
+    value appears with the text received so far, so a long "text_content" can
+    be shown token by token. Text before the document (e.g. a markdown fence)
+    and after it is ignored.
+
+    Each chunk is scanned once; only the completed prefix is re-decoded.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._started = False
+        self._stack: List[str] = []
+        self._expect_key = False
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._scalar = False
+        self._done = False
+        # (end of the complete prefix, closers of the containers open there)
+        self._checkpoint: Optional[Tuple[int, str]] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the document is complete."""
+        return self._done
+
+    def feed(self, chunk: str) -> Any:
+        """Appends a chunk and returns the value received so far (None before any)."""
+        self.text += chunk
+        self._scan()
+        return self.value()
+
+    def value(self) -> Any:
+        """The value received so far (None before any)."""
+        if self._in_string and not self._string_is_key:
+            head = self.text[:-1] if self._escape else self.text
+            match = _OPEN_UNICODE.search(head)
+            while match and len(match.group(1)) % 2:
+                head = head[:match.start() + len(match.group(1)) - 1]
+                match = _OPEN_UNICODE.search(head)
+            try:
+                return json.loads(head + '"' + self._closers())
+            except ValueError:
+                pass
+        if self._checkpoint is None:
+            return None
+        end, closers = self._checkpoint
+        try:
+            return json.loads(self.text[:end] + closers)
+        except ValueError:
+            return None
+
+    def _closers(self) -> str:
+        return "".join("}" if opener == "{" else "]" for opener in reversed(self._stack))
+
+    def _mark(self, end: int):
+        self._checkpoint = (end, self._closers())
+
+    def _scan(self):
+        text = self.text
+        i = self._pos
+        if not self._started:
+            # Skip anything before the document
+            starts = [p for p in (text.find("{", i), text.find("[", i)) if p >= 0]
+            if not starts:
+                self._pos = len(text)
+                return
+            self.text = text = text[min(starts):]
+            i = 0
+            self._started = True
+
+        while i < len(text) and not self._done:
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if not self._string_is_key:
+                        self._mark(i + 1)
+                i += 1
+                continue
+            if self._scalar:
+                if c not in _WHITESPACE and c not in ",]}":
+                    i += 1
+                    continue
+                # A number or literal ends at the first delimiter after it
+                self._scalar = False
+                self._mark(i)
+            if c == '"':
+                self._in_string = True
+                self._string_is_key = self._expect_key
+            elif c in "{[":
+                self._stack.append(c)
+                self._expect_key = c == "{"
+                self._mark(i + 1)
+            elif c in "}]":
+                self._stack.pop()
+                self._expect_key = False
+                self._mark(i + 1)
+                if not self._stack:
+                    self._done = True
+                    self.text = text = text[:i + 1]
+            elif c == ":":
+                self._expect_key = False
+            elif c == ",":
+                self._expect_key = self._stack[-1] == "{"
+            elif c not in _WHITESPACE:
+                self._scalar = True
+            i += 1
+        self._pos = i
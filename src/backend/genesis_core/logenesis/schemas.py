@@ -5,7 +5,7 @@ from datetime import datetime
 from dataclasses import dataclass
 import torch
 
-from .light_schemas import LightIntent
+from src.backend.departments.presentation.light_schemas import LightIntent
 from .visual_schemas import VisualParameters
 
 @dataclass
@@ -1,12 +1,18 @@
-import asyncio
-from typing import Dict, Any, Optional
-from datetime import datetime
+import re
+from typing import Dict, Any, List, Optional
 from .interpreter import IntentInterpreter
 from .visual_schemas import (
     EmbodimentContract, TemporalState, CognitiveMetadata, IntentData,
     TemporalPhase, ContractIntentCategory
 )
 
+# Keyword groups, each matched as substrings in one regex scan
+_ANALYTIC = re.compile("search|find|analyze|check|what|how|solve")
+_SYSTEM_OPS = re.compile("stop|start|reset|clear|system|status")
+_CREATIVE = re.compile("story|imagine|create|poem|idea")
+_HARD = re.compile("hard|complex")
+_UNSURE = re.compile("maybe|unsure")
+
 class SimulatedIntentInterpreter(IntentInterpreter):
     """A deterministic interpreter for testing and fallback scenarios.
 
@@ -24,8 +30,23 @@ class SimulatedIntentInterpreter(IntentInterpreter):
         Returns:
             A deterministic EmbodimentContract based on input keywords.
         """
-        text = text.lower()
+        return self._contract(text.lower())
+
+    async def interpret_batch(self, texts: List[str], contexts: List[Optional[Dict[str, Any]]]) -> List[EmbodimentContract]:
+        """Interprets a batch in one synchronous pass (no per-text coroutine).
+
+        Args:
+            texts: The user input texts.
+            contexts: Optional contexts (unused in simulation).
+
+        Returns:
+            One deterministic EmbodimentContract per text, in order.
+        """
+        return [self._contract(text.lower()) for text in texts]
 
+    @staticmethod
+    def _contract(text: str) -> EmbodimentContract:
+        """Builds the contract for lowercased text."""
         # Defaults
         phase = TemporalPhase.MANIFESTING
         stability = 1.0
@@ -39,24 +60,24 @@ class SimulatedIntentInterpreter(IntentInterpreter):
         text_response = "I hear you."
 
         # 1. Detect Category
-        if any(w in text for w in ["search", "find", "analyze", "check", "what", "how", "solve"]):
+        if _ANALYTIC.search(text):
             category = ContractIntentCategory.ANALYTIC
             effort = 0.8
             text_response = "Analyzing data structure."
-        elif any(w in text for w in ["stop", "start", "reset", "clear", "system", "status"]):
+        elif _SYSTEM_OPS.search(text):
             category = ContractIntentCategory.SYSTEM_OPS
             effort = 0.2
             text_response = "System operations engaged."
-        elif any(w in text for w in ["story", "imagine", "create", "poem", "idea"]):
+        elif _CREATIVE.search(text):
             category = ContractIntentCategory.CREATIVE
             effort = 0.6
             uncertainty = 0.3 # Creative chaos
             text_response = "Imagining a new possibility."
 
         # 2. Detect Nuance
-        if "hard" in text or "complex" in text:
+        if _HARD.search(text):
             effort = 1.0
-        if "maybe" in text or "unsure" in text:
+        if _UNSURE.search(text):
             uncertainty = 0.8
 
         return EmbodimentContract(
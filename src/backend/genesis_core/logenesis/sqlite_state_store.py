@@ -0,0 +1,88 @@
+import logging
+from typing import List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.backend.storage import STATE_TABLE, SqliteDocumentStore
+from .schemas import ExpressionState
+from .state_store import DEFAULT_FLUSH_INTERVAL, StateStore
+
+logger = logging.getLogger("SqliteStateStore")
+
+
+class SqliteStateStore(StateStore):
+    """SQLite backend for Logenesis expression states, shareable between worker processes.
+
+    Nothing is loaded at startup: get_state reads a session's row on demand.
+    Updates stay write-behind as in StateStore, and each flush upserts the dirty
+    sessions in one transaction. States are only kept in memory until they have
+    been written, so the next request reads what any worker last flushed (use
+    flush_interval=0 when several workers serve the same session concurrently).
+    """
+    def __init__(self, filepath: str = "logenesis_state.db", flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """Initializes the SqliteStateStore.
+
+        Args:
+            filepath: Path of the SQLite database (shared by all workers).
+            flush_interval: Seconds between batched flushes; 0 saves on every update.
+        """
+        self.documents = SqliteDocumentStore(filepath, STATE_TABLE)
+        # (session, state) pairs written by the last flush, evicted from the cache by the loop thread
+        self._written: List[Tuple[str, ExpressionState]] = []
+        # Only unwritten states are kept, so the cache needs no bounds of its own
+        super().__init__(filepath, flush_interval, max_resident=None, idle_ttl=None)
+
+    def _load(self):
+        """States are read on demand."""
+
+    def _evict_written(self):
+        written, self._written = self._written, []
+        for sid, state in written:
+            if self._cache.get(sid) is state and not self._pinned(sid):
+                del self._cache[sid]
+
+    def _snapshot(self):
+        self._evict_written()
+        if not self._dirty:
+            return None, []
+        flushed = list(self._dirty)
+        self._dirty.clear()
+        states = [self._cache[sid] for sid in flushed]
+        docs = [state.model_dump_json() for state in states] # Encoded on the loop, before the write
+        self.flushes += 1
+        return (flushed, states, docs), flushed
+
+    def _write(self, payload):
+        flushed, states, docs = payload
+        self.documents.put_many(zip(flushed, docs))
+        self._written = list(zip(flushed, states))
+
+    def _decode(self, session_id: str) -> Optional[ExpressionState]:
+        doc = self.documents.get(session_id)
+        if doc is None:
+            return None
+        try:
+            return ExpressionState.model_validate_json(doc)
+        except ValidationError as e:
+            logger.error(f"Ignoring invalid state for {session_id}: {e}")
+            return None
+
+    def get_state(self, session_id: str) -> ExpressionState:
+        """Retrieves or initializes the state for a given session.
+
+        Args:
+            session_id: The unique session identifier.
+
+        Returns:
+            The ExpressionState object.
+        """
+        self._evict_written()
+        state = self._cache.lookup(session_id)
+        if state is None:
+            # Not cached: another worker may have written it since
+            state = self._decode(session_id) or self._default_state()
+        return state
+
+    def close(self):
+        super().close()
+        self.documents.close()
@@ -0,0 +1,89 @@
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from .schemas import IntentVector
+
+# Vectorized counterparts of LogenesisEngine's scalar physics, used by
+# process_batch(). Intent vectors are rows of an (N, 4) float64 array in
+# VECTOR_FIELDS order. Every expression performs the same IEEE operations in
+# the same order as the scalar method it mirrors, so results are bit-identical.
+
+VECTOR_FIELDS = ("epistemic_need", "subjective_weight", "decision_urgency", "precision_required")
+EPISTEMIC, SUBJECTIVE, URGENCY, PRECISION = range(4)
+
+# Qualia color targets, in the order the scalar path blends them
+_COLOR_BASE = 224.0
+_COLOR_BLENDS = (
+    (SUBJECTIVE, np.array([168.0, 85.0, 247.0])),
+    (PRECISION, np.array([6.0, 182.0, 212.0])),
+    (URGENCY, np.array([245.0, 158.0, 11.0])),
+)
+
+def to_array(vectors: Iterable[IntentVector]) -> np.ndarray:
+    """Stacks intent vectors into an (N, 4) array."""
+    rows = [(v.epistemic_need, v.subjective_weight, v.decision_urgency, v.precision_required) for v in vectors]
+    return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+def to_vector(row: List[float]) -> IntentVector:
+    return IntentVector(epistemic_need=row[0], subjective_weight=row[1], decision_urgency=row[2], precision_required=row[3])
+
+def entropy(vectors: np.ndarray) -> np.ndarray:
+    """Intent entropy per row (see LogenesisEngine._calculate_entropy)."""
+    e, s, u, p = vectors.T
+    result = np.zeros(len(vectors))
+    result = np.where((p > 0.5) & (s > 0.5), result + (p - 0.5) * (s - 0.5) * 4.0, result)
+    result = np.where((u > 0.6) & (p > 0.6), result + (u - 0.6) * (p - 0.6) * 6.25, result)
+    result = np.where((e > 0.8) & (s > 0.8), result + 0.2, result)
+    return np.minimum(1.0, result)
+
+def homeostasis(vectors: np.ndarray, entropies: np.ndarray) -> np.ndarray:
+    """Corrected copy of every row (see LogenesisEngine._apply_homeostasis)."""
+    result = vectors.copy()
+    correction = np.minimum(0.5, entropies * 0.5)
+    mask = (result[:, PRECISION] > 0.5) & (result[:, SUBJECTIVE] > 0.5)
+    result[mask, PRECISION] -= correction[mask]
+    result[mask, SUBJECTIVE] -= correction[mask]
+    # Tested after the precision correction, as in the scalar path
+    mask = (result[:, URGENCY] > 0.6) & (result[:, PRECISION] > 0.6)
+    result[mask, URGENCY] -= correction[mask] * 1.5
+    return result
+
+def coherence(previous: np.ndarray, inertia: np.ndarray, proposed: np.ndarray) -> np.ndarray:
+    """Temporal coherence per row (see LogenesisEngine._calculate_coherence)."""
+    d = proposed - previous
+    dist = np.sqrt(d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1] + d[:, 2] * d[:, 2] + d[:, 3] * d[:, 3])
+    allowed = np.maximum(0.2, (1.0 - inertia) * 2.0)
+    return np.where(dist <= allowed, 1.0, np.maximum(0.0, 1.0 - (dist - allowed) * 1.5))
+
+def drift(current: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Drifted vectors, velocities and effective inertias (see LogenesisEngine._drift_state)."""
+    inertia = np.maximum(0.1, 0.95 - (0.8 * targets[:, URGENCY]))
+    alpha = 1.0 - inertia
+    drifted = current + (targets - current) * alpha[:, None]
+    d = drifted[:, :2] - current[:, :2]
+    velocity = np.sqrt(d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1])
+    return drifted, velocity, inertia
+
+def qualia(vectors: np.ndarray) -> Tuple[List[str], List[str], np.ndarray, np.ndarray]:
+    """Colors, shapes, intensities and turbulences (see LogenesisEngine._calculate_qualia)."""
+    rgb = np.full((len(vectors), 3), _COLOR_BASE)
+    for column, target in _COLOR_BLENDS:
+        factor = vectors[:, column, None]
+        rgb = np.where(factor > 0.3, rgb * (1 - factor) + target * factor, rgb)
+    colors = ["#%02x%02x%02x" % tuple(row) for row in rgb.astype(np.int64).tolist()]
+    s, u, p = vectors[:, SUBJECTIVE], vectors[:, URGENCY], vectors[:, PRECISION]
+    shapes = np.where(p > s, "shard", np.where(u > 0.6, "orb", "nebula")).tolist()
+    return colors, shapes, 0.5 + (u * 0.5), 0.1 + (s * 0.2)
+
+def audio(vectors: np.ndarray) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """Rhythm densities, textures and amplitudes (see LogenesisEngine._calculate_audio)."""
+    s, u = vectors[:, SUBJECTIVE], vectors[:, URGENCY]
+    textures = np.where(s > 0.5, "granular", np.where(u > 0.7, "noise", "smooth")).tolist()
+    return 0.1 + (u * 0.8), textures, 0.5 + (u * 0.4)
+
+def physics(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Spawn rates and decay rates (see LogenesisEngine._calculate_physics)."""
+    s, u = vectors[:, SUBJECTIVE], vectors[:, URGENCY]
+    spawn_rate = (2 + (s * 5) + (u * 15)).astype(np.int64)
+    return spawn_rate, np.maximum(0.001, 0.01 + (u * 0.05))
@@ -0,0 +1,257 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+
+from src.backend.storage import DEFAULT_IDLE_TTL, DEFAULT_MAX_RESIDENT, SessionCache
+from .schemas import ExpressionState, IntentVector
+
+logger = logging.getLogger("StateStore")
+
+# Seconds between background flushes of dirty sessions (0 writes through on every update)
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class StateStore:
+    """Persistence layer for Logenesis expression states.
+
+    Manages the saving and loading of session-specific state data (inertia, velocity, current vector)
+    to a local JSON file.
+
+    Writes are write-behind: update_state() only marks the session dirty, and dirty
+    sessions are flushed in batches every `flush_interval` seconds by a background
+    task (started by start(), or by the first update made inside a running event
+    loop). Without a running loop there is nothing to flush later, so updates are
+    written through. Each session's JSON is kept, so a flush only re-encodes the dirty sessions, but
+    the file is a single JSON document: every flush still joins and rewrites the encoded JSON of
+    all stored sessions, so its cost grows with the total number of sessions, not the dirty ones.
+    The file is replaced atomically (temp file + rename) and never left half-written. For large
+    session counts use LogStateStore or SqliteStateStore (LOGENESIS_STATE_STORE=log|sqlite),
+    which write only the dirty records.
+    Call aclose() (or close() outside a loop) on shutdown to flush what is pending.
+
+    At most `max_resident` sessions are kept as ExpressionState objects, and
+    sessions unused for `idle_ttl` seconds are dropped (see SessionCache; the
+    background flusher also sweeps them). Dropped sessions are decoded again from
+    their JSON on the next get_state; sessions with unflushed changes are kept
+    until flushed. cache_stats() reports hit rate, evictions and resident sessions.
+    Only the decoded objects are bounded: the JSON of every stored session stays in
+    memory (it is the file's contents), so memory still grows with the number of
+    sessions ever seen. SqliteStateStore keeps only unwritten states in memory, and
+    LogStateStore a fixed 89-byte record per session.
+    """
+    def __init__(self, filepath: str = "logenesis_state.json", flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 max_resident: Optional[int] = DEFAULT_MAX_RESIDENT, idle_ttl: Optional[float] = DEFAULT_IDLE_TTL):
+        """Initializes the StateStore.
+
+        Args:
+            filepath: Path to the JSON file for state persistence.
+            flush_interval: Seconds between batched flushes; 0 saves on every update.
+            max_resident: Most sessions kept decoded in memory (None: unbounded).
+            idle_ttl: Seconds before an unused session is dropped from memory (None: never).
+        """
+        self.filepath = filepath
+        self.flush_interval = flush_interval
+        self._dirty: Set[str] = set()
+        # Sessions taken by a flush whose write has not finished (still pinned, see _pinned)
+        self._flushing: Set[str] = set()
+        self._cache: SessionCache = SessionCache(max_resident, idle_ttl, pinned=self._pinned)
+        # Session -> JSON of its state as last loaded or flushed
+        self._encoded: Dict[str, str] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self.flushes = 0
+        self._load()
+
+    def _load(self):
+        """Loads the stored states' JSON; they are decoded when first requested."""
+        if not os.path.exists(self.filepath):
+            return
+        try:
+            with open(self.filepath, 'r') as f:
+                data = json.load(f)
+                for sid, state_dict in data.items():
+                    self._encoded[sid] = json.dumps(state_dict)
+        except Exception as e:
+            logger.error(f"Error loading state store: {e}")
+
+    def _decode(self, session_id: str) -> Optional[ExpressionState]:
+        """The stored state of a session that is not resident, or None."""
+        encoded = self._encoded.get(session_id)
+        if encoded is None:
+            return None
+        try:
+            return ExpressionState.model_validate_json(encoded)
+        except ValidationError:
+            logger.error(f"Dropping invalid stored state for {session_id}")
+            del self._encoded[session_id] # Skip invalid entries
+            return None
+
+    def _pinned(self, session_id: str) -> bool:
+        """Whether a session must stay resident: it has changes that are not written yet."""
+        return session_id in self._dirty or session_id in self._flushing
+
+    def cache_stats(self) -> Dict:
+        """Hit rate, evictions and resident sessions of the in-memory cache."""
+        return self._cache.stats()
+
+    def save(self):
+        """Saves pending changes to disk now (see flush)."""
+        self.flush()
+
+    def flush(self) -> int:
+        """Synchronously writes the dirty sessions. Returns how many were written."""
+        payload, flushed = self._snapshot()
+        if payload is None:
+            return 0
+        self._flushing.update(flushed)
+        try:
+            self._write(payload)
+        except Exception as e:
+            logger.error(f"Error saving state store: {e}")
+            self._dirty.update(flushed) # Retried by the next flush
+            return 0
+        finally:
+            self._flushing.difference_update(flushed)
+        self._cache.evict() # Flushed sessions may have been waiting to be dropped
+        return len(flushed)
+
+    async def flush_async(self) -> int:
+        """Like flush(), with the file write done in a worker thread. Flushes are serialized,
+        so a later snapshot is never overwritten by an earlier one."""
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        async with self._write_lock:
+            payload, flushed = self._snapshot()
+            if payload is None:
+                return 0
+            # Kept resident while the write runs, so a failed write can be retried from the cache
+            self._flushing.update(flushed)
+            try:
+                await asyncio.to_thread(self._write, payload)
+            except Exception as e:
+                logger.error(f"Error saving state store: {e}")
+                self._dirty.update(flushed)
+                return 0
+            finally:
+                self._flushing.difference_update(flushed)
+        self._cache.evict()
+        return len(flushed)
+
+    def start(self):
+        """Starts the background flusher on the running event loop (no-op if running)."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def aclose(self):
+        """Stops the background flusher and flushes pending changes."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush_async()
+
+    def close(self):
+        """Synchronous shutdown: cancels the flusher (if any) and flushes pending changes."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush_async()
+                self._cache.evict() # Sweeps idle sessions even when nothing was flushed
+            except Exception as e:
+                # Keep flushing: one failed flush must not stop persisting later updates
+                logger.error(f"Background flush failed: {e}")
+
+    def _snapshot(self) -> Tuple[Optional[str], List[str]]:
+        """Encodes the dirty sessions and assembles the file contents (None if clean).
+
+        Only the dirty sessions are re-encoded; the contents are the whole file, so the
+        join (and the write that follows) covers every stored session. The caller keeps
+        the flushed sessions pinned (see _flushing) until the write succeeds.
+        """
+        if not self._dirty:
+            return None, []
+        flushed = list(self._dirty)
+        self._dirty.clear()
+        for sid in flushed:
+            self._encoded[sid] = json.dumps(self._cache[sid].model_dump(mode='json'))
+        self.flushes += 1
+        body = ",".join(f"{json.dumps(sid)}:{encoded}" for sid, encoded in self._encoded.items())
+        return "{" + body + "}", flushed
+
+    def _write(self, payload: str):
+        """Atomically replaces the state file: temp file in the same directory, then rename."""
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        fd, tmp_path = tempfile.mkstemp(prefix=".state-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get_state(self, session_id: str) -> ExpressionState:
+        """Retrieves or initializes the state for a given session.
+
+        Args:
+            session_id: The unique session identifier.
+
+        Returns:
+            The ExpressionState object.
+        """
+        state = self._cache.lookup(session_id)
+        if state is None:
+            state = self._decode(session_id) or self._default_state()
+            self._cache[session_id] = state
+        return state
+
+    @staticmethod
+    def _default_state() -> ExpressionState:
+        """Default neutral state of a new session."""
+        default_vector = IntentVector(
+            epistemic_need=0.1,
+            subjective_weight=0.1,
+            decision_urgency=0.1,
+            precision_required=0.1
+        )
+        return ExpressionState(
+            current_vector=default_vector,
+            velocity=0.0,
+            inertia=0.8
+        )
+
+    def update_state(self, session_id: str, state: ExpressionState):
+        """Updates the state for a session; it is persisted by the next flush.
+
+        Args:
+            session_id: The unique session identifier.
+            state: The new ExpressionState.
+        """
+        self._dirty.add(session_id) # First, so the session is pinned in the cache
+        self._cache[session_id] = state
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self.flush_interval <= 0:
+            self.flush()
+        else:
+            self.start()
@@ -87,3 +87,31 @@ class EmbodimentContract(BaseModel):
 
     # Optional field to carry the original text response if generated by LLM together
     text_content: Optional[str] = None
+
+class PartialContract(BaseModel):
+    """
+    The fields of an EmbodimentContract known so far, while it streams in.
+
+    Emitted by IntentInterpreter.interpret_stream(): the intent category and
+    cognitive load first, then the response text token by token, then the
+    verified contract.
+    """
+    category: Optional[ContractIntentCategory] = None
+    effort: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    uncertainty: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    text_content: str = Field(default="", description="Response text received so far")
+    text_delta: str = Field(default="", description="Response text received since the previous update")
+    contract: Optional[EmbodimentContract] = Field(default=None, description="The verified contract (last update only)")
+
+    @classmethod
+    def from_contract(cls, contract: EmbodimentContract, text_so_far: str = "") -> "PartialContract":
+        """The final update for a complete contract, after `text_so_far` was already emitted."""
+        text = contract.text_content or ""
+        return cls(
+            category=contract.intent.category,
+            effort=contract.cognitive.effort,
+            uncertainty=contract.cognitive.uncertainty,
+            text_content=text,
+            text_delta=text[len(text_so_far):] if text.startswith(text_so_far) else text,
+            contract=contract
+        )
@@ -3,6 +3,7 @@ import json
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 
 # Ensure src is in path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -14,15 +15,23 @@ from fastapi.responses import FileResponse
 import math
 from src.backend.genesis_core.logenesis.engine import LogenesisEngine
 from src.backend.genesis_core.logenesis.schemas import LogenesisResponse, IntentPacket
-from src.backend.genesis_core.logenesis.visual_schemas import TemporalPhase, IntentCategory, BaseShape
-from src.backend.auth.routes import router as auth_router
+from src.backend.genesis_core.logenesis.visual_schemas import TemporalPhase, IntentCategory, BaseShape, VisualParameters
+from src.backend.auth.routes import router as auth_router, auth_manager
 from src.backend.departments.development.javana_core.reflex_kernel import JavanaKernel
 from src.backend.departments.development.javana_core.responses import REFLEX_PARAMS
+from src.backend.departments.presentation.lcl_stream import serve_light_stream
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AetherServer")
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Runs the state store's background flusher and flushes pending state on shutdown."""
+    engine.state_store.start()
+    yield
+    await engine.state_store.aclose()
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(auth_router)
 
 # --- DEEPGRAM INTERFACE STUB ---
@@ -62,6 +71,20 @@ javana = JavanaKernel()
 
 clients = set()
 
+def visual_params_message(params: VisualParameters) -> str:
+    """The client protocol's VISUAL_PARAMS message for a set of visual parameters."""
+    vp = params.model_dump(mode='json')
+    # The UI expects 'VISUAL_PARAMS' with the rendering specifics and a flat meta block
+    return json.dumps({
+        "type": "VISUAL_PARAMS",
+        "params": vp["visual_parameters"],
+        "meta": {
+            "category": vp["intent_category"],
+            "valence": vp["emotional_valence"],
+            "energy": vp["energy_level"]
+        }
+    })
+
 @app.websocket("/ws/v2/stream")
 async def websocket_v2_endpoint(websocket: WebSocket):
     """WebSocket endpoint for V2 Streaming Protocol.
@@ -213,17 +236,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     # --- NEW: Immediate Temporal Pulse (Thinking) ---
                     # Send visual feedback BEFORE processing starts to eliminate stutter
                     thinking_params = engine.adapter.get_temporal_visuals(TemporalPhase.THINKING)
-                    vp_thinking = thinking_params.model_dump(mode='json')
-
-                    await websocket.send_text(json.dumps({
-                        "type": "VISUAL_PARAMS",
-                        "params": vp_thinking["visual_parameters"],
-                        "meta": {
-                            "category": vp_thinking["intent_category"],
-                            "valence": vp_thinking["emotional_valence"],
-                            "energy": vp_thinking["energy_level"]
-                        }
-                    }))
+                    await websocket.send_text(visual_params_message(thinking_params))
                     # -----------------------------------------------
 
                     packet = IntentPacket(
@@ -233,25 +246,20 @@ async def websocket_endpoint(websocket: WebSocket):
                         confidence=1.0,
                         raw_payload=text
                     )
-                    response: LogenesisResponse = await engine.process(packet, session_id=session_id)
+                    # Morph as soon as the intent is known, while the response is still being generated
+                    last_params = None
+                    async for update in engine.process_stream(packet, session_id=session_id):
+                        if isinstance(update, VisualParameters):
+                            last_params = update
+                            await websocket.send_text(visual_params_message(update))
+                        else:
+                            response: LogenesisResponse = update
 
                     # Convert LogenesisResponse to Client Protocol
                     # 1. Visual Params (Check Manifestation Gate)
                     if response.visual_analysis and response.manifestation_granted:
-                        # Serialize Pydantic model
-                        vp = response.visual_analysis.model_dump(mode='json')
-                        # Flat map for the simple UI (or send full object)
-                        # The UI expects 'VISUAL_PARAMS' with specific fields.
-                        # I'll send the full structure and let UI parse it.
-                        await websocket.send_text(json.dumps({
-                            "type": "VISUAL_PARAMS",
-                            "params": vp["visual_parameters"], # Send the specifics
-                            "meta": {
-                                "category": vp["intent_category"],
-                                "valence": vp["emotional_valence"],
-                                "energy": vp["energy_level"]
-                            }
-                        }))
+                        if response.visual_analysis != last_params:
+                            await websocket.send_text(visual_params_message(response.visual_analysis))
                     elif response.visual_analysis and not response.manifestation_granted:
                          logger.info("Manifestation Gate: Blocked visual update (Conversational Loop)")
 
@@ -290,6 +298,23 @@ async def websocket_endpoint(websocket: WebSocket):
     except Exception as e:
         logger.error(f"Server Error: {e}")
 
+@app.websocket("/ws/lcl")
+async def light_stream_endpoint(websocket: WebSocket):
+    """Binary LCL state stream (keyframes/deltas acknowledged by the client) for the light testbed.
+
+    Args:
+        websocket: The WebSocket connection instance.
+    """
+    await serve_light_stream(websocket)
+
+@app.get("/metrics/sessions")
+async def get_session_metrics():
+    """Hit rate, evictions and resident sessions of the in-memory session caches."""
+    return {
+        "expression_states": engine.state_store.cache_stats(),
+        "auth_sessions": auth_manager.cache_stats(),
+    }
+
 # Mount static files and routes (Must be after specific routes)
 
 # 1. Specific Asset Routes (for clean URLs in PWA)
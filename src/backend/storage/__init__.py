@@ -0,0 +1,2 @@
+from .session_cache import DEFAULT_IDLE_TTL, DEFAULT_MAX_RESIDENT, SessionCache
+from .sqlite_documents import AUTH_TABLE, INTERPRETATION_TABLE, STATE_TABLE, SqliteDocumentStore
@@ -0,0 +1,61 @@
+# Copies the JSON session stores into the SQLite backends:
+#
+#   python -m src.backend.storage.migrate [--state-json logenesis_state.json] [--state-db logenesis_state.db]
+#                                         [--auth-json auth_sessions.json] [--auth-db auth_sessions.db]
+#
+# Entries are copied verbatim in batched transactions; rows with the same key are
+# overwritten, so re-running is safe. Invalid entries are skipped (and logged) by
+# the stores when read, as they are when loading the JSON files.
+import argparse
+import json
+import logging
+import os
+from itertools import islice
+
+from .sqlite_documents import AUTH_TABLE, STATE_TABLE, SqliteDocumentStore
+
+logger = logging.getLogger("StorageMigration")
+
+# Rows upserted per transaction
+DEFAULT_BATCH_SIZE = 5000
+
+
+def migrate_json(json_path: str, store: SqliteDocumentStore, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Copies every entry of a {key: document} JSON file into `store`.
+
+    Returns:
+        The number of entries copied (0 if the file does not exist).
+
+    Raises:
+        ValueError: If the file does not hold a JSON object.
+    """
+    if not os.path.exists(json_path):
+        logger.warning(f"{json_path} not found, nothing to migrate")
+        return 0
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{json_path} does not contain a JSON object")
+    rows = ((key, json.dumps(doc, separators=(",", ":"))) for key, doc in data.items())
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        store.put_many(batch)
+    logger.info(f"Migrated {len(data)} entries from {json_path} to {store.path}:{store.table}")
+    return len(data)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Migrate the JSON session stores to SQLite")
+    parser.add_argument("--state-json", default="logenesis_state.json", help="Logenesis StateStore JSON file")
+    parser.add_argument("--state-db", default="logenesis_state.db", help="Target database of SqliteStateStore")
+    parser.add_argument("--auth-json", default="auth_sessions.json", help="AuthManager JSON file")
+    parser.add_argument("--auth-db", default="auth_sessions.db", help="Target database of SqliteAuthManager")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per transaction")
+    args = parser.parse_args()
+
+    states = migrate_json(args.state_json, SqliteDocumentStore(args.state_db, STATE_TABLE), args.batch_size)
+    users = migrate_json(args.auth_json, SqliteDocumentStore(args.auth_db, AUTH_TABLE), args.batch_size)
+    print(f"Migrated {states} expression states and {users} user sessions")
@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Resident sessions kept in memory and seconds a session may sit unused before it is dropped
+DEFAULT_MAX_RESIDENT = 10_000
+DEFAULT_IDLE_TTL = 900.0
+
+
+class SessionCache(OrderedDict):
+    """LRU + TTL bounded map of resident session objects, in least recently used order.
+
+    Assigning an entry marks it used; lookup() is the counted read path (hits and
+    misses) and also marks it used. Once there are more than `max_entries`
+    entries, or an entry has been unused for `ttl` seconds, it is dropped,
+    except while `pinned(key)` is true (e.g. it has changes not yet written), in
+    which case it waits for the next evict(). The owner keeps the persisted
+    copy and loads dropped sessions back on a miss. None disables either bound.
+    Plain dict reads (get, [], in) neither count nor mark use.
+    """
+
+    def __init__(self, max_entries: Optional[int] = DEFAULT_MAX_RESIDENT, ttl: Optional[float] = DEFAULT_IDLE_TTL,
+                 pinned: Optional[Callable[[Hashable], bool]] = None, clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.pinned = pinned
+        self.clock = clock
+        self._last_used: Dict[Hashable, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0   # Dropped for capacity
+        self.expirations = 0 # Dropped for idling past the TTL
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._last_used[key] = self.clock()
+        self.evict()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        del self._last_used[key]
+
+    def pop(self, key, *default):
+        self._last_used.pop(key, None)
+        return super().pop(key, *default)
+
+    def clear(self):
+        super().clear()
+        self._last_used.clear()
+
+    def lookup(self, key) -> Optional[Any]:
+        """The resident entry for `key` (marked used), or None; counts a hit or a miss."""
+        value = super().get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.move_to_end(key)
+        self._last_used[key] = self.clock()
+        return value
+
+    def evict(self) -> int:
+        """Drops expired and over-capacity entries, oldest first; returns how many."""
+        dropped = 0
+        deadline = None if self.ttl is None else self.clock() - self.ttl
+        skipped = 0
+        while len(self) > skipped:
+            key = next(iter(self))
+            over = self.max_entries is not None and len(self) > self.max_entries
+            expired = deadline is not None and self._last_used[key] <= deadline
+            if not (over or expired):
+                break
+            if self.pinned is not None and self.pinned(key):
+                # Keep it, behind the entries still to be checked
+                self.move_to_end(key)
+                skipped += 1
+                continue
+            del self[key]
+            dropped += 1
+            if over:
+                self.evictions += 1
+            else:
+                self.expirations += 1
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "resident": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,109 @@
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Tables used by the SQLite backends of StateStore and AuthManager, and the interpretation cache
+STATE_TABLE = "expression_states"
+AUTH_TABLE = "user_sessions"
+INTERPRETATION_TABLE = "interpretations"
+
+# Seconds a writer waits for another process's transaction before failing
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+class SqliteDocumentStore:
+    """JSON documents by string key in one table of a SQLite database.
+
+    Meant to be shared by several processes (e.g. uvicorn workers): the database
+    runs in WAL mode, so readers never block the single writer, and every
+    process and thread opens its own connection on first use. SQLite does not
+    survive a fork with open connections, so a parent must close() its
+    connection before forking workers that use the database. Statements are
+    fixed strings run through the connection's prepared-statement cache, and
+    put_many() upserts a whole batch in one transaction. Documents are stored as JSON text; encoding and decoding
+    are left to the caller.
+    """
+
+    def __init__(self, path: str, table: str, busy_timeout: float = DEFAULT_BUSY_TIMEOUT):
+        """Opens (creating if needed) the database at `path` and the document table.
+
+        Raises:
+            ValueError: If `table` is not a plain SQL identifier.
+        """
+        if not _IDENTIFIER.fullmatch(table):
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.path = path
+        self.table = table
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._get_sql = f"SELECT doc FROM {table} WHERE key = ?"
+        self._upsert_sql = (f"INSERT INTO {table} (key, doc) VALUES (?, ?) "
+                            f"ON CONFLICT(key) DO UPDATE SET doc = excluded.doc")
+        self._delete_sql = f"DELETE FROM {table} WHERE key = ?"
+        self._items_sql = f"SELECT key, doc FROM {table}"
+        self._count_sql = f"SELECT COUNT(*) FROM {table}"
+        with self.transaction() as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, doc TEXT NOT NULL) WITHOUT ROWID")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            # Autocommit mode: transactions are opened explicitly by transaction()
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Commits survive a process crash; only an OS crash can lose the last ones
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction, taking the database write lock up front so that a
+        read-modify-write inside it cannot interleave with another process."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def get(self, key: str, conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
+        """The document stored under `key`, or None. Pass `conn` to read inside a transaction."""
+        row = (conn or self._connection()).execute(self._get_sql, (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key: str, doc: str, conn: Optional[sqlite3.Connection] = None):
+        """Inserts or replaces one document (in its own transaction unless `conn` is given)."""
+        if conn is not None:
+            conn.execute(self._upsert_sql, (key, doc))
+            return
+        with self.transaction() as conn:
+            conn.execute(self._upsert_sql, (key, doc))
+
+    def put_many(self, items: Iterable[Tuple[str, str]]):
+        """Inserts or replaces a batch of (key, document) pairs in one transaction."""
+        with self.transaction() as conn:
+            conn.executemany(self._upsert_sql, items)
+
+    def delete(self, key: str):
+        with self.transaction() as conn:
+            conn.execute(self._delete_sql, (key,))
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._connection().execute(self._items_sql))
+
+    def __len__(self) -> int:
+        return self._connection().execute(self._count_sql).fetchone()[0]
+
+    def close(self):
+        """Closes the calling thread's connection (reopened on next use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
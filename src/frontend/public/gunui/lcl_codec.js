@@ -0,0 +1,74 @@
+// Decoder for LCL binary state frames.
+// Mirrors src/backend/departments/presentation/lcl_codec.py (format v1).
+//
+// Usage:
+//   ws.binaryType = "arraybuffer";
+//   const decoder = new LCLFrameDecoder();
+//   const frame = decoder.apply(event.data);     // updates decoder.entities
+//   if (frame) ws.send(JSON.stringify({ type: "ACK_FRAME", frame_id: frame.frameId }));
+
+const LCL_MAGIC = "LCLF";
+const LCL_VERSION = 1;
+const LCL_HEADER_SIZE = 28;
+const LCL_FRAME_KEY = 0;
+const LCL_FRAME_DELTA = 1;
+
+function decodeLCLFrame(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    if (magic !== LCL_MAGIC || view.getUint8(4) !== LCL_VERSION) {
+        throw new Error("Unsupported LCL frame");
+    }
+    const kind = view.getUint8(5);
+    const frameId = view.getUint32(8, true);
+    const baseFrameId = view.getUint32(12, true);
+    const n = view.getUint32(16, true);
+    const m = view.getUint32(20, true);
+    const velRange = view.getFloat32(24, true);
+
+    // Sections are 4-byte aligned; typed arrays use host byte order (little-endian on all targets we ship to).
+    let offset = LCL_HEADER_SIZE;
+    const handles = new Uint32Array(buffer, offset, n); offset += n * 4;
+    const colors = new Uint8Array(buffer, offset, n * 4); offset += n * 4;
+    const pos = new Uint16Array(buffer, offset, n * 2); offset += n * 4;
+    const vel = new Int16Array(buffer, offset, n * 2); offset += n * 4;
+    const removed = new Uint32Array(buffer, offset, m);
+
+    return { kind, frameId, baseFrameId, velRange, handles, colors, pos, vel, removed };
+}
+
+class LCLFrameDecoder {
+    constructor() {
+        // handle -> { position: [x, y], velocity: [vx, vy], color: [r, g, b, a] | null }
+        this.entities = {};
+        this.lastFrameId = 0;
+    }
+
+    apply(buffer) {
+        const f = decodeLCLFrame(buffer);
+
+        if (f.kind === LCL_FRAME_KEY) {
+            this.entities = {};
+        } else if (f.kind === LCL_FRAME_DELTA && f.baseFrameId > this.lastFrameId) {
+            // Delta against a frame we never applied; wait for the server to resend.
+            return null;
+        }
+
+        for (let i = 0; i < f.removed.length; i++) {
+            delete this.entities[f.removed[i]];
+        }
+
+        const velScale = f.velRange / 32767;
+        for (let i = 0; i < f.handles.length; i++) {
+            const c = i * 4;
+            this.entities[f.handles[i]] = {
+                position: [f.pos[i * 2] / 65535, f.pos[i * 2 + 1] / 65535],
+                velocity: [f.vel[i * 2] * velScale, f.vel[i * 2 + 1] * velScale],
+                color: f.colors[c + 3] ? [f.colors[c], f.colors[c + 1], f.colors[c + 2], f.colors[c + 3]] : null
+            };
+        }
+
+        this.lastFrameId = f.frameId;
+        return f;
+    }
+}
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.genesis_core.logenesis.batching_interpreter import BatchingInterpreter
+from src.backend.genesis_core.logenesis.gemini_interpreter import GeminiIntentInterpreter
+
+BASE_LATENCY = 0.15   # Seconds per call (network + prefill)
+PER_INPUT = 0.01      # Extra seconds per input in a call (decoding)
+SLOTS = 8             # Calls the fake server serves at once (rate limit / replicas)
+MESSAGES = 4          # Messages per simulated client, sent one after another
+
+CONTRACT = {"temporal_state": {"phase": "MANIFESTING", "stability": 0.8},
+            "cognitive": {"effort": 0.5, "uncertainty": 0.1},
+            "intent": {"category": "CHIT_CHAT", "purity": 1.0}, "text_content": "Hello."}
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Answers a prompt with one contract per "User Input" after a simulated delay."""
+    slots = threading.Semaphore(SLOTS)
+
+    def do_POST(self):
+        prompt = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["prompt"]
+        inputs = prompt.count("User Input:")
+        with self.slots:
+            time.sleep(BASE_LATENCY + PER_INPUT * inputs)
+        body = json.dumps(CONTRACT if inputs == 1 else [CONTRACT] * inputs).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel: a blocking HTTP call per generate_content()."""
+    def __init__(self, url: str):
+        self.url = url
+
+    def generate_content(self, prompt, generation_config=None):
+        request = urllib.request.Request(self.url, data=json.dumps({"prompt": prompt}).encode(),
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            return type("Response", (), {"text": response.read().decode()})()
+
+def gemini(url: str) -> GeminiIntentInterpreter:
+    interpreter = GeminiIntentInterpreter.__new__(GeminiIntentInterpreter)
+    interpreter.model = FakeModel(url)
+    return interpreter
+
+def run(interpreter, clients: int):
+    async def client(n: int, latencies: list):
+        for m in range(MESSAGES):
+            t0 = time.perf_counter()
+            await interpreter.interpret(f"message {m} from client {n}", context={"recalled": None})
+            latencies.append(time.perf_counter() - t0)
+
+    async def scenario():
+        latencies = []
+        t0 = time.perf_counter()
+        await asyncio.gather(*(client(n, latencies) for n in range(clients)))
+        return time.perf_counter() - t0, latencies
+
+    elapsed, latencies = asyncio.run(scenario())
+    return clients * MESSAGES / elapsed, statistics.median(latencies) * 1000
+
+def run_benchmark():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLMHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/generate"
+    print(f"\n--- Fake LLM: {BASE_LATENCY * 1000:.0f} ms + {PER_INPUT * 1000:.0f} ms/input per call, {SLOTS} slots ---")
+
+    results = {}
+    try:
+        for clients in (1, 16, 64, 256):
+            direct = run(gemini(url), clients)
+            batching = BatchingInterpreter(gemini(url), max_batch_size=16, max_wait=0.01)
+            batched = run(batching, clients)
+            results[clients] = (direct, batched, batching.stats()["mean_batch_size"])
+            print(f"  {clients:3d} clients: direct {direct[0]:7.1f} msg/s (p50 {direct[1]:6.0f} ms) | "
+                  f"batched {batched[0]:7.1f} msg/s (p50 {batched[1]:6.0f} ms, "
+                  f"mean batch {results[clients][2]:.1f})")
+    finally:
+        server.shutdown()
+    return results
+
+if __name__ == "__main__":
+    results = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    for clients, (direct, batched, mean_batch) in results.items():
+        print(f"Clients: {clients:<4} | Direct: {direct[0]:7.1f} msg/s | Batched: {batched[0]:7.1f} msg/s | "
+              f"{batched[0] / direct[0]:.1f}x | p50 {direct[1]:.0f} -> {batched[1]:.0f} ms")
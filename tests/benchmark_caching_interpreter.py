@@ -0,0 +1,90 @@
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.genesis_core.logenesis.caching_interpreter import CachingInterpreter
+from src.backend.genesis_core.logenesis.gemini_interpreter import GeminiIntentInterpreter
+from src.backend.storage import INTERPRETATION_TABLE, SqliteDocumentStore
+
+LLM_LATENCY = 0.02   # Seconds per (fake) Gemini call
+UTTERANCES = 1000
+
+# Short commands and greetings dominate real sessions; the rest are one-off questions
+COMMON = ["hello", "Hello!", "hi", "status", "Status?", "stop", "thanks", "thank you", "ok", "yes", "no",
+          "show me a sphere", "what can you do?", "reset", "start", "good morning", "bye"]
+
+CONTRACT = json.dumps({"temporal_state": {"phase": "MANIFESTING", "stability": 0.8},
+                       "cognitive": {"effort": 0.5, "uncertainty": 0.1},
+                       "intent": {"category": "CHIT_CHAT", "purity": 1.0}, "text_content": "Hello."})
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel: a blocking call with a fixed latency."""
+    def generate_content(self, prompt, generation_config=None):
+        time.sleep(LLM_LATENCY)
+        return type("Response", (), {"text": CONTRACT})()
+
+def conversation_log(count: int):
+    """A replayed conversation log: Zipf-distributed common utterances and unique questions."""
+    rng = random.Random(7)
+    weights = [1 / (rank + 1) for rank in range(len(COMMON))]
+    log = []
+    for i in range(count):
+        if rng.random() < 0.7:
+            log.append(rng.choices(COMMON, weights)[0])
+        else:
+            log.append(f"tell me about topic number {i}")
+    return log
+
+def gemini() -> GeminiIntentInterpreter:
+    interpreter = GeminiIntentInterpreter.__new__(GeminiIntentInterpreter)
+    interpreter.model = FakeModel()
+    return interpreter
+
+def replay(interpreter, log):
+    async def run():
+        latencies = []
+        for text in log:
+            t0 = time.perf_counter()
+            await interpreter.interpret(text, context={"recalled": None})
+            latencies.append((time.perf_counter() - t0) * 1000)
+        return latencies
+
+    latencies = asyncio.run(run())
+    return statistics.median(latencies), statistics.quantiles(latencies, n=10)[-1]
+
+def run_benchmark():
+    log = conversation_log(UTTERANCES)
+    print(f"\n--- Replaying {UTTERANCES} utterances, {LLM_LATENCY * 1000:.0f} ms per LLM call ---")
+    results = {}
+    results["no cache"] = replay(gemini(), log) + (None,)
+
+    memory = CachingInterpreter(gemini())
+    results["memory"] = replay(memory, log) + (memory.stats(),)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "interpretations.db")
+        replay(CachingInterpreter(gemini(), documents=SqliteDocumentStore(path, INTERPRETATION_TABLE)), log)
+        # A restarted worker: empty memory tier, warm disk tier
+        restarted = CachingInterpreter(gemini(), documents=SqliteDocumentStore(path, INTERPRETATION_TABLE))
+        results["disk (restart)"] = replay(restarted, log) + (restarted.stats(),)
+
+    for name, (p50, p90, stats) in results.items():
+        detail = "" if stats is None else f" | hit rate {stats['hit_rate']:.2f}, disk hits {stats['disk_hits']}"
+        print(f"  {name:15s}: p50 {p50:7.3f} ms | p90 {p90:7.3f} ms{detail}")
+    return results
+
+if __name__ == "__main__":
+    results = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    base = results["no cache"][0]
+    for name, (p50, p90, _) in results.items():
+        print(f"{name:15s}: p50 {p50:7.3f} ms ({base / p50:6.1f}x) | p90 {p90:7.3f} ms")
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.genesis_core.logenesis import state_physics
+from src.backend.genesis_core.logenesis.engine import LogenesisEngine, StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentPacket
+
+REQUESTS = 8192
+SESSIONS = 256
+TEXTS = ["hello there", "can you analyze this hard problem", "imagine a story", "maybe check the status",
+         "create a complex idea", "how do I solve it", "I am unsure"]
+
+def make_requests(count: int):
+    """Chat traffic from many sessions with some visual frames mixed in."""
+    rng = random.Random(42)
+    packets, sessions = [], []
+    for _ in range(count):
+        if rng.random() < 0.7:
+            packets.append(rng.choice(TEXTS))
+        else:
+            packets.append(IntentPacket(modality="visual", embedding=None, energy_level=rng.random(),
+                                        confidence=rng.random(), raw_payload=None))
+        sessions.append(f"ws-{rng.randrange(SESSIONS)}")
+    return packets, sessions
+
+def fresh_engine(tmp: str) -> LogenesisEngine:
+    engine = LogenesisEngine()
+    engine.state_store = StateStore(filepath=os.path.join(tmp, "state.json"), flush_interval=60.0)
+    return engine
+
+def bench_requests(batch_size: int, packets, sessions) -> float:
+    """Requests/sec through process() (batch_size 0) or process_batch()."""
+    async def run(engine):
+        t0 = time.perf_counter()
+        if batch_size == 0:
+            for packet, session_id in zip(packets, sessions):
+                await engine.process(packet, session_id=session_id)
+        else:
+            for start in range(0, len(packets), batch_size):
+                await engine.process_batch(packets[start:start + batch_size], sessions[start:start + batch_size])
+        elapsed = time.perf_counter() - t0
+        await engine.state_store.aclose()
+        return elapsed
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = fresh_engine(tmp)
+        asyncio.run(run(engine)) # Warm formation caches
+        return len(packets) / asyncio.run(run(fresh_engine(tmp)))
+
+def bench_physics(count: int):
+    """Only the state physics: scalar engine methods vs state_physics on arrays."""
+    rng = np.random.default_rng(0)
+    targets, current, inertia = rng.random((count, 4)), rng.random((count, 4)), rng.random(count)
+    engine = LogenesisEngine.__new__(LogenesisEngine)
+    vectors = [state_physics.to_vector(row) for row in targets.tolist()]
+    states = [ExpressionState(current_vector=state_physics.to_vector(row), inertia=i)
+              for row, i in zip(current.tolist(), inertia.tolist())]
+
+    t0 = time.perf_counter()
+    for vector, state in zip(vectors, states):
+        entropy = engine._calculate_entropy(vector)
+        if entropy > 0.6:
+            vector = engine._apply_homeostasis(vector, entropy)
+        engine._calculate_coherence(state, vector)
+        drifted = engine._drift_state(state, vector).current_vector
+        engine._calculate_qualia(drifted), engine._calculate_audio(drifted), engine._calculate_physics(drifted)
+    scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    entropy = state_physics.entropy(targets)
+    corrected = np.where((entropy > 0.6)[:, None], state_physics.homeostasis(targets, entropy), targets)
+    state_physics.coherence(current, inertia, corrected)
+    drifted = state_physics.drift(current, corrected)[0]
+    state_physics.qualia(drifted), state_physics.audio(drifted), state_physics.physics(drifted)
+    vectorized = time.perf_counter() - t0
+    return count / scalar, count / vectorized
+
+def run_benchmark():
+    packets, sessions = make_requests(REQUESTS)
+    print(f"\n--- {REQUESTS} requests over {SESSIONS} sessions (simulated interpreter) ---")
+    results = {}
+    for batch_size in (0, 1, 32, 1024):
+        label = "process()" if batch_size == 0 else f"batch {batch_size}"
+        results[label] = bench_requests(batch_size, packets, sessions)
+        print(f"  {label:10s}: {results[label]:10.0f} requests/s")
+
+    print("\n--- State physics only ---")
+    physics = {}
+    for batch_size in (1, 32, 1024):
+        scalar, vectorized = bench_physics(batch_size)
+        physics[batch_size] = (scalar, vectorized)
+        print(f"  batch {batch_size:4d}: scalar {scalar:10.0f} /s | vectorized {vectorized:10.0f} /s")
+    return results, physics
+
+if __name__ == "__main__":
+    results, physics = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    for label, rate in results.items():
+        print(f"{label:10s}: {rate:10.0f} requests/s")
+    for batch_size, (scalar, vectorized) in physics.items():
+        print(f"physics x{batch_size:<5d}: {scalar:10.0f} -> {vectorized:10.0f} /s ({vectorized / scalar:.1f}x)")
@@ -0,0 +1,62 @@
+import time
+import sys
+import os
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic, formation_to_arrays
+from src.backend.departments.presentation.formation_manager import FormationManager
+
+SETTLE_EPS = 0.01
+SETTLE_SPEED = 0.05 # The target springs are linear (isochronous), so "at rest" matters, not just "passing by"
+MAX_SECONDS = 60.0
+DT = 0.016
+
+def run_case(count: int, method: str):
+    rng = np.random.default_rng(7)
+    start = rng.random((count, 2)).astype(np.float32) * 0.8 + 0.1
+    coords, colors = formation_to_arrays(FormationManager.get_formation("circle", count))
+
+    lcl = LightControlLogic()
+    lcl.assignment_method = method
+    lcl.spawn_many(count, start)
+
+    t0 = time.perf_counter()
+    lcl.manifest(coords, colors)
+    assign_ms = (time.perf_counter() - t0) * 1000.0
+
+    straight = float(np.linalg.norm(lcl._target_pos[:count] - start, axis=1).sum())
+
+    # Integrate until every particle is within SETTLE_EPS of its target and nearly at rest
+    path = 0.0
+    t = 0.0
+    while t < MAX_SECONDS:
+        before = lcl._pos[:count].copy()
+        lcl.tick(DT)
+        t += DT
+        path += float(np.linalg.norm(lcl._pos[:count] - before, axis=1).sum())
+        err = np.linalg.norm(lcl._target_pos[:count] - lcl._pos[:count], axis=1).max()
+        speed = np.linalg.norm(lcl._vel[:count], axis=1).max()
+        if err < SETTLE_EPS and speed < SETTLE_SPEED:
+            break
+
+    return assign_ms, straight, path, t
+
+def run_benchmark(count: int, methods):
+    print(f"\n--- Formation transition with {count} particles (scatter -> circle) ---")
+    results = {}
+    for method in methods:
+        assign_ms, straight, path, settle = run_case(count, method)
+        results[method] = (assign_ms, straight, path, settle)
+        settled = f"{settle:6.2f} s" if settle < MAX_SECONDS else f">{MAX_SECONDS:.0f} s"
+        print(f"  {method:<10} assign {assign_ms:8.2f} ms | straight-line travel {straight:9.2f} | "
+              f"integrated path {path:9.2f} | time-to-settle {settled}")
+    return results
+
+if __name__ == "__main__":
+    run_benchmark(200, ["index", "hungarian", "hilbert"])
+    run_benchmark(600, ["index", "hungarian", "hilbert"])
+    run_benchmark(10000, ["index", "hilbert"])
@@ -0,0 +1,63 @@
+import time
+import sys
+import os
+import statistics
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.formation_manager import FormationManager
+
+SHAPES = ["circle", "square", "spiral", "cross", "scatter"]
+
+def time_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+def run_benchmark(count: int):
+    print(f"\n--- Formations with {count} points ---")
+    repeats = 3 if count >= 1_000_000 else 20
+    results = {}
+    clear = FormationManager.cache.clear # Generation cost, see run_cache_benchmark for hits
+    for shape in SHAPES:
+        arrays = time_ms(lambda: (clear(), FormationManager.get_formation_arrays(shape, count)), repeats)
+        tuples = time_ms(lambda: (clear(), FormationManager.get_formation(shape, count)), repeats)
+        results[shape] = (arrays, tuples)
+        print(f"  {shape:8s} arrays {arrays:9.3f} ms | tuple list {tuples:9.3f} ms")
+    return results
+
+def run_cache_benchmark(count: int, repeats: int = 200):
+    """Cold (cache cleared before every call) vs repeated vs moved (cached unit shape)."""
+    print(f"\n--- Formation cache, {count} points ---")
+    cache = FormationManager.cache
+
+    def cold():
+        cache.clear()
+        FormationManager.get_formation_arrays("circle", count)
+
+    cold_ms = time_ms(cold, repeats)
+    hot_ms = time_ms(lambda: FormationManager.get_formation_arrays("circle", count), repeats)
+    offsets = iter(range(10 ** 9))
+    moved_ms = time_ms(lambda: FormationManager.get_formation_arrays(
+        "circle", count, center=(0.5, 0.5 + next(offsets) * 1e-9)), repeats)
+    tuples_ms = time_ms(lambda: FormationManager.get_formation("circle", count), repeats)
+    print(f"  cold {cold_ms:.4f} ms | repeated {hot_ms:.4f} ms | moved {moved_ms:.4f} ms | "
+          f"tuple list (cached unit) {tuples_ms:.4f} ms")
+    print(f"  {cache.stats()}")
+    return cold_ms, hot_ms, moved_ms
+
+if __name__ == "__main__":
+    results = {c: run_benchmark(c) for c in [600, 10_000, 1_000_000]}
+    cached = {c: run_cache_benchmark(c) for c in [600, 10_000]}
+
+    print("\n=== FINAL SUMMARY ===")
+    for c, shapes in results.items():
+        arrays = statistics.mean(a for a, _ in shapes.values())
+        tuples = statistics.mean(t for _, t in shapes.values())
+        print(f"Points: {c:<8} | Arrays: {arrays:>9.3f} ms | Tuple list: {tuples:>9.3f} ms (mean over shapes)")
+    for c, (cold, hot, moved) in cached.items():
+        print(f"Cache {c:<6}: cold {cold:.4f} ms | repeated {hot:.4f} ms | moved {moved:.4f} ms")
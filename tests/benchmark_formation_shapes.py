@@ -0,0 +1,79 @@
+import time
+import sys
+import os
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.formation_manager import FormationManager
+from src.backend.departments.presentation.shape_library import blue_noise_tile, resolve_region
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+SHAPES = ["sphere", "cube", "cloud", "cracks", "text:AETHERIUM"]
+
+def uniform_random(shape: str, count: int, rng) -> np.ndarray:
+    """Baseline: white-noise (rejection) samples of the same region, scaled like a formation."""
+    region = resolve_region(shape)
+    x0, y0, x1, y1 = region.bounds
+    points = np.empty((0, 2))
+    while len(points) < count:
+        batch = rng.random((4 * count, 2)) * (x1 - x0, y1 - y0) + (x0, y0)
+        points = np.concatenate([points, batch[region.inside(batch[:, 0], batch[:, 1])]])
+    return points[:count] * 0.3 + 0.5
+
+def spacing(points: np.ndarray):
+    """Nearest-neighbor distance CV and min / mean (1.0 is a perfect lattice)."""
+    nearest = cKDTree(points).query(points, 2)[0][:, 1]
+    return nearest.std() / nearest.mean(), nearest.min() / nearest.mean()
+
+def run_benchmark(counts=(600, 10_000, 100_000)):
+    print("\n--- Library shape sampling (cold cache) ---")
+    t0 = time.perf_counter()
+    tile = blue_noise_tile()
+    print(f"  blue-noise tile: {len(tile)} points, {(time.perf_counter() - t0) * 1000:.1f} ms (once per process)")
+
+    timings = {}
+    for shape in SHAPES:
+        for count in counts:
+            FormationManager.cache.clear()
+            t0 = time.perf_counter()
+            FormationManager.get_formation_arrays(shape, count)
+            timings[(shape, count)] = (time.perf_counter() - t0) * 1000.0
+            t0 = time.perf_counter()
+            FormationManager.get_formation_arrays(shape, count)
+            cached = (time.perf_counter() - t0) * 1000.0
+            print(f"  {shape:16s} {count:7d}: {timings[(shape, count)]:7.2f} ms (cached {cached:.3f} ms)")
+    return timings
+
+def run_uniformity_benchmark(count: int = 10_000):
+    print(f"\n--- Coverage uniformity at {count} points: blue noise vs white noise ---")
+    if cKDTree is None:
+        print("  scipy not installed, skipped")
+        return {}
+    rng = np.random.default_rng(0)
+    results = {}
+    for shape in SHAPES:
+        coords, _ = FormationManager.get_formation_arrays(shape, count)
+        blue = spacing(coords.astype(np.float64))
+        white = spacing(uniform_random(shape, count, rng))
+        results[shape] = (blue, white)
+        print(f"  {shape:16s} NN-distance CV {blue[0]:.3f} vs {white[0]:.3f}, "
+              f"min/mean spacing {blue[1]:.3f} vs {white[1]:.3f}")
+    return results
+
+if __name__ == "__main__":
+    timings = run_benchmark()
+    uniformity = run_uniformity_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    for shape in SHAPES:
+        row = ", ".join(f"{count}: {ms:.2f} ms" for (name, count), ms in timings.items() if name == shape)
+        print(f"{shape:16s} {row}")
+    for shape, ((blue_cv, blue_min), (white_cv, white_min)) in uniformity.items():
+        print(f"{shape:16s} NN CV {blue_cv:.3f} (random {white_cv:.3f}), min/mean {blue_min:.3f} (random {white_min:.3f})")
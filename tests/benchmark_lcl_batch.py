@@ -0,0 +1,62 @@
+import time
+import sys
+import os
+import random
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+
+def make_intents(count: int, sources: int = 2000):
+    """Touch-burst style traffic: mostly SPAWNs with GLOBAL and targeted MOVEs mixed in."""
+    rng = random.Random(42)
+    intents = []
+    for i in range(count):
+        src = f"touch-{i % sources}"
+        r = rng.random()
+        if r < 0.6:
+            x, y = rng.random() * 0.9, rng.random() * 0.9
+            intents.append(LightIntent(action=LightAction.SPAWN, region=(x, y, x + 0.1, y + 0.1), source=src))
+        elif r < 0.95:
+            intents.append(LightIntent(action=LightAction.MOVE, vector=(rng.uniform(-1, 1), rng.uniform(-1, 1)),
+                                       intensity=rng.random(), source=src))
+        else:
+            intents.append(LightIntent(action=LightAction.EMPHASIZE, intensity=0.5, source=src))
+    return intents
+
+def fresh_lcl() -> LightControlLogic:
+    lcl = LightControlLogic()
+    lcl.MAX_ENERGY = lcl.system_energy = 1e9  # measure throughput, not metabolism
+    return lcl
+
+def run_benchmark(count: int):
+    print(f"\n--- Benchmarking {count} mixed intents ---")
+
+    lcl = fresh_lcl()
+    intents = make_intents(count)
+    t0 = time.perf_counter()
+    seq = [lcl.process(i) for i in intents]
+    seq_ms = (time.perf_counter() - t0) * 1000.0
+
+    lcl = fresh_lcl()
+    intents = make_intents(count)
+    t0 = time.perf_counter()
+    batch = lcl.process_batch(intents)
+    batch_ms = (time.perf_counter() - t0) * 1000.0
+
+    accepted = sum(r is not None for r in batch)
+    assert accepted == sum(r is not None for r in seq)
+    print(f"  Accepted: {accepted}/{count}")
+    print(f"  process() loop:  {seq_ms:8.2f} ms  ({seq_ms * 1000 / count:.2f} us/intent)")
+    print(f"  process_batch(): {batch_ms:8.2f} ms  ({batch_ms * 1000 / count:.2f} us/intent)")
+    print(f"  Speedup: {seq_ms / batch_ms:.2f}x")
+    return seq_ms, batch_ms
+
+if __name__ == "__main__":
+    results = {c: run_benchmark(c) for c in [1000, 10000]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for c, (s, b) in results.items():
+        print(f"Intents: {c:<6} | Sequential: {s:>8.2f} ms | Batch: {b:>8.2f} ms | {s / b:.2f}x")
@@ -0,0 +1,65 @@
+import time
+import sys
+import os
+import json
+import statistics
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.light_schemas import LightEntity, LightState
+from src.backend.departments.presentation.lcl_codec import encode_snapshot, DeltaEncoder
+
+def build_lcl(count: int) -> LightControlLogic:
+    lcl = LightControlLogic()
+    rng = np.random.default_rng(0)
+    xy = rng.random((count, 2))
+    lcl.entities = {
+        f"e{i}": LightEntity(id=f"e{i}", position=(float(xy[i, 0]), float(xy[i, 1])),
+                             velocity=(0.0, 0.0), energy=1.0,
+                             target_position=(0.5, 0.5) if i % 10 == 0 else None,
+                             target_color="#00ff88")
+        for i in range(count)
+    }
+    return lcl
+
+def run_benchmark(count: int, frames: int = 60):
+    print(f"\n--- Codec benchmark with {count} entities ---")
+    lcl = build_lcl(count)
+
+    t0 = time.perf_counter()
+    json_bytes = len(LightState(entities=lcl.entities, system_energy=lcl.system_energy).model_dump_json())
+    json_ms = (time.perf_counter() - t0) * 1000.0
+
+    t0 = time.perf_counter()
+    key_bytes = len(encode_snapshot(lcl))
+    key_ms = (time.perf_counter() - t0) * 1000.0
+
+    # Steady state: only the 10% of particles with targets are moving.
+    encoder = DeltaEncoder()
+    encoder.encode(lcl)
+    encoder.ack(1)
+    delta_sizes, delta_times = [], []
+    for _ in range(frames):
+        lcl.tick(0.016)
+        t0 = time.perf_counter()
+        frame = encoder.encode(lcl)
+        delta_times.append((time.perf_counter() - t0) * 1000.0)
+        delta_sizes.append(len(frame))
+        encoder.ack(encoder._next_frame_id - 1)
+
+    delta_avg = statistics.mean(delta_sizes)
+    print(f"  JSON entities:  {json_bytes:>10} bytes  ({json_ms:.2f} ms)")
+    print(f"  Binary keyframe:{key_bytes:>10} bytes  ({key_ms:.2f} ms)  {json_bytes / key_bytes:.1f}x smaller")
+    print(f"  Binary delta:   {delta_avg:>10.0f} bytes  ({statistics.mean(delta_times):.2f} ms)  {json_bytes / delta_avg:.1f}x smaller")
+    return json_bytes, key_bytes, delta_avg
+
+if __name__ == "__main__":
+    results = {c: run_benchmark(c) for c in [1000, 10000]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for c, (j, k, d) in results.items():
+        print(f"Count: {c:<6} | JSON: {j:>9} B | Key: {k:>8} B | Delta: {d:>8.0f} B")
@@ -0,0 +1,63 @@
+import time
+import sys
+import os
+import statistics
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.lcl_codec import encode_snapshot
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+
+def image_formation(count: int, distinct: int, seed: int = 0):
+    """Image-like formation: `distinct` different hex colors spread over `count` points."""
+    rng = np.random.default_rng(seed)
+    palette = ["#{:02x}{:02x}{:02x}".format(*c) for c in rng.integers(0, 256, (distinct, 3)).tolist()]
+    xy = rng.random((count, 2)).tolist()
+    picks = rng.integers(0, distinct, count).tolist()
+    return [(x, y, palette[k]) for (x, y), k in zip(xy, picks)]
+
+def color_bytes_per_entity(lcl: LightControlLogic) -> int:
+    names = [n for n in ("_target_colors", "_color", "_color_vel") if hasattr(lcl, n)]
+    return sum(getattr(lcl, n).itemsize * int(np.prod(getattr(lcl, n).shape[1:])) for n in names)
+
+def timed(fn, repeats: int):
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+def run_benchmark(count: int, distinct: int):
+    print(f"\n--- {count} particles, {distinct} distinct colors ---")
+    formation = image_formation(count, distinct)
+
+    def manifest():
+        lcl = LightControlLogic()
+        lcl.MAX_ENERGY = lcl.system_energy = 1e9
+        lcl.process(LightIntent(action=LightAction.MANIFEST, formation_data=formation, source="bench"))
+        return lcl
+
+    manifest_ms = timed(manifest, 5)
+    lcl = manifest()
+    tick_ms = timed(lambda: lcl.tick(0.016), 20)
+    encode_ms = timed(lambda: encode_snapshot(lcl), 20)
+    per_entity = color_bytes_per_entity(lcl)
+
+    print(f"  MANIFEST (parse + assign): {manifest_ms:8.2f} ms")
+    print(f"  tick():                    {tick_ms:8.2f} ms")
+    print(f"  encode_snapshot():         {encode_ms:8.2f} ms")
+    print(f"  color state:               {per_entity} bytes/entity (+ str objects for object arrays)")
+    return manifest_ms, tick_ms, encode_ms, per_entity
+
+if __name__ == "__main__":
+    results = {(c, d): run_benchmark(c, d) for c, d in [(10000, 16), (100000, 16), (100000, 30000)]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for (c, d), (m, t, e, b) in results.items():
+        print(f"Particles: {c:<7} Colors: {d:<6} | MANIFEST: {m:>8.2f} ms | Tick: {t:>7.2f} ms | "
+              f"Encode: {e:>7.2f} ms | Color state: {b:>3} B/entity")
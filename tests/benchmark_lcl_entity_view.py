@@ -0,0 +1,63 @@
+import time
+import sys
+import os
+import tracemalloc
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+
+def measure(fn):
+    """Returns (result, elapsed ms, peak traced MB); timing and tracing are separate runs."""
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - t0) * 1000.0
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+def make_lcl(count: int) -> LightControlLogic:
+    lcl = LightControlLogic(capacity=count)
+    lcl.spawn_many(count, np.random.default_rng(0).random((count, 2)).astype(np.float32))
+    return lcl
+
+def page_through(lcl: LightControlLogic, size: int):
+    view = lcl.view()
+    rows = 0
+    for number in range((len(view) + size - 1) // size):
+        rows += len(view.page(number, size).to_records(("position", "energy")))
+    return rows
+
+def run_benchmark(count: int, full_snapshot: bool):
+    print(f"\n--- Entity snapshot with {count} entities ---")
+    lcl = make_lcl(count)
+    results = {}
+    if full_snapshot:
+        _, ms, mb = measure(lambda: lcl.entities)
+        results["entities (all models)"] = (ms, mb)
+    cases = {
+        "view()[:1000] models": lambda: list(lcl.view()[:1000]),
+        "one page of records": lambda: lcl.view().page(0, 1000).to_records(("position", "energy")),
+        "page through all": lambda: page_through(lcl, 1000),
+        "region filter 10%": lambda: len(lcl.view().in_region(0.0, 0.0, 0.316, 0.316)),
+        "positions projection": lambda: lcl.view().positions.sum(),
+    }
+    for name, fn in cases.items():
+        _, ms, mb = measure(fn)
+        results[name] = (ms, mb)
+    for name, (ms, mb) in results.items():
+        print(f"  {name:<24} {ms:10.2f} ms | peak {mb:9.2f} MB")
+    return results
+
+if __name__ == "__main__":
+    all_results = {c: run_benchmark(c, full) for c, full in [(100000, True), (1000000, False)]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for c, results in all_results.items():
+        for name, (ms, mb) in results.items():
+            print(f"Entities: {c:<8} | {name:<24} | {ms:>10.2f} ms | Peak: {mb:>9.2f} MB")
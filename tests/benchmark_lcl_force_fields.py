@@ -0,0 +1,68 @@
+import time
+import sys
+import os
+import statistics
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.force_fields import (
+    ForceField, Radial, Vortex, Attractor, CurlNoise
+)
+
+TERMS = {
+    "radial": [Radial(-0.5)],
+    "vortex": [Vortex(0.5)],
+    "radial+vortex": [Radial(-0.5), Vortex(0.5)],
+    "attractor x1": [Attractor(0.3, (0.2, 0.2))],
+    "attractor x4": [Attractor(0.3, (x, y)) for x in (0.2, 0.8) for y in (0.2, 0.8)],
+    "curl noise": [CurlNoise(0.4)],
+}
+
+def time_ms(fn, repeats: int = 20) -> float:
+    fn()
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+def run_benchmark(count: int = 100_000):
+    print(f"\n--- Force field cost at {count} particles ---")
+    rng = np.random.default_rng(0)
+    pos = rng.random((count, 2)).astype(np.float32)
+
+    per_term = {}
+    for name, terms in TERMS.items():
+        field = ForceField(terms)
+        per_term[name] = time_ms(lambda: field.accel(pos, 1.0))
+        print(f"  {name:14s} {per_term[name]:6.2f} ms")
+
+    everything = [term for terms in TERMS.values() for term in terms]
+    fused_field = ForceField(everything)
+    fused = time_ms(lambda: fused_field.accel(pos, 1.0))
+    singles = [ForceField([term]) for term in everything]
+    separate = time_ms(lambda: sum(field.accel(pos, 1.0) for field in singles))
+    print(f"  all {len(everything)} terms: fused {fused:.2f} ms vs one pass per term {separate:.2f} ms")
+
+    ticks = {}
+    for name, field in (("no field", None), ("vortex+noise", ForceField([Vortex(0.5), CurlNoise(0.4)]))):
+        lcl = LightControlLogic(capacity=count)
+        lcl.spawn_many(count, pos)
+        lcl.force_field = field
+        ticks[name] = time_ms(lambda: lcl.tick(0.016))
+        print(f"  tick() with {name:12s} {ticks[name]:6.2f} ms")
+    return per_term, fused, separate, ticks
+
+if __name__ == "__main__":
+    per_term, fused, separate, ticks = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    for name, ms in per_term.items():
+        print(f"{name:14s}: {ms:6.2f} ms / 100k particles")
+    print(f"All terms fused: {fused:.2f} ms (separate passes: {separate:.2f} ms)")
+    print(f"tick(): {ticks['no field']:.2f} ms -> {ticks['vortex+noise']:.2f} ms with vortex + curl noise")
@@ -0,0 +1,48 @@
+import time
+import sys
+import os
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+
+def run_benchmark(target: int = 2_000_000, per_frame: int = 5000):
+    """Spawns `per_frame` entities and ticks once per frame until `target` entities."""
+    print(f"\n--- Growing 0 -> {target} entities, {per_frame} spawns per frame ---")
+    lcl = LightControlLogic()
+    rng = np.random.default_rng(0)
+    positions = rng.random((per_frame, 2)).astype(np.float32)
+
+    spawn_ms, frame_ms, growths = [], [], []
+    while lcl._count < target:
+        capacity = lcl._capacity
+        t0 = time.perf_counter()
+        lcl.spawn_many(per_frame, positions)
+        t1 = time.perf_counter()
+        lcl.tick(0.016)
+        t2 = time.perf_counter()
+        spawn_ms.append((t1 - t0) * 1000.0)
+        frame_ms.append((t2 - t0) * 1000.0)
+        if lcl._capacity != capacity:
+            growths.append((lcl._capacity, spawn_ms[-1]))
+
+    for capacity, ms in growths:
+        print(f"  grow to {capacity:8d}: spawn_many {ms:7.2f} ms")
+    spawn = np.array(spawn_ms)
+    frames = np.array(frame_ms)
+    # Frame cost excluding the spawn, to show how much of the worst frame is the growth
+    ticks = frames - spawn
+    print(f"  spawn_many: median {np.median(spawn):6.2f} ms, worst {spawn.max():7.2f} ms")
+    print(f"  frame:      median {np.median(frames):6.2f} ms, worst {frames.max():7.2f} ms")
+    print(f"  worst frame / tick at that size: {frames.max() / ticks[frames.argmax()]:.2f}x")
+    return spawn.max(), frames.max(), float(np.median(frames))
+
+if __name__ == "__main__":
+    worst_spawn, worst_frame, median_frame = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    print(f"Worst spawn_many: {worst_spawn:.2f} ms")
+    print(f"Worst frame:      {worst_frame:.2f} ms (median {median_frame:.2f} ms)")
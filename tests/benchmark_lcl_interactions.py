@@ -0,0 +1,36 @@
+import time
+import sys
+import os
+import statistics
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+
+def run_benchmark(count: int, interactions: bool, frames: int = 20):
+    lcl = LightControlLogic()
+    rng = np.random.default_rng(0)
+    lcl.spawn_many(count, rng.random((count, 2)).astype(np.float32))
+    # Radius scaled so a uniform layout has ~10 particles per cell at any N
+    lcl.interaction_radius = float(np.sqrt(10.0 / count))
+
+    for _ in range(3):
+        lcl.tick(0.016, interactions=interactions)
+
+    times = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        lcl.tick(0.016, interactions=interactions)
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.mean(times), max(times)
+
+if __name__ == "__main__":
+    print("\n\n=== FINAL SUMMARY ===")
+    for c in [10000, 100000]:
+        base_avg, base_max = run_benchmark(c, False)
+        int_avg, int_max = run_benchmark(c, True)
+        print(f"Count: {c:<7} | Without: {base_avg:>8.2f} ms (max {base_max:.2f}) | "
+              f"With interactions: {int_avg:>8.2f} ms (max {int_max:.2f})")
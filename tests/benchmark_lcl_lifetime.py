@@ -0,0 +1,76 @@
+import time
+import sys
+import os
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic, ENTITY_ARRAYS
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+
+SOURCES = 64
+
+def array_bytes(lcl: LightControlLogic) -> int:
+    return sum(getattr(lcl, name).nbytes for name in ENTITY_ARRAYS)
+
+def run_benchmark(decay, minutes: float = 60.0, fps: float = 10.0, spawn_rate: float = 60.0,
+                  burst: int = 20000, burst_every: float = 600.0):
+    """
+    Synthetic spawn stream: `spawn_rate` SPAWN intents per second (spread over SOURCES
+    so the gatekeeper admits them) plus a `burst` of short-lived entities every
+    `burst_every` seconds. Simulated time runs on lcl.clock, ticked at `fps`.
+    """
+    label = "no decay" if decay is None else f"decay {decay}/s"
+    print(f"\n--- {minutes:.0f} min spawn stream, {spawn_rate:.0f}/s ({label}) ---")
+    lcl = LightControlLogic()
+    lcl.MAX_ENERGY = lcl.system_energy = 1e12
+    now = [0.0]
+    lcl.clock = lambda: now[0]
+
+    dt = 1.0 / fps
+    ticks = int(minutes * 60 * fps)
+    per_tick = spawn_rate / fps
+    owed = 0.0
+    sent = 0
+    samples = []
+    peak_bytes = 0
+    t0 = time.perf_counter()
+    for tick in range(ticks):
+        now[0] = tick * dt
+        owed += per_tick
+        intents = []
+        while owed >= 1.0:
+            intents.append(LightIntent(action=LightAction.SPAWN, decay=decay, source=f"c{sent % SOURCES}"))
+            sent += 1
+            owed -= 1.0
+        lcl.process_batch(intents)
+        if burst and tick % int(burst_every * fps) == int(burst_every * fps) // 4:
+            lcl.spawn_many(burst, (0.5, 0.5), decay=0.0 if decay is None else 0.5)
+        lcl.tick(dt)
+
+        peak_bytes = max(peak_bytes, array_bytes(lcl))
+        if tick % int(60 * fps) == 0:
+            samples.append((lcl._count, lcl._capacity, array_bytes(lcl)))
+    elapsed = time.perf_counter() - t0
+
+    for minute in (0, 5, 15, 30, 45):
+        if minute < len(samples):
+            count, cap, size = samples[minute]
+            print(f"  t={minute:3d} min  entities {count:7d}  capacity {cap:7d}  arrays {size / 2**20:7.2f} MB")
+    final = (lcl._count, lcl._capacity, array_bytes(lcl))
+    print(f"  t={minutes:3.0f} min  entities {final[0]:7d}  capacity {final[1]:7d}  arrays {final[2] / 2**20:7.2f} MB")
+    print(f"  Peak arrays: {peak_bytes / 2**20:.2f} MB, {elapsed * 1000 / ticks:.3f} ms/tick (incl. intents)")
+    return final[0], final[2], peak_bytes, elapsed * 1000 / ticks
+
+if __name__ == "__main__":
+    results = {
+        "no decay": run_benchmark(None),
+        "decay": run_benchmark(0.2),
+    }
+
+    print("\n=== FINAL SUMMARY ===")
+    for name, (count, size, peak, ms) in results.items():
+        print(f"{name:9s}: {count:7d} entities after 1 h, arrays {size / 2**20:7.2f} MB "
+              f"(peak {peak / 2**20:.2f} MB), {ms:.3f} ms/tick")
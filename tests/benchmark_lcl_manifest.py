@@ -0,0 +1,45 @@
+import time
+import sys
+import os
+import statistics
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+from src.backend.departments.presentation.formation_manager import FormationManager
+
+def run_benchmark(count: int, repeats: int = 5):
+    print(f"\n--- MANIFEST with {count} points ---")
+    formation = FormationManager.get_formation("circle", count)
+
+    cold, warm = [], []
+    for _ in range(repeats):
+        lcl = LightControlLogic()
+        lcl.MAX_ENERGY = lcl.system_energy = 1e9
+
+        # Cold: every particle has to be spawned
+        intent = LightIntent(action=LightAction.MANIFEST, formation_data=formation, source="bench")
+        t0 = time.perf_counter()
+        lcl.process(intent)
+        cold.append((time.perf_counter() - t0) * 1000.0)
+
+        # Warm: particles exist, only targets are reassigned
+        intent = LightIntent(action=LightAction.MANIFEST, formation_data=formation, source="bench2")
+        t0 = time.perf_counter()
+        lcl.process(intent)
+        warm.append((time.perf_counter() - t0) * 1000.0)
+
+        assert lcl._count == count
+
+    print(f"  Cold (spawn + assign): {statistics.median(cold):9.3f} ms")
+    print(f"  Warm (assign only):    {statistics.median(warm):9.3f} ms")
+    return statistics.median(cold), statistics.median(warm)
+
+if __name__ == "__main__":
+    results = {c: run_benchmark(c) for c in [600, 10000, 100000]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for c, (cold, warm) in results.items():
+        print(f"Points: {c:<7} | Cold: {cold:>9.3f} ms | Warm: {warm:>9.3f} ms")
@@ -0,0 +1,73 @@
+import time
+import sys
+import os
+import json
+import statistics
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.lcl_codec import DeltaEncoder
+from src.backend.departments.presentation.formation_manager import FormationManager
+from src.backend.departments.presentation.morph_tracks import MorphSettings
+
+COLOR = "#00ff88"
+DT = 1 / 60
+# Transition window measured: morph duration + stagger, plus a second of settling
+MORPH = MorphSettings(duration=1.2, easing="ease_in_out", stagger=0.3, order="radial")
+FRAMES = int((MORPH.duration + MORPH.stagger + 1.0) / DT)
+
+def build(count: int, morph) -> LightControlLogic:
+    lcl = LightControlLogic(capacity=count)
+    lcl.assignment_method = "hilbert" # Same assignment either way; keeps setup fast
+    coords, _ = FormationManager.get_formation_arrays("circle", count)
+    lcl.spawn_many(count, coords, target_colors=COLOR)
+    lcl.tick(DT)
+    lcl._colors_moving = False # Colors settled: measure motion only
+    lcl.morph = morph
+    return lcl
+
+def run_benchmark(count: int):
+    print(f"\n--- circle -> sphere transition, {count} particles, {FRAMES} frames ---")
+    target, _ = FormationManager.get_formation_arrays("sphere", count)
+    results = {}
+    for name, morph in (("springs", None), ("morph track", MORPH)):
+        lcl = build(count, morph)
+        t0 = time.perf_counter()
+        track = lcl.manifest(target, COLOR)
+        plan_ms = (time.perf_counter() - t0) * 1000.0
+        params_bytes = 0 if track is None else len(json.dumps(track.params(lcl._handles[:count])))
+
+        streaming, local = DeltaEncoder(), DeltaEncoder(client_morphs=True)
+        for encoder in (streaming, local):
+            encoder.ack(1) if encoder.encode(lcl) else None
+        tick_ms, sent = [], {"streamed": 0, "client-animated": 0}
+        for _ in range(FRAMES):
+            t0 = time.perf_counter()
+            lcl.tick(DT)
+            tick_ms.append((time.perf_counter() - t0) * 1000.0)
+            for label, encoder in (("streamed", streaming), ("client-animated", local)):
+                sent[label] += len(encoder.encode(lcl))
+                encoder.ack(encoder._next_frame_id - 1)
+        error = float(np.abs(lcl._pos[:count] - lcl._target_pos[:count]).max())
+        results[name] = (statistics.mean(tick_ms), plan_ms, sent, params_bytes, error)
+        print(f"  {name:12s}: tick {statistics.mean(tick_ms):6.3f} ms, manifest {plan_ms:6.2f} ms, "
+              f"max distance to target after {FRAMES} frames {error:.4f}")
+        print(f"  {'':12s}  delta frames: streamed {sent['streamed'] / 1024:8.1f} KiB, "
+              f"client-animated {sent['client-animated'] / 1024:8.1f} KiB + {params_bytes / 1024:.1f} KiB params")
+    return results
+
+if __name__ == "__main__":
+    summary = {count: run_benchmark(count) for count in (10_000, 100_000)}
+
+    print("\n=== FINAL SUMMARY ===")
+    for count, results in summary.items():
+        spring_tick, _, spring_sent, _, _ = results["springs"]
+        track_tick, plan_ms, track_sent, params_bytes, _ = results["morph track"]
+        print(f"{count} particles: tick {spring_tick:.3f} ms (springs) -> {track_tick:.3f} ms (track), "
+              f"planning {plan_ms:.2f} ms")
+        print(f"{'':{len(str(count))}} streamed {spring_sent['streamed'] / 1024:.0f} KiB (springs) -> "
+              f"{(track_sent['client-animated'] + params_bytes) / 1024:.0f} KiB (client-animated track incl. params)")
@@ -0,0 +1,52 @@
+import time
+import sys
+import os
+import tracemalloc
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+
+def run_benchmark(sources: int, ticks: int = 100):
+    print(f"\n--- Gatekeeper with {sources} distinct sources ---")
+    intents = [LightIntent(action=LightAction.EMPHASIZE, source=f"client-{i}") for i in range(sources)]
+
+    def fresh_lcl():
+        lcl = LightControlLogic()
+        lcl.MAX_ENERGY = lcl.system_energy = 1e9
+        lcl.spawn_many(1, (0.5, 0.5))  # tick() needs at least one entity to run the energy ledger
+        return lcl
+
+    lcl = fresh_lcl()
+    t0 = time.perf_counter()
+    for intent in intents:
+        lcl._admit(intent)
+    admit_us = (time.perf_counter() - t0) * 1e6 / sources
+
+    # Same traffic again under tracemalloc to size the gatekeeper state
+    mem_lcl = fresh_lcl()
+    tracemalloc.start()
+    base_mem = tracemalloc.get_traced_memory()[0]
+    for intent in intents:
+        mem_lcl._admit(intent)
+    gate_mem = tracemalloc.get_traced_memory()[0] - base_mem
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        lcl.tick(0.016)
+    tick_ms = (time.perf_counter() - t0) * 1000.0 / ticks
+
+    print(f"  Gatekeeper:       {admit_us:8.2f} us/intent")
+    print(f"  Gatekeeper state: {gate_mem / 1e6:8.2f} MB")
+    print(f"  tick() with 1 entity: {tick_ms:8.3f} ms")
+    return admit_us, gate_mem, tick_ms
+
+if __name__ == "__main__":
+    results = {s: run_benchmark(s) for s in [1000, 100000]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for s, (us, mem, tick) in results.items():
+        print(f"Sources: {s:<7} | Admit: {us:>6.2f} us | State: {mem / 1e6:>7.2f} MB | Tick: {tick:>7.3f} ms")
@@ -0,0 +1,80 @@
+import time
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.lcl_replay import SessionRecorder, replay, format_report
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+from src.backend.departments.presentation.formation_manager import FormationManager
+
+def synthetic_traffic(ticks: int, formation_points: int, seed: int = 0):
+    """A session-like stream: a spawn burst, moves every few frames, a formation change every 2 s."""
+    rng = np.random.default_rng(seed)
+    shapes = ["circle", "spiral", "square", "cross"]
+    yield "batch", [LightIntent(action=LightAction.SPAWN, source=f"user-{i % 4}") for i in range(200)]
+    for frame in range(ticks):
+        if frame % 120 == 0:
+            shape = shapes[(frame // 120) % len(shapes)]
+            yield "intent", LightIntent(action=LightAction.MANIFEST, source="system", priority=3,
+                                        formation_data=FormationManager.get_formation(shape, formation_points))
+        if frame % 5 == 0:
+            vec = tuple(float(v) for v in rng.normal(size=2))
+            yield "intent", LightIntent(action=LightAction.MOVE, source=f"user-{frame % 4}", vector=vec)
+        yield "tick", 0.016
+
+def drive(target, traffic):
+    for kind, payload in traffic:
+        if kind == "tick":
+            target.tick(payload)
+        elif kind == "batch":
+            target.process_batch(payload)
+        else:
+            target.process(payload)
+
+def fresh_lcl() -> LightControlLogic:
+    lcl = LightControlLogic()
+    lcl.MAX_ENERGY = lcl.system_energy = 1e9
+    return lcl
+
+def run_benchmark(ticks: int, formation_points: int):
+    print(f"\n--- Session: {ticks} ticks, formations of {formation_points} points ---")
+    traffic = list(synthetic_traffic(ticks, formation_points))
+
+    # Reference: live run without recording
+    lcl = fresh_lcl()
+    t0 = time.perf_counter()
+    drive(lcl, traffic)
+    live_ms = (time.perf_counter() - t0) * 1000.0
+
+    lcl = fresh_lcl()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session.lclr")
+        t0 = time.perf_counter()
+        with SessionRecorder(lcl, path) as rec:
+            drive(rec, traffic)
+        record_ms = (time.perf_counter() - t0) * 1000.0
+        size = os.path.getsize(path)
+
+        report = replay(path)
+
+    print(f"  Live run:     {live_ms:9.1f} ms")
+    print(f"  Recorded run: {record_ms:9.1f} ms ({(record_ms / live_ms - 1) * 100:+.1f}%), file {size / 1024:.1f} KB")
+    print(format_report(report))
+    assert report.ok
+    return live_ms, record_ms, size, report
+
+if __name__ == "__main__":
+    results = {(t, p): run_benchmark(t, p) for t, p in [(3600, 600), (1200, 10000)]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for (t, p), (live_ms, record_ms, size, report) in results.items():
+        tick = report.phases["tick"]
+        print(f"Ticks: {t:<5} Points: {p:<6} | Live: {live_ms:>8.1f} ms | Record: {record_ms:>8.1f} ms | "
+              f"File: {size / 1024:>7.1f} KB | Replay: {report.wall_ms:>8.1f} ms | "
+              f"Tick p99: {tick.p99_us:>7.1f} us | {'OK' if report.ok else 'MISMATCH'}")
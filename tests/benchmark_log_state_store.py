@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.genesis_core.logenesis.log_state_store import LogStateStore
+from src.backend.genesis_core.logenesis.state_store import StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentVector
+
+BATCH = 10_000 # Sessions updated between two flushes in the steady-state measurement
+COUNTS = (100_000, 1_000_000)
+
+def make_state(i: int) -> ExpressionState:
+    value = (i % 97) / 97
+    vector = IntentVector(epistemic_need=value, subjective_weight=1 - value, decision_urgency=0.5, precision_required=value)
+    previous = IntentVector(epistemic_need=0.5, subjective_weight=0.5, decision_urgency=0.5, precision_required=0.5)
+    return ExpressionState(current_vector=vector, previous_vector=previous, velocity=0.01 * (i % 7), inertia=0.8,
+                           last_updated=datetime(2026, 1, 1, 12, i % 60))
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+def mark(store: StateStore, sid: str, state: ExpressionState):
+    """What update_state does inside the event loop, minus starting the flusher."""
+    store._dirty.add(sid)
+    store._cache[sid] = state
+
+def disk_size(*paths):
+    return sum(os.path.getsize(p) for p in paths if os.path.exists(p)) / 2**20
+
+def run_benchmark(count: int):
+    print(f"\n--- {count} sessions ---")
+    distinct = [make_state(i) for i in range(97 * 60)] # Shared across sessions to keep memory in check
+    states = [distinct[i % len(distinct)] for i in range(count)]
+    batch = [make_state(i + 1) for i in range(BATCH)]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, make in (("json", lambda: StateStore(os.path.join(tmp, "state.json"))),
+                           ("log", lambda: LogStateStore(os.path.join(tmp, "state.log")))):
+            store = make()
+            for i, state in enumerate(states): # Initial population, one batched flush
+                mark(store, f"session-{i}", state)
+            _, populate = timed(store.flush)
+            # Steady state: BATCH sessions change, then one flush
+            for i, state in enumerate(batch):
+                mark(store, f"session-{i * 97 % count}", state)
+            _, flush = timed(store.flush)
+            if name == "log":
+                _, compact = timed(store.compact)
+            mark(store, f"session-{count // 2}", batch[0]) # For the log store: a tail to replay
+            store.flush()
+            paths = (store.filepath, getattr(store, "snapshot_path", ""))
+            reloaded, load = timed(make)
+            _, first_get = timed(lambda: reloaded.get_state(f"session-{count // 2}"))
+            assert reloaded.get_state(f"session-{count // 2}").model_dump() == batch[0].model_dump()
+            results[name] = (load, populate, flush, first_get)
+            store = reloaded = None # Release before the next backend
+            print(f"  {name:4s}: cold start {load * 1000:8.1f} ms ({disk_size(*paths):.0f} MiB), "
+                  f"first get_state {first_get * 1e6:5.1f} us")
+            print(f"        initial write {populate * 1000:8.1f} ms ({count / populate / 1e3:7.0f}k sessions/s), "
+                  f"flush of {BATCH} changed sessions {flush * 1000:7.1f} ms ({BATCH / flush / 1e3:6.0f}k sessions/s)")
+            if name == "log":
+                print(f"        compaction {compact * 1000:.1f} ms")
+    return results
+
+if __name__ == "__main__":
+    summary = {count: run_benchmark(count) for count in COUNTS}
+
+    print("\n=== FINAL SUMMARY ===")
+    for count, results in summary.items():
+        (json_load, _, json_flush, _), (log_load, _, log_flush, _) = results["json"], results["log"]
+        print(f"{count} sessions: cold start {json_load * 1000:.0f} ms (json) -> {log_load * 1000:.1f} ms (log), "
+              f"{BATCH}-session flush {json_flush * 1000:.0f} ms -> {log_flush * 1000:.1f} ms "
+              f"({BATCH / log_flush / 1e3:.0f}k sessions/s)")
@@ -0,0 +1,94 @@
+import time
+import sys
+import os
+import tracemalloc
+
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.scene_host import SceneHost
+
+def populate(lcl: LightControlLogic, particles: int, rng):
+    if particles:
+        lcl.spawn_many(particles, rng.random((particles, 2)).astype(np.float32))
+        lcl.manifest(rng.random((particles, 2)).astype(np.float32), "#00FFFF")
+
+def measure_memory(make, scenes: int) -> float:
+    """Bytes allocated per scene kept alive by `make`."""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    keep = [make(i) for i in range(scenes)]
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del keep
+    return used / scenes
+
+def run_memory_benchmark(particles: int, scenes: int = 200):
+    print(f"\n--- Memory per idle scene ({particles} particles) ---")
+    rng = np.random.default_rng(0)
+
+    def standalone(i):
+        lcl = LightControlLogic()
+        populate(lcl, particles, rng)
+        return lcl
+
+    host = SceneHost()
+    def hosted(i):
+        populate(host.scene(f"s{i}", now=0.0), particles, rng)
+
+    frozen_host = SceneHost()
+    def frozen(i):
+        populate(frozen_host.scene(f"s{i}", now=0.0), particles, rng)
+        frozen_host.freeze(f"s{i}")
+
+    results = (
+        measure_memory(standalone, scenes),
+        measure_memory(hosted, scenes),
+        measure_memory(frozen, scenes),
+    )
+    print(f"  LightControlLogic():  {results[0] / 1024:9.1f} KB")
+    print(f"  SceneHost (active):   {results[1] / 1024:9.1f} KB")
+    print(f"  SceneHost (frozen):   {results[2] / 1024:9.1f} KB")
+    return results
+
+def run_tick_benchmark(scenes: int, particles: int, ticks: int = 50):
+    print(f"\n--- Tick {scenes} scenes x {particles} particles ---")
+    rng = np.random.default_rng(1)
+    host = SceneHost()
+    standalone = []
+    for i in range(scenes):
+        lcl = LightControlLogic(capacity=particles)
+        populate(lcl, particles, rng)
+        standalone.append(lcl)
+        populate(host.scene(f"s{i}"), particles, rng)
+
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        for lcl in standalone:
+            lcl.tick(0.016)
+    loop_ms = (time.perf_counter() - t0) * 1000.0 / ticks
+
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        host.tick(0.016)
+    host_ms = (time.perf_counter() - t0) * 1000.0 / ticks
+
+    total = scenes * particles
+    print(f"  Per-scene tick():  {loop_ms:8.2f} ms/frame ({total / loop_ms / 1000:6.2f} M particles/s)")
+    print(f"  SceneHost.tick():  {host_ms:8.2f} ms/frame ({total / host_ms / 1000:6.2f} M particles/s)")
+    return loop_ms, host_ms
+
+if __name__ == "__main__":
+    memory = {p: run_memory_benchmark(p) for p in [0, 200]}
+    ticks = {(s, p): run_tick_benchmark(s, p) for s, p in [(1000, 20), (1000, 200), (100, 2000)]}
+
+    print("\n\n=== FINAL SUMMARY ===")
+    for p, (standalone, active, frozen) in memory.items():
+        print(f"Idle scene, {p:<4} particles | LCL(): {standalone / 1024:>8.1f} KB | "
+              f"Hosted: {active / 1024:>7.1f} KB | Frozen: {frozen / 1024:>6.1f} KB")
+    for (s, p), (loop_ms, host_ms) in ticks.items():
+        print(f"Scenes: {s:<5} x {p:<5} | Per-scene: {loop_ms:>8.2f} ms | SceneHost: {host_ms:>7.2f} ms | "
+              f"Speedup: {loop_ms / host_ms:>5.1f}x")
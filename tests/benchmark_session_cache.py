@@ -0,0 +1,81 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.genesis_core.logenesis.state_store import StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentVector
+
+CONNECTIONS = 20_000     # Each WebSocket connection is a new session (str(id(websocket)))
+REQUESTS = 4             # Requests per connection
+RETURNING = 0.2          # Share of requests that revisit an earlier session
+CONNECT_EVERY = 0.05     # Simulated seconds between connections
+FLUSH_EVERY = 200        # Simulated flush interval, in connections (10 s)
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def drifted(state: ExpressionState, step: int) -> ExpressionState:
+    v = state.current_vector
+    value = (v.epistemic_need + 0.01 * step) % 1.0
+    vector = IntentVector(epistemic_need=value, subjective_weight=v.subjective_weight,
+                          decision_urgency=v.decision_urgency, precision_required=v.precision_required)
+    return ExpressionState(current_vector=vector, previous_vector=v, velocity=0.1, inertia=state.inertia)
+
+def request(store: StateStore, sid: str, step: int):
+    """What LogenesisEngine.process does with the store (update_state inside the loop marks dirty)."""
+    state = drifted(store.get_state(sid), step)
+    store._dirty.add(sid)
+    store._cache[sid] = state
+
+def run(store: StateStore):
+    clock = Clock()
+    store._cache.clock = clock
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for c in range(CONNECTIONS):
+        clock.now = c * CONNECT_EVERY
+        for r in range(REQUESTS):
+            if r and (c * REQUESTS + r) % int(1 / RETURNING) == 0:
+                sid = f"ws-{(c * 7919) % (c + 1)}" # An earlier connection's session
+            else:
+                sid = f"ws-{c}"
+            request(store, sid, r)
+        if c % FLUSH_EVERY == 0:
+            store.flush()
+            store._cache.evict()
+    store.flush()
+    elapsed = time.perf_counter() - t0
+    resident_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    return elapsed, resident_mb, store.cache_stats()
+
+def run_benchmark():
+    print(f"\n--- {CONNECTIONS} connections x {REQUESTS} requests, one new session per connection ---")
+    results = {}
+    configs = (("unbounded", dict(max_resident=None, idle_ttl=None)),
+               ("lru+ttl", dict(max_resident=10_000, idle_ttl=300.0)))
+    for name, options in configs:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = StateStore(os.path.join(tmp, "state.json"), **options)
+            elapsed, resident_mb, stats = run(store)
+        per_request = elapsed / (CONNECTIONS * REQUESTS) * 1e6
+        results[name] = (stats["resident"], resident_mb, stats["hit_rate"], per_request)
+        print(f"  {name:9s}: {stats['resident']:6d} resident sessions, {resident_mb:6.1f} MiB traced, "
+              f"hit rate {stats['hit_rate']:.3f}, evictions {stats['evictions']}, expirations {stats['expirations']}, "
+              f"{per_request:.1f} us/request (incl. flushes)")
+    return results
+
+if __name__ == "__main__":
+    results = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    for name, (resident, mb, hit_rate, per_request) in results.items():
+        print(f"{name:9s}: {resident} resident sessions, {mb:.1f} MiB, hit rate {hit_rate:.3f}, {per_request:.1f} us/request")
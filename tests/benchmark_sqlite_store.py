@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.auth.schemas import IdentityProfile, TokenSet
+from src.backend.auth.session_manager import AuthManager, SqliteAuthManager
+from src.backend.genesis_core.logenesis.sqlite_state_store import SqliteStateStore
+from src.backend.genesis_core.logenesis.state_store import StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentVector
+from src.backend.storage import AUTH_TABLE, STATE_TABLE, SqliteDocumentStore
+from src.backend.storage.migrate import migrate_json
+
+USERS = 10_000
+SESSIONS = 100_000
+DIRTY = 1_000      # Sessions changed per flush
+WORKERS = 4
+LOGINS = 250       # Per worker in the multi-process run
+
+def identity(n: int) -> IdentityProfile:
+    return IdentityProfile(provider="mock", sub=str(n), email=f"user{n}@example.com", name=f"User {n}")
+
+def tokens(tag: str) -> TokenSet:
+    return TokenSet(access_token=f"access-{tag}", refresh_token=f"refresh-{tag}", expires_at=1e9)
+
+def make_state(i: int) -> ExpressionState:
+    value = (i % 97) / 97
+    vector = IntentVector(epistemic_need=value, subjective_weight=1 - value, decision_urgency=0.5, precision_required=value)
+    return ExpressionState(current_vector=vector, previous_vector=vector, velocity=0.01 * (i % 7), inertia=0.8)
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000.0
+
+def median_ms(fn, calls: int) -> float:
+    samples = []
+    for i in range(calls):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+def _worker_logins(kind: str, path: str, worker: int):
+    manager = SqliteAuthManager(path) if kind == "sqlite" else AuthManager(path)
+    for i in range(LOGINS):
+        manager.upsert_user(f"mock-{worker}-{i}", identity(i), tokens(str(worker)))
+
+def concurrent_logins(kind: str, path: str):
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_worker_logins, args=(kind, path, w)) for w in range(WORKERS)]
+    t0 = time.perf_counter()
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+    elapsed = time.perf_counter() - t0
+    stored = len(SqliteDocumentStore(path, AUTH_TABLE)) if kind == "sqlite" else len(AuthManager(path)._encoded)
+    return stored, WORKERS * LOGINS / elapsed
+
+def run_auth_benchmark(tmp: str):
+    print(f"\n--- AuthManager, {USERS} users ---")
+    json_path, db_path = os.path.join(tmp, "auth.json"), os.path.join(tmp, "auth.db")
+    seed = AuthManager(json_path)
+    for n in range(USERS):
+        seed._encoded[f"mock-{n}"] = AuthManager._merge(None, f"mock-{n}", identity(n), tokens(str(n))).model_dump_json()
+    seed.save()
+    _, migrate_ms = timed(lambda: migrate_json(json_path, SqliteDocumentStore(db_path, AUTH_TABLE)))
+    print(f"  migration of {USERS} sessions: {migrate_ms:.0f} ms")
+
+    results = {}
+    for name, make in (("json", lambda: AuthManager(json_path)), ("sqlite", lambda: SqliteAuthManager(db_path))):
+        manager, start_ms = timed(make)
+        upsert = median_ms(lambda i: manager.upsert_user(f"mock-{i * 37 % USERS}", identity(i), tokens("x")), 100)
+        lookup = median_ms(lambda i: manager.get_user(f"mock-{i * 53 % USERS}"), 1000)
+        results[name] = (start_ms, upsert, lookup)
+        print(f"  {name:6s}: cold start {start_ms:7.1f} ms, login (upsert) p50 {upsert:7.3f} ms, "
+              f"lookup p50 {lookup * 1000:6.1f} us")
+
+    for name in ("json", "sqlite"):
+        path = os.path.join(tmp, f"shared-{name}" + (".db" if name == "sqlite" else ".json"))
+        stored, rate = concurrent_logins(name, path)
+        results[name] += (stored, rate)
+        print(f"  {name:6s}: {WORKERS} workers x {LOGINS} new logins -> {stored} sessions stored, {rate:.0f} logins/s")
+    return results
+
+def run_state_benchmark(tmp: str):
+    print(f"\n--- StateStore, {SESSIONS} sessions, flushes of {DIRTY} changed sessions ---")
+    json_path, db_path = os.path.join(tmp, "state.json"), os.path.join(tmp, "state.db")
+    distinct = [make_state(i) for i in range(97 * 7)]
+    seed = StateStore(json_path)
+    for i in range(SESSIONS):
+        seed._dirty.add(f"session-{i}")
+        seed._cache[f"session-{i}"] = distinct[i % len(distinct)]
+    seed.flush()
+    migrate_json(json_path, SqliteDocumentStore(db_path, STATE_TABLE))
+
+    results = {}
+    for name, make in (("json", lambda: StateStore(json_path)), ("sqlite", lambda: SqliteStateStore(db_path))):
+        store, start_ms = timed(make)
+        flush_ms = []
+        for round_ in range(5):
+            for i in range(DIRTY): # What update_state does inside the event loop
+                sid = f"session-{(round_ * DIRTY + i) * 97 % SESSIONS}"
+                store._dirty.add(sid)
+                store._cache[sid] = distinct[(i + round_) % len(distinct)]
+            flush_ms.append(timed(store.flush)[1])
+        get = median_ms(lambda i: store.get_state(f"session-{i * 31 % SESSIONS}"), 1000)
+        results[name] = (start_ms, statistics.median(flush_ms), get)
+        print(f"  {name:6s}: cold start {start_ms:7.1f} ms, flush p50 {statistics.median(flush_ms):7.1f} ms, "
+              f"get_state p50 {get * 1000:6.1f} us")
+    return results
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        auth = run_auth_benchmark(tmp)
+        state = run_state_benchmark(tmp)
+
+    print("\n=== FINAL SUMMARY ===")
+    (j_start, j_upsert, _, j_stored, _), (s_start, s_upsert, _, s_stored, s_rate) = auth["json"], auth["sqlite"]
+    print(f"auth, {USERS} users: login {j_upsert:.2f} ms (json) -> {s_upsert:.3f} ms (sqlite), "
+          f"cold start {j_start:.0f} ms -> {s_start:.1f} ms")
+    print(f"auth, {WORKERS} workers: {j_stored}/{WORKERS * LOGINS} sessions kept (json) -> "
+          f"{s_stored}/{WORKERS * LOGINS} (sqlite, {s_rate:.0f} logins/s)")
+    (j_start, j_flush, _), (s_start, s_flush, _) = state["json"], state["sqlite"]
+    print(f"state, {SESSIONS} sessions: {DIRTY}-session flush {j_flush:.0f} ms (json) -> {s_flush:.1f} ms (sqlite), "
+          f"cold start {j_start:.0f} ms -> {s_start:.1f} ms")
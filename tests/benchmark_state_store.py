@@ -0,0 +1,102 @@
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.genesis_core.logenesis.state_store import StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentVector
+
+SESSIONS = 10_000
+REQUESTS = 200
+
+class LegacyStateStore(StateStore):
+    """The previous behaviour: every session decoded at startup, and every update
+    rewrites every session with indent=2."""
+    def __init__(self, filepath, flush_interval):
+        super().__init__(filepath, flush_interval, max_resident=None, idle_ttl=None)
+
+    def _load(self):
+        super()._load()
+        for sid in self._encoded:
+            self._cache[sid] = self._decode(sid)
+
+    def update_state(self, session_id, state):
+        self._cache[session_id] = state
+        data = {sid: s.model_dump(mode='json') for sid, s in self._cache.items()}
+        with open(self.filepath, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def make_state(i: int) -> ExpressionState:
+    value = (i % 97) / 97
+    vector = IntentVector(epistemic_need=value, subjective_weight=1 - value, decision_urgency=0.5, precision_required=value)
+    return ExpressionState(current_vector=vector, velocity=0.01 * (i % 7), inertia=0.8)
+
+def seed_file(path: str):
+    store = StateStore(filepath=path)
+    for i in range(SESSIONS):
+        store._dirty.add(f"session-{i}")
+        store._cache[f"session-{i}"] = make_state(i)
+    store.flush()
+
+def percentile(samples, q):
+    return sorted(samples)[min(len(samples) - 1, int(q * len(samples)))]
+
+async def measure(store: StateStore):
+    """Per-request latency of update_state on the event loop, plus how long the loop
+    stays blocked overall (the flusher runs its writes in a worker thread)."""
+    latencies, stalls = [], []
+
+    async def watchdog():
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append((time.perf_counter() - t0) * 1000.0 - 1.0)
+
+    dog = asyncio.get_running_loop().create_task(watchdog())
+    for i in range(REQUESTS):
+        state = make_state(i + 1)
+        t0 = time.perf_counter()
+        store.update_state(f"session-{i * 37 % SESSIONS}", state)
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+        await asyncio.sleep(0.005) # Requests arrive every ~5 ms
+    dog.cancel()
+    t0 = time.perf_counter()
+    await store.aclose()
+    close_ms = (time.perf_counter() - t0) * 1000.0
+    return latencies, max(stalls), close_ms
+
+def run_benchmark():
+    print(f"\n--- {REQUESTS} requests against {SESSIONS} persisted sessions ---")
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.json")
+        seed_file(path)
+        for name, store_cls, interval in (("legacy", LegacyStateStore, 1.0),
+                                          ("write-through", StateStore, 0.0),
+                                          ("write-behind", StateStore, 0.25)):
+            t0 = time.perf_counter()
+            store = store_cls(filepath=path, flush_interval=interval)
+            load_ms = (time.perf_counter() - t0) * 1000.0
+            latencies, stall, close_ms = asyncio.run(measure(store))
+            p50, p99 = percentile(latencies, 0.5), percentile(latencies, 0.99)
+            results[name] = (p50, p99, stall, store.flushes)
+            print(f"  {name:13s}: update_state p50 {p50:8.3f} ms, p99 {p99:8.3f} ms, "
+                  f"worst loop stall {stall:7.2f} ms, {store.flushes} flushes "
+                  f"(load {load_ms:.0f} ms, shutdown flush {close_ms:.1f} ms)")
+        with open(path) as f:
+            assert len(json.load(f)) == SESSIONS
+        print(f"  file size: {os.path.getsize(path) / 1024:.0f} KiB")
+    return results
+
+if __name__ == "__main__":
+    results = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    for name, (p50, p99, stall, flushes) in results.items():
+        print(f"{name:13s}: p50 {p50:.3f} ms, p99 {p99:.3f} ms, worst loop stall {stall:.2f} ms, {flushes} flushes")
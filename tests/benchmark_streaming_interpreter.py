@@ -0,0 +1,104 @@
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Ensure src is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.genesis_core.logenesis.engine import LogenesisEngine, StateStore
+from src.backend.genesis_core.logenesis.gemini_interpreter import GeminiIntentInterpreter
+from src.backend.genesis_core.logenesis.visual_schemas import VisualParameters
+
+FIRST_TOKEN = 0.3        # Seconds before the (fake) model emits anything (network + prefill)
+TOKEN_INTERVAL = 0.015   # Seconds per streamed chunk (decoding)
+CHUNK = 4                # Characters per chunk (about one token)
+REQUESTS = 10
+
+TEXT = ("A nebula is a cloud of dust and ionized gas where gravity slowly gathers matter into new stars. "
+        "Picture it as a slow breath of light: dense knots glow from within while the outer veils drift "
+        "and fade, shaped by the winds of the young stars they are giving birth to.")
+INTENT = {"category": "CREATIVE", "purity": 0.9}
+COGNITIVE = {"effort": 0.8, "uncertainty": 0.2, "latency_factor": 0.0}
+TEMPORAL = {"phase": "MANIFESTING", "stability": 0.8, "duration_ms": 0}
+
+# The key order of the previous system prompt (intent after the temporal state) and the current one
+LEGACY_ORDER = json.dumps({"temporal_state": TEMPORAL, "cognitive": COGNITIVE, "intent": INTENT, "text_content": TEXT})
+INTENT_FIRST = json.dumps({"intent": INTENT, "cognitive": COGNITIVE, "temporal_state": TEMPORAL, "text_content": TEXT})
+
+class FakeStreamingModel:
+    """Stands in for genai.GenerativeModel: a fixed time to first token, then a steady token rate."""
+    def __init__(self, answer: str):
+        self.answer = answer
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        chunks = [self.answer[i:i + CHUNK] for i in range(0, len(self.answer), CHUNK)]
+        if not stream:
+            time.sleep(FIRST_TOKEN + TOKEN_INTERVAL * len(chunks))
+            return type("Response", (), {"text": self.answer})()
+        return self._stream(chunks)
+
+    def _stream(self, chunks):
+        time.sleep(FIRST_TOKEN)
+        for chunk in chunks:
+            time.sleep(TOKEN_INTERVAL)
+            yield type("Chunk", (), {"text": chunk})()
+
+def engine_with(answer: str, tmp: str) -> LogenesisEngine:
+    engine = LogenesisEngine()
+    engine.state_store = StateStore(filepath=os.path.join(tmp, "state.json"), flush_interval=60.0)
+    interpreter = GeminiIntentInterpreter.__new__(GeminiIntentInterpreter)
+    interpreter.model = FakeStreamingModel(answer)
+    engine.interpreter = interpreter
+    return engine
+
+def measure(answer: str, streaming: bool):
+    """Median milliseconds to the first content visual and to the full response, as main.py sends them."""
+    async def one(engine, text):
+        t0 = time.perf_counter()
+        first_visual = None
+        if streaming:
+            async for update in engine.process_stream(text, session_id="bench"):
+                if first_visual is None and isinstance(update, VisualParameters):
+                    first_visual = time.perf_counter() - t0
+            response = update
+        else:
+            response = await engine.process(text, session_id="bench")
+        done = time.perf_counter() - t0
+        if first_visual is None and response.manifestation_granted:
+            first_visual = done
+        return first_visual * 1000, done * 1000
+
+    async def run(engine):
+        results = [await one(engine, f"tell me about nebula number {i}") for i in range(REQUESTS)]
+        await engine.state_store.aclose()
+        return results
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = asyncio.run(run(engine_with(answer, tmp)))
+    return statistics.median(r[0] for r in results), statistics.median(r[1] for r in results)
+
+def run_benchmark():
+    chunks = -(-len(INTENT_FIRST) // CHUNK)
+    print(f"\n--- Fake model: {FIRST_TOKEN * 1000:.0f} ms to first token, {chunks} chunks of {CHUNK} chars "
+          f"every {TOKEN_INTERVAL * 1000:.0f} ms ---")
+    results = {
+        "process()": measure(INTENT_FIRST, streaming=False),
+        "stream, old key order": measure(LEGACY_ORDER, streaming=True),
+        "stream": measure(INTENT_FIRST, streaming=True),
+    }
+    for name, (first_visual, done) in results.items():
+        print(f"  {name:22s}: first visual {first_visual:7.1f} ms | response {done:7.1f} ms")
+    return results
+
+if __name__ == "__main__":
+    results = run_benchmark()
+
+    print("\n=== FINAL SUMMARY ===")
+    base = results["process()"][0]
+    for name, (first_visual, done) in results.items():
+        print(f"{name:22s}: time-to-first-visual {first_visual:7.1f} ms ({base / first_visual:4.1f}x) | "
+              f"response {done:7.1f} ms")
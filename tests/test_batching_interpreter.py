@@ -0,0 +1,120 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.backend.genesis_core.logenesis.batching_interpreter import BatchingInterpreter
+from src.backend.genesis_core.logenesis.gemini_interpreter import GeminiIntentInterpreter
+from src.backend.genesis_core.logenesis.interpreter import IntentInterpreter
+from src.backend.genesis_core.logenesis.simulated_interpreter import SimulatedIntentInterpreter
+
+class RecordingInterpreter(SimulatedIntentInterpreter):
+    """Simulated contracts; records batch sizes and fails on the text "boom"."""
+    def __init__(self):
+        self.batch_sizes = []
+
+    async def interpret(self, text, context=None):
+        if text == "boom":
+            raise RuntimeError("bad input")
+        return await super().interpret(text, context)
+
+    async def interpret_batch(self, texts, contexts):
+        self.batch_sizes.append(len(texts))
+        await asyncio.sleep(0.01)
+        if "boom" in texts:
+            raise RuntimeError("batch rejected")
+        return await super().interpret_batch(texts, contexts)
+
+def test_concurrent_requests_are_coalesced():
+    inner = RecordingInterpreter()
+    batching = BatchingInterpreter(inner, max_batch_size=8, max_wait=0.05)
+
+    async def scenario():
+        return await asyncio.gather(*(batching.interpret(text) for text in ["hello", "solve this"] * 10))
+
+    contracts = asyncio.run(scenario())
+    assert inner.batch_sizes == [8, 8, 4]
+    assert [c.text_content for c in contracts[:2]] == ["I hear you.", "Analyzing data structure."]
+    assert batching.stats() == {"batches": 3, "requests": 20, "mean_batch_size": 20 / 3}
+
+def test_a_lone_request_waits_at_most_max_wait():
+    inner = RecordingInterpreter()
+    batching = BatchingInterpreter(inner, max_batch_size=8, max_wait=0.02)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        await batching.interpret("hello")
+        await batching.interpret("hello")
+        return loop.time() - t0
+
+    assert asyncio.run(scenario()) < 0.5
+    assert inner.batch_sizes == [1, 1]
+
+def test_a_failing_input_only_fails_its_caller():
+    inner = RecordingInterpreter()
+    batching = BatchingInterpreter(inner, max_batch_size=4, max_wait=0.01)
+
+    async def scenario():
+        return await asyncio.gather(*(batching.interpret(text) for text in ["hello", "boom", "story"]),
+                                    return_exceptions=True)
+
+    hello, boom, story = asyncio.run(scenario())
+    assert isinstance(boom, RuntimeError) and str(boom) == "bad input"
+    assert hello.text_content == "I hear you." and story.text_content == "Imagining a new possibility."
+
+def test_cancelled_callers_are_dropped():
+    inner = RecordingInterpreter()
+    batching = BatchingInterpreter(inner, max_batch_size=8, max_wait=0.02)
+
+    async def scenario():
+        gone = asyncio.ensure_future(batching.interpret("hello"))
+        kept = asyncio.ensure_future(batching.interpret("story"))
+        await asyncio.sleep(0)
+        gone.cancel()
+        return await kept
+
+    assert asyncio.run(scenario()).text_content == "Imagining a new possibility."
+    assert inner.batch_sizes == [1]
+
+def test_rejects_invalid_knobs():
+    with pytest.raises(ValueError):
+        BatchingInterpreter(SimulatedIntentInterpreter(), max_batch_size=0)
+    with pytest.raises(ValueError):
+        BatchingInterpreter(SimulatedIntentInterpreter(), max_wait=-1)
+
+def test_simulated_batch_matches_single_interpretation():
+    interpreter = SimulatedIntentInterpreter()
+    texts = ["hello", "Can you SOLVE this hard one", "system status", "imagine maybe", "write a poem, unsure"]
+
+    async def scenario():
+        single = [await interpreter.interpret(text) for text in texts]
+        batch = await interpreter.interpret_batch(texts, [None] * len(texts))
+        fallback = await IntentInterpreter.interpret_batch(interpreter, texts, [None] * len(texts))
+        return single, batch, fallback
+
+    single, batch, fallback = asyncio.run(scenario())
+    dump = lambda contracts: [c.model_dump(exclude={"timestamp"}) for c in contracts]
+    assert dump(batch) == dump(single) == dump(fallback)
+
+def test_gemini_batch_is_one_prompt():
+    contract = {"temporal_state": {"phase": "MANIFESTING", "stability": 0.8},
+                "cognitive": {"effort": 0.5, "uncertainty": 0.1},
+                "intent": {"category": "ANALYTIC", "purity": 1.0}, "text_content": "ok"}
+    prompts = []
+
+    def generate_content(prompt, generation_config=None):
+        prompts.append(prompt)
+        count = prompt.count("User Input:")
+        return SimpleNamespace(text="```json\n" + json.dumps([contract] * count) + "\n```")
+
+    interpreter = GeminiIntentInterpreter.__new__(GeminiIntentInterpreter)
+    interpreter.model = SimpleNamespace(generate_content=generate_content)
+    contracts = asyncio.run(interpreter.interpret_batch(["a", "b", "c"], [None, {"recalled": "x"}, None]))
+    assert len(prompts) == 1 and "[2] Context:" in prompts[0]
+    assert [c.text_content for c in contracts] == ["ok"] * 3
+
+    interpreter.model = SimpleNamespace(generate_content=lambda prompt, generation_config=None: SimpleNamespace(text="[]"))
+    with pytest.raises(ValueError):
+        asyncio.run(interpreter.interpret_batch(["a", "b"], [None, None]))
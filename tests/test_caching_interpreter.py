@@ -0,0 +1,156 @@
+import asyncio
+import threading
+
+from src.backend.genesis_core.logenesis import caching_interpreter
+from src.backend.genesis_core.logenesis.caching_interpreter import CachingInterpreter, cache_key
+from src.backend.genesis_core.logenesis.simulated_interpreter import SimulatedIntentInterpreter
+from src.backend.genesis_core.logenesis.verifier import VisualVerifier
+from src.backend.storage import INTERPRETATION_TABLE, SqliteDocumentStore
+
+class CountingInterpreter(SimulatedIntentInterpreter):
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def interpret(self, text, context=None):
+        self.calls.append(text)
+        await asyncio.sleep(self.delay)
+        if text == "boom":
+            raise RuntimeError("bad input")
+        return await super().interpret(text, context)
+
+    async def interpret_batch(self, texts, contexts):
+        self.calls.append(tuple(texts))
+        return await super().interpret_batch(texts, contexts)
+
+def test_keys_normalize_text_and_hash_context():
+    assert cache_key("  Hello   World! ", None) == cache_key("hello world", {})
+    assert cache_key("status", {"recalled": None}) == cache_key("Status.", {"recalled": None})
+    assert cache_key("status", {"recalled": "a"}) != cache_key("status", {"recalled": "b"})
+    assert cache_key("status", {"recalled": None}) != cache_key("status", None)
+
+def test_repeated_utterances_reuse_the_contract(monkeypatch):
+    inner = CountingInterpreter()
+    cache = CachingInterpreter(inner, max_entries=2)
+    verified = []
+    monkeypatch.setattr(VisualVerifier, "verify_contract", lambda data: verified.append(data) or data)
+
+    async def scenario():
+        first = await cache.interpret("Hello!")
+        again = await cache.interpret("hello")
+        await cache.interpret("status")
+        await cache.interpret("story")  # Evicts "hello"
+        await cache.interpret("hello")
+        return first, again
+
+    first, again = asyncio.run(scenario())
+    assert again is first and verified == []
+    assert inner.calls == ["Hello!", "status", "story", "hello"]
+    assert cache.stats() == {"resident": 2, "hits": 1, "misses": 4, "hit_rate": 0.2,
+                             "evictions": 2, "expirations": 0, "disk_hits": 0}
+
+def test_entries_expire_after_ttl(monkeypatch):
+    inner = CountingInterpreter()
+    cache = CachingInterpreter(inner, ttl=10.0)
+    now = [0.0]
+    monkeypatch.setattr(caching_interpreter.time, "time", lambda: now[0])
+
+    async def scenario():
+        await cache.interpret("hello")
+        now[0] = 6.0
+        await cache.interpret("hello") # Use does not extend the TTL
+        now[0] = 11.0
+        await cache.interpret("hello")
+
+    asyncio.run(scenario())
+    assert inner.calls == ["hello", "hello"]
+    assert cache.stats()["expirations"] == 1
+
+def test_concurrent_misses_share_one_call_and_failures_are_not_cached():
+    inner = CountingInterpreter(delay=0.01)
+    cache = CachingInterpreter(inner)
+
+    async def scenario():
+        results = await asyncio.gather(*(cache.interpret("hello") for _ in range(5)))
+        failures = await asyncio.gather(cache.interpret("boom"), cache.interpret("boom"), return_exceptions=True)
+        failures.append(*(await asyncio.gather(cache.interpret("boom"), return_exceptions=True)))
+        return results, failures
+
+    results, failures = asyncio.run(scenario())
+    assert all(r is results[0] for r in results)
+    assert all(isinstance(f, RuntimeError) for f in failures)
+    assert inner.calls == ["hello", "boom", "boom"]
+
+def test_waiters_take_over_when_the_first_caller_is_cancelled():
+    inner = CountingInterpreter(delay=0.05)
+    cache = CachingInterpreter(inner)
+
+    async def collect_stream(stream):
+        return [update async for update in stream][-1].contract
+
+    async def scenario():
+        first = asyncio.ensure_future(cache.interpret("hello"))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.ensure_future(cache.interpret("hello")) for _ in range(2)]
+        streamed = asyncio.ensure_future(collect_stream(cache.interpret_stream("hello")))
+        await asyncio.sleep(0.01)
+        first.cancel() # E.g. its client disconnected
+        results = await asyncio.gather(*waiters, streamed)
+        return first, results
+
+    first, results = asyncio.run(scenario())
+    assert first.cancelled()
+    assert all(r is results[0] for r in results) and results[0].text_content == "I hear you."
+    assert inner.calls == ["hello", "hello"]
+
+def test_batches_only_interpret_distinct_misses():
+    inner = CountingInterpreter()
+    cache = CachingInterpreter(inner)
+
+    async def scenario():
+        await cache.interpret("hello")
+        return await cache.interpret_batch(["hello", "status", "Status!", "story"], [None] * 4)
+
+    contracts = asyncio.run(scenario())
+    assert inner.calls == ["hello", ("status", "story")]
+    assert contracts[1] is contracts[2]
+    assert [c.text_content for c in contracts] == ["I hear you.", "System operations engaged.",
+                                                   "System operations engaged.", "Imagining a new possibility."]
+
+def test_disk_tier_survives_restarts(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.db")
+    inner = CountingInterpreter()
+    asyncio.run(CachingInterpreter(inner, documents=SqliteDocumentStore(path, INTERPRETATION_TABLE)).interpret("solve it"))
+
+    restarted = CachingInterpreter(inner, documents=SqliteDocumentStore(path, INTERPRETATION_TABLE))
+    contract = asyncio.run(restarted.interpret("Solve it."))
+    assert contract.text_content == "Analyzing data structure." and inner.calls == ["solve it"]
+    assert restarted.stats()["disk_hits"] == 1 and restarted.stats()["resident"] == 1
+
+    later = caching_interpreter.time.time() + 7200
+    monkeypatch.setattr(caching_interpreter.time, "time", lambda: later)
+    stale = CachingInterpreter(inner, ttl=3600.0, documents=SqliteDocumentStore(path, INTERPRETATION_TABLE))
+    asyncio.run(stale.interpret("solve it"))
+    assert inner.calls == ["solve it", "solve it"]
+
+def test_disk_tier_runs_off_the_event_loop(tmp_path):
+    threads = []
+
+    class RecordingStore(SqliteDocumentStore):
+        def get(self, key, conn=None):
+            threads.append(threading.get_ident())
+            return super().get(key, conn)
+
+        def put_many(self, items):
+            threads.append(threading.get_ident())
+            super().put_many(items)
+
+    cache = CachingInterpreter(CountingInterpreter(), documents=RecordingStore(str(tmp_path / "cache.db"), INTERPRETATION_TABLE))
+
+    async def scenario():
+        await cache.interpret("hello")
+        await cache.interpret_batch(["status", "story"], [None, None])
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert len(threads) == 5 and loop_thread not in threads
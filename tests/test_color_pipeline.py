@@ -0,0 +1,78 @@
+import numpy as np
+
+from src.backend.departments.presentation.color_pipeline import (
+    NO_COLOR, PALETTES, parse_hex_colors, to_packed, to_hex, packed_to_rgba, ease_colors
+)
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+from src.backend.departments.design.chromatic.image_processor import ImageProcessor
+
+def test_hex_parsing_and_formatting():
+    packed = parse_hex_colors(["#ff8000", "#ABC", "#11223344", "natural_green", "nope", "#12345g", "#1234"])
+    assert packed_to_rgba(packed).tolist() == [
+        [255, 128, 0, 255], [170, 187, 204, 255], [17, 34, 51, 68],
+        [0, 255, 136, 255], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0],
+    ]
+    assert to_hex(packed[:4]) == ["#ff8000", "#aabbcc", "#11223344", PALETTES["natural_green"]]
+    assert to_hex(packed[4:5]) == [None]
+
+def test_to_packed_accepts_all_forms():
+    colors = np.array(["#ff0000", None, "#ff0000"], dtype=object)
+    packed = to_packed(colors)
+    assert packed[1] == NO_COLOR and packed[0] == packed[2] != NO_COLOR
+    assert np.array_equal(to_packed(packed_to_rgba(packed)), packed)
+    assert to_packed("#ff0000") == packed[0]
+    assert to_packed(None) == NO_COLOR
+
+def test_ease_converges_without_overshoot():
+    color = np.zeros((2, 4), dtype=np.float32)
+    vel = np.zeros_like(color)
+    target = to_packed(["#ffffff", None])
+    prev = 0.0
+    for _ in range(120):
+        ease_colors(color, vel, target, 0.016)
+        assert color[0, 0] >= prev and color[0, 0] <= 255.0 + 1e-3
+        prev = color[0, 0]
+    assert np.allclose(color[0], 255.0, atol=0.5)
+    assert np.all(color[1] == 0.0) # No target: unchanged
+
+def test_lcl_colors_ease_and_spawn_palette():
+    lcl = LightControlLogic()
+    lcl.process(LightIntent(action=LightAction.SPAWN, source="u"))
+    assert lcl.view()[0].target_color == PALETTES["natural_green"]
+    assert lcl.frame_arrays()[3][0].tolist() == [0, 255, 136, 255]
+
+    lcl.manifest(np.array([[0.5, 0.5]], dtype=np.float32), "#ff0000")
+    lcl.tick(0.016)
+    mid = lcl.frame_arrays()[3][0].tolist()
+    assert 0 < mid[0] < 255 and 0 < mid[1] < 255 # Blending, not snapping
+    for _ in range(100):
+        lcl.tick(0.016)
+    assert lcl.frame_arrays()[3][0].tolist() == [255, 0, 0, 255]
+
+class _GridImage:
+    """Stand-in for an already downscaled RGBA PIL image (PIL is mocked in tests)."""
+    mode = "RGBA"
+
+    def __init__(self, pixels):
+        self.pixels = pixels
+        self.size = (pixels.shape[1], pixels.shape[0])
+
+    def resize(self, size, resample=None):
+        return self
+
+    def __array__(self, dtype=None, copy=None):
+        return self.pixels
+
+def test_image_arrays_match_particles():
+    rng = np.random.default_rng(3)
+    image = _GridImage(rng.integers(0, 256, (20, 20, 4), dtype=np.uint8))
+    particles = ImageProcessor.process_image_to_particles(image, 400)
+    coords, rgba = ImageProcessor.process_image_to_arrays(image, 400)
+
+    assert np.allclose(coords, [p[:2] for p in particles])
+    assert to_hex(to_packed(rgba)) == [p[2] for p in particles]
+
+    lcl = LightControlLogic()
+    lcl.manifest(coords, rgba)
+    assert sorted(to_hex(lcl._target_colors[:lcl._count])) == sorted(p[2] for p in particles)
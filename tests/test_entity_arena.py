@@ -0,0 +1,58 @@
+import numpy as np
+
+from src.backend.departments.presentation import lcl as lcl_module
+from src.backend.departments.presentation.lcl import LightControlLogic, STATE_ARRAYS
+from src.backend.departments.presentation.entity_arena import ARENA_CHUNK, EntityArena
+
+def _data_ptr(arr: np.ndarray) -> int:
+    return arr.__array_interface__["data"][0]
+
+def _spawn(lcl: LightControlLogic, count: int):
+    start = lcl._count
+    pos = np.stack([np.arange(start, start + count) / 1e7, np.full(count, 0.5)], axis=1)
+    lcl.spawn_many(count, pos.astype(np.float32))
+
+def test_growth_past_chunk_moves_into_arena_without_copies():
+    lcl = LightControlLogic(capacity=1000)
+    _spawn(lcl, ARENA_CHUNK + 1)
+    assert lcl._arena is not None
+    ptr = _data_ptr(lcl._pos)
+
+    _spawn(lcl, 3 * ARENA_CHUNK)
+    assert lcl._capacity >= 4 * ARENA_CHUNK + 1
+    assert _data_ptr(lcl._pos) == ptr
+    expected = np.arange(lcl._count, dtype=np.float32) / np.float32(1e7)
+    np.testing.assert_allclose(lcl._pos[:lcl._count, 0], expected)
+    assert lcl._handles[lcl._count - 1] == lcl._count
+
+def test_growth_past_reservation_reallocates(monkeypatch):
+    monkeypatch.setattr(lcl_module, "ARENA_RESERVE", 2 * ARENA_CHUNK)
+    lcl = LightControlLogic(capacity=1000)
+    _spawn(lcl, ARENA_CHUNK + 1)
+    first = lcl._arena
+    _spawn(lcl, 2 * ARENA_CHUNK)
+    assert lcl._arena is not first
+    assert lcl._arena.reserve >= lcl._capacity
+    assert lcl._handles[:lcl._count].tolist() == list(range(1, lcl._count + 1))
+
+def test_shrink_releases_arena_and_keeps_survivors():
+    lcl = LightControlLogic(capacity=1000)
+    _spawn(lcl, 3 * ARENA_CHUNK)
+    lcl._add_entity("keep", (0.25, 0.75), (0, 0), 1.0)
+    lcl._decay[:3 * ARENA_CHUNK - 10] = 1.0
+    lcl._mortal = True
+
+    for _ in range(1 + lcl_module.SHRINK_AFTER_TICKS):
+        lcl.tick(2.0)
+    assert lcl._count == 11
+    assert lcl._arena is None
+    assert lcl._capacity == 1000
+    assert lcl.view()["keep"].energy == 1.0
+
+def test_release_zeroes_whole_chunks_only():
+    arena = EntityArena(STATE_ARRAYS[:2], reserve=4 * ARENA_CHUNK)
+    pos = arena.view("_pos", 4 * ARENA_CHUNK)
+    pos[...] = 1.0
+    arena.release(ARENA_CHUNK + 1, 4 * ARENA_CHUNK)
+    assert np.all(pos[:2 * ARENA_CHUNK] == 1.0)
+    assert not np.any(pos[2 * ARENA_CHUNK:])
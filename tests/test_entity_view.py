@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+
+def _make_lcl(count: int = 100) -> LightControlLogic:
+    lcl = LightControlLogic()
+    xs = np.linspace(0.0, 0.99, count, dtype=np.float32)
+    lcl.spawn_many(count, np.stack([xs, xs], axis=1))
+    lcl._add_entity("named", (0.5, 0.25), (0.1, 0.0), 0.5, target_pos=(0.2, 0.2), target_color="#FFFFFF")
+    return lcl
+
+def test_view_matches_entities():
+    lcl = _make_lcl()
+    view = lcl.view()
+    assert len(view) == 101
+    assert view.to_entities() == lcl.entities
+    assert view["named"] == lcl.entities["named"]
+    assert view[-1].id == "named"
+    assert view[0].id == lcl._auto_id(lcl._handles[0])
+    assert "named" in view and "missing" not in view
+    with pytest.raises(KeyError):
+        view["missing"]
+    with pytest.raises(IndexError):
+        view[101]
+
+def test_slices_and_fields_are_views():
+    lcl = _make_lcl()
+    page = lcl.view().page(1, size=30)
+    assert len(page) == 30
+    assert page.ids()[0] == lcl._entity_id(30)
+    assert np.shares_memory(page.positions, lcl._pos)
+    assert "named" not in page
+    assert len(lcl.view().page(3, size=30)) == 11
+    assert len(lcl.view()[::10]) == 11
+
+    proj = page.project("position", "energy")
+    assert proj["position"].shape == (30, 2) and proj["energy"].shape == (30,)
+    with pytest.raises(ValueError):
+        page.field("nope")
+
+def test_region_filter_and_records():
+    lcl = _make_lcl()
+    region = lcl.view().in_region(0.0, 0.0, 0.3, 0.3)
+    assert np.all(region.positions <= 0.3)
+    assert len(region) == 31 # 31 linspace points + nothing else (named is at x=0.5)
+    sub = region.in_region(0.0, 0.0, 0.1, 0.1)
+    assert set(sub.ids()) <= set(region.ids())
+
+    records = lcl.view(99).to_records(("position", "target_color"))
+    assert records[1] == {"id": "named", "position": [0.5, 0.25], "target_color": "#ffffff"}
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.backend.departments.presentation.force_fields import (
+    ForceField, Radial, Vortex, Attractor, CurlNoise, noise_texture
+)
+from src.backend.departments.presentation.lcl import LightControlLogic
+
+POINTS = np.array([[0.75, 0.5], [0.5, 0.25]], dtype=np.float32)
+
+def test_radial_and_vortex_directions():
+    outward = ForceField([Radial(1.0)]).accel(POINTS)
+    np.testing.assert_allclose(outward, [[1.0, 0.0], [0.0, -1.0]], atol=1e-6)
+
+    # Clockwise on screen: right of center moves down (+y), above center moves right
+    swirl = ForceField([Vortex(1.0)]).accel(POINTS)
+    np.testing.assert_allclose(swirl, [[0.0, 1.0], [1.0, 0.0]], atol=1e-6)
+
+def test_fused_terms_match_sum_of_individual_terms():
+    rng = np.random.default_rng(0)
+    pos = rng.random((500, 2)).astype(np.float32)
+    terms = [Radial(-0.4), Vortex(0.7), Vortex(0.2, (0.2, 0.8)), Attractor(0.3, (0.1, 0.1)),
+             Attractor(-0.2, (0.9, 0.4)), CurlNoise(0.5)]
+    fused = ForceField(terms).accel(pos, t=2.0)
+    separate = sum(ForceField([term]).accel(pos, t=2.0) for term in terms)
+    np.testing.assert_allclose(fused, separate, rtol=1e-4, atol=1e-5)
+
+def test_curl_noise_is_divergence_free_and_tileable():
+    texture = noise_texture()
+    div = ((np.roll(texture[..., 1], -1, axis=0) - np.roll(texture[..., 1], 1, axis=0))
+           + (np.roll(texture[..., 0], -1, axis=1) - np.roll(texture[..., 0], 1, axis=1)))
+    assert np.abs(div).max() < 1e-3 * np.abs(texture).max()
+
+    field = ForceField([CurlNoise(1.0)])
+    np.testing.assert_allclose(field.accel(POINTS), field.accel(POINTS + 1.0), atol=1e-5)
+
+def test_spec_round_trip_and_errors():
+    field = ForceField([Vortex(0.5, (0.3, 0.3)), CurlNoise(0.2, scale=2.0)])
+    restored = ForceField.from_spec(field.to_spec())
+    assert restored.terms == field.terms
+
+    with pytest.raises(ValueError):
+        ForceField.from_spec([{"type": "tornado"}])
+    with pytest.raises(ValueError):
+        ForceField.from_spec([{"type": "vortex", "speed": 1.0}])
+
+def test_visual_parameters_mapping():
+    def params(flow, turbulence, shape="cloud"):
+        return SimpleNamespace(energy_level=0.0, visual_parameters=SimpleNamespace(
+            flow_direction=flow, turbulence=turbulence, base_shape=shape))
+
+    assert ForceField.from_visual_parameters(params("inward", 0.0)).terms[0].strength < 0
+    assert isinstance(ForceField.from_visual_parameters(params("counter-clockwise", 0.0)).terms[0], Vortex)
+    assert isinstance(ForceField.from_visual_parameters(params("none", 0.0, "vortex")).terms[0], Vortex)
+    terms = ForceField.from_visual_parameters(params("none", 0.5)).terms
+    assert terms == [CurlNoise(0.3)]
+    assert not ForceField.from_visual_parameters(params(None, 0.0))
+
+def test_lcl_applies_field_and_serializes_it():
+    lcl = LightControlLogic()
+    lcl.spawn_many(2, POINTS)
+    lcl.force_field = ForceField([Vortex(1.0), CurlNoise(0.3)])
+    lcl.tick(0.1)
+    assert lcl._vel[0, 1] > 0.0 # Swirling clockwise
+
+    restored = LightControlLogic.from_bytes(lcl.to_bytes())
+    assert restored.force_field.terms == lcl.force_field.terms
+    for scene in (lcl, restored):
+        scene.tick(0.1)
+    assert restored.state_digest() == lcl.state_digest()
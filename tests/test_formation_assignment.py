@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from src.backend.departments.presentation.formation_assignment import (
+    assign_targets, total_travel, hilbert_index
+)
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.color_pipeline import to_hex
+
+def test_hungarian_finds_optimal_matching():
+    current = np.array([[0.1, 0.1], [0.9, 0.9], [0.1, 0.9]])
+    targets = np.array([[0.9, 0.8], [0.1, 0.8], [0.2, 0.1]])
+
+    perm = assign_targets(current, targets, "hungarian")
+    assert list(perm) == [2, 0, 1]
+
+def test_hilbert_is_permutation_and_beats_index():
+    rng = np.random.default_rng(1)
+    targets = rng.random((5000, 2))
+    shuffled = targets[rng.permutation(5000)]
+
+    perm = assign_targets(shuffled, targets, "hilbert")
+    assert sorted(perm) == list(range(5000))
+    assert total_travel(shuffled, targets, perm) == pytest.approx(0.0)
+
+    contracted = shuffled * 0.5 + 0.25
+    perm = assign_targets(contracted, targets, "hilbert")
+    assert total_travel(contracted, targets, perm) < 0.6 * total_travel(contracted, targets, np.arange(5000))
+
+def test_hilbert_index_locality():
+    pts = np.array([[0.0, 0.0], [0.01, 0.0], [0.99, 0.99]])
+    d = hilbert_index(pts)
+    assert abs(d[1] - d[0]) < abs(d[2] - d[0])
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        assign_targets(np.zeros((2, 2)), np.zeros((2, 2)), "teleport")
+    with pytest.raises(ValueError):
+        assign_targets(np.zeros((2, 2)), np.zeros((3, 2)))
+
+def test_manifest_uses_nearest_targets():
+    lcl = LightControlLogic()
+    lcl.spawn_many(2, np.array([[0.9, 0.5], [0.1, 0.5]], dtype=np.float32))
+    lcl.manifest(np.array([[0.2, 0.5], [0.8, 0.5]], dtype=np.float32), np.array(["#aaa", "#bbb"], dtype=object))
+
+    assert np.allclose(lcl._target_pos[:2], [[0.8, 0.5], [0.2, 0.5]])
+    assert to_hex(lcl._target_colors[:2]) == ["#bbbbbb", "#aaaaaa"]
@@ -0,0 +1,87 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.backend.departments.presentation.formation_manager import FormationManager, FormationCache, SHAPES
+from src.backend.departments.presentation.color_pipeline import PACKED_DTYPE, PALETTES, to_packed
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+
+@pytest.mark.parametrize("count", [0, 1, 3, 7, 600])
+def test_circle_and_spiral_match_closed_form(count):
+    circle = FormationManager.get_formation("circle", count, (0.4, 0.6), 0.2)
+    spiral = FormationManager.get_formation("Spiral ", count, (0.4, 0.6), 0.2)
+    for i in range(count):
+        angle = (i / count) * 2 * math.pi
+        assert circle[i][:2] == pytest.approx((0.4 + math.cos(angle) * 0.2, 0.6 + math.sin(angle) * 0.2))
+        progress = i / count
+        angle, radius = progress * 3 * 2 * math.pi, progress * 0.2
+        assert spiral[i][:2] == pytest.approx((0.4 + math.cos(angle) * radius, 0.6 + math.sin(angle) * radius))
+
+@pytest.mark.parametrize("shape", sorted(SHAPES) + ["nebula"])
+@pytest.mark.parametrize("count", [0, 1, 5, 601])
+def test_every_shape_yields_count_points(shape, count):
+    coords, colors = FormationManager.get_formation_arrays(shape, count)
+    assert coords.shape == (count, 2) and coords.dtype == np.float32
+    assert colors.dtype == PACKED_DTYPE
+    assert np.all(colors == to_packed(PALETTES["default"]))
+    assert np.all((coords >= 0.2 - 1e-6) & (coords <= 0.8 + 1e-6))
+
+    points = FormationManager.get_formation(shape, count)
+    assert len(points) == count
+    assert all(color == "default" and isinstance(x, float) for x, _, color in points)
+
+def test_square_outline_corners():
+    points = np.array([p[:2] for p in FormationManager.get_formation("square", 8, (0.5, 0.5), 0.25)])
+    np.testing.assert_allclose(points, [[0.25, 0.25], [0.5, 0.25], [0.75, 0.25], [0.75, 0.5],
+                                        [0.75, 0.75], [0.5, 0.75], [0.25, 0.75], [0.25, 0.5]])
+
+def test_manifest_by_shape_name_uses_arrays_and_reports_points():
+    lcl = LightControlLogic()
+    instr = lcl.process(LightIntent(action=LightAction.MANIFEST, shape_name="cross", source="t"))
+    assert lcl._count == 50
+    assert len(instr.formation_data) == 50
+    expected = np.array([p[:2] for p in instr.formation_data], dtype=np.float32)
+    targets = lcl._target_pos[:50]
+    assert sorted(map(tuple, targets.tolist())) == sorted(map(tuple, expected.tolist()))
+
+def test_repeated_requests_hit_the_cache_and_are_read_only():
+    FormationManager.cache.clear()
+    first, _ = FormationManager.get_formation_arrays("circle", 600)
+    hits = FormationManager.cache.hits
+    again, colors = FormationManager.get_formation_arrays("ring", 600)
+    assert again is first
+    assert FormationManager.cache.hits == hits + 2 # Coordinates and colors
+    assert not first.flags.writeable and not colors.flags.writeable
+    with pytest.raises(ValueError):
+        first[0, 0] = 1.0
+
+def test_moved_formation_reuses_unit_shape():
+    FormationManager.cache.clear()
+    FormationManager.get_formation_arrays("spiral", 100)
+    misses = FormationManager.cache.misses
+    moved, _ = FormationManager.get_formation_arrays("spiral", 100, center=(0.2, 0.7), scale=0.1)
+    assert FormationManager.cache.misses == misses + 1 # Only the placed array, not the unit shape
+    direct = FormationManager._spiral(100, (0.2, 0.7), 0.1)
+    np.testing.assert_allclose(moved, direct, atol=1e-6)
+
+def test_scatter_is_cached_only_when_seeded():
+    a, _ = FormationManager.get_formation_arrays("nebula", 50, seed=3)
+    b, _ = FormationManager.get_formation_arrays("scatter", 50, seed=3)
+    assert b is a
+    assert FormationManager.get_formation("nebula", 50, seed=3) == FormationManager.get_formation("nebula", 50, seed=3)
+
+    c, _ = FormationManager.get_formation_arrays("nebula", 50)
+    d, _ = FormationManager.get_formation_arrays("nebula", 50)
+    assert not np.array_equal(c, d)
+
+def test_cache_bounds():
+    cache = FormationCache(max_entries=3, max_points=100)
+    for n in (10, 20, 30, 40):
+        cache.get(n, lambda: np.zeros((n, 2)))
+    assert cache.stats() == {"hits": 0, "misses": 4, "entries": 3, "points": 90}
+    cache.get("big", lambda: np.zeros((80, 2)))
+    assert cache.stats()["points"] == 80
+    big = cache.get("huge", lambda: np.zeros((500, 2)))
+    assert len(big) == 500 and cache.stats()["entries"] == 1
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.light_schemas import LightEntity
+from src.backend.departments.presentation.lcl_codec import (
+    encode_snapshot, decode_frame, DeltaEncoder, FRAME_KEY, FRAME_DELTA, HEADER_SIZE
+)
+
+def _make_lcl(n=5):
+    lcl = LightControlLogic()
+    lcl.entities = {
+        f"e{i}": LightEntity(id=f"e{i}", position=(i / 10, 0.5), velocity=(0.1, -0.2), energy=1.0,
+                             target_color="#ff8000" if i % 2 else None)
+        for i in range(n)
+    }
+    return lcl
+
+def test_snapshot_roundtrip():
+    lcl = _make_lcl()
+    frame = decode_frame(encode_snapshot(lcl, frame_id=7))
+
+    assert frame.kind == FRAME_KEY
+    assert frame.frame_id == 7
+    assert len(frame.handles) == 5
+    assert np.allclose(frame.positions[:, 0], [0.0, 0.1, 0.2, 0.3, 0.4], atol=1e-4)
+    assert np.allclose(frame.velocities[0], [0.1, -0.2], atol=1e-3)
+    assert tuple(frame.colors[1]) == (255, 128, 0, 255)
+    assert tuple(frame.colors[0]) == (0, 0, 0, 0)
+
+def test_snapshot_size_per_entity():
+    lcl = _make_lcl(100)
+    assert len(encode_snapshot(lcl)) == HEADER_SIZE + 100 * 16
+
+def test_decode_rejects_garbage():
+    with pytest.raises(ValueError):
+        decode_frame(b"nope")
+
+def test_delta_sends_only_changes():
+    lcl = _make_lcl()
+    encoder = DeltaEncoder()
+
+    first = decode_frame(encoder.encode(lcl))
+    assert first.kind == FRAME_KEY  # No ack yet
+    encoder.ack(first.frame_id)
+
+    # Nothing moved
+    unchanged = decode_frame(encoder.encode(lcl))
+    assert unchanged.kind == FRAME_DELTA
+    assert unchanged.base_frame_id == first.frame_id
+    assert len(unchanged.handles) == 0
+
+    # Move one entity, remove another
+    lcl._pos[2] = (0.9, 0.9)
+    removed_handle = int(lcl._handles[0])
+    lcl._remove_entity_by_index(0)
+
+    delta = decode_frame(encoder.encode(lcl))
+    assert list(delta.removed) == [removed_handle]
+    assert len(delta.handles) == 1
+    assert np.allclose(delta.positions[0], (0.9, 0.9), atol=1e-4)
+
+def test_delta_against_latest_ack_only():
+    lcl = _make_lcl()
+    encoder = DeltaEncoder()
+    encoder.ack(decode_frame(encoder.encode(lcl)).frame_id)
+
+    lcl._pos[1] = (0.7, 0.7)
+    lost = decode_frame(encoder.encode(lcl))  # never acked
+    assert len(lost.handles) == 1
+
+    # The change is re-sent because the baseline did not advance
+    resent = decode_frame(encoder.encode(lcl))
+    assert len(resent.handles) == 1
+    assert resent.base_frame_id == lost.base_frame_id
@@ -0,0 +1,88 @@
+import numpy as np
+
+from src.backend.departments.presentation.lcl import LightControlLogic, SHRINK_AFTER_TICKS
+from src.backend.departments.presentation.scene_host import SceneHost
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+
+def test_spawn_decay_removes_entity_when_energy_runs_out():
+    lcl = LightControlLogic()
+    instr = lcl.process(LightIntent(action=LightAction.SPAWN, decay=2.0, source="a"))
+    lcl.process(LightIntent(action=LightAction.SPAWN, source="a")) # No decay: lives forever
+    assert instr.decay == 2.0
+
+    lcl.tick(0.25)
+    assert lcl._count == 2
+    assert lcl.entities[instr.target].energy == 0.5
+
+    lcl.tick(0.25)
+    assert lcl._count == 1
+    assert instr.target not in lcl.view()
+    assert not lcl._mortal
+
+def test_default_decay_applies_to_spawns_without_decay():
+    lcl = LightControlLogic()
+    lcl.default_decay = 10.0
+    lcl.process_batch([LightIntent(action=LightAction.SPAWN, source=f"s{i}") for i in range(3)])
+    assert np.all(lcl.view().field("decay") == 10.0)
+    lcl.tick(0.1)
+    assert lcl._count == 0
+
+def test_bulk_removal_keeps_explicit_ids_consistent():
+    lcl = LightControlLogic(capacity=4)
+    lcl.entities = {}
+    for i in range(6):
+        lcl._add_entity(f"e{i}", (0.1 * i, 0.5), (0, 0), 1.0)
+    lcl._decay[[0, 2, 5]] = 1.0
+    lcl._mortal = True
+
+    lcl.tick(1.0)
+    assert sorted(lcl._id_map) == ["e1", "e3", "e4"]
+    assert {idx: eid for eid, idx in lcl._id_map.items()} == lcl._explicit_ids
+    assert all(lcl._entity_id(idx) == eid for eid, idx in lcl._id_map.items())
+
+def test_erase_region_uses_bulk_removal():
+    lcl = LightControlLogic()
+    lcl.spawn_many(4, np.array([[0.1, 0.1], [0.9, 0.9], [0.15, 0.1], [0.5, 0.5]], dtype=np.float32))
+    lcl.process(LightIntent(action=LightAction.ERASE, region=(0.0, 0.0, 0.2, 0.2)))
+    assert sorted(lcl._handles[:lcl._count].tolist()) == [2, 4]
+
+def test_freed_slots_are_reused_without_reallocation():
+    lcl = LightControlLogic(capacity=8)
+    for _ in range(50):
+        lcl.spawn_many(8, (0.5, 0.5), decay=4.0)
+        pos = lcl._pos
+        lcl.tick(0.5)
+        assert lcl._count == 0
+        assert lcl._pos is pos
+    assert lcl._capacity == 8
+
+def test_capacity_shrinks_after_sustained_low_occupancy():
+    lcl = LightControlLogic(capacity=16)
+    lcl.spawn_many(1000, (0.5, 0.5), decay=1.0)
+    lcl.spawn_many(5, (0.5, 0.5))
+    assert lcl._capacity >= 1005
+
+    for _ in range(10 + SHRINK_AFTER_TICKS): # Die after 1 s, then stay under the threshold
+        lcl.tick(0.1)
+    assert lcl._count == 5
+    assert lcl._capacity == 16
+    assert lcl._pos.shape == (16, 2)
+
+def test_decay_survives_serialization():
+    lcl = LightControlLogic()
+    lcl.spawn_many(3, (0.5, 0.5), decay=np.array([0.0, 1.0, 2.0], dtype=np.float32))
+    restored = LightControlLogic.from_bytes(lcl.to_bytes())
+    assert restored._mortal
+    np.testing.assert_array_equal(restored._decay[:3], lcl._decay[:3])
+
+def test_scene_host_expires_like_individual_ticks():
+    host = SceneHost()
+    scene = host.scene("s", now=0.0)
+    ref = LightControlLogic()
+    for lcl in (scene, ref):
+        lcl.spawn_many(20, (0.5, 0.5), decay=np.linspace(0.0, 4.0, 20, dtype=np.float32))
+    for _ in range(40):
+        host.tick(0.05, now=1.0)
+        ref.tick(0.05)
+    assert scene._count == ref._count
+    assert scene.state_digest() == ref.state_digest()
@@ -1,5 +1,6 @@
 import time
 import pytest
+import numpy as np
 from src.backend.departments.presentation.lcl import LightControlLogic
 from src.backend.departments.presentation.light_schemas import LightIntent, LightAction, PriorityLevel, LightEntity
 
@@ -76,3 +77,138 @@ def test_process_spawn_move():
     # Velocity should increase
     ent = lcl.entities[entity_id]
     assert ent.velocity[0] > 0.0
+
+def _mixed_intents():
+    return [
+        LightIntent(action=LightAction.SPAWN, region=(0.1, 0.1, 0.3, 0.3), source="a"),
+        LightIntent(action=LightAction.MOVE, vector=(1.0, 0.0), intensity=0.5, source="b"),
+        LightIntent(action=LightAction.SPAWN, source="a"),
+        LightIntent(action=LightAction.MOVE, vector=(0.0, 1.0), source="c"),
+        LightIntent(action=LightAction.ANSWER, text_content="hi", source="d"),
+        LightIntent(action=LightAction.SPAWN, priority=-1, source="e"),  # rejected by priority
+        LightIntent(action=LightAction.MOVE, vector=(3.0, 4.0), source="f"),  # clamped by harmony
+    ]
+
+def test_process_batch_matches_sequential():
+    seq = LightControlLogic()
+    seq_results = [seq.process(i) for i in _mixed_intents()]
+
+    batch = LightControlLogic()
+    batch_results = batch.process_batch(_mixed_intents())
+
+    assert [r.intent if r else None for r in batch_results] == [r.intent if r else None for r in seq_results]
+    assert batch_results[5] is None
+    assert batch._count == seq._count == 2
+    assert np.allclose(batch._pos[:2], seq._pos[:2])
+    assert np.allclose(batch._vel[:2], seq._vel[:2])
+    assert batch.system_energy == seq.system_energy
+    assert batch.metrics["intent_count"] == 7
+
+def _random_intents(rng: np.random.Generator, n: int):
+    intents = []
+    for _ in range(n):
+        action = rng.choice(["SPAWN", "SPAWN", "MOVE", "MOVE", "MOVE", "ERASE", "ANSWER"])
+        if action == "SPAWN":
+            x, y = rng.uniform(0.0, 0.8, 2)
+            intents.append(LightIntent(action=LightAction.SPAWN, region=(x, y, x + 0.2, y + 0.2), source="s"))
+        elif action == "MOVE":
+            # Targets include entities spawned later in the batch and ones already gone
+            target = rng.choice([None, "GLOBAL", f"lc-{rng.integers(1, n)}"])
+            intents.append(LightIntent(action=LightAction.MOVE, target=target, source="s",
+                                       vector=tuple(rng.uniform(-1.0, 1.0, 2)), intensity=rng.uniform(0.1, 1.0)))
+        elif action == "ERASE":
+            region = None if rng.random() < 0.2 else (0.0, 0.0, 0.5, 0.5)
+            intents.append(LightIntent(action=LightAction.ERASE, region=region, source="s"))
+        else:
+            intents.append(LightIntent(action=LightAction.ANSWER, text_content="hi", source="s"))
+    return intents
+
+def _gatekept_only_by_energy(lcl: LightControlLogic) -> LightControlLogic:
+    lcl.clock = lambda: 1000.0
+    lcl.RATE_LIMIT = 1000
+    return lcl
+
+def test_process_batch_move_ignores_later_spawns():
+    intents = [
+        LightIntent(action=LightAction.SPAWN, source="s"),
+        LightIntent(action=LightAction.MOVE, target="lc-2", vector=(1.0, 0.0), source="s"),
+        LightIntent(action=LightAction.SPAWN, source="s"),
+    ]
+    lcl = LightControlLogic()
+    lcl.process_batch(intents)
+    assert np.array_equal(lcl._vel[:2], np.zeros((2, 2)))
+
+@pytest.mark.parametrize("seed", range(100))
+def test_process_batch_matches_sequential_randomized(seed):
+    intents = _random_intents(np.random.default_rng(seed), 40)
+    seq = _gatekept_only_by_energy(LightControlLogic())
+    seq_results = [seq.process(i.model_copy()) for i in intents]
+
+    batch = _gatekept_only_by_energy(LightControlLogic())
+    batch_results = batch.process_batch([i.model_copy() for i in intents])
+
+    describe = lambda r: None if r is None else (r.intent, r.target)
+    assert [describe(r) for r in batch_results] == [describe(r) for r in seq_results]
+    count = seq._count
+    assert batch._count == count
+    assert np.array_equal(batch._handles[:count], seq._handles[:count])
+    assert np.array_equal(batch._has_target[:count], seq._has_target[:count])
+    assert np.allclose(batch._pos[:count], seq._pos[:count])
+    assert np.allclose(batch._vel[:count], seq._vel[:count], atol=1e-6)
+    assert batch.system_energy == seq.system_energy
+
+def test_process_batch_rate_limit_and_ids():
+    lcl = LightControlLogic()
+    lcl.RATE_LIMIT = 2
+    results = lcl.process_batch([LightIntent(action=LightAction.SPAWN, source="s") for _ in range(4)])
+
+    assert [r is not None for r in results] == [True, True, False, False]
+    assert set(lcl.entities.keys()) == {results[0].target, results[1].target}
+
+def test_spawn_many_auto_ids():
+    lcl = LightControlLogic()
+    positions = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]], dtype=np.float32)
+    handles = lcl.spawn_many(3, positions)
+
+    ids = list(lcl.entities.keys())
+    assert ids == [f"lc-{h}" for h in handles]
+    assert lcl.entities[ids[1]].position == pytest.approx((0.3, 0.4))
+
+    # Auto ids resolve for targeted MOVE, also after swap-removal
+    lcl._remove_entity_by_index(0)
+    move = LightIntent(action=LightAction.MOVE, target=ids[1], vector=(1.0, 0.0), source="t")
+    lcl.process(move)
+    assert lcl.entities[ids[1]].velocity[0] > 0.0
+    assert lcl.entities[ids[2]].velocity[0] == 0.0
+
+def test_auto_ids_resolve_through_churn():
+    rng = np.random.default_rng(7)
+    lcl = LightControlLogic(capacity=8)
+    gone = set()
+    for _ in range(200):
+        lcl.spawn_many(int(rng.integers(1, 20)), rng.uniform(0.0, 1.0, (1, 2)))
+        if rng.random() < 0.3:
+            lcl._remove_entity_by_index(int(rng.integers(lcl._count)))
+        dead = np.flatnonzero(rng.random(lcl._count) < 0.3)
+        gone.update(lcl._handles[dead].tolist())
+        lcl._remove_indices(dead)
+
+    handles = lcl._handles[:lcl._count].tolist()
+    for scene in (lcl, LightControlLogic.from_bytes(lcl.to_bytes())):
+        assert [scene._index_of(f"lc-{h}") for h in handles] == list(range(lcl._count))
+        assert all(scene._index_of(f"lc-{h}") is None for h in gone - set(handles))
+    lcl.process(LightIntent(action=LightAction.ERASE, source="e"))
+    assert lcl._index_of(f"lc-{handles[0]}") is None
+
+def test_manifest_bulk_spawns_and_assigns():
+    lcl = LightControlLogic()
+    formation = [(0.1 * i, 0.5, "#ffffff") for i in range(40)]
+    instruction = lcl.process(LightIntent(action=LightAction.MANIFEST, formation_data=formation, source="m"))
+
+    assert instruction.intent == LightAction.MANIFEST
+    assert len(instruction.formation_data) == 40
+    assert lcl._count == 40
+    # All particles start at the center, so any point may go to any particle
+    assert np.allclose(np.sort(lcl._target_pos[:40, 0]), [0.1 * i for i in range(40)])
+    assert lcl._has_target[:40].all()
+    assert lcl.entities["lc-40"].target_color == "#ffffff"
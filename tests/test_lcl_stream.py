@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+
+from src.backend.departments.presentation.lcl_codec import FRAME_KEY, FRAME_DELTA, decode_frame, quantize_positions
+from src.backend.departments.presentation.lcl_stream import LightStream, serve_light_stream
+
+SPAWN = {"type": "LIGHT_INTENT", "intent": {"action": "SPAWN", "source": "user", "region": [0.2, 0.2, 0.4, 0.4]}}
+
+class ClientScene:
+    """What gunui/lcl_codec.js LCLFrameDecoder keeps: handle -> quantized position."""
+    def __init__(self):
+        self.entities = {}
+        self.last_frame_id = 0
+
+    def apply(self, data: bytes):
+        frame = decode_frame(data)
+        if frame.kind == FRAME_KEY:
+            self.entities = {}
+        elif frame.base_frame_id > self.last_frame_id:
+            return None # Delta against a frame we never applied
+        for handle in frame.removed.tolist():
+            self.entities.pop(handle, None)
+        for handle, pos in zip(frame.handles.tolist(), quantize_positions(frame.positions)):
+            self.entities[handle] = tuple(pos.tolist())
+        self.last_frame_id = frame.frame_id
+        return frame
+
+def server_scene(stream: LightStream):
+    handles, pos, _, _ = stream.lcl.frame_arrays()
+    return dict(zip(handles.tolist(), map(tuple, quantize_positions(pos).tolist())))
+
+def test_deltas_follow_acknowledged_frames():
+    stream = LightStream()
+    client = ClientScene()
+
+    keyframe = client.apply(stream.frame(0.0))
+    assert keyframe.kind == FRAME_KEY
+    stream.handle({"type": "ACK_FRAME", "frame_id": keyframe.frame_id})
+    assert stream.frame(0.016) is None # Nothing changed since the ack
+
+    instruction = json.loads(stream.handle(SPAWN))
+    assert instruction["intent"] == "SPAWN"
+    lost = stream.frame(0.016) # Never reaches the client
+    assert decode_frame(lost).kind == FRAME_DELTA
+
+    # Without an ack the next delta still carries the new entity
+    frame = client.apply(stream.frame(0.016))
+    assert frame.base_frame_id == keyframe.frame_id
+    assert client.entities == server_scene(stream) and len(client.entities) == 1
+    stream.handle({"type": "ACK_FRAME", "frame_id": frame.frame_id})
+
+    stream.handle({"type": "LIGHT_INTENT", "intent": {"action": "ERASE", "source": "user"}})
+    frame = client.apply(stream.frame(0.016))
+    assert len(frame.removed) == 1 and client.entities == {}
+
+    stream.handle({"type": "RESYNC"})
+    assert decode_frame(stream.frame(0.016)).kind == FRAME_KEY
+
+def test_rejects_malformed_messages():
+    stream = LightStream()
+    for msg in ({"type": "NOPE"}, {"type": "ACK_FRAME"}, {"type": "LIGHT_INTENT", "intent": {"action": "FLY"}},
+                [1], "x", 3, None):
+        with pytest.raises(ValueError):
+            stream.handle(msg)
+
+def test_websocket_end_to_end():
+    stream = LightStream()
+    app = FastAPI()
+
+    @app.websocket("/ws/lcl")
+    async def endpoint(websocket: WebSocket):
+        await serve_light_stream(websocket, stream, frame_interval=0.005)
+
+    client = ClientScene()
+    instructions = []
+    bases = set()
+
+    def pump(ws, until):
+        for _ in range(2000):
+            message = ws.receive()
+            if message.get("text") is not None:
+                instructions.append(json.loads(message["text"]))
+            else:
+                frame = client.apply(message["bytes"])
+                if frame is not None:
+                    bases.add(frame.base_frame_id)
+                    ws.send_text(json.dumps({"type": "ACK_FRAME", "frame_id": frame.frame_id}))
+            if until():
+                return
+        raise AssertionError("Stream never reached the expected state")
+
+    with TestClient(app).websocket_connect("/ws/lcl") as ws:
+        pump(ws, lambda: client.last_frame_id > 0)
+        for _ in range(3):
+            ws.send_text(json.dumps(SPAWN))
+        pump(ws, lambda: len(instructions) == 3 and len(client.entities) == 3)
+        for ignored in ("not json", "[1]", '"x"', "null"):
+            ws.send_text(ignored)
+        ws.send_text(json.dumps({"type": "LIGHT_INTENT", "intent": {"action": "ERASE", "source": "user"}}))
+        pump(ws, lambda: len(instructions) == 4 and not client.entities)
+
+    assert [i["intent"] for i in instructions] == ["SPAWN"] * 3 + ["ERASE"]
+    # After the first ack, frames were deltas against acknowledged frames
+    assert max(bases) > 0
+    assert server_scene(stream) == client.entities == {}
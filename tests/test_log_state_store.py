@@ -0,0 +1,109 @@
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+
+from src.backend.genesis_core.logenesis.log_state_store import LogStateStore, RECORD_DTYPE
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentVector
+
+def make_state(value: float, previous: float = None, embedding=None) -> ExpressionState:
+    def vector(v, emb=None):
+        return IntentVector(epistemic_need=v, subjective_weight=1 - v, decision_urgency=v / 2,
+                            precision_required=0.25, raw_embedding=emb)
+    return ExpressionState(current_vector=vector(value, embedding),
+                           previous_vector=None if previous is None else vector(previous),
+                           velocity=value / 10, inertia=0.7, last_updated=datetime(2026, 3, 1, 12, 30, 15, 123456))
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state.log")
+
+def test_record_layout_is_fixed():
+    assert RECORD_DTYPE.itemsize == 89
+
+def test_states_round_trip_through_the_log(path):
+    store = LogStateStore(filepath=path)
+    states = {"a": make_state(0.3), "b": make_state(0.6, previous=0.2), "c": make_state(0.9, embedding=[0.5, -1.5])}
+    for sid, state in states.items():
+        store.update_state(sid, state)
+    store.update_state("a", make_state(0.4)) # Later entries win on replay
+    states["a"] = make_state(0.4)
+
+    reloaded = LogStateStore(filepath=path)
+    assert len(reloaded) == 3 and reloaded._cache == {}
+    for sid, state in states.items():
+        assert reloaded.get_state(sid).model_dump() == state.model_dump()
+    assert reloaded.get_state("new").velocity == 0.0
+
+def test_compaction_folds_the_log_into_a_snapshot(path):
+    store = LogStateStore(filepath=path, compact_min_bytes=0)
+    for i in range(50):
+        store.update_state(f"s{i}", make_state(i / 50))
+    assert store.compactions >= 1
+    store.compact()
+    assert os.path.getsize(path) == 0 and os.path.exists(store.snapshot_path)
+    store.update_state("s7", make_state(0.99, previous=0.1, embedding=[1.0]))
+
+    reloaded = LogStateStore(filepath=path)
+    assert len(reloaded) == 50
+    assert reloaded.get_state("s7").model_dump() == make_state(0.99, previous=0.1, embedding=[1.0]).model_dump()
+    assert reloaded.get_state("s12").current_vector.epistemic_need == pytest.approx(12 / 50)
+
+def test_stale_log_after_interrupted_compaction_is_harmless(path):
+    store = LogStateStore(filepath=path)
+    store.update_state("a", make_state(0.1))
+    store.update_state("a", make_state(0.2))
+    with open(path, 'rb') as f:
+        stale_log = f.read()
+    store.compact()
+    with open(path, 'wb') as f: # As if the process died before truncating the log
+        f.write(stale_log)
+    assert LogStateStore(filepath=path).get_state("a").current_vector.epistemic_need == pytest.approx(0.2)
+
+def test_torn_tail_is_dropped(path):
+    store = LogStateStore(filepath=path)
+    store.update_state("a", make_state(0.1))
+    store.update_state("b", make_state(0.2))
+    size = os.path.getsize(path)
+    with open(path, 'r+b') as f:
+        f.truncate(size - 10)
+    reloaded = LogStateStore(filepath=path)
+    assert len(reloaded) == 1 and reloaded.get_state("a").current_vector.epistemic_need == pytest.approx(0.1)
+    assert os.path.getsize(path) == size // 2
+
+def test_retry_overwrites_a_torn_write(path, monkeypatch):
+    store = LogStateStore(filepath=path)
+    store.update_state("a", make_state(0.1))
+
+    def torn(payload):
+        with open(path, 'ab') as f: # The disk filled up mid-chunk
+            f.write(payload[0][:len(payload[0]) // 2])
+        raise OSError("No space left on device")
+    monkeypatch.setattr(store, "_write", torn)
+    store.update_state("b", make_state(0.2))
+    assert store._dirty == {"b"}
+
+    monkeypatch.undo()
+    store.update_state("c", make_state(0.3))
+    reloaded = LogStateStore(filepath=path)
+    assert len(reloaded) == 3
+    assert [reloaded.get_state(sid).current_vector.epistemic_need for sid in "abc"] == pytest.approx([0.1, 0.2, 0.3])
+
+def test_updates_in_a_loop_are_batched(path):
+    async def scenario():
+        store = LogStateStore(filepath=path, flush_interval=0.05)
+        for i in range(200):
+            store.update_state(f"s{i % 20}", make_state(i / 200))
+        assert not os.path.exists(path)
+        await store.aclose()
+        return store.flushes
+
+    assert asyncio.run(scenario()) == 1
+    assert os.path.getsize(path) == 20 * (2 + 3 + RECORD_DTYPE.itemsize) - 10 # s0..s9 have 2-byte ids
+    assert LogStateStore(filepath=path).get_state("s19").current_vector.epistemic_need == pytest.approx(199 / 200)
+
+def test_rejects_unstorable_session_ids(path):
+    store = LogStateStore(filepath=path)
+    with pytest.raises(ValueError):
+        store.update_state("a\x00b", make_state(0.1))
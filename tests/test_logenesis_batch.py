@@ -0,0 +1,90 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.backend.genesis_core.logenesis import state_physics
+from src.backend.genesis_core.logenesis.engine import LogenesisEngine, StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentPacket, LogenesisState
+
+TEXTS = [
+    "hello there", "can you analyze this hard problem", "imagine a story", "maybe check the status",
+    "what is this, maybe", "create a complex idea", "system reset", "how do I solve it", "I am unsure",
+]
+
+def visual(energy: float, confidence: float) -> IntentPacket:
+    return IntentPacket(modality="visual", embedding=None, energy_level=energy, confidence=confidence, raw_payload=None)
+
+@pytest.fixture
+def make_engine(tmp_path, monkeypatch):
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("LOGENESIS_STATE_STORE", raising=False)
+    def make(name: str) -> LogenesisEngine:
+        engine = LogenesisEngine()
+        engine.state_store = StateStore(filepath=str(tmp_path / f"{name}.json"))
+        return engine
+    return make
+
+def workload(seed: int, count: int):
+    rng = np.random.default_rng(seed)
+    packets, sessions = [], []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.6:
+            packets.append(TEXTS[rng.integers(len(TEXTS))])
+        elif kind < 0.95:
+            packets.append(visual(float(rng.random()), float(rng.random())))
+        else:
+            packets.append("bye for now") # Nirodha trigger
+        sessions.append(f"s{rng.integers(6)}")
+    return packets, sessions
+
+def test_vectorized_physics_is_bit_identical(make_engine):
+    engine = make_engine("physics")
+    vectors = np.random.default_rng(0).random((500, 4))
+    current = np.random.default_rng(1).random((500, 4))
+    inertia = np.random.default_rng(2).random(500)
+    entropies = state_physics.entropy(vectors)
+    corrected = state_physics.homeostasis(vectors, entropies)
+    coherence = state_physics.coherence(current, inertia, vectors)
+    drifted, velocity, effective = state_physics.drift(current, vectors)
+    colors, shapes, intensity, turbulence = state_physics.qualia(vectors)
+    rhythm, textures, amplitude = state_physics.audio(vectors)
+    spawn_rate, decay = state_physics.physics(vectors)
+    for k in range(len(vectors)):
+        vector = state_physics.to_vector(vectors[k].tolist())
+        state = ExpressionState(current_vector=state_physics.to_vector(current[k].tolist()), inertia=float(inertia[k]))
+        assert engine._calculate_entropy(vector) == entropies[k]
+        assert state_physics.to_array([engine._apply_homeostasis(vector, float(entropies[k]))])[0].tolist() == corrected[k].tolist()
+        assert engine._calculate_coherence(state, vector) == coherence[k]
+        expected = engine._drift_state(state, vector)
+        assert state_physics.to_array([expected.current_vector])[0].tolist() == drifted[k].tolist()
+        assert (expected.velocity, expected.inertia) == (velocity[k], effective[k])
+        assert engine._calculate_qualia(vector).model_dump() == dict(color=colors[k], intensity=intensity[k], turbulence=turbulence[k], shape=shapes[k])
+        assert engine._calculate_audio(vector).model_dump() == dict(rhythm_density=rhythm[k], tone_texture=textures[k], amplitude_bias=amplitude[k])
+        physics = engine._calculate_physics(vector)
+        assert (physics.spawn_rate, physics.decay_rate) == (spawn_rate[k], decay[k])
+
+@pytest.mark.parametrize("seed,batch_size", [(0, 32), (1, 32), (2, 120), (3, 5)])
+def test_batch_matches_sequential_processing(make_engine, seed, batch_size):
+    packets, sessions = workload(seed, 120)
+    scalar, batched = make_engine("scalar"), make_engine("batched")
+
+    async def run():
+        expected = [await scalar.process(p, session_id=s) for p, s in zip(packets, sessions)]
+        actual = []
+        for start in range(0, len(packets), batch_size):
+            actual += await batched.process_batch(packets[start:start + batch_size], sessions[start:start + batch_size])
+        return expected, actual
+
+    expected, actual = asyncio.run(run())
+    assert [r.model_dump() for r in actual] == [r.model_dump() for r in expected]
+    assert {r.state for r in expected} >= {LogenesisState.AWAKENED, LogenesisState.NIRODHA, LogenesisState.COLLAPSED}
+    assert batched.state == scalar.state
+    for session_id in set(sessions):
+        assert (batched.state_store.get_state(session_id).model_dump(exclude={"last_updated"})
+                == scalar.state_store.get_state(session_id).model_dump(exclude={"last_updated"}))
+
+def test_batch_rejects_mismatched_sessions(make_engine):
+    with pytest.raises(ValueError):
+        asyncio.run(make_engine("engine").process_batch(["hello"], []))
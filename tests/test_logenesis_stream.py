@@ -0,0 +1,59 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.backend.genesis_core.logenesis.engine import LogenesisEngine, StateStore
+from src.backend.genesis_core.logenesis.gemini_interpreter import GeminiIntentInterpreter
+from src.backend.genesis_core.logenesis.schemas import LogenesisResponse
+from src.backend.genesis_core.logenesis.visual_schemas import BaseShape, VisualParameters
+
+CONTRACT = {"intent": {"category": "CREATIVE", "purity": 1.0},
+            "cognitive": {"effort": 0.8, "uncertainty": 0.1},
+            "temporal_state": {"phase": "MANIFESTING", "stability": 0.9},
+            "text_content": "Picture a nebula folding into itself."}
+
+def streaming_gemini() -> GeminiIntentInterpreter:
+    answer = json.dumps(CONTRACT)
+
+    def generate_content(prompt, generation_config=None, stream=False):
+        if not stream:
+            return SimpleNamespace(text=answer)
+        return [SimpleNamespace(text=answer[i:i + 8]) for i in range(0, len(answer), 8)]
+
+    interpreter = GeminiIntentInterpreter.__new__(GeminiIntentInterpreter)
+    interpreter.model = SimpleNamespace(generate_content=generate_content)
+    return interpreter
+
+@pytest.fixture
+def make_engine(tmp_path, monkeypatch):
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("LOGENESIS_STATE_STORE", raising=False)
+    def make(name: str) -> LogenesisEngine:
+        engine = LogenesisEngine()
+        engine.state_store = StateStore(filepath=str(tmp_path / f"{name}.json"))
+        engine.interpreter = streaming_gemini()
+        return engine
+    return make
+
+def stream(engine: LogenesisEngine, packet):
+    async def run():
+        return [update async for update in engine.process_stream(packet, session_id="s")]
+    return asyncio.run(run())
+
+def test_visuals_arrive_before_the_response(make_engine):
+    updates = stream(make_engine("stream"), "imagine a nebula")
+    *early, response = updates
+    assert early and all(isinstance(update, VisualParameters) for update in early)
+    assert early[0].visual_parameters.base_shape == BaseShape.CLOUD
+    assert isinstance(response, LogenesisResponse)
+    assert response.visual_analysis == early[-1]
+
+    # The same response as the non-streaming path
+    expected = asyncio.run(make_engine("plain").process("imagine a nebula", session_id="s"))
+    assert response.model_dump(exclude={"light_intent"}) == expected.model_dump(exclude={"light_intent"})
+
+def test_nirodha_triggers_only_yield_the_response(make_engine):
+    updates = stream(make_engine("sleep"), "time to sleep")
+    assert len(updates) == 1 and updates[0].state.name == "NIRODHA"
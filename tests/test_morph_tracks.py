@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from src.backend.departments.presentation.morph_tracks import (
+    EASINGS, MorphSettings, easing_table, stagger_delays
+)
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.lcl_codec import DeltaEncoder, decode_frame
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+from src.backend.departments.presentation.scene_host import SceneHost
+
+SETTINGS = MorphSettings(duration=1.0, easing="ease_in_out", stagger=0.5, order="radial")
+
+def _scene(n=40, settings=SETTINGS):
+    lcl = LightControlLogic()
+    lcl.spawn_many(n, np.random.default_rng(0).random((n, 2)).astype(np.float32))
+    lcl.morph = settings
+    return lcl
+
+def _ring(n=40):
+    angle = np.arange(n) * 2 * np.pi / n
+    return np.stack([0.5 + 0.3 * np.cos(angle), 0.5 + 0.3 * np.sin(angle)], axis=1).astype(np.float32)
+
+@pytest.mark.parametrize("name", sorted(EASINGS))
+def test_easing_tables_span_zero_to_one(name):
+    table = easing_table(name)
+    assert table[0] == pytest.approx(0.0, abs=1e-6) and table[-1] == pytest.approx(1.0, abs=1e-6)
+
+def test_settings_validation_and_spec():
+    with pytest.raises(ValueError):
+        MorphSettings(easing="bounce")
+    with pytest.raises(ValueError):
+        MorphSettings(order="spiral")
+    with pytest.raises(ValueError):
+        MorphSettings(duration=0.0)
+    with pytest.raises(ValueError):
+        MorphSettings.from_spec({"speed": 2})
+    assert MorphSettings.from_spec(SETTINGS.to_spec()) == SETTINGS
+
+def test_radial_stagger_grows_outwards():
+    targets = np.array([[0.5, 0.5], [0.6, 0.5], [0.9, 0.5], [0.1, 0.5]], dtype=np.float32)
+    delays = stagger_delays(targets, SETTINGS)
+    assert delays.min() >= 0.0 and delays.max() == pytest.approx(0.5)
+    assert delays[0] < delays[1] < delays[2]
+
+def test_track_follows_easing_and_lands_on_targets():
+    lcl = _scene()
+    track = lcl.manifest(_ring())
+    assert lcl.morphing == 40 and track.total == pytest.approx(1.5)
+    start = track.start.copy()
+
+    lcl.tick(0.25)
+    np.testing.assert_allclose(lcl._pos[:40], track.sample(0.25))
+    # Moving along the track, with matching velocities
+    assert np.all(lcl._vel[:40] == pytest.approx((lcl._pos[:40] - start) / 0.25, abs=1e-4))
+
+    for _ in range(6):
+        lcl.tick(0.25)
+    assert lcl.morphing == 0
+    np.testing.assert_array_equal(lcl._pos[:40], lcl._target_pos[:40])
+    assert not lcl._vel[:40].any()
+
+def test_track_position_depends_only_on_elapsed_time():
+    a, b = _scene(), _scene()
+    a.manifest(_ring())
+    b.manifest(_ring())
+    a.tick(0.6)
+    for _ in range(6):
+        b.tick(0.1)
+    np.testing.assert_allclose(a._pos[:40], b._pos[:40], atol=1e-6)
+
+def test_manifest_instruction_carries_track_params():
+    lcl = _scene()
+    instr = lcl.process(LightIntent(action=LightAction.MANIFEST, shape_name="circle", source="t"))
+    params = instr.morph
+    assert MorphSettings.from_spec({k: v for k, v in params.items() if k != "handles"}) == SETTINGS
+    # handles[j] is the entity travelling to formation point j
+    slot_of = {int(h): i for i, h in enumerate(lcl._handles[:lcl._count])}
+    for j, handle in enumerate(params["handles"]):
+        assert tuple(lcl._target_pos[slot_of[handle]]) == pytest.approx(instr.formation_data[j][:2])
+
+    lcl.morph = None
+    assert lcl.process(LightIntent(action=LightAction.MANIFEST, shape_name="square", source="t")).morph is None
+    assert lcl.morphing == 0
+
+def test_move_and_removal_cancel_the_track():
+    lcl = _scene()
+    lcl.manifest(_ring())
+    lcl.process(LightIntent(action=LightAction.MOVE, vector=(1.0, 0.0), source="t"))
+    assert lcl.morphing == 0
+
+    lcl.manifest(_ring())
+    lcl._remove_indices(np.array([39]))
+    assert lcl.morphing == 0
+
+def test_state_round_trip_mid_morph():
+    lcl = _scene()
+    lcl.manifest(_ring())
+    lcl.tick(0.3)
+    restored = LightControlLogic.from_bytes(lcl.to_bytes())
+    assert restored.morph == SETTINGS and restored.morphing == 40
+    for scene in (lcl, restored):
+        scene.tick(0.3)
+    assert restored.state_digest() == lcl.state_digest()
+
+def test_scene_host_ticks_morphing_scenes_like_tick():
+    host = SceneHost()
+    hosted = host.scene("a")
+    hosted.spawn_many(40, np.random.default_rng(0).random((40, 2)).astype(np.float32))
+    hosted.morph = SETTINGS
+    reference = LightControlLogic.from_bytes(hosted.to_bytes())
+    hosted.manifest(_ring())
+    reference.manifest(_ring())
+    host.tick(0.2)
+    reference.tick(0.2)
+    np.testing.assert_array_equal(hosted._pos[:40], reference._pos[:40])
+
+def test_delta_encoder_leaves_tracked_positions_to_the_client():
+    lcl = _scene(settings=MorphSettings(duration=0.5, stagger=0.0))
+    lcl._colors_moving = False
+    encoder, streaming = DeltaEncoder(client_morphs=True), DeltaEncoder()
+    for enc in (encoder, streaming):
+        enc.ack(decode_frame(enc.encode(lcl)).frame_id)
+
+    lcl.manifest(_ring(), colors=None)
+    lcl._colors_moving = False # Isolate positions
+    lcl.tick(0.2)
+    assert len(decode_frame(encoder.encode(lcl)).handles) == 0
+    assert len(decode_frame(streaming.encode(lcl)).handles) == 40
+
+    lcl.tick(0.4) # Track ends: final positions are synced once
+    assert lcl.morphing == 0
+    assert len(decode_frame(encoder.encode(lcl)).handles) == 40
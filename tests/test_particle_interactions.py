@@ -0,0 +1,39 @@
+import numpy as np
+from src.backend.departments.presentation.particle_interactions import interaction_forces
+from src.backend.departments.presentation.lcl import LightControlLogic
+
+def _brute_force(pos, radius, separation, cohesion):
+    d = pos[:, None, :] - pos[None, :, :]
+    dist = np.sqrt((d ** 2).sum(-1))
+    near = (dist < radius) & (dist > 0)
+    q = dist / radius
+    magnitude = np.where(near, separation * (1 - q) - cohesion * q, 0.0)
+    unit = d / np.where(dist > 0, dist, 1.0)[..., None]
+    return (magnitude[..., None] * unit).sum(axis=1)
+
+def test_matches_brute_force():
+    pos = np.random.default_rng(3).random((400, 2))
+    forces = interaction_forces(pos, 0.07, separation=1.0, cohesion=0.4, max_per_cell=10 ** 6)
+    assert np.allclose(forces, _brute_force(pos, 0.07, 1.0, 0.4), atol=1e-5)
+
+def test_pair_pushes_apart_and_is_symmetric():
+    pos = np.array([[0.50, 0.5], [0.51, 0.5], [0.9, 0.9]])
+    forces = interaction_forces(pos, 0.05)
+    assert forces[0, 0] < 0 < forces[1, 0]
+    assert np.allclose(forces[0], -forces[1])
+    assert np.allclose(forces[2], 0.0)
+
+def test_collapsed_cluster_is_bounded():
+    pos = np.full((5000, 2), 0.5) + np.random.default_rng(0).random((5000, 2)) * 1e-4
+    forces = interaction_forces(pos, 0.01, max_per_cell=8)
+    assert np.all(np.isfinite(forces))
+
+def test_tick_flag():
+    lcl = LightControlLogic()
+    lcl.spawn_many(2, np.array([[0.50, 0.5], [0.505, 0.5]], dtype=np.float32))
+
+    lcl.tick(0.016)
+    assert np.allclose(lcl._vel[:2], 0.0)
+
+    lcl.tick(0.016, interactions=True)
+    assert lcl._vel[0, 0] < 0 < lcl._vel[1, 0]
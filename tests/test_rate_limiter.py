@@ -0,0 +1,37 @@
+from src.backend.departments.presentation.rate_limiter import TokenBucketLimiter
+from src.backend.departments.presentation.light_schemas import PriorityLevel, LightIntent, LightAction
+from src.backend.departments.presentation.lcl import LightControlLogic
+
+def test_bucket_refills_over_time():
+    limiter = TokenBucketLimiter(rate=2.0, burst=2.0)
+    assert limiter.allow("s", 0.0) is True
+    assert limiter.allow("s", 0.0) is True
+    assert limiter.allow("s", 0.1) is False
+    assert limiter.allow("s", 0.6) is True  # 0.5 s * 2 tokens/s = 1 token back
+
+def test_priority_limits():
+    limiter = TokenBucketLimiter(rate=1.0, burst=1.0, priority_limits={
+        PriorityLevel.SYSTEM: None,
+        PriorityLevel.SAFETY: (10.0, 3.0),
+    })
+    assert [limiter.allow("s", 0.0, PriorityLevel.SYSTEM) for _ in range(10)] == [True] * 10
+    assert [limiter.allow("a", 0.0, PriorityLevel.SAFETY) for _ in range(4)] == [True, True, True, False]
+    assert [limiter.allow("u", 0.0) for _ in range(2)] == [True, False]
+
+def test_lru_cap_and_idle_eviction():
+    limiter = TokenBucketLimiter(rate=1.0, burst=1.0, max_sources=100)
+    for i in range(1000):
+        limiter.allow(f"s{i}", 0.0)
+    assert len(limiter) == 100
+    assert limiter.evictions == 900
+
+    # Every bucket has refilled after 1 s, so a later sweep drops them all
+    for i in range(64):
+        limiter.allow("fresh", 5.0 + i)
+    assert len(limiter) == 1
+
+def test_lcl_tracks_last_activity():
+    lcl = LightControlLogic()
+    lcl.process(LightIntent(action=LightAction.EMPHASIZE, source="a"))
+    assert lcl.last_activity > 0.0
+    assert len(lcl.rate_limiter) == 1
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from src.backend.departments.presentation.lcl import LightControlLogic
+from src.backend.departments.presentation.scene_host import SceneHost
+from src.backend.departments.presentation.light_schemas import LightIntent, LightAction
+
+def _populate(lcl: LightControlLogic, seed: int, count: int):
+    rng = np.random.default_rng(seed)
+    lcl.spawn_many(count, rng.random((count, 2)).astype(np.float32),
+                   velocities=(rng.random((count, 2)).astype(np.float32) - 0.5))
+    lcl.manifest(rng.random((count // 2, 2)).astype(np.float32), "#FF0000")
+
+def test_combined_tick_matches_individual_ticks():
+    host = SceneHost()
+    reference = []
+    for k in range(5):
+        scene = host.scene(f"s{k}", now=0.0)
+        ref = LightControlLogic()
+        for lcl in (scene, ref):
+            _populate(lcl, k, 20 + 7 * k)
+            lcl.interactions_enabled = (k == 2)
+            lcl.interaction_radius = 0.2
+        reference.append(ref)
+
+    for _ in range(80): # Long enough for the target colors to settle
+        host.tick(0.016, now=1.0)
+        for ref in reference:
+            ref.tick(0.016)
+
+    for k, ref in enumerate(reference):
+        scene = host.scene(f"s{k}", now=1.0)
+        n = ref._count
+        np.testing.assert_array_equal(scene._pos[:n], ref._pos[:n])
+        np.testing.assert_array_equal(scene._vel[:n], ref._vel[:n])
+        np.testing.assert_array_equal(scene._history[:n], ref._history[:n])
+        np.testing.assert_array_equal(scene._color[:n], ref._color[:n])
+
+def test_scenes_start_small_and_grow():
+    host = SceneHost(initial_capacity=8)
+    lcl = host.scene("a", now=0.0)
+    assert lcl._capacity == 8
+    lcl.spawn_many(100, (0.5, 0.5))
+    assert lcl._capacity >= 100
+    assert host.scene("b", now=0.0)._count == 0
+
+def test_idle_scene_freeze_thaw_roundtrip():
+    host = SceneHost(idle_timeout=10.0)
+    lcl = host.scene("a", now=0.0)
+    _populate(lcl, 1, 50)
+    lcl._add_entity("named", (0.1, 0.2), (0.0, 0.0), 0.7, target_color="#00FF00")
+    before = lcl.entities
+    host.scene("b", now=5.0)
+
+    assert host.evict_idle(now=12.0) == 1
+    assert host.get_metrics()["frozen_scenes"] == 1
+    assert "a" in host and len(host) == 2
+
+    thawed = host.scene("a", now=13.0)
+    assert thawed is not lcl
+    assert thawed.entities == before
+    assert thawed._index_of("named") == lcl._index_of("named")
+    # Handles keep counting from where the frozen scene stopped
+    assert thawed.spawn_many(1, (0.5, 0.5))[0] == lcl._next_handle
+
+    with pytest.raises(ValueError):
+        LightControlLogic.from_bytes(b"garbage")
+
+def test_max_active_freezes_least_recently_used():
+    host = SceneHost(max_active=2)
+    host.scene("a", now=0.0)
+    host.scene("b", now=1.0)
+    host.scene("a", now=2.0)
+    host.scene("c", now=3.0)
+    assert set(host._active) == {"a", "c"}
+    assert host.process("b", LightIntent(action=LightAction.SPAWN, source="u")) is not None
+    assert host.remove("b") and "b" not in host
@@ -0,0 +1,61 @@
+import pytest
+
+from src.backend.auth.schemas import IdentityProfile, TokenSet
+from src.backend.auth.session_manager import AuthManager
+from src.backend.storage import SessionCache
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_lru_eviction_and_stats():
+    cache = SessionCache(max_entries=3, ttl=None)
+    for key in "abc":
+        cache[key] = key.upper()
+    assert cache.lookup("a") == "A" # a becomes most recent
+    cache["d"] = "D"
+    assert list(cache) == ["c", "a", "d"]
+    assert cache.lookup("b") is None
+    assert cache.stats() == {"resident": 3, "hits": 1, "misses": 1, "hit_rate": 0.5, "evictions": 1, "expirations": 0}
+
+def test_idle_entries_expire():
+    clock = Clock()
+    cache = SessionCache(max_entries=None, ttl=10.0, clock=clock)
+    cache["a"], cache["b"] = 1, 2
+    clock.now = 6.0
+    cache.lookup("a")
+    clock.now = 12.0
+    assert cache.evict() == 1 and list(cache) == ["a"]
+    clock.now = 16.0
+    cache["c"] = 3 # Writes sweep too
+    assert list(cache) == ["c"] and cache.expirations == 2
+
+def test_pinned_entries_wait_until_released():
+    pinned = {"a"}
+    cache = SessionCache(max_entries=1, ttl=None, pinned=lambda key: key in pinned)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert list(cache) == ["a"] # b was the only evictable entry
+    pinned.clear()
+    cache["c"] = 3
+    assert list(cache) == ["c"] and cache.evictions == 2
+
+def test_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        SessionCache(max_entries=0)
+
+def test_auth_manager_reloads_evicted_sessions(tmp_path):
+    path = str(tmp_path / "auth.json")
+    manager = AuthManager(path, max_resident=2)
+    for n in range(5):
+        identity = IdentityProfile(provider="mock", sub=str(n))
+        manager.upsert_user(f"mock-{n}", identity, TokenSet(access_token=f"t{n}", expires_at=0.0))
+    assert len(manager._cache) == 2
+    assert manager.get_user("mock-0").tokens.access_token == "t0" # Decoded again from the stored JSON
+    assert manager.get_user("nobody") is None
+    assert manager.cache_stats()["evictions"] == 4
+
+    reloaded = AuthManager(path)
+    assert len(reloaded._cache) == 0 and reloaded.get_user("mock-3").tokens.access_token == "t3"
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from src.backend.departments.presentation.shape_library import (
+    REGIONS, GLYPHS, blue_noise_tile, text_mask, mask_region, resolve_region, sample_region
+)
+from src.backend.departments.presentation.formation_manager import FormationManager
+
+def test_blue_noise_tile_keeps_min_distance_across_edges():
+    cells = 30
+    tile = blue_noise_tile(cells)
+    delta = tile[:, None] - tile[None]
+    delta -= np.round(delta) # Periodic
+    dist = np.hypot(delta[..., 0], delta[..., 1])
+    np.fill_diagonal(dist, np.inf)
+    assert dist.min() >= np.sqrt(2) / cells - 1e-12
+    # Close to a maximal packing (~0.3 points per cell)
+    assert len(tile) > 0.28 * cells * cells
+
+@pytest.mark.parametrize("name", sorted(REGIONS) + ["text:Hi!"])
+@pytest.mark.parametrize("count", [1, 50, 2000])
+def test_samples_are_exact_inside_and_reproducible(name, count):
+    region = resolve_region(name)
+    points = sample_region(region, count, np.random.default_rng(5))
+    assert points.shape == (count, 2)
+    assert region.inside(points[:, 0], points[:, 1]).all()
+    np.testing.assert_array_equal(points, sample_region(region, count, np.random.default_rng(5)))
+
+def test_samples_are_evenly_spaced():
+    points = sample_region(REGIONS["sphere"], 1000, np.random.default_rng(0))
+    delta = points[:, None] - points[None]
+    dist = np.hypot(delta[..., 0], delta[..., 1])
+    np.fill_diagonal(dist, np.inf)
+    nearest = dist.min(axis=1)
+    # Uniform random points have a nearest-neighbor CV around 0.5 and near-zero minimum
+    assert nearest.std() / nearest.mean() < 0.2
+    assert nearest.min() > 0.7 * nearest.mean()
+
+def test_text_mask_uses_builtin_font():
+    mask = text_mask("i~\nA")
+    assert mask.shape == (16, 11)
+    np.testing.assert_array_equal(mask[:7, :5].dot(1 << np.arange(4, -1, -1)), GLYPHS["I"])
+    np.testing.assert_array_equal(mask[:7, 6:].dot(1 << np.arange(4, -1, -1)), GLYPHS["?"])
+    np.testing.assert_array_equal(mask[9:, :5].dot(1 << np.arange(4, -1, -1)), GLYPHS["A"])
+    assert not mask[7:9].any()
+
+    region = mask_region(text_mask("I"))
+    assert region.area == pytest.approx(11 * (2 / 7) ** 2)
+    assert region.inside(np.array([0.0, -0.6]), np.array([0.0, 0.0])).tolist() == [True, False]
+
+@pytest.mark.parametrize("shape", ["sphere", "Cube", "cloud", "cracks", "text:Aether"])
+def test_formation_manager_serves_library_shapes_from_cache(shape):
+    FormationManager.cache.clear()
+    coords, _ = FormationManager.get_formation_arrays(shape, 300)
+    assert coords.shape == (300, 2)
+    assert np.all((coords >= 0.2 - 1e-6) & (coords <= 0.8 + 1e-6))
+    again, _ = FormationManager.get_formation_arrays(shape.upper(), 300)
+    assert again is coords
+    seeded, _ = FormationManager.get_formation_arrays(shape, 300, seed=1)
+    assert not np.array_equal(seeded, coords)
+    assert len(FormationManager.get_formation(shape, 300)) == 300
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.backend.genesis_core.logenesis.sqlite_state_store import SqliteStateStore
+from src.backend.genesis_core.logenesis.state_store import StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentVector
+from src.backend.storage import STATE_TABLE, SqliteDocumentStore
+from src.backend.storage.migrate import migrate_json
+
+def make_state(value: float) -> ExpressionState:
+    vector = IntentVector(epistemic_need=value, subjective_weight=value, decision_urgency=value, precision_required=value)
+    return ExpressionState(current_vector=vector, velocity=value / 10, inertia=0.8)
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state.db")
+
+def test_states_are_shared_between_stores(path):
+    a, b = SqliteStateStore(path), SqliteStateStore(path) # e.g. two workers
+    assert b.get_state("s").current_vector.epistemic_need == pytest.approx(0.1) # Default
+    a.update_state("s", make_state(0.4))
+    assert b.get_state("s").current_vector.epistemic_need == pytest.approx(0.4)
+    b.update_state("s", make_state(0.6))
+    assert a.get_state("s").current_vector.epistemic_need == pytest.approx(0.6)
+    assert a._cache == {} # Written states are not kept
+
+def test_flushes_are_batched_in_a_loop(path):
+    async def scenario():
+        store = SqliteStateStore(path, flush_interval=0.05)
+        for i in range(100):
+            store.update_state(f"s{i}", make_state(0.5))
+        assert len(store.documents) == 0
+        assert store.get_state("s3").current_vector.epistemic_need == pytest.approx(0.5) # Unwritten, from memory
+        await asyncio.sleep(0.15)
+        assert len(store.documents) == 100 and store.flushes == 1
+        store.update_state("s3", make_state(0.9))
+        await store.aclose()
+
+    asyncio.run(scenario())
+    assert SqliteStateStore(path).get_state("s3").current_vector.epistemic_need == pytest.approx(0.9)
+
+def test_failed_commit_is_retried_from_memory(path, monkeypatch):
+    async def scenario():
+        store = SqliteStateStore(path, flush_interval=60.0)
+        state = make_state(0.3)
+        store.update_state("a", state)
+        await store.flush_async()
+        state.velocity = 0.5 # Changed in place, as the engine does
+        store.update_state("a", state)
+
+        def broken(items):
+            raise OSError("disk I/O error")
+        monkeypatch.setattr(store.documents, "put_many", broken)
+        assert await store.flush_async() == 0
+        store.get_state("b")
+        assert store._cache["a"] is state and store._dirty == {"a"}
+
+        monkeypatch.undo()
+        assert await store.flush_async() == 1
+        await store.aclose()
+
+    asyncio.run(scenario())
+    assert SqliteStateStore(path).get_state("a").velocity == pytest.approx(0.5)
+
+def test_migrates_the_json_state_file(tmp_path, path):
+    json_path = str(tmp_path / "state.json")
+    legacy = StateStore(json_path)
+    for i in range(20):
+        legacy.update_state(f"s{i}", make_state(i / 20))
+    assert migrate_json(json_path, SqliteDocumentStore(path, STATE_TABLE)) == 20
+    store = SqliteStateStore(path)
+    assert store.get_state("s7").model_dump() == legacy.get_state("s7").model_dump()
+
+def test_invalid_rows_fall_back_to_the_default(path):
+    store = SqliteStateStore(path)
+    store.documents.put("bad", '{"velocity": "fast"}')
+    assert store.get_state("bad").velocity == 0.0
@@ -0,0 +1,90 @@
+import json
+import multiprocessing
+
+import pytest
+
+from src.backend.auth.schemas import IdentityProfile, TokenSet
+from src.backend.auth.session_manager import AuthManager, SqliteAuthManager, create_auth_manager
+from src.backend.storage import AUTH_TABLE, SqliteDocumentStore
+from src.backend.storage.migrate import migrate_json
+
+def identity(n: int) -> IdentityProfile:
+    return IdentityProfile(provider="mock", sub=str(n), email=f"user{n}@example.com")
+
+def tokens(tag: str) -> TokenSet:
+    return TokenSet(access_token=f"access-{tag}", refresh_token=f"refresh-{tag}", expires_at=1e9)
+
+def test_document_store_upserts_in_wal_mode(tmp_path):
+    store = SqliteDocumentStore(str(tmp_path / "docs.db"), "docs")
+    assert store._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    store.put("a", '{"v":1}')
+    store.put_many([("b", '{"v":2}'), ("a", '{"v":3}')])
+    assert store.get("a") == '{"v":3}' and store.get("missing") is None
+    assert len(store) == 2 and dict(store.items()) == {"a": '{"v":3}', "b": '{"v":2}'}
+    store.delete("b")
+    assert len(store) == 1
+
+def test_failed_transaction_rolls_back(tmp_path):
+    store = SqliteDocumentStore(str(tmp_path / "docs.db"), "docs")
+    with pytest.raises(RuntimeError):
+        with store.transaction() as conn:
+            store.put("a", "{}", conn)
+            raise RuntimeError("abort")
+    assert store.get("a") is None
+
+def test_rejects_unsafe_table_names(tmp_path):
+    with pytest.raises(ValueError):
+        SqliteDocumentStore(str(tmp_path / "docs.db"), "docs; DROP TABLE x")
+
+def test_sqlite_auth_manager_keeps_creation_time(tmp_path):
+    manager = SqliteAuthManager(str(tmp_path / "auth.db"))
+    first = manager.upsert_user("mock-1", identity(1), tokens("a"))
+    again = manager.upsert_user("mock-1", identity(1), tokens("b"))
+    assert again.created_at == first.created_at and again.last_accessed >= first.last_accessed
+    other = SqliteAuthManager(str(tmp_path / "auth.db")) # e.g. another worker
+    assert other.get_user("mock-1").tokens.access_token == "access-b"
+    assert other.get_user("mock-2") is None
+
+def _login_many(path: str, worker: int, count: int):
+    manager = SqliteAuthManager(path)
+    for i in range(count):
+        manager.upsert_user(f"mock-{worker}-{i}", identity(i), tokens(str(worker)))
+        manager.upsert_user("mock-shared", identity(0), tokens(str(worker)))
+
+def test_workers_share_sessions_without_lost_updates(tmp_path):
+    path = str(tmp_path / "auth.db")
+    SqliteAuthManager(path).documents.close() # No connection may be open across the fork
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_login_many, args=(path, w, 50)) for w in range(4)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(30)
+        assert p.exitcode == 0
+    assert len(SqliteDocumentStore(path, AUTH_TABLE)) == 4 * 50 + 1
+
+def test_migrates_json_sessions(tmp_path):
+    json_path = str(tmp_path / "auth_sessions.json")
+    legacy = AuthManager(json_path)
+    for n in range(30):
+        legacy.upsert_user(f"mock-{n}", identity(n), tokens(str(n)))
+
+    db_path = str(tmp_path / "auth_sessions.db")
+    assert migrate_json(json_path, SqliteDocumentStore(db_path, AUTH_TABLE), batch_size=7) == 30
+    assert migrate_json(json_path, SqliteDocumentStore(db_path, AUTH_TABLE)) == 30 # Idempotent
+    migrated = SqliteAuthManager(db_path)
+    assert len(migrated.documents) == 30
+    assert migrated.get_user("mock-12") == legacy.get_user("mock-12")
+    assert migrate_json(str(tmp_path / "missing.json"), migrated.documents) == 0
+
+    with open(json_path, "w") as f:
+        json.dump([1, 2], f)
+    with pytest.raises(ValueError):
+        migrate_json(json_path, migrated.documents)
+
+def test_create_auth_manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert type(create_auth_manager()) is AuthManager
+    assert isinstance(create_auth_manager("sqlite"), SqliteAuthManager)
+    with pytest.raises(ValueError):
+        create_auth_manager("redis")
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from src.backend.genesis_core.logenesis.log_state_store import LogStateStore
+from src.backend.genesis_core.logenesis.state_store import StateStore
+from src.backend.genesis_core.logenesis.schemas import ExpressionState, IntentVector
+
+def make_state(value: float, velocity: float = 0.0) -> ExpressionState:
+    vector = IntentVector(epistemic_need=value, subjective_weight=value, decision_urgency=value, precision_required=value)
+    return ExpressionState(current_vector=vector, velocity=velocity, inertia=0.8)
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state.json")
+
+def test_updates_outside_a_loop_write_through(path):
+    store = StateStore(filepath=path)
+    store.update_state("a", make_state(0.3))
+    reloaded = StateStore(filepath=path)
+    assert reloaded.get_state("a").current_vector.epistemic_need == pytest.approx(0.3)
+    with open(path) as f:
+        assert set(json.load(f)) == {"a"}
+
+def test_updates_in_a_loop_are_batched_by_the_flusher(path):
+    async def scenario():
+        store = StateStore(filepath=path, flush_interval=0.05)
+        for i in range(100):
+            store.update_state(f"s{i}", make_state(0.5))
+        assert not os.path.exists(path) # Nothing written yet
+        await asyncio.sleep(0.15)
+        assert store.flushes == 1 and not store._dirty
+        with open(path) as f:
+            assert len(json.load(f)) == 100
+
+        store.update_state("s3", make_state(0.9))
+        await store.aclose()
+        assert store._flusher is None
+        return store.flushes
+
+    assert asyncio.run(scenario()) == 2
+    assert StateStore(filepath=path).get_state("s3").current_vector.epistemic_need == pytest.approx(0.9)
+
+def test_aclose_flushes_pending_changes(path):
+    async def scenario():
+        store = StateStore(filepath=path, flush_interval=60.0)
+        store.update_state("a", make_state(0.2))
+        store.update_state("b", make_state(0.4))
+        await store.aclose()
+
+    asyncio.run(scenario())
+    reloaded = StateStore(filepath=path)
+    assert reloaded.get_state("b").current_vector.epistemic_need == pytest.approx(0.4)
+
+def test_zero_interval_writes_through_inside_a_loop(path):
+    async def scenario():
+        store = StateStore(filepath=path, flush_interval=0)
+        store.update_state("a", make_state(0.7))
+        assert store._flusher is None and os.path.exists(path)
+
+    asyncio.run(scenario())
+
+def test_flush_reencodes_only_dirty_sessions(path, monkeypatch):
+    store = StateStore(filepath=path)
+    store.update_state("a", make_state(0.1))
+    store.update_state("b", make_state(0.2))
+    dumps = []
+    original = ExpressionState.model_dump
+    monkeypatch.setattr(ExpressionState, "model_dump", lambda self, **kw: dumps.append(1) or original(self, **kw))
+    store.update_state("a", make_state(0.6))
+    assert len(dumps) == 1
+    with open(path) as f:
+        data = json.load(f)
+    assert data["a"]["current_vector"]["epistemic_need"] == pytest.approx(0.6)
+    assert data["b"]["current_vector"]["epistemic_need"] == pytest.approx(0.2)
+
+def test_failed_write_keeps_sessions_dirty_and_file_intact(path, monkeypatch):
+    store = StateStore(filepath=path)
+    store.update_state("a", make_state(0.1))
+
+    def broken(payload):
+        raise OSError("disk full")
+    monkeypatch.setattr(store, "_write", broken)
+    store.update_state("a", make_state(0.9))
+    assert store._dirty == {"a"}
+    assert StateStore(filepath=path).get_state("a").current_vector.epistemic_need == pytest.approx(0.1)
+
+    monkeypatch.undo()
+    assert store.flush() == 1
+    assert StateStore(filepath=path).get_state("a").current_vector.epistemic_need == pytest.approx(0.9)
+    assert [name for name in os.listdir(os.path.dirname(path)) if name.endswith(".tmp")] == []
+
+@pytest.mark.parametrize("backend", [StateStore, LogStateStore])
+def test_sessions_stay_resident_until_their_write_succeeds(backend, tmp_path, monkeypatch):
+    filepath = str(tmp_path / "state")
+    async def scenario():
+        store = backend(filepath=filepath, flush_interval=60.0, max_resident=1)
+        store.update_state("a", make_state(0.4))
+        started, release = threading.Event(), threading.Event()
+
+        def broken(payload):
+            started.set()
+            release.wait()
+            raise OSError("disk full")
+        monkeypatch.setattr(store, "_write", broken)
+        flush = asyncio.ensure_future(store.flush_async())
+        await asyncio.to_thread(started.wait)
+        store.get_state("b") # Would evict "a" while its write is running
+        release.set()
+        assert await flush == 0
+        assert "a" in store._cache and store._dirty == {"a"}
+
+        monkeypatch.undo()
+        assert await store.flush_async() == 1
+        await store.aclose()
+
+    asyncio.run(scenario())
+    assert backend(filepath=filepath).get_state("a").current_vector.epistemic_need == pytest.approx(0.4)
+
+def test_flusher_survives_a_failed_flush(path, monkeypatch):
+    async def scenario():
+        store = StateStore(filepath=path, flush_interval=0.01)
+        original = store.flush_async
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return await original()
+        monkeypatch.setattr(store, "flush_async", flaky)
+        store.update_state("a", make_state(0.7))
+        await asyncio.sleep(0.1)
+        assert len(calls) > 1 and not store._dirty and not store._flusher.done()
+        await store.aclose()
+
+    asyncio.run(scenario())
+    assert StateStore(filepath=path).get_state("a").current_vector.epistemic_need == pytest.approx(0.7)
+
+def test_resident_sessions_are_bounded_and_reloaded(path):
+    async def scenario():
+        store = StateStore(filepath=path, flush_interval=60.0, max_resident=10)
+        for i in range(50):
+            store.update_state(f"s{i}", make_state(i / 50))
+        assert len(store._cache) == 50 # Unflushed sessions stay resident
+        await store.flush_async()
+        assert len(store._cache) == 10
+        assert store.get_state("s3").current_vector.epistemic_need == pytest.approx(3 / 50)
+        await store.aclose()
+        return store.cache_stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["resident"] == 10 and stats["evictions"] == 41 and stats["misses"] == 1
+
+def test_idle_sessions_expire(path):
+    store = StateStore(filepath=path, idle_ttl=0.0)
+    store.update_state("a", make_state(0.3))
+    assert len(store._cache) == 0
+    assert store.get_state("a").current_vector.epistemic_need == pytest.approx(0.3)
+    assert store.cache_stats()["expirations"] >= 1
@@ -0,0 +1,101 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.backend.genesis_core.logenesis.caching_interpreter import CachingInterpreter
+from src.backend.genesis_core.logenesis.embodiment import EmbodimentAdapter
+from src.backend.genesis_core.logenesis.gemini_interpreter import GeminiIntentInterpreter
+from src.backend.genesis_core.logenesis.partial_json import PartialJSONParser
+from src.backend.genesis_core.logenesis.simulated_interpreter import SimulatedIntentInterpreter
+from src.backend.genesis_core.logenesis.visual_schemas import BaseShape, ContractIntentCategory, PartialContract
+
+CONTRACT = {"intent": {"category": "ANALYTIC", "purity": 1.0},
+            "cognitive": {"effort": 0.85, "uncertainty": 0.2},
+            "temporal_state": {"phase": "MANIFESTING", "stability": 0.8},
+            "text_content": 'Step one: "parse" the input \\ then a snowman ☃ and \U0001F600.'}
+
+def gemini(answer: str, chunk: int = 5) -> GeminiIntentInterpreter:
+    """A Gemini interpreter whose model streams `answer` in chunks of `chunk` characters."""
+    def generate_content(prompt, generation_config=None, stream=False):
+        assert stream
+        return [SimpleNamespace(text=answer[i:i + chunk]) for i in range(0, len(answer), chunk)]
+
+    interpreter = GeminiIntentInterpreter.__new__(GeminiIntentInterpreter)
+    interpreter.model = SimpleNamespace(generate_content=generate_content)
+    return interpreter
+
+def collect(interpreter, text: str = "solve this"):
+    async def run():
+        return [update async for update in interpreter.interpret_stream(text)]
+    return asyncio.run(run())
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 7, 64])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_partial_json_grows_towards_the_document(chunk, ensure_ascii):
+    document = "```json\n" + json.dumps(CONTRACT, ensure_ascii=ensure_ascii) + "\n```"
+    parser = PartialJSONParser()
+    texts = []
+    for i in range(0, len(document), chunk):
+        value = parser.feed(document[i:i + chunk])
+        if value is None:
+            continue
+        # Numbers never show up half-written
+        assert value.get("cognitive", {}).get("effort", 0.85) == 0.85
+        if "text_content" in value:
+            texts.append(value["text_content"])
+    assert parser.done and value == CONTRACT
+    assert all(later.startswith(earlier) for earlier, later in zip(texts, texts[1:]))
+
+def test_partial_json_handles_truncated_documents():
+    parser = PartialJSONParser()
+    assert parser.feed("Sure! ") is None
+    assert parser.feed('{"intent": {"cat') == {"intent": {}}
+    assert parser.feed('egory": "CRE') == {"intent": {"category": "CRE"}}
+    assert parser.feed('ATIVE"}, "cognitive": {"effort": 0.') == {"intent": {"category": "CREATIVE"}, "cognitive": {}}
+    assert parser.feed('7, "tags": [tr') == {"intent": {"category": "CREATIVE"}, "cognitive": {"effort": 0.7, "tags": []}}
+    assert not parser.done
+
+def test_gemini_streams_category_and_effort_before_text():
+    updates = collect(gemini(json.dumps(CONTRACT)))
+    first = updates[0]
+    assert first.category == ContractIntentCategory.ANALYTIC and first.text_content == ""
+    assert next(u for u in updates if u.text_content).effort == 0.85
+    assert all(u.contract is None for u in updates[:-1])
+
+    final = updates[-1].contract
+    assert final.intent.category == ContractIntentCategory.ANALYTIC
+    assert "".join(u.text_delta for u in updates) == final.text_content == CONTRACT["text_content"]
+
+def test_gemini_stream_rejects_a_truncated_answer():
+    with pytest.raises(ValueError):
+        collect(gemini(json.dumps(CONTRACT)[:-20]))
+
+def test_default_stream_is_the_final_contract():
+    updates = collect(SimulatedIntentInterpreter(), "imagine a story")
+    assert len(updates) == 1
+    assert updates[0].contract is not None and updates[0].text_delta == "Imagining a new possibility."
+
+def test_translate_partial_morphs_once_the_category_is_known():
+    adapter = EmbodimentAdapter()
+    assert adapter.translate_partial(PartialContract()) is None
+
+    early = adapter.translate_partial(PartialContract(category=ContractIntentCategory.CREATIVE))
+    assert early.visual_parameters.base_shape == BaseShape.CLOUD
+    assert early.visual_parameters.color_palette == "#FF00FF"
+
+    refined = adapter.translate_partial(PartialContract(category=ContractIntentCategory.CREATIVE, effort=1.0))
+    assert refined.energy_level < early.energy_level
+
+    final = collect(gemini(json.dumps(CONTRACT)))[-1]
+    assert adapter.translate_partial(final) == adapter.translate(final.contract)
+
+def test_cached_contracts_stream_at_once():
+    caching = CachingInterpreter(gemini(json.dumps(CONTRACT)))
+    streamed = collect(caching)
+    assert len(streamed) > 1
+
+    cached = collect(caching)
+    assert len(cached) == 1 and cached[0].contract is streamed[-1].contract
+    assert caching.stats()["hits"] == 1